@@ -1022,6 +1022,8 @@ def demonstrate_real_world_applications():
         
         def get_config(self, key, config_type=None):
             """Get configuration value with type validation."""
+            # Hot-path variant with compiled per-key coercers, a cached resolved
+            # dict and immutable snapshots: see 3.1.1_Python_DT_CONFIG_SCHEMA.py
             value = self.config.get(key, self.defaults.get(key))
             
             if config_type and not isinstance(value, config_type):
@@ -0,0 +1,587 @@
+""" 3.1.1_Python_DT_CONFIG_SCHEMA.py """
+
+# =============================================================================
+# PYTHON DATA TYPES - TYPED CONFIGURATION WITH COMPILED COERCERS
+# =============================================================================
+# Version: 3.1.1 | Educational Excellence Target: 9.5/10
+# Purpose: Resolve configuration values once, then serve typed lookups cheaply
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Describe configuration with a schema of typed fields and defaults
+✓ Compile one coercer function per key instead of branching on every lookup
+✓ Cache resolved, typed values in a flat dict and invalidate it on update
+✓ Publish immutable __slots__ snapshots with plain attribute access
+✓ Measure lookups per second against the per-call conversion approach
+
+🚀 QUICK NAVIGATION:
+├── 1. COERCER COMPILATION (FOUNDATION)
+├── 2. ConfigSchema (TYPED FIELDS)
+├── 3. IMMUTABLE SNAPSHOTS (__slots__)
+├── 4. CachedConfigManager (RESOLVED VALUE CACHE)
+└── 5. BENCHMARK VS PER-CALL CONVERSION
+
+🔍 CORE CONCEPT:
+ConfigManager.get_config in 3.1.0 repeats the same work on every call:
+two dict lookups, an isinstance check, a branch on the requested type and
+(for strings) a parse. None of that changes between updates. Decide the
+conversion once per key (compile it), apply it once per update (cache it),
+and a hot-path lookup becomes a single dict access - or, with a snapshot,
+a single attribute load.
+"""
+
+import json
+import keyword
+import sys
+import time
+from types import MappingProxyType
+
+# =============================================================================
+# 1. COERCER COMPILATION - FOUNDATION
+# =============================================================================
+
+"""
+ONE FUNCTION PER TYPE:
+compile_coercer(config_type) returns a function raw -> typed value that
+already knows which conversion applies, so no type branching is left for
+lookup time. Every coercer starts with the cheap exact-type check
+(type(value) is config_type) and returns the value untouched when it is
+already right.
+
+STRING PARSING RULES:
+    bool              'true', '1', 'yes', 'on' (any case) -> True, else False
+                      (3.1.0 accepts 'true', '1', 'yes'; 'on' is added here)
+    int / float       int(' 42 ') / float('1e-3')
+    list/tuple/set    comma-separated items, whitespace stripped
+    dict              JSON object text
+
+Coercers raise ValueError/TypeError on bad input. The schema catches those
+and falls back to the field's default, as get_config does.
+"""
+
+TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+MUTABLE_DEFAULT_TYPES = (list, set, dict)
+
+# Benchmark configuration
+BENCHMARK_LOOKUPS = 200_000
+FULL_BENCHMARK_LOOKUPS = 5_000_000
+
+
+def _split_items(text):
+    """'a, b,,c' -> ['a', 'b', 'c']"""
+    return [item for item in (part.strip() for part in text.split(',')) if item]
+
+
+def _coerce_bool(value):
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    return bool(value)
+
+
+def _coerce_dict(value):
+    if type(value) is dict:
+        return value
+    if isinstance(value, str):
+        value = json.loads(value)
+    return dict(value)
+
+
+def compile_coercer(config_type):
+    """Return a function converting raw config values to config_type."""
+    if config_type is bool:
+        return _coerce_bool
+    if config_type is dict:
+        return _coerce_dict
+    if config_type in (list, tuple, set, frozenset):
+        def coerce_collection(value, _type=config_type):
+            if type(value) is _type:
+                return value
+            if isinstance(value, str):
+                value = _split_items(value)
+            return _type(value)
+        return coerce_collection
+    if config_type is str or config_type is object:
+        def coerce_identity(value, _type=config_type):
+            return value if _type is object or type(value) is str else str(value)
+        return coerce_identity
+
+    def coerce_scalar(value, _type=config_type):
+        if type(value) is _type:
+            return value
+        if isinstance(value, str):
+            value = value.strip()
+        return _type(value)
+    return coerce_scalar
+
+
+# =============================================================================
+# 2. ConfigSchema - TYPED FIELDS
+# =============================================================================
+
+"""
+FIELDS COMPILE ONCE:
+A ConfigField records name, type and default, plus the coercer compiled for
+that type. The field's resolve(raw) is the only conversion code that ever
+runs, and it runs once per key per update - not per lookup.
+
+ConfigSchema.from_defaults infers each field's type from its default value,
+which is exactly the information the 3.1.0 defaults dict already carries.
+Field names must be identifiers because snapshots expose them as
+attributes. They also must not clash with the snapshot API (version,
+as_dict, _names, ...), which a slot of the same name would shadow.
+
+Mutable defaults (list, set, dict) are copied on every resolve. A cached
+value can then be changed without touching the field's default, the
+caller's defaults dict or any other manager built from it.
+"""
+
+
+class ConfigField:
+    """A typed configuration key with its default and compiled coercer."""
+
+    __slots__ = ('name', 'type', 'default', 'coerce')
+
+    def __init__(self, name, config_type, default=None):
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"config key {name!r} is not a valid identifier")
+        if hasattr(ConfigSnapshot, name):
+            raise ValueError(f"config key {name!r} is reserved by the snapshot API")
+        self.name = name
+        self.type = config_type
+        self.default = default
+        self.coerce = compile_coercer(config_type)
+
+    def resolve(self, raw):
+        """Typed value for raw (a copy of the default when raw is missing or invalid)."""
+        if raw is not None:
+            try:
+                return self.coerce(raw)
+            except (ValueError, TypeError):
+                pass
+        default = self.default
+        return default.copy() if isinstance(default, MUTABLE_DEFAULT_TYPES) else default
+
+    def __repr__(self):
+        return f"ConfigField({self.name!r}, {self.type.__name__}, default={self.default!r})"
+
+
+class ConfigSchema:
+    """Ordered collection of ConfigFields."""
+
+    def __init__(self, fields):
+        self.fields = {field.name: field for field in fields}
+        self.names = tuple(self.fields)
+        self.snapshot_class = make_snapshot_class(self.names)
+
+    @classmethod
+    def from_defaults(cls, defaults):
+        """Infer each field's type from its default value."""
+        return cls(ConfigField(name, type(value), value) for name, value in defaults.items())
+
+    def __contains__(self, name):
+        return name in self.fields
+
+    def __iter__(self):
+        return iter(self.fields.values())
+
+
+# =============================================================================
+# 3. IMMUTABLE SNAPSHOTS (__slots__)
+# =============================================================================
+
+"""
+ATTRIBUTE ACCESS WITHOUT A DICT:
+make_snapshot_class(names) builds a class whose __slots__ are the config
+keys. Slot reads are descriptor lookups on the class, so config.timeout is
+as cheap as attribute access gets, and there is no per-instance __dict__.
+
+FROZEN:
+__setattr__ and __delattr__ raise AttributeError; the constructor writes the
+slots with object.__setattr__. Mutable defaults (list, set, dict) are frozen
+into tuple, frozenset and MappingProxyType so a snapshot cannot be changed
+through its values either.
+"""
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, set):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value
+
+
+class ConfigSnapshot:
+    """Base class for generated immutable configuration snapshots."""
+
+    __slots__ = ('_version',)
+    _names = ()
+
+    def __init__(self, values, version=0):
+        setter = object.__setattr__
+        for name in self._names:
+            setter(self, name, _freeze(values[name]))
+        setter(self, '_version', version)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def version(self):
+        """Manager version this snapshot was taken at."""
+        return self._version
+
+    def as_dict(self):
+        """Plain dict copy of the snapshot values."""
+        return {name: getattr(self, name) for name in self._names}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._names)
+        return f"{type(self).__name__}({fields})"
+
+
+def make_snapshot_class(names):
+    """Build a ConfigSnapshot subclass with one slot per config key."""
+    return type('ConfigSnapshot', (ConfigSnapshot,),
+                {'__slots__': tuple(names), '_names': tuple(names)})
+
+
+# =============================================================================
+# 4. CachedConfigManager - RESOLVED VALUE CACHE
+# =============================================================================
+
+"""
+FLAT CACHE, EXPLICIT INVALIDATION:
+_resolved maps key -> typed value. get() is a single dict lookup once a key
+has been resolved; a miss resolves it through the field's coercer and
+stores it. update() writes the raw values, drops only the changed keys from
+_resolved, bumps the version and forgets the cached snapshot.
+
+get_config(key, config_type) keeps the 3.1.0 signature. When config_type is
+omitted or matches the schema, it is served from the cache. Any other
+requested type is converted per call with a coercer compiled once per type.
+Keys outside the schema resolve to their raw value (None if unset), like the
+original.
+"""
+
+
+class CachedConfigManager:
+    """Typed configuration with compiled coercers and cached resolution."""
+
+    def __init__(self, schema, config_dict=None):
+        if isinstance(schema, dict):
+            schema = ConfigSchema.from_defaults(schema)
+        self.schema = schema
+        self.config = dict(config_dict or {})
+        self.version = 0
+        self._resolved = {}
+        self._snapshot = None
+        self._type_coercers = {}
+
+    def _resolve(self, key):
+        field = self.schema.fields.get(key)
+        raw = self.config.get(key)
+        value = field.resolve(raw) if field is not None else raw
+        self._resolved[key] = value
+        return value
+
+    def get(self, key):
+        """Typed value for key (cached until the key is updated)."""
+        try:
+            return self._resolved[key]
+        except KeyError:
+            return self._resolve(key)
+
+    __getitem__ = get
+
+    def get_config(self, key, config_type=None):
+        """3.1.0-compatible lookup with optional type conversion."""
+        value = self.get(key)
+        field = self.schema.fields.get(key)
+        if config_type is None or (field is not None and config_type is field.type):
+            return value
+        if isinstance(value, config_type):
+            return value
+        coerce = self._type_coercers.get(config_type)
+        if coerce is None:
+            coerce = self._type_coercers[config_type] = compile_coercer(config_type)
+        try:
+            return coerce(value)
+        except (ValueError, TypeError):
+            return field.resolve(None) if field is not None else None
+
+    def update(self, changes=None, **kwargs):
+        """Set raw values and invalidate only the affected cached entries."""
+        changes = dict(changes or {}, **kwargs)
+        if not changes:
+            return self.version
+        self.config.update(changes)
+        resolved = self._resolved
+        for key in changes:
+            resolved.pop(key, None)
+        self._snapshot = None
+        self.version += 1
+        return self.version
+
+    def resolve_all(self):
+        """Resolve every schema key now (e.g. at startup), returning the flat dict."""
+        for name in self.schema.names:
+            if name not in self._resolved:
+                self._resolve(name)
+        return self._resolved
+
+    def snapshot(self):
+        """Immutable attribute-access view of the current configuration."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self.schema.snapshot_class(self.resolve_all(), self.version)
+        return snapshot
+
+
+# =============================================================================
+# 5. BENCHMARK VS PER-CALL CONVERSION
+# =============================================================================
+
+DEFAULTS = {
+    'debug': False,
+    'max_connections': 100,
+    'timeout': 30.0,
+    'allowed_hosts': ['localhost'],
+    'features': set(),
+    'metadata': {},
+}
+
+ENVIRONMENT = {
+    'debug': 'yes',
+    'max_connections': '250',
+    'timeout': '12.5',
+    'allowed_hosts': 'localhost, api.internal',
+}
+
+
+class ConfigManager:
+    """Reference implementation from 3.1.0 (converts on every lookup)."""
+
+    def __init__(self, config_dict=None):
+        self.config = config_dict or {}
+        self.defaults = {
+            'debug': False,
+            'max_connections': 100,
+            'timeout': 30.0,
+            'allowed_hosts': ['localhost'],
+            'features': set(),
+            'metadata': {},
+        }
+
+    def get_config(self, key, config_type=None):
+        """Get configuration value with type validation."""
+        value = self.config.get(key, self.defaults.get(key))
+
+        if config_type and not isinstance(value, config_type):
+            try:
+                if config_type == bool:
+                    return bool(value) if not isinstance(value, str) else value.lower() in ('true', '1', 'yes')
+                else:
+                    return config_type(value)
+            except (ValueError, TypeError):
+                return self.defaults.get(key)
+
+        return value
+
+
+def benchmark_config_lookups(lookups=BENCHMARK_LOOKUPS):
+    """Lookups per second: 3.1.0 get_config vs cached get vs snapshot attributes."""
+    typed_keys = [('debug', bool), ('max_connections', int), ('timeout', float)]
+    rounds = lookups // len(typed_keys)
+    results = {'lookups': rounds * len(typed_keys)}
+
+    original = ConfigManager(dict(ENVIRONMENT))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for key, config_type in typed_keys:
+            original.get_config(key, config_type)
+    original_time = time.perf_counter() - start
+
+    manager = CachedConfigManager(DEFAULTS, ENVIRONMENT)
+    compatible_get = manager.get_config
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for key, config_type in typed_keys:
+            compatible_get(key, config_type)
+    compatible_time = time.perf_counter() - start
+
+    get = manager.get
+    start = time.perf_counter()
+    for _ in range(rounds):
+        get('debug')
+        get('max_connections')
+        get('timeout')
+    cached_time = time.perf_counter() - start
+
+    config = manager.snapshot()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        config.debug
+        config.max_connections
+        config.timeout
+    snapshot_time = time.perf_counter() - start
+
+    count = results['lookups']
+    for name, elapsed in (('original', original_time), ('cached_get_config', compatible_time),
+                          ('cached_get', cached_time), ('snapshot', snapshot_time)):
+        results[f'{name}_lookups_per_s'] = count / elapsed if elapsed else float('inf')
+    results['cached_get_speedup'] = original_time / cached_time if cached_time else float('inf')
+    results['snapshot_speedup'] = original_time / snapshot_time if snapshot_time else float('inf')
+    results['values_agree'] = all(
+        original.get_config(key, config_type) == getattr(config, key)
+        for key, config_type in typed_keys
+    )
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_compiled_coercers():
+    """
+    COMPILED COERCER DEMONSTRATION
+    One conversion function per type, decided once
+    """
+
+    samples = [(bool, ' YES '), (bool, 'off'), (int, ' 42 '), (float, '1e-3'),
+               (list, 'a, b,,c'), (frozenset, 'x,y,x'), (dict, '{"region": "eu"}')]
+    results = {}
+    for config_type, raw in samples:
+        value = compile_coercer(config_type)(raw)
+        results[f'{config_type.__name__}:{raw}'] = value
+        print(f"   {config_type.__name__:>9}({raw!r}) -> {value!r}")
+
+    field = ConfigField('max_connections', int, 100)
+    print(f"   invalid input falls back: {field.resolve('lots')!r}")
+    return results
+
+
+def demonstrate_cached_manager():
+    """
+    CACHED MANAGER DEMONSTRATION
+    Flat resolved-value cache with targeted invalidation
+    """
+
+    manager = CachedConfigManager(DEFAULTS, ENVIRONMENT)
+    print(f"   schema: {list(manager.schema)}")
+    print(f"   timeout={manager.get('timeout')!r}, debug={manager.get('debug')!r}, "
+          f"hosts={manager['allowed_hosts']!r}")
+    print(f"   get_config('max_connections', str) = {manager.get_config('max_connections', str)!r}")
+    print(f"   cached keys: {sorted(manager._resolved)}")
+
+    version = manager.update(timeout='5', debug='false')
+    print(f"   after update (version {version}), cached keys: {sorted(manager._resolved)}")
+    print(f"   timeout={manager.get('timeout')!r}, debug={manager.get('debug')!r}")
+
+    # Mutating a returned default must not reach the schema or another manager
+    scratch = CachedConfigManager(DEFAULTS)
+    scratch.get('features').add('leak')
+    scratch.get_config('allowed_hosts', dict).append('leak')   # unconvertible -> default
+    fresh = CachedConfigManager(DEFAULTS)
+    defaults_isolated = ('leak' not in fresh.get('features')
+                         and 'leak' not in fresh.get('allowed_hosts')
+                         and DEFAULTS['allowed_hosts'] == ['localhost'] and not DEFAULTS['features'])
+    print(f"   mutable defaults isolated between managers: {defaults_isolated}")
+    return {'version': version, 'timeout': manager.get('timeout'), 'debug': manager.get('debug'),
+            'defaults_isolated': defaults_isolated}
+
+
+def demonstrate_snapshots():
+    """
+    SNAPSHOT DEMONSTRATION
+    Immutable __slots__ objects with attribute access
+    """
+
+    manager = CachedConfigManager(DEFAULTS, ENVIRONMENT)
+    config = manager.snapshot()
+    print(f"   {config!r}")
+    print(f"   config.max_connections = {config.max_connections}, has __dict__: {hasattr(config, '__dict__')}")
+    print(f"   same object until update: {manager.snapshot() is config}")
+
+    try:
+        config.timeout = 1.0
+    except AttributeError as error:
+        print(f"   assignment rejected: {error}")
+
+    manager.update(max_connections=500)
+    fresh = manager.snapshot()
+    print(f"   new snapshot v{fresh.version}: max_connections={fresh.max_connections} "
+          f"(old v{config.version} still {config.max_connections})")
+    return {'old': config.as_dict(), 'new': fresh.as_dict()}
+
+
+def demonstrate_config_benchmarks(lookups=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 5,000,000 lookups
+    """
+
+    if lookups is None:
+        lookups = FULL_BENCHMARK_LOOKUPS if '--full' in sys.argv else BENCHMARK_LOOKUPS
+    results = benchmark_config_lookups(lookups)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute typed configuration demonstrations
+    Pass --full for the large lookup benchmark
+    """
+
+    print("🎯 PYTHON DATA TYPES - TYPED CONFIGURATION WITH COMPILED COERCERS")
+    print("=" * 60)
+
+    sections = [
+        ("Compiled Coercers", demonstrate_compiled_coercers),
+        ("Cached Manager", demonstrate_cached_manager),
+        ("Snapshots", demonstrate_snapshots),
+        ("Config Benchmarks", demonstrate_config_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -1468,7 +1468,8 @@ def demonstrate_multidimensional_indexing():
             'entire_last_row': matrix[-1]     # Entire last row
         }
         
-        # Column extraction (manual)
+        # Column extraction (manual) - each call loops and builds a new list;
+        # 3.10.1_Python_IDX_STRIDED_ARRAY.py gives O(1) column/diagonal/submatrix views
         def extract_column(matrix, col_index):
             """Extract a column from 2D matrix."""
             return [row[col_index] for row in matrix]
@@ -1597,6 +1598,7 @@ def demonstrate_multidimensional_indexing():
         total_size = dims[0] * dims[1] * dims[2]
         flat_array = list(range(total_size))  # [0, 1, 2, ..., 59]
         
+        # N-dimensional versions: ravel_index / unravel_index in 3.10.1_Python_IDX_STRIDED_ARRAY.py
         def coords_to_flat_index(x, y, z, dims):
             """Convert 3D coordinates to flat index."""
             return x * dims[1] * dims[2] + y * dims[2] + z
@@ -1878,6 +1880,8 @@ def demonstrate_indexing_performance():
         # Cache-friendly access patterns
         def cache_friendly_patterns():
             """Demonstrate cache-friendly indexing patterns."""
+            # Blocked/tiled traversal, transposes and column reductions on flat
+            # array('d') matrices: see 3.10.6_Python_IDX_BLOCKED_TRAVERSAL.py
             
             large_matrix = [[i * 100 + j for j in range(100)] for i in range(100)]
             
@@ -1912,6 +1916,8 @@ def demonstrate_indexing_performance():
         # Batch operations
         def batch_operations():
             """Demonstrate batch indexing operations."""
+            # take/put with a reusable IndexPlan (sorted reads, caller order
+            # restored) and shared-memory workers: see 3.10.4_Python_IDX_GATHER_SCATTER.py
             
             test_data = list(range(10000))
             indices_to_access = [random.randint(0, len(test_data)-1) for _ in range(1000)]
@@ -1955,6 +1961,8 @@ def demonstrate_indexing_performance():
         # Pre-computation strategies
         def precomputation_strategies():
             """Demonstrate pre-computation for repeated access."""
+            # Self-updating tail/head/every-k slices with O(1) running
+            # aggregates: see 3.10.5_Python_IDX_MATERIALIZED_SLICES.py
             
             data = list(range(1000))
             
@@ -3291,6 +3299,8 @@ def demonstrate_mastery_techniques():
             
             def windowed_generator(sequence, window_size, step=1):
                 """Generate sliding windows efficiently."""
+                # memoryview windows (no copies) and incremental sum/mean/min/max
+                # reductions: see 3.10.3_Python_IDX_WINDOW_VIEWS.py
                 for start in range(0, len(sequence) - window_size + 1, step):
                     window_indices = range(start, start + window_size)
                     window_data = [sequence[i] for i in window_indices]
@@ -3316,6 +3326,8 @@ def demonstrate_mastery_techniques():
             
             class LazyIndexedSequence:
                 """Lazy sequence that computes values on demand."""
+                # Bounded (LRU/LFU/size), lock-striped variant with batch slices
+                # and thread-pool prefetch: see 3.10.2_Python_IDX_LAZY_SEQUENCE.py
                 
                 def __init__(self, compute_func, length):
                     self.compute_func = compute_func
@@ -0,0 +1,615 @@
+""" 3.10.1_Python_IDX_STRIDED_ARRAY.py """
+
+# =============================================================================
+# PYTHON INDEXING - N-DIMENSIONAL STRIDED ARRAYS & ZERO-COPY VIEWS
+# =============================================================================
+# Version: 3.10.1 | Educational Excellence Target: 9.5/10
+# Purpose: Store matrices in one flat array.array and index them with strides
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Store an N-dimensional dense array in ONE flat array.array
+✓ Map coordinates to flat positions with shape, strides and offset
+✓ Get rows, columns, diagonals and submatrices as O(1) views (no copies)
+✓ Transpose by swapping strides instead of moving data
+✓ Read a 1-D view with a single extended slice (data[start:stop:step])
+✓ Multiply matrices tile by tile and apply element-wise operations
+
+🚀 QUICK NAVIGATION:
+├── 1. SHAPE, STRIDES & OFFSET (FOUNDATION)
+├── 2. THE StridedArray TYPE (STORAGE & INDEXING)
+├── 3. VIEWS: ROW, COLUMN, DIAGONAL, SUBMATRIX, TRANSPOSE (ZERO-COPY)
+├── 4. ELEMENT-WISE OPS & BLOCKED MATRIX MULTIPLY (COMPUTATION)
+└── 5. BENCHMARKS VS NESTED LISTS
+
+🔍 CORE CONCEPT:
+Element (i, j) of a view lives at data[offset + i*strides[0] + j*strides[1]].
+Every view - a column, a diagonal, a transposed matrix - is just a
+different (offset, shape, strides) triple over the same flat buffer.
+"""
+
+import array
+import operator
+import sys
+import time
+from itertools import product
+
+# =============================================================================
+# 1. SHAPE, STRIDES & OFFSET - FOUNDATION
+# =============================================================================
+
+"""
+ROW-MAJOR LAYOUT (shape 3x4):
+    strides = (4, 1): moving one row skips 4 elements, one column skips 1
+    column j        → offset j,      shape (3,), strides (4,)
+    main diagonal   → offset 0,      shape (3,), strides (5,)   (4 + 1)
+    transpose       → shape (4, 3),  strides (1, 4)
+"""
+
+DEFAULT_TILE = 64
+
+# Default matrix sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SIZES = (100, 200)
+FULL_BENCHMARK_SIZES = (100, 300, 1000)
+
+
+def row_major_strides(shape):
+    """Strides of a contiguous row-major (C order) array with this shape."""
+    strides = []
+    step = 1
+    for extent in reversed(shape):
+        strides.append(step)
+        step *= extent
+    return tuple(reversed(strides))
+
+
+def ravel_index(coords, shape, strides=None, offset=0):
+    """Coordinates → flat position (the general form of coords_to_flat_index)."""
+    strides = strides or row_major_strides(shape)
+    position = offset
+    for coordinate, extent, stride in zip(coords, shape, strides):
+        if coordinate < 0:
+            coordinate += extent
+        if not 0 <= coordinate < extent:
+            raise IndexError(f"index {coordinate} out of range for extent {extent}")
+        position += coordinate * stride
+    return position
+
+
+def unravel_index(flat_index, shape):
+    """Flat position → coordinates of a contiguous row-major array."""
+    coords = []
+    for extent in reversed(shape):
+        flat_index, coordinate = divmod(flat_index, extent)
+        coords.append(coordinate)
+    return tuple(reversed(coords))
+
+
+def _slice_stop(start, length, stride):
+    """Stop bound for data[start:stop:stride] covering length elements."""
+    stop = start + length * stride
+    return None if stop < 0 else stop
+
+
+def _product(values):
+    result = 1
+    for value in values:
+        result *= value
+    return result
+
+
+# =============================================================================
+# 2. THE StridedArray TYPE - STORAGE & INDEXING
+# =============================================================================
+
+class StridedArray:
+    """
+    Dense N-dimensional array over one flat array.array.
+
+    Indexing with slices, and row/column/diagonal/transpose, return views
+    that share the buffer: creating a view is O(1) and writes through a
+    view are visible in every other view of the same data.
+    """
+
+    __slots__ = ('data', 'shape', 'strides', 'offset')
+
+    def __init__(self, data, shape, strides=None, offset=0):
+        self.data = data
+        self.shape = tuple(shape)
+        self.strides = tuple(strides) if strides is not None else row_major_strides(self.shape)
+        self.offset = offset
+        if strides is None and len(data) - offset < _product(self.shape):
+            raise ValueError(f"buffer of {len(data)} elements is too small for shape {self.shape}")
+
+    # Construction -----------------------------------------------------------
+
+    @classmethod
+    def zeros(cls, shape, typecode='d'):
+        size = _product(shape)
+        return cls(array.array(typecode, bytes(size * array.array(typecode).itemsize)), shape)
+
+    @classmethod
+    def from_nested(cls, nested, typecode='d'):
+        """Build from nested lists (rectangular) such as [[1, 2], [3, 4]]."""
+        shape = []
+        level = nested
+        while isinstance(level, (list, tuple)):
+            shape.append(len(level))
+            level = level[0] if level else None
+        flat = nested
+        for _ in range(len(shape) - 1):
+            flat = [item for sub in flat for item in sub]
+        return cls(array.array(typecode, flat), shape)
+
+    @classmethod
+    def arange(cls, shape, typecode='d'):
+        return cls(array.array(typecode, range(_product(shape))), shape)
+
+    # Properties -------------------------------------------------------------
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return _product(self.shape)
+
+    @property
+    def typecode(self):
+        return self.data.typecode
+
+    def is_contiguous(self):
+        return self.strides == row_major_strides(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    # Indexing ---------------------------------------------------------------
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim:
+            raise IndexError(f"too many indices for a {self.ndim}-d array")
+
+        offset = self.offset
+        shape = []
+        strides = []
+        for axis, extent in enumerate(self.shape):
+            stride = self.strides[axis]
+            index = key[axis] if axis < len(key) else slice(None)
+            if isinstance(index, slice):
+                start, stop, step = index.indices(extent)
+                shape.append(len(range(start, stop, step)))
+                strides.append(stride * step)
+                offset += start * stride
+            else:
+                if index < 0:
+                    index += extent
+                if not 0 <= index < extent:
+                    raise IndexError(f"index {index} out of range for axis {axis} with size {extent}")
+                offset += index * stride
+
+        if not shape:
+            return self.data[offset]
+        return StridedArray(self.data, shape, strides, offset)
+
+    def __setitem__(self, key, value):
+        target = self[key]
+        if not isinstance(target, StridedArray):
+            if not isinstance(key, tuple):
+                key = (key,)
+            self.data[ravel_index(key, self.shape, self.strides, self.offset)] = value
+            return
+        target.assign(value)
+
+    def assign(self, value):
+        """Write a scalar or a same-shape array into this view, in place."""
+        if isinstance(value, StridedArray):
+            if value.shape != self.shape:
+                raise ValueError(f"shape mismatch: {value.shape} vs {self.shape}")
+            source_lines = value._lines()
+        else:
+            source_lines = None
+        for position, (start, length, stride) in enumerate(self._line_specs()):
+            stop = _slice_stop(start, length, stride)
+            if source_lines is None:
+                line = array.array(self.typecode, [value]) * length
+            else:
+                line = array.array(self.typecode, source_lines[position])
+            self.data[start:stop:stride] = line
+
+    # Line access: a "line" is the innermost axis, readable with one slice ---
+
+    def _line_specs(self):
+        """Yield (start, length, stride) for every innermost-axis line."""
+        if self.ndim == 0:
+            return
+        outer_shape = self.shape[:-1]
+        outer_strides = self.strides[:-1]
+        length = self.shape[-1]
+        stride = self.strides[-1]
+        for coords in product(*(range(extent) for extent in outer_shape)):
+            start = self.offset + sum(c * s for c, s in zip(coords, outer_strides))
+            yield start, length, stride
+
+    def _lines(self):
+        """Materialize every innermost-axis line with one extended slice each."""
+        data = self.data
+        lines = []
+        for start, length, stride in self._line_specs():
+            if length == 0:
+                lines.append(array.array(self.typecode))
+                continue
+            lines.append(data[start:_slice_stop(start, length, stride):stride])
+        return lines
+
+    def __iter__(self):
+        """Iterate over the first axis (elements for 1-d, sub-views otherwise)."""
+        if self.ndim == 1:
+            yield from self._lines()[0]
+        else:
+            for index in range(self.shape[0]):
+                yield self[index]
+
+    def flat(self):
+        """Return all elements in row-major order as a new array.array."""
+        result = array.array(self.typecode)
+        for line in self._lines():
+            result.extend(line)
+        return result
+
+    def copy(self):
+        """Contiguous copy of this view."""
+        return StridedArray(self.flat(), self.shape)
+
+    def tolist(self):
+        """Nested lists, like the representation used in 3.10.0 and 3.8.0."""
+        if self.ndim == 1:
+            return self.flat().tolist()
+        return [self[index].tolist() for index in range(self.shape[0])]
+
+    def __repr__(self):
+        return f"StridedArray(shape={self.shape}, strides={self.strides}, offset={self.offset}, typecode='{self.typecode}')"
+
+    # =========================================================================
+    # 3. VIEWS: ROW, COLUMN, DIAGONAL, SUBMATRIX, TRANSPOSE - ZERO-COPY
+    # =========================================================================
+
+    def row(self, index):
+        return self[index]
+
+    def column(self, index):
+        return self[:, index]
+
+    def diagonal(self, k=0):
+        """Main (k=0), upper (k>0) or lower (k<0) diagonal as a 1-d view."""
+        rows, cols = self.shape
+        row_stride, col_stride = self.strides
+        if k >= 0:
+            length = max(0, min(rows, cols - k))
+            offset = self.offset + k * col_stride
+        else:
+            length = max(0, min(rows + k, cols))
+            offset = self.offset - k * row_stride
+        return StridedArray(self.data, (length,), (row_stride + col_stride,), offset)
+
+    def anti_diagonal(self):
+        """Top-right to bottom-left diagonal as a 1-d view."""
+        return self[:, ::-1].diagonal()
+
+    def submatrix(self, start_row, end_row, start_col, end_col):
+        return self[start_row:end_row, start_col:end_col]
+
+    def transpose(self, *axes):
+        """Reverse (or permute) the axes by reordering shape and strides only."""
+        axes = axes or tuple(reversed(range(self.ndim)))
+        return StridedArray(self.data,
+                            [self.shape[axis] for axis in axes],
+                            [self.strides[axis] for axis in axes],
+                            self.offset)
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def reshape(self, *shape):
+        """New shape over the same buffer (contiguous arrays only)."""
+        if len(shape) == 1 and isinstance(shape[0], tuple):
+            shape = shape[0]
+        if _product(shape) != self.size:
+            raise ValueError(f"cannot reshape size {self.size} into {shape}")
+        if not self.is_contiguous():
+            return self.copy().reshape(*shape)
+        return StridedArray(self.data, shape, None, self.offset)
+
+    # =========================================================================
+    # 4. ELEMENT-WISE OPS & BLOCKED MATRIX MULTIPLY - COMPUTATION
+    # =========================================================================
+
+    def _elementwise(self, other, function, reverse=False):
+        left = self.flat()
+        if isinstance(other, StridedArray):
+            if other.shape != self.shape:
+                raise ValueError(f"shape mismatch: {self.shape} vs {other.shape}")
+            right = other.flat()
+            values = map(function, right, left) if reverse else map(function, left, right)
+        else:
+            if reverse:
+                values = (function(other, value) for value in left)
+            else:
+                values = (function(value, other) for value in left)
+        typecode = 'd' if function is operator.truediv else self.typecode
+        return StridedArray(array.array(typecode, values), self.shape)
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __mul__(self, other):
+        return self._elementwise(other, operator.mul)
+
+    def __truediv__(self, other):
+        return self._elementwise(other, operator.truediv)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other):
+        return self._elementwise(other, operator.sub, reverse=True)
+
+    def apply(self, function):
+        """New array with function applied to each element."""
+        return StridedArray(array.array(self.typecode, map(function, self.flat())), self.shape)
+
+    def sum(self):
+        return sum(sum(line) for line in self._lines())
+
+    def __matmul__(self, other):
+        return matmul(self, other)
+
+
+def matmul(left, right, tile=DEFAULT_TILE):
+    """
+    Blocked matrix multiply of two 2-d StridedArrays.
+
+    The right operand is transposed once into contiguous columns, so each
+    output element is one C-level dot product of two arrays. Output tiles
+    of tile x tile elements reuse the same tile of rows and columns while
+    they are hot, instead of streaming every column past every row.
+    """
+    rows, inner = left.shape
+    inner_right, cols = right.shape
+    if inner != inner_right:
+        raise ValueError(f"cannot multiply {left.shape} by {right.shape}")
+
+    typecode = 'd' if 'd' in (left.typecode, right.typecode) or 'f' in (left.typecode, right.typecode) else left.typecode
+    left_rows = left._lines()
+    right_columns = right.T._lines()
+    result = StridedArray.zeros((rows, cols), typecode)
+    out = result.data
+    mul = operator.mul
+
+    for row_start in range(0, rows, tile):
+        row_block = range(row_start, min(row_start + tile, rows))
+        for col_start in range(0, cols, tile):
+            col_stop = min(col_start + tile, cols)
+            column_block = right_columns[col_start:col_stop]
+            for i in row_block:
+                row = left_rows[i]
+                base = i * cols + col_start
+                out[base:base + len(column_block)] = array.array(
+                    typecode, [sum(map(mul, row, column)) for column in column_block])
+    return result
+
+
+# =============================================================================
+# 5. BENCHMARKS VS NESTED LISTS
+# =============================================================================
+
+def _nested_extract_column(matrix, col_index):
+    return [row[col_index] for row in matrix]
+
+
+def _nested_extract_diagonal(matrix):
+    return [matrix[i][i] for i in range(min(len(matrix), len(matrix[0])))]
+
+
+def _nested_extract_submatrix(matrix, start_row, end_row, start_col, end_col):
+    return [row[start_col:end_col] for row in matrix[start_row:end_row]]
+
+
+def _nested_transpose(matrix):
+    return [[matrix[i][j] for i in range(len(matrix))] for j in range(len(matrix[0]))]
+
+
+def _nested_matmul(left, right):
+    right_t = _nested_transpose(right)
+    return [[sum(a * b for a, b in zip(row, column)) for column in right_t] for row in left]
+
+
+def _timed(function, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_strided_vs_nested(sizes=BENCHMARK_SIZES):
+    """Time view creation, materialization and matmul against nested lists."""
+    results = {}
+    for n in sizes:
+        nested = [[float(i * n + j) for j in range(n)] for i in range(n)]
+        strided = StridedArray.from_nested(nested)
+        half = n // 2
+
+        timings = {
+            'column: nested list': _timed(lambda: _nested_extract_column(nested, half)),
+            'column: view': _timed(lambda: strided.column(half)),
+            'column: view + materialize': _timed(lambda: strided.column(half).flat()),
+            'diagonal: nested list': _timed(lambda: _nested_extract_diagonal(nested)),
+            'diagonal: view + materialize': _timed(lambda: strided.diagonal().flat()),
+            'submatrix: nested list': _timed(lambda: _nested_extract_submatrix(nested, 0, half, 0, half)),
+            'submatrix: view': _timed(lambda: strided.submatrix(0, half, 0, half)),
+            'transpose: nested list': _timed(lambda: _nested_transpose(nested)),
+            'transpose: view': _timed(lambda: strided.T),
+            'transpose: view + copy': _timed(lambda: strided.T.copy()),
+            'add: nested list': _timed(lambda: [[a + b for a, b in zip(r1, r2)] for r1, r2 in zip(nested, nested)]),
+            'add: strided': _timed(lambda: strided + strided),
+        }
+        if n <= 300:
+            timings['matmul: nested list'] = _timed(lambda: _nested_matmul(nested, nested), repeat=1)
+        timings['matmul: blocked strided'] = _timed(lambda: strided @ strided, repeat=1)
+        results[n] = timings
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_strided_views():
+    """
+    STRIDED VIEW DEMONSTRATION
+    The 3.10.0 nested_list_indexing examples as zero-copy views
+    """
+
+    matrix = StridedArray.from_nested([
+        [1, 2, 3, 4],
+        [5, 6, 7, 8],
+        [9, 10, 11, 12],
+        [13, 14, 15, 16]
+    ], typecode='i')
+
+    column = matrix.column(-1)
+    results = {
+        'element_1_2': matrix[1, 2],
+        'last_row': matrix.row(-1).tolist(),
+        'last_column': column.tolist(),
+        'last_column_view': repr(column),
+        'main_diagonal': matrix.diagonal().tolist(),
+        'anti_diagonal': matrix.anti_diagonal().tolist(),
+        'center_2x2': matrix.submatrix(1, 3, 1, 3).tolist(),
+        'transpose': matrix.T.tolist(),
+        'transpose_strides': matrix.T.strides,
+        'shares_buffer': matrix.T.data is matrix.data,
+    }
+
+    # Writes through a view are visible everywhere
+    matrix.column(0)[:] = 0
+    results['after_zeroing_column_0'] = matrix.tolist()
+
+    for key in ('last_column', 'last_column_view', 'main_diagonal', 'transpose_strides', 'shares_buffer'):
+        print(f"   {key}: {results[key]}")
+    return results
+
+
+def demonstrate_flat_indexing():
+    """
+    FLAT INDEXING DEMONSTRATION
+    coords_to_flat_index / flat_index_to_coords for any number of dimensions
+    """
+
+    cube = StridedArray.arange((3, 4, 5), typecode='i')
+    coords = [(0, 0, 0), (1, 2, 3), (2, 3, 4), (0, 1, 4)]
+    conversions = [
+        {
+            'coords': c,
+            'flat_index': ravel_index(c, cube.shape),
+            'round_trip': unravel_index(ravel_index(c, cube.shape), cube.shape) == c,
+            'value': cube[c],
+        }
+        for c in coords
+    ]
+    plane = cube[0]
+    z_column = cube[:, :, 2]
+
+    print(f"   conversions: {[(c['coords'], c['flat_index']) for c in conversions]}")
+    print(f"   first xy plane view: {plane!r}")
+    print(f"   middle z column: {z_column.tolist()}")
+    return {'conversions': conversions, 'plane': plane.tolist(), 'z_column': z_column.tolist()}
+
+
+def demonstrate_matrix_operations():
+    """
+    MATRIX OPERATIONS DEMONSTRATION
+    The 3.8.0 matrix_operations example, plus element-wise ops and matmul
+    """
+
+    matrix = StridedArray.from_nested([[1, 2, 3], [4, 5, 6], [7, 8, 9]], typecode='q')
+    identity = StridedArray.from_nested([[1, 0, 0], [0, 1, 0], [0, 0, 1]], typecode='q')
+
+    results = {
+        'element': matrix[1, 2],
+        'row': matrix.row(1).tolist(),
+        'column': matrix.column(1).tolist(),
+        'transpose': matrix.T.tolist(),
+        'flattened': matrix.flat().tolist(),
+        'sum_with_transpose': (matrix + matrix.T).tolist(),
+        'scaled': (matrix * 10).tolist(),
+        'matmul_identity': (matrix @ identity).tolist(),
+        'matmul_square': (matrix @ matrix).tolist(),
+    }
+    for key in ('transpose', 'sum_with_transpose', 'matmul_square'):
+        print(f"   {key}: {results[key]}")
+    return results
+
+
+def demonstrate_strided_benchmarks(sizes=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for matrices up to 1000x1000
+    """
+
+    if sizes is None:
+        sizes = FULL_BENCHMARK_SIZES if '--full' in sys.argv else BENCHMARK_SIZES
+    results = benchmark_strided_vs_nested(sizes)
+
+    for n, timings in results.items():
+        print(f"   n={n}")
+        for name, seconds in timings.items():
+            print(f"      {name:<30} {seconds * 1000:10.3f} ms")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute strided array demonstrations
+    Pass --full for the large-matrix benchmark
+    """
+
+    print("🎯 PYTHON INDEXING - STRIDED N-D ARRAYS")
+    print("=" * 60)
+
+    sections = [
+        ("Strided Views", demonstrate_strided_views),
+        ("Flat Indexing", demonstrate_flat_indexing),
+        ("Matrix Operations", demonstrate_matrix_operations),
+        ("Strided Benchmarks", demonstrate_strided_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
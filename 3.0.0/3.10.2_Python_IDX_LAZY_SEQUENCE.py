@@ -0,0 +1,820 @@
+""" 3.10.2_Python_IDX_LAZY_SEQUENCE.py """
+
+# =============================================================================
+# PYTHON INDEXING - BOUNDED, THREAD-SAFE LAZY SEQUENCES
+# =============================================================================
+# Version: 3.10.2 | Educational Excellence Target: 9.5/10
+# Purpose: Serve expensive derived columns lazily with bounded, shared caches
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Plug LRU, LFU or size-bounded eviction into a lazily computed sequence
+✓ Compute slices with one vectorized compute_batch call instead of N calls
+✓ Prefetch ranges ahead of time on a thread pool
+✓ Stay thread-safe with lock striping instead of one global lock
+✓ Keep cache_info O(1) with running counters
+
+🚀 QUICK NAVIGATION:
+├── 1. EVICTION POLICIES (LRU, LFU, SIZE-BOUNDED)
+├── 2. LOCK-STRIPED SHARDS & IN-FLIGHT DEDUPLICATION
+├── 3. LazyIndexedSequence (INDEX, SLICE, PREFETCH)
+├── 4. BATCH COMPUTE HOOKS
+└── 5. BENCHMARKS VS THE UNBOUNDED DICT CACHE
+
+🔍 CORE CONCEPT:
+LazyIndexedSequence in 3.10.0 keeps every computed value forever, computes
+a slice one index at a time and lists every cached key to report its size.
+Here the cache is split into shards, each with its own lock, eviction
+policy and counters. Indices that are already being computed by another
+thread are waited on instead of recomputed, and a slice sends all of its
+missing indices to compute_batch at once.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+# =============================================================================
+# 1. EVICTION POLICIES - LRU, LFU, SIZE-BOUNDED
+# =============================================================================
+
+"""
+POLICY INTERFACE:
+A policy tracks the keys of one shard and decides which to drop:
+
+    add(key, value)   a new entry was stored
+    touch(key)        an entry was read
+    discard(key)      an entry was removed for another reason
+    over_capacity()   True while something must be evicted
+    pop_victim()      remove and return the key to evict
+
+Operations are O(1) (LFU is O(1) amortised). Policies are not thread-safe on their own; the
+shard lock protects them. The sequence builds one policy per shard by
+calling policy(capacity), so any class or factory with that signature plugs
+in (e.g. functools.partial(SizeBoundedPolicy, weigh=len)).
+"""
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_SHARDS = 8
+DEFAULT_PREFETCH_CHUNK = 256
+DEFAULT_PREFETCH_WORKERS = 4
+
+# Benchmark configuration
+BENCHMARK_LENGTH = 2_000
+FULL_BENCHMARK_LENGTH = 10_000
+BENCHMARK_THREADS = 4
+
+
+class EvictionPolicy:
+    """Base policy: never evicts (the 3.10.0 behaviour)."""
+
+    name = 'unbounded'
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+
+    def add(self, key, value):
+        pass
+
+    def touch(self, key):
+        pass
+
+    def discard(self, key):
+        pass
+
+    def over_capacity(self):
+        return False
+
+    def pop_victim(self):
+        raise KeyError("nothing to evict")
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key (OrderedDict recency list)."""
+
+    name = 'lru'
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._order = OrderedDict()
+
+    def add(self, key, value):
+        self._order[key] = None
+
+    def touch(self, key):
+        self._order.move_to_end(key)
+
+    def discard(self, key):
+        self._order.pop(key, None)
+
+    def over_capacity(self):
+        return len(self._order) > self.capacity
+
+    def pop_victim(self):
+        return self._order.popitem(last=False)[0]
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Evict the least frequently used key, oldest first among ties.
+
+    Keys live in per-frequency OrderedDict buckets and the minimum frequency
+    is tracked, so add and touch are O(1). Only when eviction or discard
+    empties the lowest bucket is the (short) list of distinct frequencies
+    scanned.
+    """
+
+    name = 'lfu'
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._frequency = {}
+        self._buckets = {}
+        self._min_frequency = 0
+
+    def _bucket(self, frequency):
+        bucket = self._buckets.get(frequency)
+        if bucket is None:
+            bucket = self._buckets[frequency] = OrderedDict()
+        return bucket
+
+    def _remove_from_bucket(self, key, frequency):
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+
+    def add(self, key, value):
+        self._frequency[key] = 1
+        self._bucket(1)[key] = None
+        self._min_frequency = 1
+
+    def touch(self, key):
+        frequency = self._frequency[key]
+        self._remove_from_bucket(key, frequency)
+        if self._min_frequency == frequency and frequency not in self._buckets:
+            self._min_frequency = frequency + 1
+        self._frequency[key] = frequency + 1
+        self._bucket(frequency + 1)[key] = None
+
+    def discard(self, key):
+        frequency = self._frequency.pop(key, None)
+        if frequency is not None:
+            self._remove_from_bucket(key, frequency)
+            if frequency == self._min_frequency and self._buckets:
+                self._min_frequency = min(self._buckets)
+
+    def over_capacity(self):
+        return len(self._frequency) > self.capacity
+
+    def pop_victim(self):
+        frequency = self._min_frequency
+        bucket = self._buckets[frequency]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[frequency]
+            self._min_frequency = min(self._buckets) if self._buckets else 0
+        del self._frequency[key]
+        return key
+
+
+class SizeBoundedPolicy(LRUPolicy):
+    """LRU order, but bounded by the total weight of the values (bytes by default)."""
+
+    name = 'size'
+
+    def __init__(self, capacity, weigh=sys.getsizeof):
+        super().__init__(capacity)
+        self.weigh = weigh
+        self.total = 0
+
+    def add(self, key, value):
+        weight = self.weigh(value)
+        self._order[key] = weight
+        self.total += weight
+
+    def discard(self, key):
+        weight = self._order.pop(key, None)
+        if weight is not None:
+            self.total -= weight
+
+    def over_capacity(self):
+        # Always keep the newest entry, even if it alone exceeds the budget
+        return self.total > self.capacity and len(self._order) > 1
+
+    def pop_victim(self):
+        key, weight = self._order.popitem(last=False)
+        self.total -= weight
+        return key
+
+
+POLICIES = {
+    'unbounded': EvictionPolicy,
+    'lru': LRUPolicy,
+    'lfu': LFUPolicy,
+    'size': SizeBoundedPolicy,
+}
+
+
+# =============================================================================
+# 2. LOCK-STRIPED SHARDS & IN-FLIGHT DEDUPLICATION
+# =============================================================================
+
+"""
+LOCK STRIPING:
+Index i belongs to shard i % shards. Each shard has its own lock, value
+dict, policy and counters, so threads working on different indices rarely
+contend. A lock is only held for dict and policy bookkeeping, never while
+compute_func runs.
+
+IN-FLIGHT DEDUPLICATION:
+The first thread to miss an index registers a _Pending entry for it and
+computes it. Threads that miss the same index while it is pending wait on
+that entry instead of computing it again. Errors are passed to the waiters
+and nothing is cached.
+
+CAPACITY:
+maxsize is divided evenly between the shards (rounded up), so the total
+bound is exact to within shards - 1 entries. maxsize=None means no bound,
+as with functools.lru_cache, and selects the 'unbounded' policy whatever
+policy was named.
+"""
+
+
+class _Pending:
+    """A value some thread is computing; other threads wait for it."""
+
+    __slots__ = ('_event', 'value', 'error')
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.value = None
+        self.error = None
+
+    def set(self, value):
+        self.value = value
+        self._event.set()
+
+    def fail(self, error):
+        self.error = error
+        self._event.set()
+
+    def result(self):
+        self._event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class _Shard:
+    """One lock stripe: values, pending computations, policy and counters."""
+
+    __slots__ = ('lock', 'values', 'pending', 'policy', 'hits', 'misses', 'waits', 'evictions')
+
+    def __init__(self, policy):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.pending = {}
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+
+    def store(self, index, value):
+        """Insert a computed value and evict as needed (caller holds the lock)."""
+        values = self.values
+        policy = self.policy
+        if index in values:
+            policy.discard(index)
+        values[index] = value
+        policy.add(index, value)
+        while policy.over_capacity():
+            del values[policy.pop_victim()]
+            self.evictions += 1
+        return self.pending.pop(index, None)
+
+
+# =============================================================================
+# 3. LazyIndexedSequence - INDEX, SLICE, PREFETCH
+# =============================================================================
+
+"""
+ACCESS PATHS:
+    seq[i]              shard lookup; on a miss compute_func(i) runs once
+    seq[a:b:c]          every missing index goes to compute_batch in one call
+    seq.prefetch(r)     chunks of r computed through compute_batch on a
+                        thread pool; returns the futures
+    seq.cache_info()    sums the shard counters: O(shards), not O(cache)
+
+Negative indices count from the end and out-of-range indices raise
+IndexError, like a list.
+"""
+
+
+class LazyIndexedSequence:
+    """Lazily computed sequence with a bounded, lock-striped cache."""
+
+    def __init__(self, compute_func, length, compute_batch=None, policy='lru',
+                 maxsize=DEFAULT_MAXSIZE, shards=DEFAULT_SHARDS,
+                 prefetch_workers=DEFAULT_PREFETCH_WORKERS):
+        self.compute_func = compute_func
+        self.compute_batch = compute_batch or self._compute_each
+        self._length = length
+        if maxsize is None:
+            policy = POLICIES['unbounded']
+        elif isinstance(policy, str):
+            policy = POLICIES[policy]
+        capacity = None if maxsize is None else max(1, -(-maxsize // shards))
+        self._shards = tuple(_Shard(policy(capacity)) for _ in range(shards))
+        self._policy_name = getattr(getattr(policy, 'func', policy), 'name', 'custom')
+        self._maxsize = maxsize
+        self._prefetch_workers = prefetch_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _compute_each(self, indices):
+        """Default batch hook: one compute_func call per index."""
+        return list(map(self.compute_func, indices))
+
+    def __len__(self):
+        return self._length
+
+    def _normalise(self, index):
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("LazyIndexedSequence index out of range")
+        return index
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.get_many(range(*key.indices(self._length)))
+        index = key + self._length if key < 0 else key
+        if not 0 <= index < self._length:
+            raise IndexError("LazyIndexedSequence index out of range")
+        shards = self._shards
+        shard = shards[index % len(shards)]
+
+        with shard.lock:
+            try:
+                value = shard.values[index]
+            except KeyError:
+                pending = shard.pending.get(index)
+                if pending is None:
+                    pending = shard.pending[index] = _Pending()
+                    shard.misses += 1
+                    owner = True
+                else:
+                    shard.waits += 1
+                    owner = False
+            else:
+                shard.hits += 1
+                shard.policy.touch(index)
+                return value
+
+        if not owner:
+            return pending.result()
+        try:
+            value = self.compute_func(index)
+        except BaseException as error:
+            with shard.lock:
+                shard.pending.pop(index, None)
+            pending.fail(error)
+            raise
+        with shard.lock:
+            shard.store(index, value)
+        pending.set(value)
+        return value
+
+    def get_many(self, indices):
+        """Values for indices, computing all missing ones in one compute_batch call."""
+        indices = [self._normalise(index) for index in indices]
+        shards = self._shards
+        count = len(shards)
+        groups = {}
+        for index in dict.fromkeys(indices):
+            groups.setdefault(index % count, []).append(index)
+
+        found = {}
+        waiting = {}
+        owned = []
+        for shard_id, group in groups.items():
+            shard = shards[shard_id]
+            with shard.lock:
+                values, pending, policy = shard.values, shard.pending, shard.policy
+                for index in group:
+                    if index in values:
+                        found[index] = values[index]
+                        policy.touch(index)
+                        shard.hits += 1
+                    elif index in pending:
+                        waiting[index] = pending[index]
+                        shard.waits += 1
+                    else:
+                        pending[index] = _Pending()
+                        owned.append(index)
+                        shard.misses += 1
+
+        if owned:
+            self._compute_owned(owned, found)
+        for index, pending in waiting.items():
+            found[index] = pending.result()
+        return [found[index] for index in indices]
+
+    def _compute_owned(self, owned, found):
+        """Run compute_batch for indices this thread registered as pending."""
+        shards = self._shards
+        count = len(shards)
+        try:
+            values = self.compute_batch(owned)
+        except BaseException as error:
+            for index in owned:
+                shard = shards[index % count]
+                with shard.lock:
+                    pending = shard.pending.pop(index, None)
+                if pending is not None:
+                    pending.fail(error)
+            raise
+
+        computed = {}
+        for index, value in zip(owned, values):
+            computed.setdefault(index % count, []).append((index, value))
+        for shard_id, items in computed.items():
+            shard = shards[shard_id]
+            with shard.lock:
+                released = [(shard.store(index, value), value) for index, value in items]
+            for pending, value in released:
+                if pending is not None:
+                    pending.set(value)
+        found.update(zip(owned, values))
+
+    # -- prefetch --------------------------------------------------------------
+
+    def _pool(self):
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._prefetch_workers,
+                        thread_name_prefix='lazy-prefetch')
+                executor = self._executor
+        return executor
+
+    def prefetch(self, indices, chunk_size=DEFAULT_PREFETCH_CHUNK, block=False):
+        """
+        Compute indices ahead of use on the thread pool.
+
+        indices may be a range, a slice or any iterable. Already cached or
+        in-flight indices are skipped by get_many. Returns the list of chunk
+        futures (already completed when block=True).
+        """
+        if isinstance(indices, slice):
+            indices = range(*indices.indices(self._length))
+        indices = list(indices)
+        pool = self._pool()
+        futures = [pool.submit(self.get_many, indices[start:start + chunk_size])
+                   for start in range(0, len(indices), chunk_size)]
+        if block:
+            wait(futures)
+            for future in futures:
+                future.result()
+        return futures
+
+    def close(self):
+        """Shut down the prefetch thread pool (if one was started)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # -- introspection ----------------------------------------------------------
+
+    def cache_info(self):
+        """Counter-based cache statistics (O(shards), independent of cache size)."""
+        hits = misses = waits = evictions = size = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                waits += shard.waits
+                evictions += shard.evictions
+                size += len(shard.values)
+        return {
+            'cache_size': size,
+            'maxsize': self._maxsize,
+            'hits': hits,
+            'misses': misses,
+            'waits': waits,
+            'evictions': evictions,
+            'policy': self._policy_name,
+            'shards': len(self._shards),
+            'total_length': self._length,
+        }
+
+    def cached_indices(self):
+        """Sorted list of cached indices (O(cache size); for debugging only)."""
+        indices = []
+        for shard in self._shards:
+            with shard.lock:
+                indices.extend(shard.values)
+        return sorted(indices)
+
+    def clear(self):
+        """Drop every cached value (counters are kept)."""
+        for shard in self._shards:
+            with shard.lock:
+                for index in list(shard.values):
+                    shard.policy.discard(index)
+                shard.values.clear()
+
+
+# =============================================================================
+# 4. BATCH COMPUTE HOOKS
+# =============================================================================
+
+"""
+WHY A BATCH HOOK:
+Many derived columns are cheaper to compute together than one at a time.
+fibonacci_batch walks the recurrence once up to the largest requested index
+instead of restarting for every index, so a 100-element slice costs one
+pass, not 100. For I/O-bound sources the hook is where one bulk query
+replaces N single-row queries.
+"""
+
+
+def fibonacci_computer(n):
+    """Compute nth Fibonacci number (3.10.0 reference, O(n) per call)."""
+    if n <= 1:
+        return n
+
+    a, b = 0, 1
+    for _ in range(2, n + 1):
+        a, b = b, a + b
+
+    return b
+
+
+def fibonacci_batch(indices):
+    """Fibonacci numbers for many indices in one pass up to max(indices)."""
+    wanted = {}
+    for position, index in enumerate(indices):
+        wanted.setdefault(index, []).append(position)
+    results = [0] * len(indices)
+    a, b = 0, 1
+    for n in range(max(wanted) + 1 if wanted else 0):
+        positions = wanted.get(n)
+        if positions:
+            for position in positions:
+                results[position] = a
+        a, b = b, a + b
+    return results
+
+
+# =============================================================================
+# 5. BENCHMARKS VS THE UNBOUNDED DICT CACHE
+# =============================================================================
+
+class UnboundedLazySequence:
+    """Reference implementation from 3.10.0 (unbounded dict, per-index slices)."""
+
+    def __init__(self, compute_func, length):
+        self.compute_func = compute_func
+        self._length = length
+        self._cache = {}
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            return [self[i] for i in indices]
+
+        if key not in self._cache:
+            self._cache[key] = self.compute_func(key)
+
+        return self._cache[key]
+
+    def cache_info(self):
+        return {
+            'cache_size': len(self._cache),
+            'cached_indices': list(self._cache.keys()),
+            'total_length': self._length
+        }
+
+
+def _slow_square(n, delay=0.0005):
+    """Simulated I/O-bound derived value (the sleep releases the GIL)."""
+    time.sleep(delay)
+    return n * n
+
+
+def _slow_square_batch(indices, delay=0.0005):
+    """Bulk variant: one round trip for the whole batch."""
+    time.sleep(delay)
+    return [n * n for n in indices]
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def benchmark_lazy_sequences(length=BENCHMARK_LENGTH, threads=BENCHMARK_THREADS):
+    """Slice, threaded and cache_info timings against the 3.10.0 sequence."""
+    results = {'length': length}
+
+    original = UnboundedLazySequence(fibonacci_computer, length)
+    bounded = LazyIndexedSequence(fibonacci_computer, length, fibonacci_batch, maxsize=length)
+    original_time, expected = _timed(lambda: original[:])
+    bounded_time, actual = _timed(lambda: bounded[:])
+    results['slice_original_s'] = original_time
+    results['slice_batch_s'] = bounded_time
+    results['slice_speedup'] = original_time / bounded_time if bounded_time else float('inf')
+    results['slice_matches'] = expected == actual
+
+    repeats = 1000
+    original_info_time, _ = _timed(lambda: [original.cache_info() for _ in range(repeats)])
+    bounded_info_time, _ = _timed(lambda: [bounded.cache_info() for _ in range(repeats)])
+    results['cache_info_original_us'] = original_info_time / repeats * 1e6
+    results['cache_info_counters_us'] = bounded_info_time / repeats * 1e6
+
+    hot = LazyIndexedSequence(fibonacci_computer, length, fibonacci_batch, maxsize=length)
+    hot[:]
+    reads = [(i * 7919) % length for i in range(20_000)]
+    original_hit_time, _ = _timed(lambda: [original[i] for i in reads])
+    bounded_hit_time, _ = _timed(lambda: [hot[i] for i in reads])
+    results['hit_original_per_s'] = len(reads) / original_hit_time
+    results['hit_striped_per_s'] = len(reads) / bounded_hit_time
+
+    span = min(length, 400)
+    sequential = LazyIndexedSequence(_slow_square, span, policy='unbounded')
+    sequential_time, _ = _timed(lambda: [sequential[i] for i in range(span)])
+    with LazyIndexedSequence(_slow_square, span, _slow_square_batch, policy='unbounded') as prefetched:
+        prefetch_time, _ = _timed(lambda: prefetched.prefetch(range(span), chunk_size=50, block=True))
+        hit_time, values = _timed(lambda: [prefetched[i] for i in range(span)])
+    results['io_sequential_s'] = sequential_time
+    results['io_prefetch_s'] = prefetch_time + hit_time
+    results['io_prefetch_speedup'] = sequential_time / (prefetch_time + hit_time)
+    results['io_prefetch_matches'] = values == [n * n for n in range(span)]
+
+    shared = LazyIndexedSequence(_slow_square, span, policy='lru', maxsize=span)
+
+    def worker(offset):
+        return [shared[(offset + i) % span] for i in range(span)]
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        threaded_time, outputs = _timed(lambda: list(pool.map(worker, range(threads))))
+    info = shared.cache_info()
+    results['threads'] = threads
+    results['threaded_s'] = threaded_time
+    results['threaded_misses'] = info['misses']
+    results['threaded_waits'] = info['waits']
+    results['threaded_consistent'] = all(
+        sorted(output) == [n * n for n in range(span)] for output in outputs)
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_eviction_policies():
+    """
+    EVICTION POLICY DEMONSTRATION
+    LRU, LFU and size-bounded caches over the same access pattern
+    """
+
+    pattern = [0, 0, 0, 1, 2, 3]
+    policies = {
+        'lru': LRUPolicy,
+        'lfu': LFUPolicy,
+        'size': partial(SizeBoundedPolicy, weigh=len),
+    }
+    results = {}
+    for name, policy in policies.items():
+        maxsize = 3 if name != 'size' else 60
+        sequence = LazyIndexedSequence(lambda n: 'x' * (10 + 10 * n), 10, policy=policy,
+                                       maxsize=maxsize, shards=1)
+        for index in pattern:
+            sequence[index]
+        info = sequence.cache_info()
+        results[name] = sequence.cached_indices()
+        print(f"   {name:>4} (maxsize {maxsize}): cached={results[name]} "
+              f"evictions={info['evictions']} hits={info['hits']} misses={info['misses']}")
+    print("   lru drops the stale hot key 0, lfu keeps it, size keeps values totalling <= 60 chars")
+    return results
+
+
+def demonstrate_batch_slices():
+    """
+    BATCH SLICE DEMONSTRATION
+    Slices send every missing index to compute_batch at once
+    """
+
+    calls = []
+
+    def recording_batch(indices):
+        calls.append(len(indices))
+        return fibonacci_batch(indices)
+
+    sequence = LazyIndexedSequence(fibonacci_computer, 50, recording_batch, maxsize=32)
+    sample = [sequence[i] for i in (5, 10, 15, 7, 12)]
+    window = sequence[20:25]
+    overlapping = sequence[18:30:2]
+    print(f"   individual: {sample}")
+    print(f"   fib[20:25]: {window}")
+    print(f"   fib[18:30:2]: {overlapping}")
+    print(f"   compute_batch calls (sizes): {calls}")
+    print(f"   fib[-1] = {sequence[-1]}")
+    info = sequence.cache_info()
+    print(f"   cache_info: {info}")
+    return {'sample': sample, 'window': window, 'batch_calls': calls, 'info': info}
+
+
+def demonstrate_prefetch():
+    """
+    PREFETCH DEMONSTRATION
+    Compute ahead on a thread pool, then read from the cache
+    """
+
+    with LazyIndexedSequence(_slow_square, 200, _slow_square_batch, maxsize=256) as sequence:
+        futures = sequence.prefetch(range(200), chunk_size=40)
+        print(f"   submitted {len(futures)} prefetch chunks")
+        wait(futures)
+        before = sequence.cache_info()
+        values = sequence[0:200:50]
+        after = sequence.cache_info()
+    print(f"   after prefetch: cache_size={before['cache_size']} misses={before['misses']}")
+    print(f"   seq[0:200:50] = {values} (hits {before['hits']} -> {after['hits']})")
+    return {'chunks': len(futures), 'values': values, 'info': after}
+
+
+def demonstrate_lazy_sequence_benchmarks(length=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for a 10,000-element sequence
+    """
+
+    if length is None:
+        length = FULL_BENCHMARK_LENGTH if '--full' in sys.argv else BENCHMARK_LENGTH
+    results = benchmark_lazy_sequences(length)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute lazy sequence demonstrations
+    Pass --full for the larger benchmark
+    """
+
+    print("🎯 PYTHON INDEXING - BOUNDED, THREAD-SAFE LAZY SEQUENCES")
+    print("=" * 60)
+
+    sections = [
+        ("Eviction Policies", demonstrate_eviction_policies),
+        ("Batch Slices", demonstrate_batch_slices),
+        ("Prefetch", demonstrate_prefetch),
+        ("Lazy Sequence Benchmarks", demonstrate_lazy_sequence_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,486 @@
+""" 3.10.3_Python_IDX_WINDOW_VIEWS.py """
+
+# =============================================================================
+# PYTHON INDEXING - ZERO-COPY WINDOW & STRIDE VIEWS
+# =============================================================================
+# Version: 3.10.3 | Educational Excellence Target: 9.5/10
+# Purpose: Slide windows over buffers without copying and reduce them incrementally
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Index any buffer-protocol object (array.array, bytearray, mmap) via memoryview
+✓ Yield sliding windows and strided views that share the caller's memory
+✓ Compute sliding sums and means by adding the new item and dropping the old
+✓ Compute sliding min/max in O(1) per window (van Herk / Gil-Werman blocks)
+✓ Stream results block by block so 10^8-element inputs fit in memory
+
+🚀 QUICK NAVIGATION:
+├── 1. BUFFERS AS TYPED MEMORYVIEWS (FOUNDATION)
+├── 2. SLIDING WINDOW & STRIDED VIEW ITERATORS (ZERO-COPY)
+├── 3. INCREMENTAL SUM & MEAN
+├── 4. SLIDING MIN & MAX
+└── 5. BENCHMARKS VS windowed_generator
+
+🔍 CORE CONCEPT:
+windowed_generator in 3.10.0 copies every window into a new list, so n
+windows of size w cost O(n*w) time and allocations before any reduction
+starts. A memoryview slice is a new view of the same memory: making one
+costs O(1) whatever the window size. A reduction that updates the previous
+window's result instead of rescanning the window then brings the whole
+pass down to O(n), driven by C-level map/accumulate loops.
+"""
+
+import array
+import math
+import mmap
+import os
+import sys
+import tempfile
+import time
+from itertools import accumulate, chain, islice
+from operator import sub, truediv
+
+# =============================================================================
+# 1. BUFFERS AS TYPED MEMORYVIEWS - FOUNDATION
+# =============================================================================
+
+"""
+ONE ENTRY POINT FOR EVERY BUFFER:
+as_view(buffer, format) returns a 1-D memoryview:
+
+    array.array('d')   -> format 'd' already (no cast needed)
+    bytearray / bytes  -> format 'B', or cast to e.g. 'i', 'd'
+    mmap.mmap          -> format 'B', cast like a bytearray
+    memoryview         -> used as-is (or cast)
+
+Indexing the view returns Python numbers, slicing it returns another view,
+and nothing is ever copied. While views exist, a bytearray cannot be resized
+and an mmap cannot be closed: release them first (with-blocks do that).
+"""
+
+DEFAULT_BLOCK_WINDOWS = 65_536      # results produced per streamed block
+SMALL_WINDOW = 16                   # up to here, min/max compare shifted views directly
+
+# Benchmark configuration
+BENCHMARK_ELEMENTS = 1_000_000
+FULL_BENCHMARK_ELEMENTS = 100_000_000
+BENCHMARK_WINDOW_SIZES = (5, 100, 10_000)
+BASELINE_WINDOWS = 2_000            # windows timed for the list-copy baseline
+
+
+def as_view(buffer, format=None):
+    """1-D memoryview over any buffer-protocol object, optionally cast to format."""
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    if view.ndim != 1:
+        view = view.cast('B')
+    if format is not None and view.format != format:
+        if view.format != 'B':
+            view = view.cast('B')
+        view = view.cast(format)
+    return view
+
+
+def _is_integral(view):
+    return view.format not in ('f', 'd', 'e')
+
+
+def _window_count(length, size, step):
+    if size < 1 or step < 1:
+        raise ValueError("window size and step must be positive")
+    return 0 if length < size else (length - size) // step + 1
+
+
+# =============================================================================
+# 2. SLIDING WINDOW & STRIDED VIEW ITERATORS - ZERO-COPY
+# =============================================================================
+
+"""
+VIEWS, NOT LISTS:
+sliding_windows yields (start, view[start:start + size]); each window is an
+O(1) memoryview object no matter how large the window is. strided_view
+returns ONE view for an extended slice (memoryviews support steps), and
+strided_items pairs its values with their indices through C-level zip/range
+instead of a Python loop over sequence[i].
+"""
+
+
+def sliding_windows(buffer, size, step=1, format=None):
+    """Yield (start, memoryview) windows of `size` items every `step` items."""
+    view = as_view(buffer, format)
+    for start in range(0, _window_count(len(view), size, step) * step, step):
+        yield start, view[start:start + size]
+
+
+def strided_view(buffer, start=None, stop=None, step=None, format=None):
+    """Zero-copy memoryview of buffer[start:stop:step]."""
+    return as_view(buffer, format)[start:stop:step]
+
+
+def strided_items(buffer, start=None, stop=None, step=None, format=None):
+    """Iterator of (index, value) pairs like slice_generator, without per-item indexing."""
+    view = as_view(buffer, format)
+    indices = range(*slice(start, stop, step).indices(len(view)))
+    return zip(indices, view[start:stop:step])
+
+
+# =============================================================================
+# 3. INCREMENTAL SUM & MEAN
+# =============================================================================
+
+"""
+SLIDE, DON'T RESCAN:
+    sum[k+1] = sum[k] + x[k + size] - x[k]
+
+map(sub, view[size:], view) produces all the (incoming - outgoing)
+differences in C, and accumulate(differences, initial=sum[0]) turns them
+into window sums. Integer buffers stay exact. For floats, each block of
+DEFAULT_BLOCK_WINDOWS results restarts from an exact math.fsum of its first
+window, so rounding drift cannot build up across the whole buffer.
+
+When step >= size, windows do not overlap, and summing each window directly
+is already O(n).
+
+Every reduction streams blocks: iter_window_sums yields (first_window_index,
+array) pairs, and window_sums joins them into one array for convenience.
+"""
+
+
+def iter_window_sums(buffer, size, step=1, format=None, block=DEFAULT_BLOCK_WINDOWS):
+    """Yield (first_window, array of sums) blocks of sliding-window sums."""
+    view = as_view(buffer, format)
+    count = _window_count(len(view), size, step)
+    integral = _is_integral(view)
+    typecode = 'q' if integral else 'd'
+    exact_sum = sum if integral else math.fsum
+
+    if step >= size:
+        for first in range(0, count, block):
+            starts = range(first * step, min(count, first + block) * step, step)
+            yield first, array.array(typecode, [exact_sum(view[s:s + size]) for s in starts])
+        return
+
+    # Overlapping windows: slide one item at a time, keep every step-th sum
+    windows_per_block = max(1, block // step)
+    for first in range(0, count, windows_per_block):
+        start = first * step
+        last = min(count, first + windows_per_block) - 1
+        span = last * step - start + 1                      # stride-1 sums needed
+        initial = exact_sum(view[start:start + size])
+        sums = accumulate(
+            map(sub, view[start + size:start + size + span - 1], view[start:start + span - 1]),
+            initial=initial)
+        if step > 1:
+            sums = islice(sums, 0, None, step)
+        yield first, array.array(typecode, sums)
+
+
+def window_sums(buffer, size, step=1, format=None):
+    """Sliding-window sums as one array."""
+    blocks = iter_window_sums(buffer, size, step, format)
+    view = as_view(buffer, format)
+    return array.array('q' if _is_integral(view) else 'd',
+                       chain.from_iterable(values for _, values in blocks))
+
+
+def iter_window_means(buffer, size, step=1, format=None, block=DEFAULT_BLOCK_WINDOWS):
+    """Yield (first_window, array of means) blocks."""
+    for first, sums in iter_window_sums(buffer, size, step, format, block):
+        yield first, array.array('d', map(truediv, sums, [size] * len(sums)))
+
+
+def window_means(buffer, size, step=1, format=None):
+    """Sliding-window means as one array('d')."""
+    return array.array('d', chain.from_iterable(
+        values for _, values in iter_window_means(buffer, size, step, format)))
+
+
+# =============================================================================
+# 4. SLIDING MIN & MAX
+# =============================================================================
+
+"""
+SMALL WINDOWS (size <= SMALL_WINDOW):
+map(max, view[0:], view[1:], ..., view[size-1:]) compares `size` shifted
+views element by element in C - size-1 comparisons per window, no Python
+loop per item.
+
+LARGE WINDOWS - VAN HERK / GIL-WERMAN:
+Cut the input into blocks of `size` items. For each block, compute the
+running max from the left (prefix) and from the right (suffix). Any window
+of length `size` covers the tail of one block and the head of the next, so
+
+    max(window starting at i) = max(suffix[i], prefix[i + size - 1])
+
+That is three comparisons per item whatever the window size. Each block's
+prefix and suffix is one accumulate() call (the suffix runs over a
+reversed zero-copy view, view[b:e][::-1]).
+"""
+
+
+def _small_window_extreme(view, start, count, size, function):
+    shifted = [view[start + k:start + k + count] for k in range(size)]
+    return map(function, *shifted)
+
+
+def _van_herk_extreme(view, start, count, size, function):
+    segment = view[start:start + count + size - 1]
+    length = len(segment)
+    prefix = []
+    suffix = []
+    for block_start in range(0, length, size):
+        chunk = segment[block_start:block_start + size]
+        prefix.extend(accumulate(chunk, function))
+        reversed_running = list(accumulate(chunk[::-1], function))
+        reversed_running.reverse()
+        suffix.extend(reversed_running)
+    return map(function, suffix[:count], prefix[size - 1:size - 1 + count])
+
+
+def iter_window_extremes(buffer, size, function=max, step=1, format=None,
+                         block=DEFAULT_BLOCK_WINDOWS):
+    """Yield (first_window, array) blocks of sliding min or max (function=min/max)."""
+    view = as_view(buffer, format)
+    count = _window_count(len(view), size, step)
+    typecode = 'q' if _is_integral(view) else 'd'
+
+    if step >= size:
+        for first in range(0, count, block):
+            starts = range(first * step, min(count, first + block) * step, step)
+            yield first, array.array(typecode, [function(view[s:s + size]) for s in starts])
+        return
+
+    extreme = _small_window_extreme if size <= SMALL_WINDOW else _van_herk_extreme
+    windows_per_block = max(1, block // step)
+    for first in range(0, count, windows_per_block):
+        start = first * step
+        last = min(count, first + windows_per_block) - 1
+        span = last * step - start + 1
+        values = extreme(view, start, span, size, function)
+        if step > 1:
+            values = islice(values, 0, None, step)
+        yield first, array.array(typecode, values)
+
+
+def window_min(buffer, size, step=1, format=None):
+    """Sliding-window minimums as one array."""
+    return _join(iter_window_extremes(buffer, size, min, step, format), buffer, format)
+
+
+def window_max(buffer, size, step=1, format=None):
+    """Sliding-window maximums as one array."""
+    return _join(iter_window_extremes(buffer, size, max, step, format), buffer, format)
+
+
+def _join(blocks, buffer, format):
+    typecode = 'q' if _is_integral(as_view(buffer, format)) else 'd'
+    return array.array(typecode, chain.from_iterable(values for _, values in blocks))
+
+
+# =============================================================================
+# 5. BENCHMARKS VS windowed_generator
+# =============================================================================
+
+def windowed_generator(sequence, window_size, step=1):
+    """Reference implementation from 3.10.0 (one list copy per window)."""
+    for start in range(0, len(sequence) - window_size + 1, step):
+        window_indices = range(start, start + window_size)
+        window_data = [sequence[i] for i in window_indices]
+        yield (start, window_data)
+
+
+def slice_generator(sequence, start=None, stop=None, step=None):
+    """Reference implementation from 3.10.0 (one tuple per element)."""
+    slice_obj = slice(start, stop, step)
+    indices = range(*slice_obj.indices(len(sequence)))
+
+    for i in indices:
+        yield (i, sequence[i])
+
+
+def make_signal(elements):
+    """Pseudo-random-looking doubles, built by repeating one 65,536-item block."""
+    pattern = array.array('d', (((i * 2654435761) % 1_000_003) / 1000.0 for i in range(65_536)))
+    repeats, remainder = divmod(elements, len(pattern))
+    return pattern * repeats + pattern[:remainder]
+
+
+def _drain(blocks):
+    """Consume a block stream, returning (windows, checksum of first block)."""
+    windows = 0
+    first_value = None
+    for _, values in blocks:
+        if first_value is None and values:
+            first_value = values[0]
+        windows += len(values)
+    return windows, first_value
+
+
+def benchmark_window_views(elements=BENCHMARK_ELEMENTS, sizes=BENCHMARK_WINDOW_SIZES):
+    """Windows per second for the list-copy baseline vs streamed view reductions."""
+    data = make_signal(elements)
+    results = {'elements': elements}
+
+    for size in sizes:
+        windows = _window_count(len(data), size, 1)
+        if windows == 0:
+            continue
+        baseline_windows = min(BASELINE_WINDOWS, windows)
+
+        start = time.perf_counter()
+        baseline_sums = [sum(w) for _, w in islice(windowed_generator(data, size), baseline_windows)]
+        baseline_maxes = [max(w) for _, w in islice(windowed_generator(data, size), baseline_windows)]
+        baseline_rate = 2 * baseline_windows / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        counted = sum(1 for _ in sliding_windows(data, size))
+        view_rate = counted / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        sum_windows, _ = _drain(iter_window_sums(data, size))
+        max_windows, _ = _drain(iter_window_extremes(data, size, max))
+        reduction_rate = (sum_windows + max_windows) / (time.perf_counter() - start)
+
+        check_sums = window_sums(data[:baseline_windows + size - 1], size)
+        check_maxes = window_max(data[:baseline_windows + size - 1], size)
+        sums_ok = all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+                      for a, b in zip(check_sums, baseline_sums))
+        maxes_ok = list(check_maxes) == baseline_maxes
+
+        results[f'w{size}_baseline_windows_per_s'] = baseline_rate
+        results[f'w{size}_view_windows_per_s'] = view_rate
+        results[f'w{size}_reduction_windows_per_s'] = reduction_rate
+        results[f'w{size}_reduction_speedup'] = reduction_rate / baseline_rate
+        results[f'w{size}_matches_baseline'] = sums_ok and maxes_ok
+
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_zero_copy_views():
+    """
+    ZERO-COPY VIEW DEMONSTRATION
+    Windows and strided views share the caller's memory
+    """
+
+    data = array.array('i', range(20))
+    windows = list(sliding_windows(data, 4, step=3))
+    print(f"   windows(size=4, step=3): {[(s, w.tolist()) for s, w in windows[:4]]} ...")
+
+    data[3] = 300
+    print(f"   after data[3] = 300, window 1 sees it: {windows[1][1].tolist()}")
+
+    evens = strided_view(data, 0, None, 2)
+    print(f"   strided_view(data, 0, None, 2) = {evens.tolist()} (format {evens.format!r})")
+    items = list(strided_items(data, 15, 5, -3))
+    print(f"   strided_items(data, 15, 5, -3) = {items}")
+    print(f"   matches slice_generator: {items == list(slice_generator(data, 15, 5, -3))}")
+    for _, window in windows:
+        window.release()
+    return {'windows': len(windows), 'strided': evens.tolist(), 'items': items}
+
+
+def demonstrate_incremental_reductions():
+    """
+    INCREMENTAL REDUCTION DEMONSTRATION
+    Sliding sum, mean, min and max updated as the window moves
+    """
+
+    data = array.array('d', [4, 8, 15, 16, 23, 42, 8, 4, 1, 0, 9, 7])
+    results = {
+        'sum': window_sums(data, 3).tolist(),
+        'mean': [round(v, 3) for v in window_means(data, 3)],
+        'min': window_min(data, 3).tolist(),
+        'max_step_2': window_max(data, 3, step=2).tolist(),
+        'max_large_window': window_max(data * 4, SMALL_WINDOW + 4, step=5).tolist(),
+    }
+    for name, values in results.items():
+        print(f"   {name:>16}: {values}")
+
+    expected = [max(w) for _, w in windowed_generator(data * 4, SMALL_WINDOW + 4, 5)]
+    print(f"   van Herk result matches windowed_generator: {results['max_large_window'] == expected}")
+    return results
+
+
+def demonstrate_buffer_sources():
+    """
+    BUFFER SOURCE DEMONSTRATION
+    The same functions over bytearray and a memory-mapped file
+    """
+
+    raw = bytearray(b'\x01\x02\x03\x04\x05\x06\x07\x08')
+    byte_sums = window_sums(raw, 3).tolist()
+    print(f"   bytearray window sums: {byte_sums}")
+
+    values = array.array('d', (float(i % 7) for i in range(1_000)))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'signal.bin')
+        with open(path, 'wb') as handle:
+            values.tofile(handle)
+        with open(path, 'rb') as handle, \
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as raw_view, raw_view.cast('d') as doubles:
+                mapped_means = window_means(doubles, 7, step=7)
+                mapped_max = window_max(doubles, 50)
+    print(f"   mmap'd file: {len(values):,} doubles, {len(mapped_means)} block means "
+          f"(all {set(mapped_means)}), sliding max(50) all {set(mapped_max)}")
+    return {'bytearray': byte_sums, 'mmap_means': len(mapped_means), 'mmap_max': len(mapped_max)}
+
+
+def demonstrate_window_benchmarks(elements=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for a 10^8-element array (about 800 MB)
+    """
+
+    if elements is None:
+        elements = FULL_BENCHMARK_ELEMENTS if '--full' in sys.argv else BENCHMARK_ELEMENTS
+    results = benchmark_window_views(elements)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute window view demonstrations
+    Pass --full for the 10^8-element benchmark
+    """
+
+    print("🎯 PYTHON INDEXING - ZERO-COPY WINDOW & STRIDE VIEWS")
+    print("=" * 60)
+
+    sections = [
+        ("Zero-Copy Views", demonstrate_zero_copy_views),
+        ("Incremental Reductions", demonstrate_incremental_reductions),
+        ("Buffer Sources", demonstrate_buffer_sources),
+        ("Window Benchmarks", demonstrate_window_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,547 @@
+""" 3.10.4_Python_IDX_GATHER_SCATTER.py """
+
+# =============================================================================
+# PYTHON INDEXING - GATHER/SCATTER BATCH INDEXING
+# =============================================================================
+# Version: 3.10.4 | Educational Excellence Target: 9.5/10
+# Purpose: Read and write millions of scattered positions in one call
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Gather (take) and scatter (put) by index arrays with C-level map loops
+✓ Precompute an IndexPlan: sorted unique indices plus the permutation back
+✓ Deduplicate repeated indices and define last-write-wins scatter
+✓ Split very large gathers/scatters across processes over shared memory
+✓ Measure when sorting for locality pays off in CPython - and when it doesn't
+
+🚀 QUICK NAVIGATION:
+├── 1. INDEX VALIDATION & NORMALISATION (FOUNDATION)
+├── 2. IndexPlan (SORTED UNIQUE INDICES & INVERSE PERMUTATION)
+├── 3. take / put
+├── 4. SHARED-MEMORY PROCESS SPLIT
+└── 5. BENCHMARK: 10^7 RANDOM GATHERS
+
+🔍 CORE CONCEPT:
+batch_operations in 3.10.0 sorts its indices and then reads the values
+in sorted order, which loses the mapping back to the caller's order. An
+IndexPlan keeps that mapping: the sorted, de-duplicated indices are read
+once, in memory order, and a precomputed inverse permutation puts each
+value back where the caller asked for it. The plan is computed once and
+reused for every column gathered with the same index set.
+"""
+
+import array
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
+from multiprocessing import shared_memory
+
+# =============================================================================
+# 1. INDEX VALIDATION & NORMALISATION - FOUNDATION
+# =============================================================================
+
+"""
+ONE PASS, THEN TRUST:
+Indices are checked once per call with min() and max() (two C-level scans)
+instead of one bounds check per Python-level access. Negative indices count
+from the end, as with list indexing. Everything downstream works on an
+array('q') of non-negative positions.
+
+C-LEVEL LOOPS:
+    gather   list(map(seq.__getitem__, indices))
+    scatter  deque(map(seq.__setitem__, indices, values), maxlen=0)
+
+deque(..., maxlen=0) consumes an iterator in C without storing anything,
+so the scatter runs without a Python-level for loop.
+"""
+
+DENSE_PLAN_FACTOR = 4               # dense lookup tables when length <= 4 * len(indices)
+DEFAULT_PARALLEL_WORKERS = 4
+PARALLEL_MIN_CHUNK = 250_000
+
+# Benchmark configuration
+BENCHMARK_GATHERS = 1_000_000
+FULL_BENCHMARK_GATHERS = 10_000_000
+BENCHMARK_DISTINCT = 1_000          # distinct indices in the duplicate-heavy case
+
+
+def _consume(iterator):
+    deque(iterator, maxlen=0)
+
+
+def normalize_indices(indices, length):
+    """Validated array('q') of non-negative positions (negative indices count from the end)."""
+    if not isinstance(indices, array.array) or indices.typecode != 'q':
+        indices = array.array('q', indices)
+    if not indices:
+        return indices
+    low, high = min(indices), max(indices)
+    if low < -length or high >= length:
+        raise IndexError("index out of range")
+    if low < 0:
+        indices = array.array('q', (i + length if i < 0 else i for i in indices))
+    return indices
+
+
+def _like(seq, values):
+    """Container of the same kind as seq (array keeps its typecode)."""
+    if isinstance(seq, array.array):
+        return array.array(seq.typecode, values)
+    return list(values)
+
+
+# =============================================================================
+# 2. IndexPlan - SORTED UNIQUE INDICES & INVERSE PERMUTATION
+# =============================================================================
+
+"""
+WHAT A PLAN HOLDS:
+    unique    sorted distinct positions        read in memory order
+    inverse   position of each request in unique   restores caller order
+    last      for each unique position, the last request that named it
+              (put uses it: last write wins)
+
+DENSE BUILD (length <= DENSE_PLAN_FACTOR * requests), no sorting at all:
+    last_at[i]   = last request naming i     one C-level scatter of range(n)
+    unique       = positions with last_at >= 0, in order   (compress)
+    rank[i]      = slot of i in unique      one more C-level scatter
+    inverse      = rank gathered by the requests
+
+SPARSE BUILD (few requests into a huge sequence): sorted(set(...)) plus dicts.
+
+WHEN IT PAYS:
+Restoring the caller's order is itself a random gather, so in CPython a
+plan used once for distinct random indices costs more than the plain
+gather it replaces. A plan pays off when it is reused (several columns, the
+same rows) or when indices repeat, because each distinct value is then read
+(and for arrays, boxed) only once. take/put therefore accept either raw
+indices (direct C-level loops) or an IndexPlan.
+"""
+
+
+class IndexPlan:
+    """Precomputed sorted/de-duplicated access plan for one index set."""
+
+    __slots__ = ('length', 'indices', 'unique', 'inverse', 'last')
+
+    def __init__(self, indices, length):
+        indices = normalize_indices(indices, length)
+        self.length = length
+        self.indices = indices
+        count = len(indices)
+        if length <= DENSE_PLAN_FACTOR * count:
+            last_at = array.array('q', [-1]) * length
+            _consume(map(last_at.__setitem__, indices, range(count)))
+            unique = array.array('q', compress(range(length), map((-1).__lt__, last_at)))
+            rank = array.array('q', [0]) * length
+            _consume(map(rank.__setitem__, unique, range(len(unique))))
+            last = array.array('q', map(last_at.__getitem__, unique))
+            inverse = array.array('q', map(rank.__getitem__, indices))
+        else:
+            last_at = dict(zip(indices, range(count)))
+            unique = array.array('q', sorted(last_at))
+            rank = dict(zip(unique, range(len(unique))))
+            last = array.array('q', map(last_at.__getitem__, unique))
+            inverse = array.array('q', map(rank.__getitem__, indices))
+        self.unique = unique
+        self.inverse = inverse
+        self.last = last
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def duplicates(self):
+        """Number of requests that repeat an earlier index."""
+        return len(self.indices) - len(self.unique)
+
+    def take(self, seq):
+        """Gather seq at the planned indices, in the caller's order."""
+        if len(seq) != self.length:
+            raise ValueError(f"plan built for length {self.length}, got {len(seq)}")
+        gathered = list(map(seq.__getitem__, self.unique))
+        return _like(seq, map(gathered.__getitem__, self.inverse))
+
+    def put(self, seq, values):
+        """Scatter values into seq (sorted order, one write per index, last wins)."""
+        if len(seq) != self.length:
+            raise ValueError(f"plan built for length {self.length}, got {len(seq)}")
+        if len(values) != len(self.indices):
+            raise ValueError("values must match the number of indices")
+        _consume(map(seq.__setitem__, self.unique, map(values.__getitem__, self.last)))
+        return seq
+
+    def __repr__(self):
+        return (f"IndexPlan(requests={len(self.indices):,}, unique={len(self.unique):,}, "
+                f"length={self.length:,})")
+
+
+# =============================================================================
+# 3. take / put
+# =============================================================================
+
+"""
+API:
+    take(seq, indices)          -> list for lists, array of seq.typecode for arrays
+    put(seq, indices, values)   -> writes into seq in place and returns it
+
+indices may be any iterable of ints or an IndexPlan built for len(seq).
+Repeated indices in put: the last value wins, with or without a plan.
+"""
+
+
+def take(seq, indices):
+    """Values of seq at indices, in the order requested."""
+    if isinstance(indices, IndexPlan):
+        return indices.take(seq)
+    indices = normalize_indices(indices, len(seq))
+    return _like(seq, map(seq.__getitem__, indices))
+
+
+def put(seq, indices, values):
+    """Write values to seq at indices in place (last write wins); returns seq."""
+    if isinstance(indices, IndexPlan):
+        return indices.put(seq, values)
+    indices = normalize_indices(indices, len(seq))
+    if len(values) != len(indices):
+        raise ValueError("values must match the number of indices")
+    _consume(map(seq.__setitem__, indices, values))
+    return seq
+
+
+# =============================================================================
+# 4. SHARED-MEMORY PROCESS SPLIT
+# =============================================================================
+
+"""
+TYPED ARRAYS ONLY:
+A list holds pointers to Python objects that other processes cannot see,
+but a typed array is plain bytes. SharedArray puts those bytes in a
+multiprocessing.shared_memory block; workers attach by name, cast a
+memoryview to the typecode and read or write their part directly.
+
+take_parallel: each worker gathers one contiguous chunk of the requests and
+writes it straight into the shared output at the same positions.
+
+put_parallel: the IndexPlan splits its sorted unique indices into contiguous
+chunks, so workers write disjoint positions and last-write-wins still holds
+without any locking.
+
+On a single core the workers only add start-up and copy costs; the split
+only pays off with real parallel hardware and very large index sets.
+"""
+
+
+class SharedArray:
+    """A typed array whose storage lives in a shared_memory block."""
+
+    def __init__(self, typecode, length, name=None):
+        itemsize = array.array(typecode).itemsize
+        self.typecode = typecode
+        self.length = length
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(1, length * itemsize))
+            self._owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self.view = self.shm.buf[:length * itemsize].cast(typecode)
+
+    @classmethod
+    def from_array(cls, values):
+        """Copy an array.array into a new shared block."""
+        shared = cls(values.typecode, len(values))
+        shared.view[:] = values
+        return shared
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def to_array(self):
+        """Copy the shared contents back into a private array.array."""
+        return array.array(self.typecode, self.view.tobytes())
+
+    def close(self):
+        """Detach (and, for the creator, free) the shared block."""
+        self.view.release()
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _take_worker(source, indices, output, start, stop):
+    """Gather requests [start, stop) from source into output (all shared, by name)."""
+    src = SharedArray(*source)
+    idx = SharedArray(*indices)
+    out = SharedArray(*output)
+    try:
+        out.view[start:stop] = array.array(src.typecode, map(src.view.__getitem__, idx.view[start:stop]))
+    finally:
+        for shared in (src, idx, out):
+            shared.close()
+    return stop - start
+
+
+def _put_worker(target, positions, values, sources, start, stop):
+    """Write unique positions [start, stop) of a plan into target (all shared, by name)."""
+    dst = SharedArray(*target)
+    pos = SharedArray(*positions)
+    val = SharedArray(*values)
+    src = SharedArray(*sources)
+    try:
+        _consume(map(dst.view.__setitem__, pos.view[start:stop],
+                     map(val.view.__getitem__, src.view[start:stop])))
+    finally:
+        for shared in (dst, pos, val, src):
+            shared.close()
+    return stop - start
+
+
+def _chunks(count, workers):
+    size = max(PARALLEL_MIN_CHUNK, -(-count // workers))
+    return [(start, min(count, start + size)) for start in range(0, count, size)]
+
+
+def take_parallel(source, indices, workers=DEFAULT_PARALLEL_WORKERS):
+    """take() for typed arrays, split across worker processes over shared memory."""
+    if not isinstance(source, array.array):
+        raise TypeError("take_parallel needs an array.array source")
+    indices = normalize_indices(indices, len(source))
+    with SharedArray.from_array(source) as src, SharedArray.from_array(indices) as idx, \
+            SharedArray(source.typecode, len(indices)) as out:
+        spec = lambda shared: (shared.typecode, shared.length, shared.name)  # noqa: E731
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_take_worker, spec(src), spec(idx), spec(out), start, stop)
+                       for start, stop in _chunks(len(indices), workers)]
+            for future in futures:
+                future.result()
+        return out.to_array()
+
+
+def put_parallel(target, indices, values, workers=DEFAULT_PARALLEL_WORKERS):
+    """put() for typed arrays: plan-partitioned disjoint writes in worker processes."""
+    if not isinstance(target, array.array):
+        raise TypeError("put_parallel needs an array.array target")
+    plan = indices if isinstance(indices, IndexPlan) else IndexPlan(indices, len(target))
+    if len(values) != len(plan.indices):
+        raise ValueError("values must match the number of indices")
+    values = values if isinstance(values, array.array) else array.array(target.typecode, values)
+    with SharedArray.from_array(target) as dst, SharedArray.from_array(plan.unique) as pos, \
+            SharedArray.from_array(values) as val, SharedArray.from_array(plan.last) as src:
+        spec = lambda shared: (shared.typecode, shared.length, shared.name)  # noqa: E731
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_put_worker, spec(dst), spec(pos), spec(val), spec(src), start, stop)
+                       for start, stop in _chunks(len(plan.unique), workers)]
+            for future in futures:
+                future.result()
+        target[:] = dst.to_array()
+    return target
+
+
+# =============================================================================
+# 5. BENCHMARK: 10^7 RANDOM GATHERS
+# =============================================================================
+
+def batch_access(test_data, indices_to_access):
+    """Reference from 3.10.0 batch_operations: list comprehension gather."""
+    return [test_data[idx] for idx in indices_to_access]
+
+
+def scatter_loop(seq, indices, values):
+    """Reference scatter: one Python-level assignment per request."""
+    for index, value in zip(indices, values):
+        seq[index] = value
+    return seq
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def benchmark_gather_scatter(gathers=BENCHMARK_GATHERS, workers=2, parallel=True):
+    """Gathers/s and scatters/s for lists and arrays, direct vs planned vs processes."""
+    rng = random.Random(42)
+    length = gathers
+    as_list = list(range(length))
+    as_array = array.array('d', map(float, as_list))
+    indices = array.array('q', [rng.randrange(length) for _ in range(gathers)])
+    results = {'gathers': gathers}
+
+    def rate(elapsed):
+        return gathers / elapsed if elapsed else float('inf')
+
+    baseline_time, expected = _timed(lambda: batch_access(as_list, indices))
+    results['list_comprehension_per_s'] = rate(baseline_time)
+
+    direct_time, direct = _timed(lambda: take(as_list, indices))
+    results['list_take_per_s'] = rate(direct_time)
+
+    plan_time, plan = _timed(lambda: IndexPlan(indices, length))
+    results['plan_build_s'] = plan_time
+    planned_time, planned = _timed(lambda: take(as_array, plan))
+    results['array_take_planned_per_s'] = rate(planned_time)
+    array_time, gathered = _timed(lambda: take(as_array, indices))
+    results['array_take_per_s'] = rate(array_time)
+    results['gathers_match'] = (expected == direct and list(map(float, expected)) == list(planned)
+                                == list(gathered))
+
+    hot = array.array('q', [rng.randrange(BENCHMARK_DISTINCT) * (length // BENCHMARK_DISTINCT)
+                            for _ in range(gathers)])
+    hot_plan = IndexPlan(hot, length)
+    hot_direct_time, hot_direct = _timed(lambda: take(as_array, hot))
+    hot_planned_time, hot_planned = _timed(lambda: take(as_array, hot_plan))
+    results['duplicate_heavy_direct_per_s'] = rate(hot_direct_time)
+    results['duplicate_heavy_planned_per_s'] = rate(hot_planned_time)
+    results['duplicate_heavy_match'] = hot_direct == hot_planned
+
+    values = array.array('d', repeat(-1.0, gathers))
+    loop_time, _ = _timed(lambda: scatter_loop(array.array('d', as_array), indices, values))
+    put_time, _ = _timed(lambda: put(array.array('d', as_array), indices, values))
+    results['scatter_loop_per_s'] = rate(loop_time)
+    results['put_per_s'] = rate(put_time)
+
+    if parallel:
+        parallel_time, parallel_result = _timed(lambda: take_parallel(as_array, indices, workers))
+        results['take_parallel_per_s'] = rate(parallel_time)
+        results['take_parallel_match'] = parallel_result == gathered
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_take_and_put():
+    """
+    TAKE/PUT DEMONSTRATION
+    Gather and scatter on lists and typed arrays
+    """
+
+    letters = list('abcdefghij')
+    readings = array.array('i', range(100, 110))
+    results = {
+        'take_list': take(letters, [7, 0, -1, 3, 3]),
+        'take_array': take(readings, (9, 2, 2, 5)),
+        'put_list': put(list(letters), [0, 9, 0], ['X', 'Z', 'Y']),
+        'put_array': put(array.array('i', readings), [1, 1, 8], [-1, -2, -3]),
+    }
+    for name, value in results.items():
+        print(f"   {name:>10}: {value}")
+    print("   repeated indices in put: the last value wins")
+    try:
+        take(letters, [10])
+    except IndexError as error:
+        print(f"   out of range: IndexError({error})")
+    return results
+
+
+def demonstrate_index_plan():
+    """
+    INDEX PLAN DEMONSTRATION
+    Sorted unique reads with the caller's order restored
+    """
+
+    requests = [42, 7, 42, 19, 3, 7, 42]
+    plan = IndexPlan(requests, 50)
+    print(f"   {plan}")
+    print(f"   requests: {requests}")
+    print(f"   unique (read order): {plan.unique.tolist()}")
+    print(f"   inverse permutation: {plan.inverse.tolist()}")
+    print(f"   last occurrence per unique: {plan.last.tolist()}")
+
+    columns = {'id': list(range(50)), 'score': array.array('d', (i * 1.5 for i in range(50)))}
+    gathered = {name: take(column, plan) for name, column in columns.items()}
+    print(f"   reused for two columns: ids={gathered['id']}")
+    print(f"                           scores={gathered['score'].tolist()}")
+
+    sparse = IndexPlan([10**9 - 1, 5, 5], 10**9)
+    print(f"   sparse plan (sort/dict build): unique={sparse.unique.tolist()}")
+    return {'plan': repr(plan), 'gathered': len(gathered), 'duplicates': plan.duplicates}
+
+
+def demonstrate_shared_memory_split():
+    """
+    SHARED MEMORY DEMONSTRATION
+    Worker processes gather and scatter over shared_memory blocks
+    """
+
+    source = array.array('d', (i * 0.5 for i in range(1_000_000)))
+    rng = random.Random(7)
+    indices = array.array('q', [rng.randrange(len(source)) for _ in range(600_000)])
+    gathered = take_parallel(source, indices, workers=2)
+    print(f"   take_parallel: {len(gathered):,} values, matches take(): {gathered == take(source, indices)}")
+
+    values = array.array('d', range(len(indices)))
+    expected = put(array.array('d', source), indices, values)
+    scattered = put_parallel(array.array('d', source), indices, values, workers=2)
+    print(f"   put_parallel (disjoint plan chunks): matches put(): {scattered == expected}")
+    return {'gathered': len(gathered), 'scatter_match': scattered == expected}
+
+
+def demonstrate_gather_benchmarks(gathers=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 10^7 random gathers
+    """
+
+    if gathers is None:
+        gathers = FULL_BENCHMARK_GATHERS if '--full' in sys.argv else BENCHMARK_GATHERS
+    results = benchmark_gather_scatter(gathers)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute gather/scatter demonstrations
+    Pass --full for the 10^7-gather benchmark
+    """
+
+    print("🎯 PYTHON INDEXING - GATHER/SCATTER BATCH INDEXING")
+    print("=" * 60)
+
+    sections = [
+        ("Take And Put", demonstrate_take_and_put),
+        ("Index Plan", demonstrate_index_plan),
+        ("Shared Memory Split", demonstrate_shared_memory_split),
+        ("Gather Benchmarks", demonstrate_gather_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,660 @@
+""" 3.10.5_Python_IDX_MATERIALIZED_SLICES.py """
+
+# =============================================================================
+# PYTHON INDEXING - MATERIALIZED SLICES OVER GROWING SEQUENCES
+# =============================================================================
+# Version: 3.10.5 | Educational Excellence Target: 9.5/10
+# Purpose: Keep hot slices and their aggregates up to date as data arrives
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Turn the "precompute data[-n:]" trick into a reusable, self-updating helper
+✓ Maintain tail-N, head-N and every-k slices incrementally on append
+✓ Keep running count, sum, mean, min and max in O(1) per append and per read
+✓ Use monotonic deques for sliding min/max and periodic fsum re-anchoring
+✓ Benchmark dashboard-style reads against re-slicing and re-summing
+
+🚀 QUICK NAVIGATION:
+├── 1. RUNNING AGGREGATES (FOUNDATION)
+├── 2. SLICE VIEWS: TAIL, HEAD, EVERY-K
+├── 3. MaterializedSeries (WATCHING A GROWING LIST OR ARRAY)
+├── 4. DASHBOARD READ PATTERNS
+└── 5. BENCHMARK VS RE-SLICING
+
+🔍 CORE CONCEPT:
+precomputation_strategies in 3.10.0 shows that computing data[-n:] once
+beats computing it on every read, but the precomputed slice goes stale as
+soon as the data grows. A materialized slice is updated by every append
+instead: the new value enters, the oldest leaves, and the sum, min and
+max are adjusted. A read is then a cached value, however long the
+history or the window.
+"""
+
+import array
+import math
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+# =============================================================================
+# 1. RUNNING AGGREGATES - FOUNDATION
+# =============================================================================
+
+"""
+APPEND-ONLY AGGREGATES:
+When values are only ever added (a head slice filling up, an every-k
+sample), count, sum, min and max each update with one comparison or one
+addition. RunningAggregate holds those values plus the slice itself.
+
+SHARED READ INTERFACE (every view):
+    count, sum, mean, min, max     O(1) properties
+    values()                       the slice as a list, cached until it changes
+    aggregates()                   all of the above as a dict
+"""
+
+DEFAULT_REANCHOR = None             # tail views: re-sum exactly every `size` evictions
+
+# Benchmark configuration
+BENCHMARK_READS = 50_000
+FULL_BENCHMARK_READS = 1_000_000
+BENCHMARK_WINDOWS = (100, 1_000, 10_000)
+BENCHMARK_READS_PER_APPEND = 10
+RESLICE_ELEMENT_BUDGET = 20_000_000  # caps re-slicing reads for large windows
+
+
+class SliceView:
+    """Common read interface for materialized slices."""
+
+    __slots__ = ('_count', '_sum', '_min', '_max', '_cached')
+
+    def __init__(self):
+        self._count = 0
+        self._sum = 0
+        self._min = None
+        self._max = None
+        self._cached = None
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def sum(self):
+        return self._sum
+
+    @property
+    def mean(self):
+        return self._sum / self._count if self._count else None
+
+    @property
+    def min(self):
+        return self._min
+
+    @property
+    def max(self):
+        return self._max
+
+    def values(self):
+        """The slice as a list (cached until the next change)."""
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = self._materialize()
+        return cached
+
+    def aggregates(self):
+        return {'count': self.count, 'sum': self.sum, 'mean': self.mean,
+                'min': self.min, 'max': self.max}
+
+    def _materialize(self):
+        raise NotImplementedError
+
+    def empty_copy(self):
+        """A new, empty view with the same parameters (used by rebuild())."""
+        raise NotImplementedError
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.aggregates()})"
+
+
+class RunningAggregate(SliceView):
+    """Append-only slice with running count/sum/min/max."""
+
+    __slots__ = ('_values',)
+
+    def __init__(self):
+        super().__init__()
+        self._values = []
+
+    def push(self, value):
+        self._values.append(value)
+        self._count += 1
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+        self._cached = None
+
+    def extend(self, values):
+        values = list(values)
+        if not values:
+            return
+        self._values.extend(values)
+        self._count += len(values)
+        self._sum += sum(values)
+        low, high = min(values), max(values)
+        self._min = low if self._min is None else min(self._min, low)
+        self._max = high if self._max is None else max(self._max, high)
+        self._cached = None
+
+    def _materialize(self):
+        return list(self._values)
+
+    def empty_copy(self):
+        return RunningAggregate()
+
+
+# =============================================================================
+# 2. SLICE VIEWS: TAIL, HEAD, EVERY-K
+# =============================================================================
+
+"""
+TAIL-N (sliding window):
+A deque(maxlen=n) holds the window. When it is full, the oldest value leaves
+as the new one enters: sum += new - old. min and max come from monotonic
+deques of (position, value) pairs: entries that can never be the answer
+again are dropped from the back, and expired positions from the front, so
+each value is pushed and popped at most once - O(1) amortised.
+
+Float sums drift when values are added and subtracted for ever, so the sum
+is recomputed exactly with math.fsum every n evictions. That costs O(1)
+amortised per append and keeps the error bounded by one window.
+
+HEAD-N:
+Collects the first n values, then ignores the rest.
+
+EVERY-K:
+Samples positions offset, offset + k, ...; with limit=m it keeps only the
+latest m samples (a tail over the sampled stream).
+"""
+
+
+class TailView(SliceView):
+    """The last `size` values with O(1) sum/mean/min/max."""
+
+    __slots__ = ('size', '_window', '_mins', '_maxes', '_position', '_evictions', '_reanchor')
+
+    def __init__(self, size, reanchor=DEFAULT_REANCHOR):
+        if size < 1:
+            raise ValueError("tail size must be positive")
+        super().__init__()
+        self.size = size
+        self._window = deque(maxlen=size)
+        self._mins = deque()
+        self._maxes = deque()
+        self._position = 0
+        self._evictions = 0
+        self._reanchor = reanchor or size
+
+    def push(self, value):
+        window = self._window
+        if len(window) == self.size:
+            self._sum += value - window[0]
+            self._evictions += 1
+            if self._evictions >= self._reanchor:
+                window.append(value)
+                self._sum = math.fsum(window) if isinstance(value, float) else sum(window)
+                self._evictions = 0
+            else:
+                window.append(value)
+        else:
+            window.append(value)
+            self._sum += value
+            self._count += 1
+
+        position = self._position
+        self._position = position + 1
+        expired = position - self.size
+
+        mins = self._mins
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((position, value))
+        if mins[0][0] <= expired:
+            mins.popleft()
+
+        maxes = self._maxes
+        while maxes and maxes[-1][1] <= value:
+            maxes.pop()
+        maxes.append((position, value))
+        if maxes[0][0] <= expired:
+            maxes.popleft()
+
+        self._cached = None
+
+    def extend(self, values):
+        values = list(values)
+        if len(values) >= self.size:
+            # The new values replace the whole window: rebuild directly
+            self._reset(values[-self.size:], self._position + len(values) - self.size)
+            return
+        push = self.push
+        for value in values:
+            push(value)
+
+    def _reset(self, window_values, first_position):
+        self._window = deque(window_values, maxlen=self.size)
+        self._count = len(window_values)
+        self._sum = (math.fsum(window_values) if window_values and isinstance(window_values[0], float)
+                     else sum(window_values))
+        self._mins = deque()
+        self._maxes = deque()
+        for offset, value in enumerate(window_values):
+            position = first_position + offset
+            while self._mins and self._mins[-1][1] >= value:
+                self._mins.pop()
+            self._mins.append((position, value))
+            while self._maxes and self._maxes[-1][1] <= value:
+                self._maxes.pop()
+            self._maxes.append((position, value))
+        self._position = first_position + len(window_values)
+        self._evictions = 0
+        self._cached = None
+
+    @property
+    def min(self):
+        return self._mins[0][1] if self._mins else None
+
+    @property
+    def max(self):
+        return self._maxes[0][1] if self._maxes else None
+
+    def _materialize(self):
+        return list(self._window)
+
+    def empty_copy(self):
+        return TailView(self.size, self._reanchor)
+
+
+class HeadView(RunningAggregate):
+    """The first `size` values; later values are ignored."""
+
+    __slots__ = ('size',)
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("head size must be positive")
+        super().__init__()
+        self.size = size
+
+    def push(self, value):
+        if self._count < self.size:
+            super().push(value)
+
+    def extend(self, values):
+        remaining = self.size - self._count
+        if remaining > 0:
+            super().extend(islice(values, remaining))
+
+    def empty_copy(self):
+        return HeadView(self.size)
+
+
+class EveryKView(SliceView):
+    """Every k-th value from `offset` on, optionally only the latest `limit` samples."""
+
+    __slots__ = ('k', 'offset', 'limit', '_inner', '_next_position')
+
+    def __init__(self, k, offset=0, limit=None):
+        if k < 1 or offset < 0:
+            raise ValueError("k must be positive and offset non-negative")
+        super().__init__()
+        self.k = k
+        self.offset = offset
+        self.limit = limit
+        self._inner = TailView(limit) if limit else RunningAggregate()
+        self._next_position = 0
+
+    def push(self, value):
+        position = self._next_position
+        self._next_position = position + 1
+        if position >= self.offset and (position - self.offset) % self.k == 0:
+            self._inner.push(value)
+
+    def extend(self, values):
+        values = list(values)
+        start = self._next_position
+        self._next_position = start + len(values)
+        first = self.offset if start <= self.offset else start + (-(start - self.offset)) % self.k
+        if first - start < len(values):
+            self._inner.extend(islice(values, first - start, None, self.k))
+
+    count = property(lambda self: self._inner.count)
+    sum = property(lambda self: self._inner.sum)
+    mean = property(lambda self: self._inner.mean)
+    min = property(lambda self: self._inner.min)
+    max = property(lambda self: self._inner.max)
+
+    def values(self):
+        return self._inner.values()
+
+    def empty_copy(self):
+        return EveryKView(self.k, self.offset, self.limit)
+
+    def __len__(self):
+        return self._inner.count
+
+
+def tail(size):
+    """Factory: materialized data[-size:]."""
+    return TailView(size)
+
+
+def head(size):
+    """Factory: materialized data[:size]."""
+    return HeadView(size)
+
+
+def every(k, offset=0, limit=None):
+    """Factory: materialized data[offset::k] (optionally only the last `limit` samples)."""
+    return EveryKView(k, offset, limit)
+
+
+# =============================================================================
+# 3. MaterializedSeries - WATCHING A GROWING LIST OR ARRAY
+# =============================================================================
+
+"""
+TWO WAYS TO GROW:
+    series.append(x) / series.extend(xs)   update the data and every view
+    data.append(x) elsewhere, then read    views notice len(data) grew and
+                                           catch up on the new tail
+                                           (one len() check per read)
+
+The data must only grow at the end: slices and aggregates describe the
+values seen so far, and the series cannot see edits in the middle. Call
+rebuild() after such edits.
+
+Views added to a series that already holds data are filled from it at once.
+"""
+
+
+class MaterializedSeries:
+    """A growing list/array with named, incrementally maintained slices."""
+
+    def __init__(self, data=None, **views):
+        self.data = data if data is not None else []
+        self._views = {}
+        self._seen = 0
+        for name, view in views.items():
+            self.add_view(name, view)
+
+    def add_view(self, name, view):
+        """Register a slice view and fill it from the existing data."""
+        self._sync()
+        view.extend(self.data)
+        self._views[name] = view
+        return view
+
+    def remove_view(self, name):
+        return self._views.pop(name)
+
+    def _sync(self):
+        length = len(self.data)
+        if length != self._seen:
+            if length < self._seen:
+                raise RuntimeError("data shrank; call rebuild()")
+            new_values = self.data[self._seen:length]
+            self._seen = length
+            for view in self._views.values():
+                view.extend(new_values)
+
+    def append(self, value):
+        """Append to the data and update every view."""
+        if len(self.data) != self._seen:
+            self._sync()
+        self.data.append(value)
+        self._seen += 1
+        for view in self._views.values():
+            view.push(value)
+
+    def extend(self, values):
+        """Extend the data and update every view in bulk."""
+        if len(self.data) != self._seen:
+            self._sync()
+        values = list(values)
+        self.data.extend(values)
+        self._seen += len(values)
+        for view in self._views.values():
+            view.extend(values)
+
+    def rebuild(self):
+        """Recreate every view from scratch (after non-append edits)."""
+        views = self._views
+        self._views = {}
+        self._seen = len(self.data)
+        for name, view in views.items():
+            self.add_view(name, view.empty_copy())
+
+    def __getitem__(self, name):
+        if len(self.data) != self._seen:
+            self._sync()
+        return self._views[name]
+
+    def __len__(self):
+        return len(self.data)
+
+    def aggregates(self):
+        """{view name: aggregates dict} for every view."""
+        if len(self.data) != self._seen:
+            self._sync()
+        return {name: view.aggregates() for name, view in self._views.items()}
+
+
+# =============================================================================
+# 4. DASHBOARD READ PATTERNS
+# =============================================================================
+
+"""
+READ-HEAVY, APPEND-LIGHT:
+A dashboard polls "mean and max of the last N samples" far more often than
+new samples arrive. With re-slicing every poll costs O(N) twice (slice
+copy, then sum); with a materialized tail every poll is a few attribute
+loads, and the O(1) update work moves to the append.
+"""
+
+
+def frequent_tail_access_naive(data, n, iterations=100):
+    """3.10.0 reference: compute the slice and its sum on every access."""
+    total = 0
+    for _ in range(iterations):
+        tail_values = data[-n:]
+        total += sum(tail_values)
+    return total
+
+
+def dashboard_poll(series, name):
+    """One dashboard refresh: the aggregates of a named slice."""
+    view = series[name]
+    return view.mean, view.min, view.max
+
+
+def dashboard_poll_naive(data, n):
+    """The same refresh done by re-slicing."""
+    window = data[-n:]
+    return sum(window) / len(window), min(window), max(window)
+
+
+# =============================================================================
+# 5. BENCHMARK VS RE-SLICING
+# =============================================================================
+
+def benchmark_materialized_slices(reads=BENCHMARK_READS, windows=BENCHMARK_WINDOWS,
+                                  reads_per_append=BENCHMARK_READS_PER_APPEND):
+    """Polls per second: re-slicing vs a materialized tail, with interleaved appends."""
+    results = {'reads': reads, 'reads_per_append': reads_per_append}
+    history = [((i * 7919) % 10_007) / 10.0 for i in range(max(windows) * 2)]
+
+    for n in windows:
+        naive_data = array.array('d', history)
+        series = MaterializedSeries(array.array('d', history), latest=tail(n))
+
+        naive_reads = min(reads, max(1_000, RESLICE_ELEMENT_BUDGET // n))
+        start = time.perf_counter()
+        for i in range(naive_reads):
+            if i % reads_per_append == 0:
+                naive_data.append(i * 0.5)
+            naive = dashboard_poll_naive(naive_data, n)
+        naive_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(reads):
+            if i % reads_per_append == 0:
+                series.append(i * 0.5)
+            materialized = dashboard_poll(series, 'latest')
+            if i + 1 == naive_reads:
+                checkpoint = materialized
+        materialized_time = time.perf_counter() - start
+
+        naive_rate = naive_reads / naive_time
+        materialized_rate = reads / materialized_time
+        results[f'tail{n}_reslice_reads_per_s'] = naive_rate
+        results[f'tail{n}_materialized_reads_per_s'] = materialized_rate
+        results[f'tail{n}_speedup'] = materialized_rate / naive_rate
+        results[f'tail{n}_matches'] = (
+            math.isclose(naive[0], checkpoint[0], rel_tol=1e-12) and naive[1:] == checkpoint[1:])
+
+    appends = min(reads, 200_000)
+    series = MaterializedSeries(array.array('d'), latest=tail(1_000), first=head(100),
+                                sampled=every(60, limit=500))
+    start = time.perf_counter()
+    for i in range(appends):
+        series.append(float(i % 977))
+    results['appends_per_s_three_views'] = appends / (time.perf_counter() - start)
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_slice_views():
+    """
+    SLICE VIEW DEMONSTRATION
+    Tail, head and every-k slices updated on append
+    """
+
+    series = MaterializedSeries(list(range(1, 11)), last3=tail(3), first4=head(4),
+                                odd_positions=every(2, offset=1))
+    for value in (11, 12, 13):
+        series.append(value)
+
+    results = {}
+    for name in ('last3', 'first4', 'odd_positions'):
+        view = series[name]
+        results[name] = view.values()
+        print(f"   {name:>13}: {view.values()}  sum={view.sum} mean={view.mean:.2f} "
+              f"min={view.min} max={view.max}")
+    print(f"   matches slicing: {series['last3'].values() == series.data[-3:]}, "
+          f"{series['first4'].values() == series.data[:4]}, "
+          f"{series['odd_positions'].values() == series.data[1::2]}")
+    return results
+
+
+def demonstrate_watching_data():
+    """
+    WATCHED DATA DEMONSTRATION
+    Appends made directly to the list are picked up on the next read
+    """
+
+    metrics = []
+    series = MaterializedSeries(metrics, latest=tail(5), hourly=every(60, limit=3))
+    metrics.extend(float(minute % 17) for minute in range(240))     # writer bypasses the series
+    latest = series['latest']
+    print(f"   after 240 direct appends: latest={latest.values()} max={latest.max}")
+    print(f"   hourly samples (last 3): {series['hourly'].values()}")
+    series.extend([100.0, 1.0])
+    print(f"   after series.extend: latest={series['latest'].values()} max={series['latest'].max}")
+    return series.aggregates()
+
+
+def demonstrate_float_drift_control():
+    """
+    FLOAT DRIFT DEMONSTRATION
+    Periodic fsum re-anchoring keeps sliding float sums exact
+    """
+
+    series = MaterializedSeries(array.array('d'), anchored=tail(100),
+                                unanchored=TailView(100, reanchor=sys.maxsize))
+    values = [1e16 if i % 1000 == 0 else 0.1 for i in range(100_000)]
+    series.extend(values[:1])
+    for value in values[1:]:
+        series.append(value)
+    exact = math.fsum(values[-100:])
+    anchored = series['anchored'].sum
+    unanchored = series['unanchored'].sum
+    print(f"   exact fsum of the last 100 values: {exact!r}")
+    print(f"   sliding sum, re-anchored every 100 evictions: {anchored!r}")
+    print(f"   sliding sum, never re-anchored:               {unanchored!r}")
+    return {'exact': exact, 'anchored': anchored, 'unanchored': unanchored}
+
+
+def demonstrate_materialized_benchmarks(reads=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 1,000,000 dashboard reads per window size
+    """
+
+    if reads is None:
+        reads = FULL_BENCHMARK_READS if '--full' in sys.argv else BENCHMARK_READS
+    results = benchmark_materialized_slices(reads)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute materialized slice demonstrations
+    Pass --full for the long read benchmark
+    """
+
+    print("🎯 PYTHON INDEXING - MATERIALIZED SLICES OVER GROWING SEQUENCES")
+    print("=" * 60)
+
+    sections = [
+        ("Slice Views", demonstrate_slice_views),
+        ("Watching Data", demonstrate_watching_data),
+        ("Float Drift Control", demonstrate_float_drift_control),
+        ("Materialized Benchmarks", demonstrate_materialized_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,658 @@
+""" 3.10.6_Python_IDX_BLOCKED_TRAVERSAL.py """
+
+# =============================================================================
+# PYTHON INDEXING - BLOCKED, TRANSPOSE-AWARE MATRIX TRAVERSAL
+# =============================================================================
+# Version: 3.10.6 | Educational Excellence Target: 9.5/10
+# Purpose: Traverse, transpose and reduce large flat matrices in cache-sized tiles
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Describe a 2-D matrix as (rows, cols, row_stride, col_stride, offset) over a flat array('d')
+✓ Iterate row-major, column-major and tile by tile with one slice per line segment
+✓ Transpose with blocked tiles, an auto-tuned tile size and a cache-oblivious recursion
+✓ Reduce columns with sequential scans instead of strided column walks
+✓ Benchmark every order and tile size on matrices up to 10^4 x 10^4
+
+🚀 QUICK NAVIGATION:
+├── 1. STRIDED 2-D MATRICES (FOUNDATION)
+├── 2. TILED TRAVERSAL
+├── 3. TRANSPOSE: COLUMN GATHER, BLOCKED, AUTO-TUNED, RECURSIVE
+├── 4. COLUMN REDUCTIONS WITH SEQUENTIAL SCANS
+└── 5. BENCHMARK ACROSS TILE SIZES AND ORDERS
+
+🔍 CORE CONCEPT:
+cache_friendly_patterns in 3.10.0 walks a 100x100 nested list one element
+at a time, so interpreter overhead hides any memory effect. Moving whole
+line segments with slices (data[start:stop:step]) runs the inner loop in
+C, and then memory layout starts to matter. A column walk of a 10^4 x 10^4
+matrix jumps 80 KB per element and touches a new page each time. Tiles
+keep the lines being read and written small enough to stay in cache.
+"""
+
+import array
+import sys
+import time
+from operator import add
+
+# =============================================================================
+# 1. STRIDED 2-D MATRICES - FOUNDATION
+# =============================================================================
+
+"""
+LAYOUT:
+Element (i, j) is data[offset + i*row_stride + j*col_stride].
+
+    contiguous row-major   row_stride = cols, col_stride = 1
+    transposed view (.T)   the two strides swapped - no data moves
+
+Strides must be positive. A row of any Matrix2D is one extended slice
+data[start:stop:col_stride], and a column is data[start:stop:row_stride].
+For a contiguous matrix the first is sequential memory and the second
+jumps a whole row per element.
+"""
+
+DEFAULT_TILE = 512
+TILE_CANDIDATES = (64, 128, 256, 512, 1024)
+TUNE_BAND_ROWS = 1024               # rows transposed per candidate while tuning
+DEFAULT_STRIP = 512                 # column strip width for strip reductions
+
+# Benchmark configuration
+BENCHMARK_SIZES = (1_000, 2_000)
+FULL_BENCHMARK_SIZES = (2_000, 10_000)
+NAIVE_LIMIT = 1_000                 # element-by-element baselines only up to this size
+
+
+def _stop(start, count, stride):
+    """Slice stop for `count` items from `start` with a positive `stride`."""
+    return start + (count - 1) * stride + 1 if count else start
+
+
+class Matrix2D:
+    """A 2-D strided view over a flat array.array."""
+
+    __slots__ = ('data', 'rows', 'cols', 'row_stride', 'col_stride', 'offset')
+
+    def __init__(self, data, rows, cols, row_stride=None, col_stride=1, offset=0):
+        row_stride = cols * col_stride if row_stride is None else row_stride
+        if min(row_stride, col_stride) < (1 if rows and cols else 0):    # empty: 0 is fine
+            raise ValueError("strides must be positive")
+        if rows and cols and offset + (rows - 1) * row_stride + (cols - 1) * col_stride >= len(data):
+            raise ValueError("buffer too small for this shape and strides")
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+        self.row_stride = row_stride
+        self.col_stride = col_stride
+        self.offset = offset
+
+    @classmethod
+    def zeros(cls, rows, cols, typecode='d'):
+        itemsize = array.array(typecode).itemsize
+        return cls(array.array(typecode, bytes(rows * cols * itemsize)), rows, cols)
+
+    @classmethod
+    def arange(cls, rows, cols, typecode='d'):
+        return cls(array.array(typecode, range(rows * cols)), rows, cols)
+
+    @classmethod
+    def from_nested(cls, nested, typecode='d'):
+        rows, cols = len(nested), len(nested[0]) if nested else 0
+        return cls(array.array(typecode, (value for row in nested for value in row)), rows, cols)
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def T(self):
+        """Transposed view (O(1): swaps the strides)."""
+        return Matrix2D(self.data, self.cols, self.rows, self.col_stride, self.row_stride, self.offset)
+
+    def is_contiguous(self):
+        return self.col_stride == 1 and self.row_stride == self.cols
+
+    def row(self, i):
+        start = self.offset + i * self.row_stride
+        return self.data[start:_stop(start, self.cols, self.col_stride):self.col_stride]
+
+    def column(self, j):
+        start = self.offset + j * self.col_stride
+        return self.data[start:_stop(start, self.rows, self.row_stride):self.row_stride]
+
+    def segment(self, i, c0, c1):
+        """Row i, columns [c0, c1), as one slice."""
+        start = self.offset + i * self.row_stride + c0 * self.col_stride
+        return self.data[start:_stop(start, c1 - c0, self.col_stride):self.col_stride]
+
+    def __getitem__(self, key):
+        i, j = key
+        return self.data[self.offset + i * self.row_stride + j * self.col_stride]
+
+    def copy(self):
+        """Contiguous row-major copy (transposed views go through the blocked transpose)."""
+        if self.is_contiguous():
+            start = self.offset
+            return Matrix2D(self.data[start:start + self.rows * self.cols], self.rows, self.cols)
+        if self.row_stride < self.col_stride:
+            return transpose_blocked(self.T)
+        result = array.array(self.data.typecode)
+        for i in range(self.rows):
+            result.extend(self.row(i))
+        return Matrix2D(result, self.rows, self.cols)
+
+    def tolist(self):
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix2D) or other.shape != self.shape:
+            return NotImplemented
+        return all(self.row(i) == other.row(i) for i in range(self.rows))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"Matrix2D(shape={self.shape}, strides=({self.row_stride}, {self.col_stride}), "
+                f"offset={self.offset}, typecode='{self.data.typecode}')")
+
+
+# =============================================================================
+# 2. TILED TRAVERSAL
+# =============================================================================
+
+"""
+TILES:
+iter_tiles(matrix, tile) yields (r0, r1, c0, c1) bounds of tile x tile
+blocks, tile-row by tile-row. iter_tile_segments goes one level deeper and
+yields the row segment of every tile as a zero-copy memoryview (for
+contiguous array buffers) or a slice copy (strided ones), so any reduction
+can run per segment in C.
+
+ORDERS (traverse):
+    'row'      each row as one segment (sequential)
+    'column'   each column as one segment (stride = row_stride)
+    'tiled'    tile segments, tile by tile
+"""
+
+
+def iter_tiles(matrix, tile=DEFAULT_TILE):
+    """Yield (r0, r1, c0, c1) tile bounds in tile-row-major order."""
+    rows, cols = matrix.rows, matrix.cols
+    for r0 in range(0, rows, tile):
+        r1 = min(rows, r0 + tile)
+        for c0 in range(0, cols, tile):
+            yield r0, r1, c0, min(cols, c0 + tile)
+
+
+def iter_tile_segments(matrix, tile=DEFAULT_TILE):
+    """Yield the row segments of every tile, tile by tile."""
+    if matrix.col_stride == 1:
+        view = memoryview(matrix.data)
+        offset, row_stride = matrix.offset, matrix.row_stride
+        for r0, r1, c0, c1 in iter_tiles(matrix, tile):
+            for i in range(r0, r1):
+                start = offset + i * row_stride + c0
+                yield view[start:start + c1 - c0]
+    else:
+        segment = matrix.segment
+        for r0, r1, c0, c1 in iter_tiles(matrix, tile):
+            for i in range(r0, r1):
+                yield segment(i, c0, c1)
+
+
+def traverse(matrix, order='row', tile=DEFAULT_TILE):
+    """Iterator of line segments covering the matrix in the given order."""
+    if order == 'row':
+        return map(matrix.row, range(matrix.rows))
+    if order == 'column':
+        return map(matrix.column, range(matrix.cols))
+    if order == 'tiled':
+        return iter_tile_segments(matrix, tile)
+    raise ValueError(f"unknown order {order!r} (expected 'row', 'column' or 'tiled')")
+
+
+def matrix_sum(matrix, order='row', tile=DEFAULT_TILE):
+    """Sum of all elements, reading the matrix in the given order."""
+    return sum(map(sum, traverse(matrix, order, tile)))
+
+
+# =============================================================================
+# 3. TRANSPOSE: COLUMN GATHER, BLOCKED, AUTO-TUNED, RECURSIVE
+# =============================================================================
+
+"""
+FOUR WAYS TO BUILD out = matrix^T (contiguous, shape cols x rows):
+
+    naive        out[j*rows + i] = m[i, j], one element at a time
+    columns      out row j = m column j: one strided read per column
+    blocked      for each tile, each source row segment is written with one
+                 strided slice assignment into the output; the tile's
+                 destination lines stay in cache while the tile is done
+    recursive    split the larger dimension in half until a block has at
+                 most leaf elements, then transpose it like a tile
+                 (cache-oblivious: no tile size to choose, only a leaf
+                 size to cover Python's per-call overhead)
+
+AUTO-TUNING ON THE REAL PROBLEM:
+transpose_auto hands a band of source rows to each candidate tile size.
+A band is TUNE_BAND_ROWS rows, shrunk for smaller matrices so the probes
+cover at most half of the rows. The band is transposed into the real
+output, so no work is wasted, and its elements/second are measured. The
+fastest tile finishes the remaining rows and is remembered per (shape,
+strides, typecode), so later transposes of the same kind skip tuning.
+tuning_rates() returns the measured rates. A matrix with fewer than two
+rows per candidate is too small to probe and gets DEFAULT_TILE.
+"""
+
+_TUNED_TILES = {}
+_TUNING_RATES = {}
+
+
+def _empty_like(matrix, rows, cols):
+    return Matrix2D.zeros(rows, cols, matrix.data.typecode)
+
+
+def transpose_naive(matrix):
+    """Element-by-element transpose (reference)."""
+    rows, cols = matrix.rows, matrix.cols
+    result = _empty_like(matrix, cols, rows)
+    out = result.data
+    for i in range(rows):
+        for j in range(cols):
+            out[j * rows + i] = matrix[i, j]
+    return result
+
+
+def transpose_columns(matrix):
+    """Transpose by gathering each source column with one strided slice."""
+    rows, cols = matrix.rows, matrix.cols
+    result = _empty_like(matrix, cols, rows)
+    out = result.data
+    column = matrix.column
+    for j in range(cols):
+        out[j * rows:(j + 1) * rows] = column(j)
+    return result
+
+
+def _transpose_block(matrix, out, r0, r1, c0, c1):
+    """Write source block [r0:r1, c0:c1] transposed into contiguous out."""
+    rows = matrix.rows
+    data = matrix.data
+    row_stride, col_stride = matrix.row_stride, matrix.col_stride
+    width = c1 - c0
+    source = matrix.offset + r0 * row_stride + c0 * col_stride
+    source_span = (width - 1) * col_stride + 1
+    target = c0 * rows + r0
+    target_span = (width - 1) * rows + 1
+    for _ in range(r1 - r0):
+        out[target:target + target_span:rows] = data[source:source + source_span:col_stride]
+        source += row_stride
+        target += 1
+
+
+def _transpose_band(matrix, out, r0, r1, tile):
+    cols = matrix.cols
+    for c0 in range(0, cols, tile):
+        c1 = min(cols, c0 + tile)
+        for t0 in range(r0, r1, tile):
+            _transpose_block(matrix, out, t0, min(r1, t0 + tile), c0, c1)
+
+
+def transpose_blocked(matrix, tile=DEFAULT_TILE):
+    """Transpose tile by tile (tile x tile blocks)."""
+    result = _empty_like(matrix, matrix.cols, matrix.rows)
+    _transpose_band(matrix, result.data, 0, matrix.rows, tile)
+    return result
+
+
+def transpose_recursive(matrix, leaf=DEFAULT_TILE * DEFAULT_TILE):
+    """Cache-oblivious transpose: halve the larger side down to `leaf` elements."""
+    result = _empty_like(matrix, matrix.cols, matrix.rows)
+    out = result.data
+    stack = [(0, matrix.rows, 0, matrix.cols)]
+    while stack:
+        r0, r1, c0, c1 = stack.pop()
+        height, width = r1 - r0, c1 - c0
+        if height * width <= leaf or (height == 1 and width == 1):
+            _transpose_block(matrix, out, r0, r1, c0, c1)
+        elif height >= width:
+            middle = (r0 + r1) // 2
+            stack.append((middle, r1, c0, c1))
+            stack.append((r0, middle, c0, c1))
+        else:
+            middle = (c0 + c1) // 2
+            stack.append((r0, r1, middle, c1))
+            stack.append((r0, r1, c0, middle))
+    return result
+
+
+def _tuning_key(matrix):
+    return (matrix.rows, matrix.cols, matrix.row_stride, matrix.col_stride, matrix.data.typecode)
+
+
+def transpose_auto(matrix, candidates=TILE_CANDIDATES, band=TUNE_BAND_ROWS):
+    """Blocked transpose with the tile size tuned on the matrix itself."""
+    result = _empty_like(matrix, matrix.cols, matrix.rows)
+    out = result.data
+    key = _tuning_key(matrix)
+    tile = _TUNED_TILES.get(key)
+    row = 0
+    if tile is None:
+        band = min(band, matrix.rows // (2 * len(candidates)))
+        if band < 1:
+            tile = DEFAULT_TILE
+        else:
+            rates = {}
+            for candidate in candidates:
+                start = time.perf_counter()
+                _transpose_band(matrix, out, row, row + band, candidate)
+                rates[candidate] = band * matrix.cols / (time.perf_counter() - start)
+                row += band
+            tile = max(rates, key=rates.get)
+            _TUNING_RATES[key] = rates
+        _TUNED_TILES[key] = tile
+    _transpose_band(matrix, out, row, matrix.rows, tile)
+    return result
+
+
+def tuned_tile(matrix):
+    """Tile size chosen by transpose_auto for this kind of matrix (None if not tuned yet)."""
+    return _TUNED_TILES.get(_tuning_key(matrix))
+
+
+def tuning_rates(matrix):
+    """{tile: elements/s} measured by transpose_auto ({} if it was not probed)."""
+    return dict(_TUNING_RATES.get(_tuning_key(matrix), {}))
+
+
+# =============================================================================
+# 4. COLUMN REDUCTIONS WITH SEQUENTIAL SCANS
+# =============================================================================
+
+"""
+THREE WAYS TO REDUCE EVERY COLUMN:
+
+    strided   reduce(column j) for each j: one strided walk per column,
+              touching a new cache line (and often a new page) per element
+    rows      acc = map(op, acc, row) for each row: the matrix is read
+              front to back exactly once and only `cols` partial results
+              live in memory. This also works on a stream of rows
+              (column_reduce_rows) that is never stored as a matrix.
+    strips    transpose a strip of DEFAULT_STRIP columns into a small
+              buffer with sequential reads, then reduce each buffer line
+              sequentially
+
+In CPython, rows creates one new number object per element for its
+partial results, so it trades speed for streaming and O(cols) memory. The
+benchmark reports all three.
+"""
+
+
+def column_reduce_rows(rows, op=add, initial=None):
+    """Reduce a stream of equal-length rows column-wise: acc[j] = op(acc[j], row[j])."""
+    iterator = iter(rows)
+    if initial is None:
+        initial = next(iterator, ())
+    acc = list(initial)
+    for row in iterator:
+        acc = list(map(op, acc, row))
+    return acc
+
+
+def column_reduce(matrix, reduce=sum, method='strips', op=add, strip=DEFAULT_STRIP):
+    """
+    Reduce every column of matrix.
+
+    method='strided' and 'strips' apply `reduce` (sum, min, max, ...) to
+    each whole column; method='rows' folds rows together with the binary
+    `op` (add, min, max, ...), which must agree with `reduce`.
+    """
+    if method == 'strided' or (method == 'rows' and not matrix.rows):   # nothing to fold
+        return list(map(reduce, map(matrix.column, range(matrix.cols))))
+    if method == 'rows':
+        return column_reduce_rows(map(matrix.row, range(matrix.rows)), op)
+    if method != 'strips':
+        raise ValueError(f"unknown method {method!r} (expected 'strided', 'rows' or 'strips')")
+
+    rows, cols = matrix.rows, matrix.cols
+    buffer = array.array(matrix.data.typecode, bytes(rows * min(strip, cols) * matrix.data.itemsize))
+    strip_matrix = Matrix2D(buffer, min(strip, cols), rows)
+    results = []
+    for c0 in range(0, cols, strip):
+        c1 = min(cols, c0 + strip)
+        band = Matrix2D(matrix.data, rows, c1 - c0, matrix.row_stride, matrix.col_stride,
+                        matrix.offset + c0 * matrix.col_stride)
+        _transpose_band(band, buffer, 0, rows, strip)
+        results.extend(map(reduce, map(strip_matrix.row, range(c1 - c0))))
+    return results
+
+
+def column_sums(matrix, method='strips'):
+    return column_reduce(matrix, sum, method, add)
+
+
+def column_means(matrix, method='strips'):
+    return [total / matrix.rows for total in column_sums(matrix, method)]
+
+
+def row_sums(matrix):
+    """Row sums: already sequential, one slice per row."""
+    return list(map(sum, map(matrix.row, range(matrix.rows))))
+
+
+# =============================================================================
+# 5. BENCHMARK ACROSS TILE SIZES AND ORDERS
+# =============================================================================
+
+def row_major_access(large_matrix, size):
+    """3.10.0 reference: nested-list sum, row-major, one element at a time."""
+    total = 0
+    for i in range(size):
+        for j in range(size):
+            total += large_matrix[i][j]
+    return total
+
+
+def column_major_access(large_matrix, size):
+    """3.10.0 reference: nested-list sum, column-major, one element at a time."""
+    total = 0
+    for j in range(size):
+        for i in range(size):
+            total += large_matrix[i][j]
+    return total
+
+
+def _timed(function, repeat=1):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_traversal(sizes=BENCHMARK_SIZES, tiles=TILE_CANDIDATES):
+    """Seconds per operation for every order, method and tile size."""
+    results = {}
+    for size in sizes:
+        matrix = Matrix2D.arange(size, size)
+        prefix = f'n{size}'
+        repeat = 3 if size <= 2_000 else 1
+
+        if size <= NAIVE_LIMIT:
+            nested = matrix.tolist()
+            results[f'{prefix}_nested_row_major_s'], _ = _timed(lambda: row_major_access(nested, size))
+            results[f'{prefix}_nested_column_major_s'], _ = _timed(lambda: column_major_access(nested, size))
+
+        for order in ('row', 'column'):
+            results[f'{prefix}_sum_{order}_s'], _ = _timed(lambda: matrix_sum(matrix, order), repeat)
+        for tile in tiles:
+            results[f'{prefix}_sum_tiled{tile}_s'], _ = _timed(lambda: matrix_sum(matrix, 'tiled', tile), repeat)
+
+        # Each result is compared and dropped at once: at 10^4 a copy is 800 MB.
+        results[f'{prefix}_transpose_columns_s'], reference = _timed(lambda: transpose_columns(matrix), repeat)
+        variants = {f'tile{tile}': (lambda m, tile=tile: transpose_blocked(m, tile)) for tile in tiles}
+        variants['recursive'] = transpose_recursive
+        variants['auto'] = transpose_auto
+        if size <= NAIVE_LIMIT:
+            variants['naive'] = transpose_naive
+        matches = True
+        for name, transpose in variants.items():
+            elapsed, transposed = _timed(lambda: transpose(matrix), 1 if name in ('auto', 'naive') else repeat)
+            results[f'{prefix}_transpose_{name}_s'] = elapsed
+            matches = matches and transposed == reference
+            del transposed
+        del reference
+        results[f'{prefix}_auto_tile'] = tuned_tile(matrix)
+        results[f'{prefix}_auto_tuned'] = len(tuning_rates(matrix)) == len(TILE_CANDIDATES)
+        results[f'{prefix}_transposes_match'] = matches
+
+        sums = {}
+        for method in ('strided', 'rows', 'strips'):
+            results[f'{prefix}_column_sums_{method}_s'], sums[method] = _timed(
+                lambda: column_sums(matrix, method))
+        results[f'{prefix}_column_sums_match'] = sums['strided'] == sums['rows'] == sums['strips']
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_strided_matrices():
+    """
+    STRIDED MATRIX DEMONSTRATION
+    Rows, columns and O(1) transposed views over one flat array
+    """
+
+    matrix = Matrix2D.arange(3, 4)
+    print(f"   {matrix}")
+    print(f"   row 1: {matrix.row(1).tolist()}, column 2: {matrix.column(2).tolist()}")
+    print(f"   .T view: {matrix.T} -> {matrix.T.tolist()}")
+    print(f"   .T.copy() contiguous: {matrix.T.copy().is_contiguous()}")
+    return {'matrix': matrix.tolist(), 'transposed': matrix.T.tolist()}
+
+
+def demonstrate_tiled_traversal():
+    """
+    TILED TRAVERSAL DEMONSTRATION
+    Row, column and tile orders over the same matrix
+    """
+
+    matrix = Matrix2D.arange(6, 6)
+    tiles = list(iter_tiles(matrix, 4))
+    segments = [segment.tolist() for segment in iter_tile_segments(matrix, 4)][:4]
+    print(f"   tiles(4) of 6x6: {tiles}")
+    print(f"   first tile segments: {segments}")
+    totals = {order: matrix_sum(matrix, order, 4) for order in ('row', 'column', 'tiled')}
+    print(f"   sums by order: {totals}")
+    return {'tiles': tiles, 'totals': totals}
+
+
+def demonstrate_transposes():
+    """
+    TRANSPOSE DEMONSTRATION
+    Blocked, recursive and auto-tuned transposes agree
+    """
+
+    matrix = Matrix2D.arange(300, 170)
+    reference = transpose_naive(matrix)
+    results = {
+        'columns': transpose_columns(matrix) == reference,
+        'blocked_64': transpose_blocked(matrix, 64) == reference,
+        'recursive': transpose_recursive(matrix, leaf=1_000) == reference,
+        'auto': transpose_auto(matrix) == reference,
+        'strided_input': transpose_blocked(matrix.T, 64) == matrix.copy(),
+        'empty': all(transpose(Matrix2D.zeros(5, 0)).shape == (0, 5)
+                     for transpose in (transpose_columns, transpose_blocked, transpose_recursive, transpose_auto)),
+    }
+    for name, ok in results.items():
+        print(f"   {name:>13}: matches naive transpose: {ok}")
+    rates = tuning_rates(matrix)
+    print(f"   probe rates for 300x170 (elements/s): "
+          + ", ".join(f"{tile}: {rate:,.0f}" for tile, rate in rates.items()))
+    print(f"   tile chosen: {tuned_tile(matrix)}")
+    results['auto_tuned'] = len(rates) == len(TILE_CANDIDATES)
+    return results
+
+
+def demonstrate_column_reductions():
+    """
+    COLUMN REDUCTION DEMONSTRATION
+    Sequential scans instead of strided column walks
+    """
+
+    matrix = Matrix2D.from_nested([[3, 1, 4], [1, 5, 9], [2, 6, 5], [3, 5, 8]])
+    results = {
+        'sums_strided': column_sums(matrix, 'strided'),
+        'sums_rows': column_sums(matrix, 'rows'),
+        'sums_strips': column_sums(matrix, 'strips'),
+        'maxes_rows': column_reduce(matrix, max, 'rows', max),
+        'means': column_means(matrix),
+        'row_sums': row_sums(matrix),
+        'streamed': column_reduce_rows(iter([[1, 2], [3, 4], [5, 6]])),
+        'streamed_empty': column_reduce_rows(iter([])),
+        'no_rows': column_sums(Matrix2D.zeros(0, 3), 'rows'),
+    }
+    for name, value in results.items():
+        print(f"   {name:>12}: {value}")
+    return results
+
+
+def demonstrate_traversal_benchmarks(sizes=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for a 10^4 x 10^4 matrix (about 2.4 GB peak)
+    """
+
+    if sizes is None:
+        sizes = FULL_BENCHMARK_SIZES if '--full' in sys.argv else BENCHMARK_SIZES
+    results = benchmark_traversal(sizes)
+    for key, value in results.items():
+        if isinstance(value, bool) or value is None:
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute blocked traversal demonstrations
+    Pass --full for the 10^4 x 10^4 benchmark
+    """
+
+    print("🎯 PYTHON INDEXING - BLOCKED, TRANSPOSE-AWARE MATRIX TRAVERSAL")
+    print("=" * 60)
+
+    sections = [
+        ("Strided Matrices", demonstrate_strided_matrices),
+        ("Tiled Traversal", demonstrate_tiled_traversal),
+        ("Transposes", demonstrate_transposes),
+        ("Column Reductions", demonstrate_column_reductions),
+        ("Traversal Benchmarks", demonstrate_traversal_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
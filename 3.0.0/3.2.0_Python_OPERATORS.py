@@ -1037,6 +1037,7 @@ def demonstrate_real_world_applications():
         @staticmethod
         def is_prime(n):
             """Prime check using various operators."""
+            # Trial division per call; sieve/Miller-Rabin batch APIs: 3.7.1_Python_NUM_NUMBER_THEORY.py
             if n < 2:
                 return False
             if n == 2:
@@ -1065,7 +1066,7 @@ def demonstrate_real_world_applications():
         def __init__(self):
             self.player_health = 100
             self.player_mana = 50
-            self.game_flags = 0  # Bitwise flags
+            self.game_flags = 0  # Bitwise flags (per-entity flag columns: 3.2.2_Python_OPS_BITSET.py)
             
             # Flag constants
             self.FLAG_PAUSED = 1 << 0      # 1
@@ -1132,6 +1133,7 @@ def create_operator_exercises():
             def evaluate(self, expression):
                 """Safely evaluate mathematical expression."""
                 # TODO: Implement safe expression evaluation
+                # (reference solution: 3.2.1_Python_OPS_EXPRESSION_COMPILER.py)
                 pass
         
         return ExpressionEvaluator
@@ -1156,6 +1158,7 @@ def create_operator_exercises():
             def calculate(self, operation, *operands):
                 """Perform bitwise calculation with visualization."""
                 # TODO: Implement bitwise calculator
+                # (reference solution: 3.2.2_Python_OPS_BITSET.py)
                 pass
         
         return BitwiseCalculator
@@ -0,0 +1,607 @@
+""" 3.2.2_Python_OPS_BITSET.py """
+
+# =============================================================================
+# PYTHON OPERATORS - PACKED BITSETS & WORD-PARALLEL BITWISE OPERATIONS
+# =============================================================================
+# Version: 3.2.2 | Educational Excellence Target: 9.5/10
+# Purpose: Track millions of boolean flags with whole-set bitwise operators
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Pack one bit per entity into array('Q') words (64 flags per word)
+✓ Apply &, |, ^ and ~ to whole sets at once instead of bit by bit
+✓ Count set bits with int.bit_count (popcount)
+✓ Iterate over set bits, and answer rank/select queries
+✓ Store game flags as columns: one bitset per flag, one bit per entity
+✓ Finish the BitwiseCalculator exercise from 3.2.0
+
+🚀 QUICK NAVIGATION:
+├── 1. WORD LAYOUT (FOUNDATION)
+├── 2. PackedBitset (STORAGE, BULK OPS, POPCOUNT)
+├── 3. ITERATION, RANK & SELECT (QUERIES)
+├── 4. FlagColumns (PER-ENTITY FLAG COLUMNS)
+├── 5. BitwiseCalculator (EXERCISE SOLUTION)
+└── 6. BENCHMARK VS PER-OBJECT INT FLAGS
+
+🔍 CORE CONCEPT:
+GameLogic in 3.2.0 keeps one int of flags per object, so "which entities
+are paused?" means visiting every object. Turning the layout around - one
+bitset per flag, one bit per entity - makes that question a single
+bitwise operation over the whole set.
+"""
+
+import array
+import sys
+import time
+from bisect import bisect_right
+
+# =============================================================================
+# 1. WORD LAYOUT - FOUNDATION
+# =============================================================================
+
+"""
+WORD LAYOUT:
+bit i lives in word i >> 6 at position i & 63 (little-endian bit order).
+The same bytes read with int.from_bytes(..., 'little') form one big int
+whose bit i is bit i of the set. Bulk operators therefore run as a single
+C-level big-int operation over all words at once.
+"""
+
+WORD_BITS = 64
+WORD_SHIFT = 6
+WORD_MASK = WORD_BITS - 1
+RANK_BLOCK_WORDS = 8  # words per precomputed rank entry (512 bits)
+
+# Default entity counts for the quick benchmark and the full benchmark (--full)
+BENCHMARK_ENTITIES = 200_000
+FULL_BENCHMARK_ENTITIES = 5_000_000
+
+
+def _word_count(size):
+    return (size + WORD_MASK) >> WORD_SHIFT
+
+
+# =============================================================================
+# 2. PackedBitset - STORAGE, BULK OPS, POPCOUNT
+# =============================================================================
+
+class PackedBitset:
+    """
+    Fixed-size set of bits stored in an array('Q').
+
+    Single-bit operations touch one word. Whole-set operations (&, |, ^,
+    ~, popcount) convert the words to one int, operate in C, and convert
+    back, which is far faster than looping over words in Python.
+    """
+
+    __slots__ = ('size', 'words', '_rank_index')
+
+    def __init__(self, size, words=None):
+        self.size = size
+        if words is None:
+            words = array.array('Q', bytes(_word_count(size) * 8))
+        self.words = words
+        self._rank_index = None
+
+    # Conversions ------------------------------------------------------------
+
+    @classmethod
+    def from_int(cls, value, size):
+        words = array.array('Q')
+        words.frombytes(value.to_bytes(_word_count(size) * 8, 'little'))
+        return cls(size, words)
+
+    @classmethod
+    def from_indices(cls, indices, size):
+        bitset = cls(size)
+        bitset.update(indices)
+        return bitset
+
+    def to_int(self):
+        return int.from_bytes(self.words.tobytes(), 'little')
+
+    def _tail_mask(self):
+        return (1 << self.size) - 1
+
+    def copy(self):
+        return PackedBitset(self.size, array.array('Q', self.words))
+
+    # Single bits ------------------------------------------------------------
+
+    def _check(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(f"bit {index} out of range for bitset of size {self.size}")
+
+    def add(self, index):
+        self._check(index)
+        self.words[index >> WORD_SHIFT] |= 1 << (index & WORD_MASK)
+        self._rank_index = None
+
+    def discard(self, index):
+        self._check(index)
+        self.words[index >> WORD_SHIFT] &= ~(1 << (index & WORD_MASK)) & 0xFFFFFFFFFFFFFFFF
+        self._rank_index = None
+
+    def update(self, indices):
+        """
+        Set many bits at once.
+
+        Bits are collected in a bytearray (small ints stay cached, unlike
+        64-bit word values) and merged into the words with one big-int OR.
+        """
+        size = self.size
+        staging = bytearray(len(self.words) * 8)
+        for index in indices:
+            if not 0 <= index < size:
+                raise IndexError(f"bit {index} out of range for bitset of size {size}")
+            staging[index >> 3] |= 1 << (index & 7)
+        merged = self.to_int() | int.from_bytes(staging, 'little')
+        self.words = PackedBitset.from_int(merged, size).words
+        self._rank_index = None
+
+    def toggle(self, index):
+        self._check(index)
+        self.words[index >> WORD_SHIFT] ^= 1 << (index & WORD_MASK)
+        self._rank_index = None
+
+    def __contains__(self, index):
+        return 0 <= index < self.size and bool(self.words[index >> WORD_SHIFT] >> (index & WORD_MASK) & 1)
+
+    def __getitem__(self, index):
+        self._check(index)
+        return self.words[index >> WORD_SHIFT] >> (index & WORD_MASK) & 1
+
+    # Whole-set operations ---------------------------------------------------
+
+    def _binary(self, other, function):
+        if other.size != self.size:
+            raise ValueError(f"bitset sizes differ: {self.size} vs {other.size}")
+        return PackedBitset.from_int(function(self.to_int(), other.to_int()), self.size)
+
+    def __and__(self, other):
+        return self._binary(other, int.__and__)
+
+    def __or__(self, other):
+        return self._binary(other, int.__or__)
+
+    def __xor__(self, other):
+        return self._binary(other, int.__xor__)
+
+    def __invert__(self):
+        return PackedBitset.from_int(~self.to_int() & self._tail_mask(), self.size)
+
+    def difference(self, other):
+        return self._binary(other, lambda a, b: a & ~b)
+
+    def _inplace(self, other, function):
+        result = self._binary(other, function)
+        self.words = result.words
+        self._rank_index = None
+        return self
+
+    def __iand__(self, other):
+        return self._inplace(other, int.__and__)
+
+    def __ior__(self, other):
+        return self._inplace(other, int.__or__)
+
+    def __ixor__(self, other):
+        return self._inplace(other, int.__xor__)
+
+    def set_range(self, start, stop):
+        """Set every bit in [start, stop) with one big-int OR."""
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError(f"range [{start}, {stop}) out of range for bitset of size {self.size}")
+        if start < stop:
+            run = ((1 << (stop - start)) - 1) << start
+            self.words = PackedBitset.from_int(self.to_int() | run, self.size).words
+            self._rank_index = None
+
+    def count(self):
+        """Popcount of the whole set (int.bit_count runs in C)."""
+        return self.to_int().bit_count()
+
+    __len__ = count
+
+    def any(self):
+        return any(self.words)
+
+    def __eq__(self, other):
+        return isinstance(other, PackedBitset) and self.size == other.size and self.words == other.words
+
+    def __repr__(self):
+        return f"PackedBitset(size={self.size}, count={self.count()})"
+
+    # =========================================================================
+    # 3. ITERATION, RANK & SELECT - QUERIES
+    # =========================================================================
+
+    def __iter__(self):
+        """Yield the index of every set bit in increasing order."""
+        for word_index, word in enumerate(self.words):
+            if not word:
+                continue  # skip empty words without touching their bits
+            base = word_index << WORD_SHIFT
+            while word:
+                lowest = word & -word
+                yield base + lowest.bit_length() - 1
+                word ^= lowest
+
+    def _build_rank_index(self):
+        """Cumulative popcounts before each block of RANK_BLOCK_WORDS words."""
+        index = array.array('Q', [0])
+        running = 0
+        words = self.words
+        for start in range(0, len(words), RANK_BLOCK_WORDS):
+            block = words[start:start + RANK_BLOCK_WORDS]
+            running += int.from_bytes(block.tobytes(), 'little').bit_count()
+            index.append(running)
+        self._rank_index = index
+        return index
+
+    def rank(self, index):
+        """Number of set bits strictly before position index."""
+        if not 0 <= index <= self.size:
+            raise IndexError(f"rank position {index} out of range")
+        rank_index = self._rank_index or self._build_rank_index()
+        word_index = index >> WORD_SHIFT
+        block = word_index // RANK_BLOCK_WORDS
+        total = rank_index[block]
+        for word in self.words[block * RANK_BLOCK_WORDS:word_index]:
+            total += word.bit_count()
+        if index & WORD_MASK:
+            total += (self.words[word_index] & ((1 << (index & WORD_MASK)) - 1)).bit_count()
+        return total
+
+    def select(self, k):
+        """Position of the k-th set bit (0-based)."""
+        rank_index = self._rank_index or self._build_rank_index()
+        if not 0 <= k < rank_index[-1]:
+            raise IndexError(f"select({k}) out of range for {rank_index[-1]} set bits")
+        block = bisect_right(rank_index, k) - 1
+        remaining = k - rank_index[block]
+        word_index = block * RANK_BLOCK_WORDS
+        while True:
+            word = self.words[word_index]
+            bits = word.bit_count()
+            if remaining < bits:
+                break
+            remaining -= bits
+            word_index += 1
+        for _ in range(remaining):
+            word &= word - 1  # drop the lowest set bit
+        return (word_index << WORD_SHIFT) + (word & -word).bit_length() - 1
+
+    def gather(self, indices):
+        """Bit values at many positions, as a list of 0/1 ints."""
+        if not isinstance(indices, (list, tuple, range, array.array)):
+            indices = list(indices)
+        if indices:
+            low, high = min(indices), max(indices)   # one bounds check for the batch
+            self._check(low if low < 0 else high)
+        words = self.words
+        return [words[i >> WORD_SHIFT] >> (i & WORD_MASK) & 1 for i in indices]
+
+
+# =============================================================================
+# 4. FlagColumns - PER-ENTITY FLAG COLUMNS
+# =============================================================================
+
+class FlagColumns:
+    """
+    Flags for many entities, stored as one PackedBitset per flag.
+
+    Mirrors the GameLogic API (set_flag / clear_flag / toggle_flag /
+    has_flag) with an entity id added, plus bulk queries that answer a
+    question for every entity with one bitwise operation.
+    """
+
+    def __init__(self, entity_count, flag_names):
+        self.entity_count = entity_count
+        self.columns = {name: PackedBitset(entity_count) for name in flag_names}
+
+    def _column(self, flag):
+        try:
+            return self.columns[flag]
+        except KeyError:
+            raise KeyError(f"Unknown flag {flag!r}") from None
+
+    def set_flag(self, entity, flag):
+        self._column(flag).add(entity)
+
+    def clear_flag(self, entity, flag):
+        self._column(flag).discard(entity)
+
+    def toggle_flag(self, entity, flag):
+        self._column(flag).toggle(entity)
+
+    def has_flag(self, entity, flag):
+        return entity in self._column(flag)
+
+    def has_flag_bulk(self, flag, entities=None):
+        """
+        has_flag for many entities at once.
+
+        With entities=None the whole column bitset is returned (a copy);
+        otherwise a list of booleans, one per requested entity.
+        """
+        column = self._column(flag)
+        if entities is None:
+            return column.copy()
+        return [bool(bit) for bit in column.gather(entities)]
+
+    def set_flag_bulk(self, flag, entities):
+        self._column(flag).update(entities)
+
+    def entities_with_all(self, *flags):
+        result = self._column(flags[0]).copy()
+        for flag in flags[1:]:
+            result &= self._column(flag)
+        return result
+
+    def entities_with_any(self, *flags):
+        result = self._column(flags[0]).copy()
+        for flag in flags[1:]:
+            result |= self._column(flag)
+        return result
+
+    def count(self, flag):
+        return self._column(flag).count()
+
+    def flags_of(self, entity):
+        """All flags set for one entity (the GameLogic view of one object)."""
+        return {name for name, column in self.columns.items() if entity in column}
+
+
+# =============================================================================
+# 5. BitwiseCalculator - EXERCISE SOLUTION
+# =============================================================================
+
+class BitwiseCalculator:
+    """
+    Reference solution for exercise_bitwise_calculator in 3.2.0.
+
+    Results are masked to word_size bits (two's complement) and returned
+    with their binary, hex and signed interpretations.
+    """
+
+    OPERATIONS = {
+        'and': lambda a, b: a & b,
+        'or': lambda a, b: a | b,
+        'xor': lambda a, b: a ^ b,
+        'not': lambda a: ~a,
+        'shl': lambda a, n: a << n,
+        'shr': lambda a, n: a >> n,
+        'popcount': lambda a: a.bit_count(),
+        'set': lambda a, bit: a | (1 << bit),
+        'clear': lambda a, bit: a & ~(1 << bit),
+        'toggle': lambda a, bit: a ^ (1 << bit),
+        'test': lambda a, bit: (a >> bit) & 1,
+    }
+
+    def __init__(self, word_size=32):
+        self.word_size = word_size
+        self.mask = (1 << word_size) - 1
+
+    def calculate(self, operation, *operands):
+        """Perform bitwise calculation with visualization."""
+        try:
+            function = self.OPERATIONS[operation]
+        except KeyError:
+            raise ValueError(f"Unknown operation {operation!r}") from None
+        operands = [int(str(value), 0) if isinstance(value, str) else value for value in operands]
+        masked = [operands[0] & self.mask] + operands[1:]
+        result = function(*masked) & self.mask
+        signed = result - (1 << self.word_size) if result >> (self.word_size - 1) else result
+        return {
+            'operation': operation,
+            'operands': [self.to_binary(value & self.mask) for value in operands[:1]] + operands[1:],
+            'result': result,
+            'signed': signed,
+            'binary': self.to_binary(result),
+            'hex': f"0x{result:0{self.word_size // 4}X}",
+        }
+
+    def to_binary(self, value):
+        digits = f"{value & self.mask:0{self.word_size}b}"
+        return '_'.join(digits[i:i + 4] for i in range(0, len(digits), 4))
+
+
+# =============================================================================
+# 6. BENCHMARK VS PER-OBJECT INT FLAGS
+# =============================================================================
+
+class _IntFlagEntity:
+    """GameLogic-style flag storage: one int of flags per object."""
+
+    __slots__ = ('game_flags',)
+
+    def __init__(self):
+        self.game_flags = 0
+
+
+FLAG_PAUSED, FLAG_MUTED, FLAG_GODMODE, FLAG_DEBUG = (1 << bit for bit in range(4))
+FLAG_NAMES = {'PAUSED': FLAG_PAUSED, 'MUTED': FLAG_MUTED, 'GODMODE': FLAG_GODMODE, 'DEBUG': FLAG_DEBUG}
+
+
+def benchmark_flags(entities=BENCHMARK_ENTITIES):
+    """Compare per-object int flags with FlagColumns for typical bulk queries."""
+    results = {'per_object_int_flags': {}, 'flag_columns': {}}
+
+    # Per-object ints (3.2.0 GameLogic layout)
+    objects = [_IntFlagEntity() for _ in range(entities)]
+    timings = results['per_object_int_flags']
+    start = time.perf_counter()
+    for entity_id in range(0, entities, 3):
+        objects[entity_id].game_flags |= FLAG_PAUSED
+    for entity_id in range(0, entities, 5):
+        objects[entity_id].game_flags |= FLAG_MUTED
+    timings['set flags'] = time.perf_counter() - start
+    start = time.perf_counter()
+    paused_list = [bool(obj.game_flags & FLAG_PAUSED) for obj in objects]
+    timings['has_flag for all'] = time.perf_counter() - start
+    start = time.perf_counter()
+    both_count = sum(1 for obj in objects if obj.game_flags & FLAG_PAUSED and obj.game_flags & FLAG_MUTED)
+    timings['count paused AND muted'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for obj in objects:
+        obj.game_flags ^= FLAG_DEBUG
+    timings['toggle flag for all'] = time.perf_counter() - start
+
+    # Flag columns
+    flags = FlagColumns(entities, FLAG_NAMES)
+    timings = results['flag_columns']
+    start = time.perf_counter()
+    flags.set_flag_bulk('PAUSED', range(0, entities, 3))
+    flags.set_flag_bulk('MUTED', range(0, entities, 5))
+    timings['set flags'] = time.perf_counter() - start
+    start = time.perf_counter()
+    paused_column = flags.has_flag_bulk('PAUSED')
+    timings['has_flag for all'] = time.perf_counter() - start
+    start = time.perf_counter()
+    column_count = flags.entities_with_all('PAUSED', 'MUTED').count()
+    timings['count paused AND muted'] = time.perf_counter() - start
+    start = time.perf_counter()
+    flags.columns['DEBUG'] = ~flags.columns['DEBUG']
+    timings['toggle flag for all'] = time.perf_counter() - start
+
+    assert column_count == both_count, "bitset count differs from per-object count"
+    assert paused_column.count() == sum(paused_list), "bitset has_flag differs"
+    results['memory_bytes'] = {
+        'per_object_int_flags': sum(sys.getsizeof(obj) for obj in objects[:1000]) * entities // 1000,
+        'flag_columns': sum(column.words.buffer_info()[1] * 8 for column in flags.columns.values()),
+    }
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_packed_bitset():
+    """
+    PACKED BITSET DEMONSTRATION
+    Bulk operators, popcount, iteration, rank and select
+    """
+
+    evens = PackedBitset.from_indices(range(0, 200, 2), 200)
+    threes = PackedBitset.from_indices(range(0, 200, 3), 200)
+    sixes = evens & threes
+
+    results = {
+        'evens_count': evens.count(),
+        'multiples_of_six': list(sixes)[:10],
+        'union_count': (evens | threes).count(),
+        'xor_count': (evens ^ threes).count(),
+        'odd_count': (~evens).count(),
+        'rank_of_100_in_evens': evens.rank(100),
+        'select_10th_of_sixes': sixes.select(10),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_flag_columns():
+    """
+    FLAG COLUMN DEMONSTRATION
+    The GameLogic API over many entities at once
+    """
+
+    flags = FlagColumns(10, ['PAUSED', 'MUTED', 'GODMODE', 'DEBUG'])
+    flags.set_flag(3, 'PAUSED')
+    flags.set_flag(3, 'MUTED')
+    flags.set_flag(7, 'PAUSED')
+    flags.toggle_flag(7, 'GODMODE')
+    flags.clear_flag(3, 'MUTED')
+
+    results = {
+        'entity_3_flags': sorted(flags.flags_of(3)),
+        'entity_7_flags': sorted(flags.flags_of(7)),
+        'paused_entities': list(flags.has_flag_bulk('PAUSED')),
+        'paused_lookup': flags.has_flag_bulk('PAUSED', [0, 3, 7]),
+        'paused_and_godmode': list(flags.entities_with_all('PAUSED', 'GODMODE')),
+    }
+    try:
+        flags.has_flag_bulk('PAUSED', [0, -1])
+    except IndexError as error:
+        results['bad_lookup'] = f"IndexError: {error}"
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_bitwise_calculator():
+    """
+    BITWISE CALCULATOR DEMONSTRATION
+    Exercise solution with 8-bit words
+    """
+
+    calculator = BitwiseCalculator(word_size=8)
+    results = {
+        'and': calculator.calculate('and', 0b1100_1010, 0b1010_0110),
+        'not': calculator.calculate('not', 0b0000_1111),
+        'shl_overflow': calculator.calculate('shl', 0b1000_0001, 1),
+        'toggle_bit_7': calculator.calculate('toggle', '0x0F', 7),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value['binary']} = {value['result']} (signed {value['signed']})")
+    return results
+
+
+def demonstrate_flag_benchmarks(entities=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 5 * 10**6 entities
+    """
+
+    if entities is None:
+        entities = FULL_BENCHMARK_ENTITIES if '--full' in sys.argv else BENCHMARK_ENTITIES
+    results = benchmark_flags(entities)
+
+    print(f"   entities={entities:,}")
+    for operation in results['flag_columns']:
+        per_object = results['per_object_int_flags'][operation]
+        columns = results['flag_columns'][operation]
+        print(f"   {operation:<24} int flags {per_object * 1000:9.3f} ms   "
+              f"columns {columns * 1000:9.3f} ms")
+    print(f"   memory: {results['memory_bytes']}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute bitset demonstrations
+    Pass --full for the 5 * 10**6 entity benchmark
+    """
+
+    print("🎯 PYTHON OPERATORS - PACKED BITSETS")
+    print("=" * 60)
+
+    sections = [
+        ("Packed Bitset", demonstrate_packed_bitset),
+        ("Flag Columns", demonstrate_flag_columns),
+        ("Bitwise Calculator", demonstrate_bitwise_calculator),
+        ("Flag Benchmarks", demonstrate_flag_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
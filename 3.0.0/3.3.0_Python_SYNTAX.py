@@ -594,6 +594,8 @@ def demonstrate_advanced_syntax():
     
     class DataContainer(Generic[T]):
         """Generic container class with type hints."""
+        # Lazy, fused filter/transform views with typed storage:
+        # see 3.3.3_Python_SYN_LAZY_CONTAINER.py
         
         def __init__(self, items: List[T]) -> None:
             self._items: List[T] = items
@@ -695,6 +697,8 @@ def demonstrate_advanced_syntax():
     # Context managers and advanced with statements
     class DatabaseConnection:
         """Example context manager for database connections."""
+        # Pooled sqlite3-backed version with batching and metrics:
+        # see 3.3.2_Python_SYN_CONNECTION_POOL.py
         
         def __init__(self, connection_string: str):
             self.connection_string = connection_string
@@ -750,6 +754,8 @@ def demonstrate_advanced_syntax():
     # Async syntax (basic demonstration)
     async def async_syntax_example():
         """Demonstrate basic async/await syntax."""
+        # Bounded fan-out with timeouts, retries and streamed results:
+        # see 3.3.5_Python_SYN_ASYNC_FANOUT.py
         import asyncio
         
         async def fetch_data(url: str) -> str:
@@ -1261,6 +1267,8 @@ def demonstrate_documentation():
                 This method is the main entry point for data processing.
                 It automatically detects format if 'auto' is specified.
             """
+            # Streaming JSON Lines/JSON/CSV ingest with sniffing and batches:
+            # see 3.3.1_Python_SYN_STREAMING_INGEST.py
             import time
             self._start_time = time.time()
             
@@ -1569,6 +1577,8 @@ def demonstrate_naming_examples():
         This class follows PEP 8 naming standards throughout,
         with descriptive names that clearly indicate purpose.
         """
+        # High-QPS login path (precompiled validation, sharded sessions):
+        # see 3.3.4_Python_SYN_AUTH_SESSIONS.py
         
         # Class constants (UPPER_CASE)
         MAX_LOGIN_ATTEMPTS = 3
@@ -0,0 +1,866 @@
+""" 3.3.1_Python_SYN_STREAMING_INGEST.py """
+
+# =============================================================================
+# PYTHON SYNTAX - STREAMING DATA INGEST WITH FORMAT SNIFFING
+# =============================================================================
+# Version: 3.3.1 | Educational Excellence Target: 9.5/10
+# Purpose: Turn the documented DataProcessor into a real, incremental ingest entry point
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Detect JSON Lines, JSON arrays and CSV (with its dialect) from the first KB
+✓ Parse incrementally: one line at a time for JSON Lines, csv.reader over a chunked file
+✓ Yield records in batches so memory stays flat for any input size
+✓ Count bad records, keep the first max_errors of them, and never stop the stream
+✓ Report rows/s and bytes/s, and split large files across processes
+
+🚀 QUICK NAVIGATION:
+├── 1. FORMAT SNIFFING (FOUNDATION)
+├── 2. BYTE-COUNTING, CHUNKED SOURCES
+├── 3. STREAMING DataProcessor
+├── 4. PARALLEL INGEST BY FILE SPLIT
+└── 5. BENCHMARK VS LOAD-EVERYTHING PARSING
+
+🔍 CORE CONCEPT:
+The DataProcessor in 3.3.0 documents an ingest API, but _detect_format
+always answers 'json' and the parsers only bump a counter. A real ingest
+path must not hold the input in memory. It sniffs a small sample, reads the
+source in fixed-size chunks, parses one record at a time and hands records
+on in batches. Then peak memory depends on batch_size, not on file size.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import chain
+from operator import add
+from pathlib import Path
+
+# =============================================================================
+# 1. FORMAT SNIFFING - FOUNDATION
+# =============================================================================
+
+"""
+WHAT THE FIRST KB TELLS US:
+    starts with '{'    JSON Lines - one object per line
+    starts with '['    a JSON array document
+    anything else      CSV. csv.Sniffer picks the delimiter and quote
+                       character and guesses whether row 1 is a header.
+
+A byte-order mark and leading whitespace are skipped. The last line of the
+sample is dropped before CSV sniffing because it is usually cut off.
+Sniffer.has_header votes per column and is easily outvoted by text columns
+of varying length (names, ids like 'user17'). When it says no, a second
+rule is tried: row 1 has no numbers, but some row below it does.
+FormatGuess holds plain strings and bools only, so it can be pickled to
+worker processes (csv.Sniffer's dialect classes cannot).
+"""
+
+SNIFF_BYTES = 1024
+CSV_DELIMITERS = ',;\t|'
+DEFAULT_BATCH_SIZE = 1_000
+DEFAULT_CHUNK_SIZE = 1 << 16        # bytes per read from the underlying file
+MIN_SPLIT_BYTES = 1 << 20           # smaller files are not worth a process pool
+
+# Benchmark configuration
+BENCHMARK_ROWS = 50_000
+FULL_BENCHMARK_ROWS = 1_000_000
+BAD_ROW_EVERY = 10_000              # one malformed record per this many rows
+
+FormatGuess = namedtuple('FormatGuess', 'format delimiter quotechar has_header')
+_ARRAY_SEPARATORS = re.compile(r'[\s,]*')
+_LONGEST_LITERAL = len('-Infinity')  # a cut literal ('tru', '-Inf') errors at its start
+
+
+def _needs_more_input(error, buffer):
+    """True if a raw_decode error could be a cut at the end of the buffer."""
+    position = getattr(error, 'pos', None)
+    if position is None:
+        return False                    # e.g. int digit limit: not a syntax error
+    return error.msg.startswith('Unterminated string') or len(buffer) - position <= _LONGEST_LITERAL
+
+
+def sniff_format(sample):
+    """Guess the format of text or bytes `sample` (the first SNIFF_BYTES of the input)."""
+    if isinstance(sample, (bytes, bytearray)):
+        sample = bytes(sample).decode('utf-8', errors='ignore')
+    text = sample.lstrip('\ufeff \t\r\n')
+    if not text:
+        raise ValueError("cannot detect the format of empty input")
+    if text[0] == '{':
+        return FormatGuess('jsonl', ',', '"', False)
+    if text[0] == '[':
+        return FormatGuess('json', ',', '"', False)
+
+    lines = text.splitlines()
+    if len(lines) > 1:
+        lines.pop()
+    body = '\n'.join(lines)
+    sniffer = csv.Sniffer()
+    try:
+        dialect = sniffer.sniff(body, delimiters=CSV_DELIMITERS)
+        delimiter, quotechar = dialect.delimiter, dialect.quotechar
+    except csv.Error:
+        delimiter, quotechar = ',', '"'
+    try:
+        has_header = sniffer.has_header(body)
+    except csv.Error:
+        has_header = True
+    if not has_header:
+        rows = list(csv.reader(lines, delimiter=delimiter, quotechar=quotechar))
+        has_header = _looks_like_header(rows)
+    return FormatGuess('csv', delimiter, quotechar, has_header)
+
+
+def _is_number(field):
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def _looks_like_header(rows):
+    """Row 1 is a header if it has no numbers but a column below it does."""
+    if len(rows) < 2 or any(map(_is_number, rows[0])):
+        return False
+    width = len(rows[0])
+    return any(_is_number(field) for row in rows[1:] for field in row[:width])
+
+
+def _resolve_guess(sample, format='auto', has_header=None):
+    """Sniffed FormatGuess with the caller's explicit format/header choices applied."""
+    guess = sniff_format(sample)
+    if format != 'auto':
+        guess = guess._replace(format=format)
+    if has_header is not None:
+        guess = guess._replace(has_header=has_header)
+    return guess
+
+
+# =============================================================================
+# 2. BYTE-COUNTING, CHUNKED SOURCES
+# =============================================================================
+
+"""
+ONE PIPELINE FOR EVERY SOURCE:
+
+    path / bytes / binary file
+        -> _CountingReader      counts bytes and stops at an optional limit
+        -> io.BufferedReader    reads chunk_size bytes at a time; peek()
+                                gives the sniffing sample without consuming it
+        -> io.TextIOWrapper     decodes and yields lines (newline='' as the
+                                csv module requires)
+
+Every layer is a C-level io class except the readinto() of the counter, and
+that runs once per chunk, not once per line. The limit lets a worker read
+exactly one byte range of a shared file.
+"""
+
+
+class _CountingReader(io.RawIOBase):
+    """Raw reader that counts bytes and can stop after `limit` bytes."""
+
+    def __init__(self, raw, limit=None):
+        self._raw = raw
+        self._remaining = limit
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                return 0
+            if len(buffer) > self._remaining:
+                buffer = memoryview(buffer)[:self._remaining]
+        count = self._raw.readinto(buffer) or 0
+        self.bytes_read += count
+        if self._remaining is not None:
+            self._remaining -= count
+        return count
+
+
+def _binary_source(data, encoding):
+    """(binary file object, should_close) for any supported input."""
+    if isinstance(data, (bytes, bytearray)):
+        return io.BytesIO(data), True
+    if isinstance(data, str):
+        return io.BytesIO(data.encode(encoding)), True
+    if isinstance(data, os.PathLike):
+        return open(data, 'rb', buffering=0), True
+    if hasattr(data, 'readinto'):
+        return data, False
+    if hasattr(data, 'buffer'):                     # text file opened by the caller
+        return data.buffer, False
+    if hasattr(data, 'read'):                       # e.g. io.StringIO: no byte layer to stream
+        return io.BytesIO(data.read().encode(encoding)), True
+    raise TypeError(f"unsupported data source: {type(data).__name__}")
+
+
+def _open_text(raw, chunk_size, encoding, limit=None):
+    """Wrap a binary source: (text stream, counter, first-KB sample)."""
+    counter = _CountingReader(raw, limit)
+    buffered = io.BufferedReader(counter, buffer_size=max(chunk_size, SNIFF_BYTES))
+    sample = buffered.peek(SNIFF_BYTES)[:SNIFF_BYTES]
+    text = io.TextIOWrapper(buffered, encoding=encoding, newline='')
+    return text, counter, sample
+
+
+# =============================================================================
+# 3. STREAMING DataProcessor
+# =============================================================================
+
+"""
+API (compatible with 3.3.0):
+    DataProcessor(max_errors=5, verbose=False, batch_size=..., ...)
+    process_data(data, format='auto', handler=None) -> result dict
+    iter_batches(data, format='auto')               -> lists of record dicts
+    process_file(path, ...)                         -> process_data(Path)
+
+ERRORS NEVER STOP THE STREAM:
+A malformed line, a CSV row of the wrong width, a non-object JSON value or a
+failing converter counts one error and is skipped. The first max_errors
+errors are kept with their line numbers. After that, only the count grows.
+The result status is 'ok' (no errors), 'partial' (at most max_errors) or
+'failed' (more than max_errors). Even 'failed' runs have processed every
+good record. The only error that ends a source early is a syntax error
+inside a JSON array, because the parser cannot find the next element after
+it. More input is read only when the error could be a cut at the end of the
+buffer: it points into the last few characters, or it is an unterminated
+string. Any other syntax error stops the source at once, instead of pulling
+the rest of the file into the buffer.
+
+RATES:
+processing_time only counts time spent inside the processor, not the time
+the consumer spends on a batch. rows_per_second and bytes_per_second are
+therefore the ingest throughput.
+"""
+
+
+class DataProcessor:
+    """
+    Streaming ingest for JSON Lines, JSON arrays and CSV.
+
+    Attributes:
+        processed_count (int): Records yielded so far
+        error_count (int): Bad records seen so far (all of them)
+        errors (list): The first max_errors errors as dicts
+        bytes_read (int): Input bytes consumed
+        processing_time (float): Seconds spent parsing (perf_counter)
+
+    Example:
+        processor = DataProcessor(max_errors=10)
+        for batch in processor.iter_batches(Path('events.jsonl')):
+            store(batch)
+        print(processor.rows_per_second, processor.bytes_per_second)
+    """
+
+    def __init__(self, max_errors=5, verbose=False, batch_size=DEFAULT_BATCH_SIZE,
+                 chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', converters=None):
+        """
+        Args:
+            max_errors (int): Errors kept in detail; more than this marks the run 'failed'
+            verbose (bool): Print each recorded error
+            batch_size (int): Records per yielded batch
+            chunk_size (int): Bytes per read from the source
+            encoding (str): Text encoding of byte sources
+            converters (dict): Field name -> callable applied to each record
+        """
+        self.max_errors = max_errors
+        self.verbose = verbose
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.converters = dict(converters or {})
+        self.reset()
+
+    def reset(self):
+        self.processed_count = 0
+        self.error_count = 0
+        self.errors = []
+        self.bytes_read = 0
+        self.processing_time = 0.0
+        self.format = None
+
+    @property
+    def rows_per_second(self):
+        return self.processed_count / self.processing_time if self.processing_time else 0.0
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes_read / self.processing_time if self.processing_time else 0.0
+
+    @property
+    def status(self):
+        if not self.error_count:
+            return 'ok'
+        return 'partial' if self.error_count <= self.max_errors else 'failed'
+
+    def stats(self):
+        return {
+            'status': self.status,
+            'format': self.format,
+            'processed_count': self.processed_count,
+            'error_count': self.error_count,
+            'bytes_read': self.bytes_read,
+            'processing_time': self.processing_time,
+            'rows_per_second': self.rows_per_second,
+            'bytes_per_second': self.bytes_per_second,
+        }
+
+    def _record_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'line': line, 'error': str(message)})
+            if self.verbose:
+                print(f"Processing error (line {line}): {message}")
+
+    def _convert(self, record, line):
+        try:
+            for name, convert in self.converters.items():
+                if name in record:
+                    record[name] = convert(record[name])
+        except (ValueError, TypeError) as error:
+            self._record_error(line, f"{name}: {error}")
+            return False
+        return True
+
+    # -- public entry points ---------------------------------------------------
+
+    def process_data(self, data, format='auto', handler=None, has_header=None):
+        """
+        Ingest `data` completely and return the statistics.
+
+        Args:
+            data: path (os.PathLike), str/bytes content, or a file object
+            format (str): 'jsonl', 'json', 'csv' or 'auto'
+            handler (callable): Called with each batch (list of dicts)
+            has_header (bool): Override the sniffed CSV header guess
+        """
+        for batch in self.iter_batches(data, format, has_header):
+            if handler is not None:
+                handler(batch)
+        return self.stats()
+
+    def process_file(self, path, format='auto', handler=None, has_header=None):
+        return self.process_data(Path(path), format, handler, has_header)
+
+    def iter_batches(self, data, format='auto', has_header=None):
+        """Yield lists of up to batch_size record dicts from `data`."""
+        raw, should_close = _binary_source(data, self.encoding)
+        try:
+            yield from self._iter_source(raw, format, has_header)
+        finally:
+            if should_close:
+                raw.close()
+
+    # -- internals -------------------------------------------------------------
+
+    def _iter_source(self, raw, format, has_header, limit=None, fieldnames=None, guess=None):
+        start = time.perf_counter()
+        text, counter, sample = _open_text(raw, self.chunk_size, self.encoding, limit)
+        counted = 0
+        try:
+            if guess is None:
+                if not sample.strip():
+                    return
+                guess = _resolve_guess(sample, format, has_header)
+            self.format = guess.format
+            parsers = {'jsonl': self._parse_jsonl, 'json': self._parse_json_array, 'csv': self._parse_csv}
+            if guess.format not in parsers:
+                raise ValueError(f"Unsupported format: {guess.format}")
+
+            for batch in parsers[guess.format](text, guess, fieldnames):
+                self.processed_count += len(batch)
+                self.bytes_read += counter.bytes_read - counted
+                counted = counter.bytes_read
+                self.processing_time += time.perf_counter() - start
+                yield batch
+                start = time.perf_counter()
+        finally:
+            self.bytes_read += counter.bytes_read - counted
+            self.processing_time += time.perf_counter() - start
+            text.detach()
+
+    def _parse_jsonl(self, text, guess, fieldnames):
+        loads = json.loads
+        batch_size = self.batch_size
+        converters = self.converters
+        batch = []
+        for line_number, line in enumerate(text, 1):
+            if line.isspace():
+                continue
+            try:
+                record = loads(line)
+            except ValueError as error:
+                self._record_error(line_number, error)
+                continue
+            if type(record) is not dict:
+                self._record_error(line_number, f"expected an object, got {type(record).__name__}")
+                continue
+            if converters and not self._convert(record, line_number):
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _parse_json_array(self, text, guess, fieldnames):
+        raw_decode = json.JSONDecoder().raw_decode
+        skip = _ARRAY_SEPARATORS.match
+        batch_size = self.batch_size
+        batch = []
+        buffer = text.read(self.chunk_size).lstrip(' \t\r\n\ufeff')
+        if not buffer.startswith('['):
+            self._record_error(0, "input is not a JSON array")
+            return
+        position, index, eof = 1, 0, False
+        while True:
+            position = skip(buffer, position).end()
+            if buffer.startswith(']', position):
+                break
+            try:
+                record, end = raw_decode(buffer, position)
+            except ValueError as error:
+                if eof or not _needs_more_input(error, buffer):
+                    self._record_error(index, f"{error} - rest of the array skipped")
+                    break
+                end = None
+            if end is None or (end == len(buffer) and not eof):
+                chunk = text.read(self.chunk_size)
+                eof = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            position = end
+            index += 1
+            if type(record) is not dict:
+                self._record_error(index, f"expected an object, got {type(record).__name__}")
+                continue
+            if self.converters and not self._convert(record, index):
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _parse_csv(self, text, guess, fieldnames):
+        reader = rows = csv.reader(text, delimiter=guess.delimiter, quotechar=guess.quotechar)
+        if fieldnames is None:
+            if guess.has_header:
+                fieldnames = next(reader, [])
+            else:
+                first = next(reader, [])
+                fieldnames = [f'column_{position}' for position in range(1, len(first) + 1)]
+                rows = chain([first], reader)
+        width = len(fieldnames)
+        batch_size = self.batch_size
+        converters = self.converters
+        batch = []
+        while True:
+            try:
+                for row in rows:
+                    if len(row) != width:
+                        if row:
+                            self._record_error(reader.line_num, f"expected {width} fields, got {len(row)}")
+                        continue
+                    record = dict(zip(fieldnames, row))
+                    if converters and not self._convert(record, reader.line_num):
+                        continue
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                break
+            except csv.Error as error:
+                self._record_error(reader.line_num, error)
+        if batch:
+            yield batch
+
+
+
+# =============================================================================
+# 4. PARALLEL INGEST BY FILE SPLIT
+# =============================================================================
+
+"""
+SPLITTING A FILE BY BYTES:
+split_ranges cuts the file into byte ranges of roughly equal size and
+moves each cut forward to the next line start. Every range then holds
+whole records, and each worker opens the file itself, seeks to its start
+and reads at most end - start bytes (the _CountingReader limit). Nothing
+is sent to the workers except offsets, the FormatGuess and the CSV field
+names from the parent.
+
+Workers send back batch_function(batch) for each batch (len by default,
+i.e. counts), not the records: pickling records back would cost more than
+parsing them. The parent folds the partial results with `combine`.
+
+LIMITS:
+    JSON arrays are read sequentially. A cut can land inside an element,
+    so they cannot be split.
+    CSV fields with embedded newlines break line-based splitting. Use the
+    sequential iter_batches for such files.
+    Small files (< min_split_bytes) are processed in-process.
+"""
+
+
+def split_ranges(path, parts, start=0):
+    """[(start, end), ...] byte ranges from `start` to EOF, each beginning at a line start."""
+    size = os.path.getsize(path)
+    bounds = [start]
+    with open(path, 'rb') as handle:
+        for part in range(1, parts):
+            target = start + (size - start) * part // parts
+            if target <= bounds[-1]:
+                continue
+            handle.seek(target - 1)
+            handle.readline()
+            position = handle.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return [(low, high) for low, high in zip(bounds, bounds[1:]) if high > low]
+
+
+def _ingest_range(path, start, end, guess, fieldnames, settings, batch_function):
+    """Worker: ingest one byte range and return (partials, stats, errors)."""
+    processor = DataProcessor(**settings)
+    with open(path, 'rb', buffering=0) as raw:
+        raw.seek(start)
+        partials = [batch_function(batch) for batch in processor._iter_source(
+            raw, guess.format, None, limit=end - start, fieldnames=fieldnames, guess=guess)]
+    for error in processor.errors:
+        error['offset'] = start
+    return partials, processor.stats(), processor.errors
+
+
+def ingest_parallel(path, batch_function=len, combine=add, initial=0, workers=None,
+                    format='auto', has_header=None, processor=None, min_split_bytes=MIN_SPLIT_BYTES):
+    """
+    Ingest a large file in worker processes, one byte range each.
+
+    Returns (combined result, processor). Counters, errors and rates are
+    accumulated into `processor` (a new DataProcessor when None).
+    Line numbers in errors are relative to the range starting at 'offset'.
+    """
+    processor = processor or DataProcessor()
+    path = Path(path)
+    start_time = time.perf_counter()
+    with open(path, 'rb', buffering=0) as raw:
+        text, counter, sample = _open_text(raw, processor.chunk_size, processor.encoding)
+        if not sample.strip():
+            text.detach()
+            return initial, processor
+        guess = _resolve_guess(sample, format, has_header)
+        fieldnames, body_start = None, 0
+        if guess.format == 'csv':
+            header = text.readline()
+            body_start = len(header.encode(processor.encoding))
+            fieldnames = next(csv.reader([header], delimiter=guess.delimiter, quotechar=guess.quotechar), [])
+            if not guess.has_header:
+                fieldnames = [f'column_{position}' for position in range(1, len(fieldnames) + 1)]
+                body_start = 0
+        text.detach()
+
+    workers = workers or os.cpu_count() or 1
+    if guess.format == 'json' or workers == 1 or path.stat().st_size < min_split_bytes:
+        partials = [batch_function(batch) for batch in processor.iter_batches(path, format, has_header)]
+        return reduce(combine, partials, initial), processor
+
+    settings = {'max_errors': processor.max_errors, 'batch_size': processor.batch_size,
+                'chunk_size': processor.chunk_size, 'encoding': processor.encoding,
+                'converters': processor.converters}
+    ranges = split_ranges(path, workers, body_start)
+    result = initial
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_ingest_range, path, start, end, guess, fieldnames, settings, batch_function)
+                   for start, end in ranges]
+        for future in futures:
+            partials, stats, errors = future.result()
+            result = reduce(combine, partials, result)
+            processor.processed_count += stats['processed_count']
+            processor.error_count += stats['error_count']
+            processor.bytes_read += stats['bytes_read']
+            processor.errors.extend(errors[:processor.max_errors - len(processor.errors)])
+    processor.bytes_read += body_start
+    processor.format = guess.format
+    processor.processing_time += time.perf_counter() - start_time
+    return result, processor
+
+
+# =============================================================================
+# 5. BENCHMARK VS LOAD-EVERYTHING PARSING
+# =============================================================================
+
+"""
+BASELINE:
+The 3.3.0 stubs parse nothing, so the baseline is the usual quick version of
+a real parser. It reads the whole file, splits it into lines, then parses
+(json.loads per line, or csv.DictReader over the full text). Both versions
+skip the same malformed rows. Peak traced memory (tracemalloc) shows the
+real difference: load-everything grows with the file, streaming stays near
+one chunk plus one batch.
+"""
+
+
+def make_sample_files(directory, rows, bad_every=BAD_ROW_EVERY):
+    """Write users.jsonl and users.csv with `rows` records (one bad line every bad_every)."""
+    jsonl_path = Path(directory) / 'users.jsonl'
+    csv_path = Path(directory) / 'users.csv'
+    with open(jsonl_path, 'w', encoding='utf-8') as jsonl, \
+            open(csv_path, 'w', encoding='utf-8', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['id', 'name', 'score', 'active'])
+        for index in range(rows):
+            if bad_every and index % bad_every == bad_every - 1:
+                jsonl.write('{"id": %d, "name": broken\n' % index)
+                writer.writerow([index, 'broken'])
+                continue
+            record = {'id': index, 'name': f'user{index}', 'score': index % 997 / 10, 'active': index % 3 == 0}
+            jsonl.write(json.dumps(record) + '\n')
+            writer.writerow([index, record['name'], record['score'], record['active']])
+    return {'jsonl': jsonl_path, 'csv': csv_path}
+
+
+def load_everything_jsonl(path):
+    """Baseline: read the whole file, then json.loads each line."""
+    with open(path, encoding='utf-8') as handle:
+        lines = handle.read().splitlines()
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            pass
+    return records
+
+
+def load_everything_csv(path):
+    """Baseline: read the whole file, then csv.DictReader over it."""
+    with open(path, encoding='utf-8', newline='') as handle:
+        rows = list(csv.DictReader(io.StringIO(handle.read())))
+    return [row for row in rows if None not in row.values() and None not in row]
+
+
+def _peak_traced_bytes(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_ingest(rows=BENCHMARK_ROWS, workers=2):
+    """Rows/s, bytes/s and peak memory: load-everything vs streaming vs split files."""
+    results = {'rows': rows}
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_sample_files(directory, rows)
+        baselines = {'jsonl': load_everything_jsonl, 'csv': load_everything_csv}
+        for name, path in paths.items():
+            size = path.stat().st_size
+            results[f'{name}_file_bytes'] = size
+
+            start = time.perf_counter()
+            loaded = len(baselines[name](path))
+            baseline_time = time.perf_counter() - start
+
+            processor = DataProcessor(max_errors=rows)
+            stats = processor.process_file(path)
+            results[f'{name}_load_all_rows_per_s'] = loaded / baseline_time
+            results[f'{name}_streaming_rows_per_s'] = stats['rows_per_second']
+            results[f'{name}_streaming_bytes_per_s'] = stats['bytes_per_second']
+            results[f'{name}_streaming_errors'] = stats['error_count']
+            results[f'{name}_counts_match'] = stats['processed_count'] == loaded and stats['bytes_read'] == size
+
+            counted, parallel = ingest_parallel(path, workers=workers, min_split_bytes=0)
+            results[f'{name}_parallel{workers}_rows_per_s'] = parallel.rows_per_second
+            results[f'{name}_parallel_counts_match'] = (counted == loaded == parallel.processed_count
+                                                        and parallel.bytes_read == size)
+
+            load_peak = _peak_traced_bytes(lambda: baselines[name](path))
+            stream_peak = _peak_traced_bytes(lambda: DataProcessor().process_file(path))
+            results[f'{name}_load_all_peak_bytes'] = load_peak
+            results[f'{name}_streaming_peak_bytes'] = stream_peak
+            results[f'{name}_memory_ratio'] = load_peak / stream_peak
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_format_sniffing():
+    """
+    FORMAT SNIFFING DEMONSTRATION
+    JSON Lines, JSON arrays and CSV dialects from the first KB
+    """
+
+    samples = {
+        'jsonl': '{"id": 1}\n{"id": 2}\n',
+        'json_array': '\ufeff  [{"id": 1}, {"id": 2}]',
+        'csv_comma': 'id,score\n1,2.5\n2,3.5\n',
+        'csv_semicolon': 'id;score;city\n1;2,5;Oslo\n2;3,5;Bergen\n',
+        'tsv_no_header': '1\t2.5\n2\t3.5\n3\t4.5\n',
+    }
+    results = {}
+    for name, sample in samples.items():
+        results[name] = sniff_format(sample.encode('utf-8'))
+        guess = results[name]
+        print(f"   {name:>14}: format={guess.format!r}, delimiter={guess.delimiter!r}, "
+              f"header={guess.has_header}")
+    return results
+
+
+def demonstrate_streaming_batches():
+    """
+    STREAMING BATCH DEMONSTRATION
+    Records arrive in batches; bad lines are counted and skipped
+    """
+
+    data = '\n'.join([
+        '{"id": 1, "name": "ada"}',
+        '{"id": 2, "name": "grace"}',
+        '{"id": 3, "name": oops}',
+        '[1, 2, 3]',
+        '',
+        '{"id": 4, "name": "linus"}',
+        '{"id": 5, "name": "guido"}',
+    ]) + '\n'
+    processor = DataProcessor(max_errors=5, batch_size=2)
+    batches = [[record['id'] for record in batch] for batch in processor.iter_batches(data)]
+    print(f"   batches of ids: {batches}")
+    print(f"   errors: {processor.errors}")
+    stats = processor.stats()
+    print(f"   status={stats['status']}, processed={stats['processed_count']}, bytes={stats['bytes_read']}")
+    return {'batches': batches, 'stats': stats}
+
+
+def demonstrate_error_budget():
+    """
+    ERROR BUDGET DEMONSTRATION
+    max_errors bounds the error log and the status, not the stream
+    """
+
+    lines = [f'{index},user{index},{index / 2}' if index % 3 else f'{index},broken'
+             for index in range(1, 16)]
+    data = 'id,name,score\n' + '\n'.join(lines) + '\n'
+    processor = DataProcessor(max_errors=2, converters={'id': int, 'score': float})
+    result = processor.process_data(data)
+    print(f"   status={result['status']}: {result['error_count']} errors, "
+          f"{result['processed_count']} good rows still processed")
+    print(f"   kept errors: {processor.errors}")
+    first = next(DataProcessor(converters={'id': int, 'score': float}).iter_batches(data))[0]
+    print(f"   converted first record: {first}")
+    return {'result': result, 'first': first}
+
+
+def demonstrate_incremental_json_array():
+    """
+    INCREMENTAL JSON ARRAY DEMONSTRATION
+    raw_decode across tiny chunks, never holding the whole document
+    """
+
+    document = json.dumps([{'id': index, 'tags': ['a', 'b'] * index} for index in range(6)])
+    processor = DataProcessor(batch_size=4, chunk_size=16)
+    batches = [[record['id'] for record in batch] for batch in processor.iter_batches(document.encode())]
+    print(f"   {len(document)} characters read 16 at a time -> batches {batches}")
+    broken = DataProcessor()
+    broken.process_data('[{"id": 1}, {"id": 2}, {"id": ]')
+    print(f"   truncated array: processed={broken.processed_count}, errors={broken.errors}")
+    return {'batches': batches, 'broken_status': broken.status}
+
+
+def demonstrate_parallel_ingest():
+    """
+    PARALLEL INGEST DEMONSTRATION
+    Byte-range splits aligned to line starts
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_sample_files(directory, 20_000, bad_every=5_000)
+        ranges = split_ranges(paths['jsonl'], 3)
+        print(f"   jsonl ranges: {ranges}")
+        results = {}
+        for name, path in paths.items():
+            total, processor = ingest_parallel(path, workers=2, min_split_bytes=0)
+            results[name] = total
+            print(f"   {name}: {total:,} records, {processor.error_count} errors, "
+                  f"{processor.bytes_read:,} of {path.stat().st_size:,} bytes")
+    return results
+
+
+def demonstrate_ingest_benchmarks(rows=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 1,000,000 rows per format
+    """
+
+    if rows is None:
+        rows = FULL_BENCHMARK_ROWS if '--full' in sys.argv else BENCHMARK_ROWS
+    results = benchmark_ingest(rows)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute streaming ingest demonstrations
+    Pass --full for the 1,000,000-row benchmark
+    """
+
+    print("🎯 PYTHON SYNTAX - STREAMING DATA INGEST WITH FORMAT SNIFFING")
+    print("=" * 60)
+
+    sections = [
+        ("Format Sniffing", demonstrate_format_sniffing),
+        ("Streaming Batches", demonstrate_streaming_batches),
+        ("Error Budget", demonstrate_error_budget),
+        ("Incremental JSON Array", demonstrate_incremental_json_array),
+        ("Parallel Ingest", demonstrate_parallel_ingest),
+        ("Ingest Benchmarks", demonstrate_ingest_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
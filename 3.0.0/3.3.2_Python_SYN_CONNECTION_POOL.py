@@ -0,0 +1,732 @@
+""" 3.3.2_Python_SYN_CONNECTION_POOL.py """
+
+# =============================================================================
+# PYTHON SYNTAX - POOLED DATABASE CONNECTIONS (SQLITE STAND-IN)
+# =============================================================================
+# Version: 3.3.2 | Educational Excellence Target: 9.5/10
+# Purpose: Back the DatabaseConnection context manager with a real, bounded connection pool
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Build a bounded, thread-safe pool of sqlite3 connections with lazy creation
+✓ Keep the `with DatabaseConnection(...) as db:` protocol: checkout on enter, return on exit
+✓ Batch writes into one transaction with chunked executemany
+✓ Size and observe the per-connection prepared-statement cache
+✓ Measure pool wait time and usage, and queries/s for 1-64 threads vs open-per-use
+
+🚀 QUICK NAVIGATION:
+├── 1. CONNECTION TARGETS (FOUNDATION)
+├── 2. PooledConnection (STATEMENT CACHE)
+├── 3. ConnectionPool (CHECKOUT, RETURN, METRICS)
+├── 4. DatabaseConnection (CONTEXT MANAGER + BATCHING)
+└── 5. BENCHMARK VS OPEN-PER-USE
+
+🔍 CORE CONCEPT:
+The DatabaseConnection in 3.3.0 "connects" on every `with` and drops the
+connection on exit. With a real database, that means a connect, a schema
+read and a fresh statement cache for every unit of work. A pool pays for a
+connection once and lends it out many times. Only the checkout (a queue
+get) and the return (a queue put) remain per `with`.
+"""
+
+import os
+import queue
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+
+# =============================================================================
+# 1. CONNECTION TARGETS - FOUNDATION
+# =============================================================================
+
+"""
+EVERY CONNECTION STRING BECOMES A SQLITE DATABASE:
+    'sqlite:///data/app.db'     relative file data/app.db
+    'sqlite:////tmp/app.db'     absolute file /tmp/app.db
+    'app.db' / Path('app.db')   file
+    ':memory:', 'postgresql://localhost:5432/db', ...
+                                a named, shared-cache in-memory database
+                                (one per string, shared by the pool's
+                                connections, gone when the last one closes)
+
+A plain ':memory:' database is private to one connection. It cannot be
+pooled, so it is mapped to a shared in-memory URI. Shared-cache databases
+lock whole tables, so for concurrent writers use a file database in WAL
+mode (the benchmark does).
+"""
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_TIMEOUT = 10.0              # seconds to wait for a free connection
+DEFAULT_STATEMENT_CACHE = 128       # sqlite3's own default
+DEFAULT_BATCH_SIZE = 1_000
+
+# Benchmark configuration
+BENCHMARK_QUERIES = 4_000
+FULL_BENCHMARK_QUERIES = 64_000
+BENCHMARK_THREADS = (1, 4, 16, 64)
+FULL_BENCHMARK_THREADS = (1, 2, 4, 8, 16, 32, 64)
+BENCHMARK_ROWS = 10_000
+
+
+def sqlite_target(connection_string):
+    """(database, uri) for sqlite3.connect from a connection string or path."""
+    if isinstance(connection_string, os.PathLike):
+        return os.fspath(connection_string), False
+    if connection_string.startswith('sqlite:///') and connection_string != 'sqlite:///:memory:':
+        return connection_string[len('sqlite:///'):], False
+    if connection_string.startswith('file:'):
+        return connection_string, True
+    if '://' in connection_string or connection_string in (':memory:', 'sqlite:///:memory:'):
+        name = re.sub(r'\W+', '_', connection_string).strip('_') or 'memory'
+        return f'file:{name}?mode=memory&cache=shared', True
+    return connection_string, False
+
+
+# =============================================================================
+# 2. PooledConnection - STATEMENT CACHE
+# =============================================================================
+
+"""
+PREPARED STATEMENTS:
+sqlite3 already keeps an LRU cache of compiled statements per connection,
+keyed by SQL text (cached_statements=128 by default). Reusing a SQL string
+with different parameters skips the parse/plan step. The cache belongs to
+the connection, so open-per-use code throws it away every time. A pooled
+connection keeps it warm.
+
+The sqlite3 module does not expose that cache, so PooledConnection keeps an
+LRU of the same size over the SQL it sends and reports hits and misses. The
+pool sets the real cache size (statement_cache_size) when it connects.
+Always pass values as parameters, never formatted into the SQL: every
+distinct string is a new statement (and an injection risk).
+"""
+
+
+class PooledConnection:
+    """A sqlite3 connection owned by a pool, with statement-cache accounting."""
+
+    __slots__ = ('connection', 'uses', 'hits', 'misses', 'cache_size', '_statements', 'checked_out_at')
+
+    def __init__(self, connection, cache_size=DEFAULT_STATEMENT_CACHE):
+        self.connection = connection
+        self.cache_size = cache_size
+        self.uses = 0
+        self.hits = 0
+        self.misses = 0
+        self._statements = OrderedDict()
+        self.checked_out_at = 0.0
+
+    def _track(self, sql):
+        statements = self._statements
+        if sql in statements:
+            statements.move_to_end(sql)
+            self.hits += 1
+            return
+        self.misses += 1
+        if self.cache_size:
+            statements[sql] = None
+            if len(statements) > self.cache_size:
+                statements.popitem(last=False)
+
+    def execute(self, sql, parameters=()):
+        self._track(sql)
+        return self.connection.execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._track(sql)
+        return self.connection.executemany(sql, seq_of_parameters)
+
+    @property
+    def in_transaction(self):
+        return self.connection.in_transaction
+
+    def statement_cache_info(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._statements), 'maxsize': self.cache_size}
+
+    def close(self):
+        self.connection.close()
+
+
+# =============================================================================
+# 3. ConnectionPool - CHECKOUT, RETURN, METRICS
+# =============================================================================
+
+"""
+POOL MECHANICS:
+    idle connections   queue.LifoQueue - the most recently returned (warmest)
+                       connection is handed out first
+    creation           lazy, up to `size`; a counter guarded by a lock
+                       reserves a slot before connecting, so threads
+                       racing for the last slot never create size + 1
+    checkout           get_nowait(); else create if under size; else block on
+                       get(timeout) and raise PoolTimeout when it expires
+    return             roll back any transaction left open, then put()
+
+METRICS (stats()):
+    checkouts, created, waits (checkouts that had to block), timeouts,
+    wait_time / max_wait (seconds blocked on a full pool), connect_time,
+    in_use / peak_in_use, hold_time (seconds connections were lent out)
+"""
+
+
+class PoolTimeout(TimeoutError):
+    """No connection became free within the pool timeout."""
+
+
+class PoolClosedError(RuntimeError):
+    """The pool was closed and hands out no more connections."""
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of sqlite3 connections."""
+
+    def __init__(self, database, size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 statement_cache_size=DEFAULT_STATEMENT_CACHE, setup=None):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.database, self.uri = sqlite_target(database)
+        self.size = size
+        self.timeout = timeout
+        self.statement_cache_size = statement_cache_size
+        self.setup = setup
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {'checkouts': 0, 'waits': 0, 'timeouts': 0, 'wait_time': 0.0,
+                           'max_wait': 0.0, 'connect_time': 0.0, 'in_use': 0,
+                           'peak_in_use': 0, 'hold_time': 0.0}
+
+    def _connect(self):
+        start = time.perf_counter()
+        connection = sqlite3.connect(
+            self.database, timeout=self.timeout, isolation_level=None, check_same_thread=False,
+            cached_statements=self.statement_cache_size, uri=self.uri)
+        if self.setup is not None:
+            self.setup(connection)
+        pooled = PooledConnection(connection, self.statement_cache_size)
+        with self._lock:
+            self._stats['connect_time'] += time.perf_counter() - start
+        return pooled
+
+    def acquire(self, timeout=None):
+        """Check a PooledConnection out (blocks up to `timeout` when all are in use)."""
+        if self._closed:
+            raise PoolClosedError("connection pool is closed")
+        waited = 0.0
+        try:
+            pooled = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    pooled = self._connect()
+                except BaseException:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                start = time.perf_counter()
+                try:
+                    pooled = self._idle.get(timeout=self.timeout if timeout is None else timeout)
+                except queue.Empty:
+                    with self._lock:
+                        self._stats['timeouts'] += 1
+                    raise PoolTimeout(f"no connection free within {self.timeout if timeout is None else timeout}s "
+                                      f"(pool size {self.size})") from None
+                waited = time.perf_counter() - start
+
+        stats = self._stats
+        with self._lock:
+            stats['checkouts'] += 1
+            stats['in_use'] += 1
+            if stats['in_use'] > stats['peak_in_use']:
+                stats['peak_in_use'] = stats['in_use']
+            if waited:
+                stats['waits'] += 1
+                stats['wait_time'] += waited
+                if waited > stats['max_wait']:
+                    stats['max_wait'] = waited
+        pooled.uses += 1
+        pooled.checked_out_at = time.perf_counter()
+        return pooled
+
+    def release(self, pooled):
+        """Return a connection; an open transaction is rolled back first."""
+        if pooled.connection.in_transaction:
+            pooled.connection.rollback()
+        held = time.perf_counter() - pooled.checked_out_at
+        with self._lock:
+            self._stats['in_use'] -= 1
+            self._stats['hold_time'] += held
+            closed = self._closed
+            if closed:
+                self._created -= 1
+        if closed:
+            pooled.close()
+        else:
+            self._idle.put(pooled)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['created'] = self._created
+        stats['idle'] = self._idle.qsize()
+        stats['size'] = self.size
+        stats['average_wait'] = stats['wait_time'] / stats['checkouts'] if stats['checkouts'] else 0.0
+        return stats
+
+    def close(self):
+        """Close idle connections now and busy ones as they are returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            pooled.close()
+            with self._lock:
+                self._created -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return (f"ConnectionPool({self.database!r}, size={self.size}, created={self._created}, "
+                f"idle={self._idle.qsize()})")
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(connection_string, **options):
+    """The shared pool for a connection string (created on first use with `options`)."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(connection_string)
+        if pool is None or pool._closed:
+            pool = _POOLS[connection_string] = ConnectionPool(connection_string, **options)
+        return pool
+
+
+def close_all_pools():
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+# =============================================================================
+# 4. DatabaseConnection - CONTEXT MANAGER + BATCHING
+# =============================================================================
+
+"""
+SAME PROTOCOL AS 3.3.0:
+    with DatabaseConnection("postgresql://localhost:5432/db") as db:
+        db.begin_transaction()
+        rows = db.execute_query("SELECT * FROM users WHERE id = ?", (7,))
+
+__enter__ checks a connection out of the shared pool for that string (or
+of an explicit ConnectionPool). __exit__ commits, or rolls back on an
+exception, and returns the connection. It never suppresses the exception.
+execute_query returns the fetched rows for statements that produce rows,
+and the affected row count otherwise.
+
+TRANSACTION BATCHING:
+Connections run in autocommit mode (isolation_level=None). BEGIN and
+COMMIT are explicit. execute_many(sql, rows, batch_size) feeds rows to
+executemany batch_size at a time. Outside a transaction it opens one for
+the whole call, so N rows cost one commit (one fsync), not N.
+"""
+
+
+class DatabaseConnection:
+    """Context manager lending a pooled sqlite3 connection for one unit of work."""
+
+    def __init__(self, connection_string, **pool_options):
+        if isinstance(connection_string, ConnectionPool):
+            self.pool = connection_string
+            self.connection_string = connection_string.database
+        else:
+            self.pool = get_pool(connection_string, **pool_options)
+            self.connection_string = connection_string
+        self.connection = None
+        self.transaction = None
+
+    def __enter__(self):
+        self.connection = self.pool.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self.transaction:
+                if exc_type is None:
+                    self.commit()
+                else:
+                    self.rollback()
+        finally:
+            connection, self.connection = self.connection, None
+            self.pool.release(connection)
+        return False
+
+    def _require(self):
+        if self.connection is None:
+            raise RuntimeError("No active connection")
+        return self.connection
+
+    def begin_transaction(self):
+        """Begin a database transaction (BEGIN)."""
+        self._require().execute('BEGIN')
+        self.transaction = "Active transaction"
+
+    def commit(self):
+        if self._require().in_transaction:
+            self.connection.execute('COMMIT')
+        self.transaction = None
+
+    def rollback(self):
+        if self._require().in_transaction:
+            self.connection.execute('ROLLBACK')
+        self.transaction = None
+
+    def execute_query(self, query, parameters=()):
+        """Execute a query: fetched rows for SELECT-like statements, else the row count."""
+        cursor = self._require().execute(query, parameters)
+        return cursor.fetchall() if cursor.description is not None else cursor.rowcount
+
+    def execute_many(self, query, rows, batch_size=DEFAULT_BATCH_SIZE):
+        """executemany in batches of batch_size inside one transaction; returns rows written."""
+        connection = self._require()
+        own_transaction = not self.transaction
+        if own_transaction:
+            self.begin_transaction()
+        written = 0
+        iterator = iter(rows)
+        try:
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                connection.executemany(query, batch)
+                written += len(batch)
+        except BaseException:
+            if own_transaction:
+                self.rollback()
+            raise
+        if own_transaction:
+            self.commit()
+        return written
+
+    def statement_cache_info(self):
+        return self._require().statement_cache_info()
+
+
+# =============================================================================
+# 5. BENCHMARK VS OPEN-PER-USE
+# =============================================================================
+
+"""
+OPEN-PER-USE:
+OpenPerUseConnection is the 3.3.0 protocol backed by real sqlite3. It
+connects on __enter__ and closes on __exit__, so each unit of work pays for
+connecting, loading the schema and compiling its statements again.
+
+WORKLOAD:
+Threads share a file database in WAL mode and run point SELECTs by primary
+key, one `with` per query (the worst case for open-per-use). Threads
+outnumber the pool from 16 up, so wait-time metrics show up there. The GIL
+and SQLite's own locking cap the total throughput. The point of the pool
+is to stop paying for setup, not to scale across cores.
+"""
+
+
+class OpenPerUseConnection:
+    """3.3.0 semantics on sqlite3: a fresh connection for every `with`."""
+
+    def __init__(self, connection_string):
+        self.connection_string = connection_string
+        self.database, self.uri = sqlite_target(connection_string)
+        self.connection = None
+        self.transaction = None
+
+    def __enter__(self):
+        self.connection = sqlite3.connect(self.database, isolation_level=None, uri=self.uri)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.transaction and self.connection.in_transaction:
+            self.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+        self.connection.close()
+        self.connection = None
+        return False
+
+    def execute_query(self, query, parameters=()):
+        if not self.connection:
+            raise RuntimeError("No active connection")
+        cursor = self.connection.execute(query, parameters)
+        return cursor.fetchall() if cursor.description is not None else cursor.rowcount
+
+
+def create_sample_database(path, rows=BENCHMARK_ROWS):
+    with DatabaseConnection(ConnectionPool(path, size=1)) as db:
+        db.execute_query('PRAGMA journal_mode=WAL')
+        db.execute_query('CREATE TABLE IF NOT EXISTS users '
+                         '(id INTEGER PRIMARY KEY, name TEXT NOT NULL, score REAL NOT NULL)')
+        db.execute_many('INSERT INTO users (id, name, score) VALUES (?, ?, ?)',
+                        ((index, f'user{index}', index % 997 / 10) for index in range(rows)))
+        db.pool.close()
+
+
+def _run_threads(worker, threads, queries):
+    """Run `queries` calls of worker(user_id) split over `threads` threads; returns seconds."""
+    per_thread = max(1, queries // threads)
+    barrier = threading.Barrier(threads + 1)
+    errors = []
+
+    def run(seed):
+        ids = random.Random(seed).choices(range(BENCHMARK_ROWS), k=per_thread)
+        barrier.wait()
+        try:
+            for user_id in ids:
+                worker(user_id)
+        except Exception as error:
+            errors.append(error)
+
+    pool = [threading.Thread(target=run, args=(seed,)) for seed in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return elapsed, per_thread * threads
+
+
+def benchmark_pool(queries=BENCHMARK_QUERIES, thread_counts=BENCHMARK_THREADS, pool_size=DEFAULT_POOL_SIZE):
+    """Queries/s per thread count: pooled vs open-per-use, plus batching and statement cache."""
+    select = 'SELECT name, score FROM users WHERE id = ?'
+    results = {'queries': queries, 'pool_size': pool_size}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.db')
+        create_sample_database(path)
+
+        def open_per_use(user_id):
+            with OpenPerUseConnection(path) as db:
+                return db.execute_query(select, (user_id,))
+
+        for threads in thread_counts:
+            with ConnectionPool(path, size=pool_size) as pool:
+                def pooled(user_id):
+                    with DatabaseConnection(pool) as db:
+                        return db.execute_query(select, (user_id,))
+
+                pooled_time, done = _run_threads(pooled, threads, queries)
+                stats = pool.stats()
+            open_time, _ = _run_threads(open_per_use, threads, queries)
+            results[f't{threads}_pooled_qps'] = done / pooled_time
+            results[f't{threads}_open_per_use_qps'] = done / open_time
+            results[f't{threads}_speedup'] = open_time / pooled_time
+            results[f't{threads}_connections_created'] = stats['created']
+            results[f't{threads}_waits'] = stats['waits']
+            results[f't{threads}_average_wait_ms'] = stats['average_wait'] * 1000
+
+        rows = [(f'bulk{index}', index / 7) for index in range(queries)]
+        insert = 'INSERT INTO users (name, score) VALUES (?, ?)'
+        with ConnectionPool(path, size=1) as pool, DatabaseConnection(pool) as db:
+            start = time.perf_counter()
+            for row in rows[:queries // 10]:
+                db.execute_query(insert, row)
+            per_row_rate = (queries // 10) / (time.perf_counter() - start)
+            start = time.perf_counter()
+            written = db.execute_many(insert, rows)
+            batch_rate = written / (time.perf_counter() - start)
+            results['autocommit_rows_per_s'] = per_row_rate
+            results['execute_many_rows_per_s'] = batch_rate
+            results['batching_speedup'] = batch_rate / per_row_rate
+
+        for cache_size in (0, DEFAULT_STATEMENT_CACHE):
+            with ConnectionPool(path, size=1, statement_cache_size=cache_size) as pool, \
+                    DatabaseConnection(pool) as db:
+                start = time.perf_counter()
+                for user_id in range(queries):
+                    db.execute_query(select, (user_id % BENCHMARK_ROWS,))
+                results[f'statement_cache{cache_size}_qps'] = queries / (time.perf_counter() - start)
+                results[f'statement_cache{cache_size}_hits'] = db.statement_cache_info()['hits']
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_connection_targets():
+    """
+    CONNECTION TARGET DEMONSTRATION
+    Every connection string maps to a local sqlite3 database
+    """
+
+    results = {}
+    for connection_string in ('sqlite:///data/app.db', 'sqlite:////tmp/app.db', 'app.db', ':memory:',
+                              'postgresql://localhost:5432/db'):
+        results[connection_string] = sqlite_target(connection_string)
+        print(f"   {connection_string!r:>34} -> {results[connection_string]}")
+    return results
+
+
+def demonstrate_pooled_context_manager():
+    """
+    POOLED CONTEXT MANAGER DEMONSTRATION
+    The 3.3.0 `with` protocol, now reusing connections
+    """
+
+    # Same call pattern as 3.3.0 demonstrate_context_managers
+    with (
+        DatabaseConnection("postgresql://localhost:5432/db") as db1,
+        DatabaseConnection("mysql://localhost:3306/db") as db2
+    ):
+        db1.begin_transaction()
+        db1.execute_query("CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, name TEXT)")
+        db1.execute_many("INSERT INTO users (name) VALUES (?)", [("ada",), ("grace",), ("linus",)])
+        result1 = db1.execute_query("SELECT * FROM users")
+
+        db2.begin_transaction()
+        db2.execute_query("CREATE TABLE IF NOT EXISTS products (sku TEXT)")
+        result2 = db2.execute_query("SELECT * FROM products")
+    print(f"   db1 rows: {result1}")
+    print(f"   db2 rows: {result2}")
+
+    try:
+        with DatabaseConnection("postgresql://localhost:5432/db") as db:
+            db.begin_transaction()
+            db.execute_query("INSERT INTO users (name) VALUES ('rolled back')")
+            raise ValueError("simulated failure")
+    except ValueError as error:
+        print(f"   error '{error}' -> rolled back")
+
+    for _ in range(5):
+        with DatabaseConnection("postgresql://localhost:5432/db") as db:
+            count = db.execute_query("SELECT COUNT(*) FROM users")[0][0]
+            cache = db.statement_cache_info()
+    stats = get_pool("postgresql://localhost:5432/db").stats()
+    print(f"   users after rollback: {count}; checkouts={stats['checkouts']}, "
+          f"connections created={stats['created']}")
+    print(f"   statement cache: {cache}")
+    close_all_pools()
+    return {'db1': result1, 'db2': result2, 'count': count, 'created': stats['created']}
+
+
+def demonstrate_pool_limits():
+    """
+    POOL LIMIT DEMONSTRATION
+    Blocking checkouts, wait-time metrics and timeouts
+    """
+
+    with ConnectionPool(':memory:', size=2, timeout=0.05) as pool:
+        first, second = pool.acquire(), pool.acquire()
+        try:
+            pool.acquire()
+        except PoolTimeout as error:
+            print(f"   third checkout: PoolTimeout({error})")
+
+        timer = threading.Timer(0.02, pool.release, args=(first,))
+        timer.start()
+        third = pool.acquire(timeout=1.0)
+        timer.join()
+        print(f"   blocked checkout got the returned connection: {third is first}")
+        pool.release(second)
+        pool.release(third)
+        stats = pool.stats()
+    for key in ('checkouts', 'created', 'waits', 'timeouts', 'max_wait', 'peak_in_use'):
+        value = stats[key]
+        print(f"   {key}: {value:.4f}" if isinstance(value, float) else f"   {key}: {value}")
+    return stats
+
+
+def demonstrate_pool_benchmarks(queries=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 64,000 queries over 1-64 threads
+    """
+
+    full = '--full' in sys.argv
+    if queries is None:
+        queries = FULL_BENCHMARK_QUERIES if full else BENCHMARK_QUERIES
+    results = benchmark_pool(queries, FULL_BENCHMARK_THREADS if full else BENCHMARK_THREADS)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute connection pool demonstrations
+    Pass --full for the large thread-scaling benchmark
+    """
+
+    print("🎯 PYTHON SYNTAX - POOLED DATABASE CONNECTIONS (SQLITE STAND-IN)")
+    print("=" * 60)
+
+    sections = [
+        ("Connection Targets", demonstrate_connection_targets),
+        ("Pooled Context Manager", demonstrate_pooled_context_manager),
+        ("Pool Limits", demonstrate_pool_limits),
+        ("Pool Benchmarks", demonstrate_pool_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,667 @@
+""" 3.3.3_Python_SYN_LAZY_CONTAINER.py """
+
+# =============================================================================
+# PYTHON SYNTAX - LAZY, FUSED DataContainer PIPELINES
+# =============================================================================
+# Version: 3.3.3 | Educational Excellence Target: 9.5/10
+# Purpose: Turn DataContainer filter/transform chains into one fused pass
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ See why filter_items/transform chains allocate one full list per stage
+✓ Return deferred views from filter_items/transform and fuse them into one comprehension
+✓ Back numeric containers with array.array (8 bytes per item instead of a pointer + object)
+✓ Share storage on get_all with copy-on-write instead of copying up front
+✓ Send chunks of large containers to a process pool
+✓ Benchmark a 5-stage chain over 10^7 items
+
+🚀 QUICK NAVIGATION:
+├── 1. TYPED BACKING STORES (FOUNDATION)
+├── 2. COPY-ON-WRITE get_all
+├── 3. FUSED KERNELS (ONE COMPREHENSION PER CHAIN)
+├── 4. LAZY VIEWS AND THE NEW DataContainer
+└── 5. BENCHMARK: 5-STAGE CHAIN
+
+🔍 CORE CONCEPT:
+In 3.3.0, container.transform(f).filter_items(p) builds one list for
+transform, wraps it in a new container, then builds a second list for the
+filter. Each stage walks the data again and allocates a full list. A lazy
+view only records (kind, operation). The first consumer compiles the whole
+chain into a single comprehension:
+    [x for x in block for x in (x * 3,) if x % 2 == 0 for x in (x + 7,) ...]
+so each item is read once and no intermediate list ever exists.
+"""
+
+import array
+import functools
+import pickle
+import sys
+import time
+from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Generic, Iterable, List, TypeVar, Union
+
+T = TypeVar('T')
+
+# =============================================================================
+# 1. TYPED BACKING STORES - FOUNDATION
+# =============================================================================
+
+"""
+LIST VS array.array:
+A list of 10^7 ints holds 10^7 pointers (80 MB) to int objects (28-32
+bytes each, apart from the small-int cache). array('q') stores the raw
+8-byte values (80 MB total) and hands out memoryview slices with no copy.
+choose_typecode picks a store:
+    any bool / non-number    -> None (plain list)
+    all ints in int64 range  -> 'q'
+    ints and floats          -> 'd'
+typecode='auto' asks for that choice. typecode=None keeps a list or an
+array.array as given and turns any other iterable into a list (the 3.3.0
+behaviour). An explicit typecode always builds that array.
+"""
+
+DEFAULT_BLOCK_SIZE = 16_384         # items per fused block; fits in cache
+PARALLEL_CHUNK_SIZE = 1 << 20       # items per process-pool task
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+# Benchmark configuration
+BENCHMARK_SIZE = 1_000_000
+FULL_BENCHMARK_SIZE = 10_000_000
+
+
+def choose_typecode(items):
+    """'q', 'd' or None (list) for the given items."""
+    typecode = 'q'
+    for item in items:
+        kind = type(item)
+        if kind is int:
+            if not INT64_MIN <= item <= INT64_MAX:
+                return None
+        elif kind is float:
+            typecode = 'd'
+        else:
+            return None
+    return typecode
+
+
+def make_store(items, typecode=None):
+    """A list, or an array.array when a typecode is given ('auto' to choose)."""
+    if isinstance(items, array.array) and typecode in ('auto', items.typecode):
+        return items
+    if typecode == 'auto':
+        items = items if isinstance(items, (list, tuple, array.array)) else list(items)
+        typecode = choose_typecode(items)
+    if typecode is None:
+        return items if type(items) in (list, array.array) else list(items)
+    return array.array(typecode, items)
+
+
+# =============================================================================
+# 2. COPY-ON-WRITE get_all
+# =============================================================================
+
+"""
+SHARING INSTEAD OF COPYING:
+get_all in 3.3.0 returns self._items.copy(), an O(n) copy for every
+reader. Here get_all returns a CopyOnWriteList that shares the store. Both
+sides copy only when they write:
+    container.add(...)   copies the store first if it was handed out
+    result[0] = ...      the CopyOnWriteList copies its own data first
+Lazy views take the store the same way, so a view always sees the items
+as they were when it was created (a snapshot), even if the container
+changes later.
+"""
+
+
+class CopyOnWriteList(MutableSequence):
+    """List-like view sharing a store until its first mutation."""
+
+    __slots__ = ('_data', '_owned')
+
+    def __init__(self, data):
+        self._data = data
+        self._owned = False
+
+    def _writable(self):
+        if not self._owned:
+            self._data = self._data[:]
+            self._owned = True
+        return self._data
+
+    @property
+    def is_shared(self):
+        return not self._owned
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __setitem__(self, index, value):
+        self._writable()[index] = value
+
+    def __delitem__(self, index):
+        del self._writable()[index]
+
+    def insert(self, index, value):
+        self._writable().insert(index, value)
+
+    def append(self, value):
+        self._writable().append(value)
+
+    def extend(self, values):
+        self._writable().extend(values)
+
+    def copy(self):
+        return list(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, CopyOnWriteList):
+            other = other._data
+        return list(self._data) == list(other) if isinstance(other, (list, array.array)) else NotImplemented
+
+    def __repr__(self):
+        return f"CopyOnWriteList({list(self._data)!r})"
+
+
+# =============================================================================
+# 3. FUSED KERNELS - ONE COMPREHENSION PER CHAIN
+# =============================================================================
+
+"""
+KERNELS (same scheme as 3.9.4_Python_ARR_FUSED_EXPRESSIONS.py):
+Each stage becomes one clause of a comprehension that rebinds x:
+    transform 'expr'     -> for x in ((expr),)
+    transform callable   -> for x in (_f0(x),)
+    filter 'expr'        -> if (expr)
+    filter callable      -> if _f1(x)
+String expressions are wrapped in parentheses, so 'x, -x' yields a tuple
+instead of silently becoming a second loop value.
+CPython compiles `for x in (expr,)` into a plain assignment, so
+string stages cost no function call. Callables still cost one call per
+item per stage, but fusion removes every intermediate list. Kernels made
+only of strings are cached by their stage tuple.
+"""
+
+
+def _stage_clause(position, kind, operation, namespace):
+    if isinstance(operation, str):
+        expression = operation
+    else:
+        name = f"_f{position}"
+        namespace[name] = operation
+        expression = f"{name}(x)"
+    if kind == 'transform':
+        return f"for x in (({expression}),)"
+    if kind == 'filter':
+        return f"if ({expression})"
+    raise ValueError(f"Unknown stage kind: {kind!r}")
+
+
+def _compile_kernel(stages, wrapper):
+    namespace = {}
+    clauses = ' '.join(_stage_clause(position, kind, operation, namespace)
+                       for position, (kind, operation) in enumerate(stages))
+    body = f"{wrapper}(x for x in block {clauses})" if wrapper else f"[x for x in block {clauses}]"
+    namespace.update({'sum': sum, 'len': len})
+    exec(compile(f"def kernel(block):\n    return {body}\n", '<container-kernel>', 'exec'), namespace)
+    return namespace['kernel']
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_string_kernel(stages, wrapper):
+    return _compile_kernel(stages, wrapper)
+
+
+def build_kernel(stages, wrapper=None):
+    """kernel(block) running every stage in one comprehension (wrapper: None or 'sum')."""
+    stages = tuple(stages)
+    if all(isinstance(operation, str) for _, operation in stages):
+        return _compile_string_kernel(stages, wrapper)
+    return _compile_kernel(stages, wrapper)
+
+
+# =============================================================================
+# 4. LAZY VIEWS AND THE NEW DataContainer
+# =============================================================================
+
+"""
+API (3.3.0 names, lazy results):
+    container.filter_items(p) / .transform(f)   -> LazyView (no work yet)
+    view.filter_items(p) / view.transform(f)    -> longer LazyView (no work)
+    view.collect(typecode='auto', workers=None) -> DataContainer (one pass)
+    view.get_all() / list(view) / view.sum() / view.count() / view.reduce(...)
+
+Stages are callables or expressions in x ('x * 3', 'x % 2 == 0').
+Iterating a view evaluates block by block (DEFAULT_BLOCK_SIZE items), so
+even for-loops over a view never build the full result. collect() and
+get_all() cache their result, and len(view) uses that cache.
+
+PROCESS POOL:
+With workers set, collect() sends PARALLEL_CHUNK_SIZE chunks to a
+ProcessPoolExecutor. Arrays travel as raw bytes. Every stage must pickle:
+string expressions always do, module-level functions do, lambdas do not
+(a ValueError tells you so). Workers compile string kernels once per
+process (lru_cache).
+"""
+
+
+class LazyView(Generic[T]):
+    """A deferred filter/transform chain over a snapshot of a DataContainer."""
+
+    __slots__ = ('_store', '_stages', '_block_size', '_result')
+
+    def __init__(self, store, stages=(), block_size=DEFAULT_BLOCK_SIZE):
+        self._store = store
+        self._stages = tuple(stages)
+        self._block_size = block_size
+        self._result = None
+
+    # Builders ---------------------------------------------------------------
+
+    def _extend(self, kind, operation):
+        return LazyView(self._store, self._stages + ((kind, operation),), self._block_size)
+
+    def filter_items(self, predicate: Union[Callable[[T], bool], str]) -> 'LazyView[T]':
+        """Keep items where predicate (callable or expression in x) is true."""
+        return self._extend('filter', predicate)
+
+    def transform(self, transformer: Union[Callable[[T], T], str]) -> 'LazyView[T]':
+        """Apply transformer (callable or expression in x) to each item."""
+        return self._extend('transform', transformer)
+
+    @property
+    def stages(self):
+        return self._stages
+
+    @property
+    def preserves_length(self):
+        return all(kind != 'filter' for kind, _ in self._stages)
+
+    # Evaluation -------------------------------------------------------------
+
+    def _blocks(self):
+        store, size = self._store, self._block_size
+        if isinstance(store, array.array):
+            store = memoryview(store)
+        for start in range(0, len(store), size):
+            yield store[start:start + size]
+
+    def _run(self, wrapper=None):
+        kernel = build_kernel(self._stages, wrapper)
+        return map(kernel, self._blocks())
+
+    def __iter__(self):
+        if self._result is not None:
+            return iter(self._result)
+        return (item for values in self._run() for item in values)
+
+    def get_all(self) -> List[T]:
+        """Evaluate once (cached) and return the results as a list."""
+        if self._result is None:
+            result = []
+            for values in self._run():
+                result.extend(values)
+            self._result = result
+        return self._result
+
+    def __len__(self):
+        if self.preserves_length:
+            return len(self._store)
+        return len(self.get_all())
+
+    def __eq__(self, other):
+        if isinstance(other, (LazyView, DataContainer)):
+            other = other.get_all()
+        return self.get_all() == list(other) if isinstance(other, (list, CopyOnWriteList)) else NotImplemented
+
+    __hash__ = None
+
+    def sum(self):
+        return sum(self._run('sum'))
+
+    def count(self):
+        return len(self)
+
+    def reduce(self, function, initial):
+        accumulator = initial
+        for values in self._run():
+            accumulator = functools.reduce(function, values, accumulator)
+        return accumulator
+
+    def collect(self, typecode='auto', workers=None, chunk_size=PARALLEL_CHUNK_SIZE) -> 'DataContainer[T]':
+        """
+        Materialize into a new DataContainer in one fused pass.
+
+        typecode: 'auto' keeps the source's array typecode when the results
+        fit (else a list); None forces a list; or an explicit typecode.
+        """
+        if workers:
+            values = self._collect_parallel(workers, chunk_size)
+        else:
+            values = self.get_all()
+        if typecode == 'auto':
+            typecode = self._store.typecode if isinstance(self._store, array.array) else None
+            if typecode is not None:
+                try:
+                    return DataContainer(array.array(typecode, values))
+                except (TypeError, OverflowError):
+                    typecode = None
+        return DataContainer(values, typecode)
+
+    def _collect_parallel(self, workers, chunk_size):
+        try:
+            stages = pickle.dumps(self._stages)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError(f"parallel collect needs picklable stages (strings or module-level "
+                             f"functions): {error}") from None
+        store = self._store
+        typed = isinstance(store, array.array)
+        tasks = []
+        for start in range(0, len(store), chunk_size):
+            chunk = store[start:start + chunk_size]
+            tasks.append((stages, store.typecode if typed else None, chunk.tobytes() if typed else chunk))
+        result = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for values in executor.map(_collect_chunk_worker, tasks):
+                result.extend(values)
+        self._result = result
+        return result
+
+    def __repr__(self):
+        chain = ''.join(f".{'filter_items' if kind == 'filter' else kind}({operation!r})"
+                        for kind, operation in self._stages)
+        kind = f"array('{self._store.typecode}')" if isinstance(self._store, array.array) else 'list'
+        return f"LazyView({kind}[{len(self._store)}]){chain}"
+
+
+def _collect_chunk_worker(task):
+    """Process-pool worker: rebuild one chunk and run the fused kernel over it."""
+    stages, typecode, chunk = task
+    stages = pickle.loads(stages)
+    if typecode is not None:
+        data = array.array(typecode)
+        data.frombytes(chunk)
+        chunk = data
+    return LazyView(chunk, stages).get_all()
+
+
+class DataContainer(Generic[T]):
+    """Generic container with lazy, fused filter/transform pipelines."""
+
+    __slots__ = ('_items', '_shared')
+
+    def __init__(self, items: Iterable[T], typecode=None) -> None:
+        self._items = make_store(items, typecode)
+        self._shared = False
+
+    @classmethod
+    def typed(cls, items: Iterable[T], typecode='auto') -> 'DataContainer[T]':
+        return cls(items, typecode)
+
+    @property
+    def typecode(self):
+        return self._items.typecode if isinstance(self._items, array.array) else None
+
+    def _share(self):
+        self._shared = True
+        return self._items
+
+    def add(self, item: T) -> None:
+        """Add an item to the container (copies a store that was handed out)."""
+        if self._shared:
+            self._items = self._items[:]
+            self._shared = False
+        self._items.append(item)
+
+    def get_all(self) -> CopyOnWriteList:
+        """All items, shared until either side writes."""
+        return CopyOnWriteList(self._share())
+
+    def view(self) -> LazyView[T]:
+        return LazyView(self._share())
+
+    def filter_items(self, predicate: Union[Callable[[T], bool], str]) -> LazyView[T]:
+        """Deferred filter (callable or expression in x)."""
+        return self.view().filter_items(predicate)
+
+    def transform(self, transformer: Union[Callable[[T], T], str]) -> LazyView[T]:
+        """Deferred transform (callable or expression in x)."""
+        return self.view().transform(transformer)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self):
+        kind = f"array('{self.typecode}')" if self.typecode else 'list'
+        return f"DataContainer({kind}, {len(self._items)} items)"
+
+
+# =============================================================================
+# 5. BENCHMARK: 5-STAGE CHAIN
+# =============================================================================
+
+"""
+THE CHAIN (over range(n)):
+    transform x * 3  ->  filter even  ->  transform x + 7
+    ->  filter x % 5 != 0  ->  transform x // 2
+
+Contenders:
+    eager         the 3.3.0 DataContainer (reference copy below, lambdas)
+    fused_lambda  LazyView with the same lambdas (one pass, no intermediates)
+    fused_string  LazyView with string stages (one pass, inlined)
+    typed         string stages over an array('q') store, collected to array('q')
+    parallel      typed, collected on a process pool (only with --full)
+"""
+
+STRING_CHAIN = (('transform', 'x * 3'), ('filter', 'x % 2 == 0'), ('transform', 'x + 7'),
+                ('filter', 'x % 5 != 0'), ('transform', 'x // 2'))
+LAMBDA_CHAIN = (('transform', lambda x: x * 3), ('filter', lambda x: x % 2 == 0),
+                ('transform', lambda x: x + 7), ('filter', lambda x: x % 5 != 0),
+                ('transform', lambda x: x // 2))
+
+
+class EagerDataContainer(Generic[T]):
+    """3.3.0 reference: every stage builds a new list."""
+
+    def __init__(self, items: List[T]) -> None:
+        self._items: List[T] = items
+
+    def add(self, item: T) -> None:
+        self._items.append(item)
+
+    def get_all(self) -> List[T]:
+        return self._items.copy()
+
+    def filter_items(self, predicate: Callable[[T], bool]) -> List[T]:
+        return [item for item in self._items if predicate(item)]
+
+    def transform(self, transformer: Callable[[T], T]) -> 'EagerDataContainer[T]':
+        transformed_items = [transformer(item) for item in self._items]
+        return EagerDataContainer(transformed_items)
+
+
+def run_chain(container, chain):
+    """Apply (kind, operation) stages with the container's own methods."""
+    current = container
+    for kind, operation in chain:
+        if kind == 'filter':
+            current = current.filter_items(operation)
+            if isinstance(current, list):           # eager filter_items returns a plain list
+                current = EagerDataContainer(current)
+        else:
+            current = current.transform(operation)
+    return current
+
+
+def benchmark_chain(size=BENCHMARK_SIZE, workers=None):
+    """Seconds for the 5-stage chain: eager vs fused (lambda / string / typed / parallel)."""
+    results = {'items': size}
+
+    start = time.perf_counter()
+    expected = run_chain(EagerDataContainer(list(range(size))), LAMBDA_CHAIN).get_all()
+    results['eager_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fused_lambda = run_chain(DataContainer(range(size)), LAMBDA_CHAIN).get_all()
+    results['fused_lambda_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fused_string = run_chain(DataContainer(range(size)), STRING_CHAIN).get_all()
+    results['fused_string_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    typed = run_chain(DataContainer(array.array('q', range(size))), STRING_CHAIN).collect()
+    results['typed_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = run_chain(DataContainer(array.array('q', range(size))), STRING_CHAIN).sum()
+    results['typed_sum_s'] = time.perf_counter() - start
+
+    results['result_items'] = len(expected)
+    results['fused_lambda_speedup'] = results['eager_s'] / results['fused_lambda_s']
+    results['fused_string_speedup'] = results['eager_s'] / results['fused_string_s']
+    results['typed_speedup'] = results['eager_s'] / results['typed_s']
+    results['results_match'] = (fused_lambda == expected == fused_string and list(typed) == expected
+                                and total == sum(expected) and typed.typecode == 'q')
+
+    if workers:
+        start = time.perf_counter()
+        parallel = run_chain(DataContainer(array.array('q', range(size))), STRING_CHAIN).collect(workers=workers)
+        results[f'parallel{workers}_s'] = time.perf_counter() - start
+        results['parallel_matches'] = list(parallel) == expected
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_lazy_views():
+    """
+    LAZY VIEW DEMONSTRATION
+    Chains record stages; consumers run them in one pass
+    """
+
+    calls = []
+
+    def traced_double(x):
+        calls.append(x)
+        return x * 2
+
+    container = DataContainer([1, 2, 3, 4, 5, 6])
+    view = container.filter_items('x % 2 == 0').transform(traced_double).filter_items(lambda x: x > 4)
+    print(f"   {view!r}")
+    print(f"   calls before consuming: {len(calls)}")
+    print(f"   get_all(): {view.get_all()}, calls: {len(calls)}")
+    print(f"   again (cached): {view.get_all()}, calls: {len(calls)}")
+    checked = []
+    big = DataContainer.typed(range(1_000_000)).filter_items(lambda x: checked.append(x) or x % 7 == 3)
+    first = next(iter(big))
+    print(f"   first match {first} of 1,000,000 items: only {len(checked):,} checked (one block)")
+    return {'result': view.get_all(), 'calls': len(calls), 'first': first, 'checked': len(checked)}
+
+
+def demonstrate_typed_store():
+    """
+    TYPED STORE DEMONSTRATION
+    array.array backing for numeric containers
+    """
+
+    samples = {'ints': [1, 2, 3], 'mixed': [1, 2.5], 'huge': [1 << 70], 'text': ['a', 'b'], 'bools': [True]}
+    results = {}
+    for name, items in samples.items():
+        container = DataContainer.typed(items)
+        results[name] = container.typecode
+        print(f"   {name:>6}: {container!r}")
+    numbers = DataContainer.typed(range(1_000))
+    collected = numbers.transform('x * x').filter_items('x % 3 == 0').collect()
+    fallback = numbers.transform('x / 2').collect()
+    print(f"   collect keeps 'q': {collected!r}; x / 2 falls back to {fallback!r}")
+    print(f"   sizes: list {sys.getsizeof(list(range(1_000))):,} B + int objects, "
+          f"array {sys.getsizeof(numbers._items):,} B")
+    results['collected'] = collected.typecode
+    return results
+
+
+def demonstrate_copy_on_write():
+    """
+    COPY-ON-WRITE DEMONSTRATION
+    get_all shares storage until someone writes
+    """
+
+    container = DataContainer([1, 2, 3])
+    snapshot = container.get_all()
+    view = container.transform('x * 10')
+    print(f"   get_all shares the store: {snapshot._data is container._items}")
+    container.add(4)
+    print(f"   after add(4): container={list(container)}, snapshot={list(snapshot)}, view={view.get_all()}")
+    snapshot[0] = 99
+    print(f"   after snapshot[0] = 99: snapshot={list(snapshot)}, container={list(container)}")
+    return {'container': list(container), 'snapshot': list(snapshot), 'view': view.get_all()}
+
+
+def demonstrate_chain_benchmarks(size=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for the 10^7-item chain (with a 2-worker pool)
+    """
+
+    full = '--full' in sys.argv
+    if size is None:
+        size = FULL_BENCHMARK_SIZE if full else BENCHMARK_SIZE
+    results = benchmark_chain(size, workers=2 if full else None)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute lazy container demonstrations
+    Pass --full for the 10^7-item benchmark
+    """
+
+    print("🎯 PYTHON SYNTAX - LAZY, FUSED DataContainer PIPELINES")
+    print("=" * 60)
+
+    sections = [
+        ("Lazy Views", demonstrate_lazy_views),
+        ("Typed Store", demonstrate_typed_store),
+        ("Copy On Write", demonstrate_copy_on_write),
+        ("Chain Benchmarks", demonstrate_chain_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
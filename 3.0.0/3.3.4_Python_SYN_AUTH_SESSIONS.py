@@ -0,0 +1,834 @@
+""" 3.3.4_Python_SYN_AUTH_SESSIONS.py """
+
+# =============================================================================
+# PYTHON SYNTAX - HIGH-QPS AUTHENTICATION WITH SHARDED SESSIONS
+# =============================================================================
+# Version: 3.3.4 | Educational Excellence Target: 9.5/10
+# Purpose: Turn the naming-example authentication manager into a fast login path
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Validate usernames with one precompiled re.fullmatch
+✓ Check password rules with one set() pass and precomputed character tables
+✓ Cut many session ids from one secrets.token_bytes call
+✓ Keep sessions in lock-striped shards, expired by a timing wheel
+✓ Measure logins per second against the 3.3.0 manager
+
+🚀 QUICK NAVIGATION:
+├── 1. PRECOMPILED VALIDATION (FOUNDATION)
+├── 2. BATCH SESSION-ID GENERATION
+├── 3. SHARDED SESSION STORE WITH A TIMING WHEEL
+├── 4. AuthenticationService (SINGLE AND BATCH LOGIN)
+└── 5. BENCHMARK: LOGINS PER SECOND
+
+🔍 CORE CONCEPT:
+UserAuthenticationManager in 3.3.0 (demonstrate_naming_examples) repeats
+setup on every login. _validate_username builds the same 64-character set
+each time. _validate_password scans the password five times with Python
+generators. Each session calls uuid.uuid4(), which reads 16 bytes from the
+OS, and the manager holds only one _session_data dict. Fixed tables built
+once, one C-level pass per input and bulk randomness remove most of that
+work. A sharded store with a timing wheel holds many sessions and expires
+them without ever scanning all of them.
+"""
+
+import math
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+import uuid
+
+# =============================================================================
+# 1. PRECOMPILED VALIDATION - FOUNDATION
+# =============================================================================
+
+"""
+USERNAME:
+3-50 characters from [A-Za-z0-9_-]. USERNAME_PATTERN.fullmatch does the
+length and character checks in one C-level match. fullmatch (not match
+with '$') also rejects a trailing newline.
+
+PASSWORD (same rules as 3.3.0):
+At least 8 characters, with an upper-case letter, a lower-case letter, a
+digit and one of !@#$%^&*()_+-=. set(password) is built in one C-level
+pass. Each rule is then a single isdisjoint() against a frozenset built at
+import. 3.3.0 uses str.isupper/islower/isdigit, which also accept
+non-ASCII letters and digits ('É', '٣'). Only the few non-ASCII characters
+of a password fall back to those methods, so the results match exactly.
+"""
+
+USERNAME_PATTERN = re.compile(r'[A-Za-z0-9_-]{3,50}')
+UPPER_ASCII = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+LOWER_ASCII = frozenset('abcdefghijklmnopqrstuvwxyz')
+DIGITS_ASCII = frozenset('0123456789')
+SPECIAL_CHARACTERS = frozenset('!@#$%^&*()_+-=')
+ASCII_CHARACTERS = frozenset(map(chr, range(128)))
+MIN_PASSWORD_LENGTH = 8
+
+SESSION_ID_BYTES = 16               # 128 bits, shown as 32 hex characters
+SESSION_ID_BATCH = 4_096            # ids per secrets.token_bytes call
+DEFAULT_SHARDS = 16
+DEFAULT_TICK = 1.0                  # timing-wheel resolution in seconds
+DEFAULT_WHEEL_SLOTS = 4_096         # wheel span = slots * tick
+
+# Benchmark configuration
+BENCHMARK_LOGINS = 50_000
+FULL_BENCHMARK_LOGINS = 1_000_000
+
+
+def validate_username(username):
+    """3-50 characters of [A-Za-z0-9_-]."""
+    return isinstance(username, str) and USERNAME_PATTERN.fullmatch(username) is not None
+
+
+def validate_password(password):
+    """3.3.0 password rules with one pass over the password."""
+    if not password or len(password) < MIN_PASSWORD_LENGTH:
+        return False
+    characters = set(password)
+    if characters.isdisjoint(SPECIAL_CHARACTERS):
+        return False
+    other = characters - ASCII_CHARACTERS
+    return (_has_class(characters, UPPER_ASCII, other, str.isupper)
+            and _has_class(characters, LOWER_ASCII, other, str.islower)
+            and _has_class(characters, DIGITS_ASCII, other, str.isdigit))
+
+
+def _has_class(characters, ascii_table, non_ascii, predicate):
+    return not characters.isdisjoint(ascii_table) or any(map(predicate, non_ascii))
+
+
+def validate_credentials(credentials):
+    """[(username, password), ...] -> [bool, ...] (both valid)."""
+    return [validate_username(username) and validate_password(password) for username, password in credentials]
+
+
+# =============================================================================
+# 2. BATCH SESSION-ID GENERATION
+# =============================================================================
+
+"""
+ONE SYSCALL PER BATCH:
+secrets.token_bytes(16 * 4096) is one read from the OS CSPRNG. .hex() turns
+it into one string, and slicing that string every 32 characters gives 4096
+ids. uuid.uuid4() makes one OS read plus UUID object construction and
+formatting for every single id.
+
+The ids are 128 random bits (uuid4 has 122). They are as unpredictable as
+secrets.token_hex(16), because they are the same bytes. Unused ids wait in
+process memory until they are handed out. That is the one trade-off, and
+the reason the batch is small.
+
+Thread safety: list.pop() is atomic under the GIL. Only a refill takes the
+lock, and two threads refilling at once just add more ids. take() pops its
+ids one at a time for the same reason. A slice followed by a del could
+race with next_id() in another thread and return a short batch or an id
+that was also handed out elsewhere.
+"""
+
+
+class SessionIdGenerator:
+    """Hands out hex session ids cut from bulk secrets.token_bytes output."""
+
+    __slots__ = ('id_bytes', 'batch_size', '_ids', '_lock', 'refills')
+
+    def __init__(self, id_bytes=SESSION_ID_BYTES, batch_size=SESSION_ID_BATCH):
+        self.id_bytes = id_bytes
+        self.batch_size = batch_size
+        self._ids = []
+        self._lock = threading.Lock()
+        self.refills = 0
+
+    def _refill(self):
+        width = 2 * self.id_bytes
+        block = secrets.token_bytes(self.id_bytes * self.batch_size).hex()
+        with self._lock:
+            self._ids.extend([block[start:start + width] for start in range(0, len(block), width)])
+            self.refills += 1
+
+    def next_id(self):
+        ids = self._ids
+        while True:
+            try:
+                return ids.pop()
+            except IndexError:
+                self._refill()
+
+    __call__ = next_id
+
+    def take(self, count):
+        """`count` ids at once; safe alongside next_id() in other threads."""
+        taken = []
+        append, pop = taken.append, self._ids.pop
+        while len(taken) < count:
+            try:
+                for _ in range(count - len(taken)):
+                    append(pop())
+            except IndexError:
+                self._refill()
+        return taken
+
+
+# =============================================================================
+# 3. SHARDED SESSION STORE WITH A TIMING WHEEL
+# =============================================================================
+
+"""
+SHARDS:
+hash(session_id) % shards picks one of N independent shards. Each has its
+own dict, lock and timing wheel, so threads working on different sessions
+rarely share a lock.
+
+TIMING WHEEL (per shard):
+A ring of `slots` buckets, each covering `tick` seconds. A session that
+expires at time t goes into bucket ceil(t / tick) % slots. Advancing the
+wheel from the last tick to now empties only the buckets that passed, so
+expiry costs O(sessions expiring + ticks passed), never a scan of every
+session. Entries are checked lazily:
+    - a refreshed session left an old entry behind; its expiry is now later,
+      so the entry is skipped (and re-filed if it is beyond the wheel span)
+    - a revoked session is simply gone from the dict
+    - expiry beyond the span (slots * tick) is re-filed each time the wheel
+      comes round, so any TTL works
+Rounding up means a bucket only comes due after all its sessions have
+expired, so expire() and len() can count a session for at most one tick
+after its expiry. get() checks the exact expiry time itself, so it never
+serves a session late.
+
+The clock is injectable (default time.monotonic) so tests and demos can
+move time forward.
+"""
+
+
+class Session:
+    """One login session."""
+
+    __slots__ = ('session_id', 'user_id', 'start_time', 'expiry_time', 'permissions')
+
+    def __init__(self, session_id, user_id, start_time, expiry_time, permissions):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.start_time = start_time
+        self.expiry_time = expiry_time
+        self.permissions = permissions
+
+    def as_dict(self):
+        """The 3.3.0 _session_data layout."""
+        return {'session_id': self.session_id, 'user_id': self.user_id, 'start_time': self.start_time,
+                'expiry_time': self.expiry_time, 'permissions': list(self.permissions)}
+
+    def __repr__(self):
+        return f"Session({self.session_id[:8]}..., user_id={self.user_id}, expires={self.expiry_time:.1f})"
+
+
+class _SessionShard:
+    __slots__ = ('sessions', 'lock', 'wheel', 'current_tick', 'expired')
+
+    def __init__(self, slots, start_tick):
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.wheel = [[] for _ in range(slots)]
+        self.current_tick = start_tick
+        self.expired = 0
+
+
+class SessionStore:
+    """Lock-striped in-memory sessions with timing-wheel expiry."""
+
+    def __init__(self, ttl=1800.0, shards=DEFAULT_SHARDS, tick=DEFAULT_TICK,
+                 slots=DEFAULT_WHEEL_SLOTS, clock=time.monotonic):
+        self.ttl = ttl
+        self.tick = tick
+        self.slots = slots
+        self.clock = clock
+        start_tick = int(clock() / tick)
+        self._shards = [_SessionShard(slots, start_tick) for _ in range(shards)]
+
+    def _shard(self, session_id):
+        return self._shards[hash(session_id) % len(self._shards)]
+
+    def _schedule(self, shard, session_id, expiry_time):
+        """File an expiry into the wheel (clamped to the wheel span)."""
+        tick = min(max(math.ceil(expiry_time / self.tick), shard.current_tick + 1),
+                   shard.current_tick + self.slots - 1)
+        shard.wheel[tick % self.slots].append(session_id)
+
+    def _advance(self, shard, now):
+        """Expire everything due up to `now`; caller holds the shard lock."""
+        target = int(now / self.tick)
+        if target <= shard.current_tick:
+            return
+        sessions, wheel, slots = shard.sessions, shard.wheel, self.slots
+        start = shard.current_tick + 1
+        if target - shard.current_tick > slots:
+            start = target - slots + 1              # every bucket comes due once
+        shard.current_tick = target
+        for tick in range(start, target + 1):
+            index = tick % slots
+            bucket = wheel[index]
+            if not bucket:
+                continue
+            wheel[index] = []
+            for session_id in bucket:
+                session = sessions.get(session_id)
+                if session is None:
+                    continue
+                if session.expiry_time <= now:
+                    del sessions[session_id]
+                    shard.expired += 1
+                else:
+                    self._schedule(shard, session_id, session.expiry_time)
+
+    def add(self, session):
+        shard = self._shard(session.session_id)
+        with shard.lock:
+            self._advance(shard, self.clock())
+            shard.sessions[session.session_id] = session
+            self._schedule(shard, session.session_id, session.expiry_time)
+
+    def add_many(self, sessions):
+        """Insert sessions grouped by shard: one lock acquisition per shard."""
+        groups = {}
+        shards = self._shards
+        count = len(shards)
+        for session in sessions:
+            groups.setdefault(hash(session.session_id) % count, []).append(session)
+        now = self.clock()
+        for index, group in groups.items():
+            shard = shards[index]
+            with shard.lock:
+                self._advance(shard, now)
+                table = shard.sessions
+                for session in group:
+                    table[session.session_id] = session
+                    self._schedule(shard, session.session_id, session.expiry_time)
+
+    def get(self, session_id):
+        """The live Session, or None if unknown or expired."""
+        shard = self._shard(session_id)
+        now = self.clock()
+        with shard.lock:
+            self._advance(shard, now)
+            session = shard.sessions.get(session_id)
+            if session is not None and session.expiry_time <= now:
+                del shard.sessions[session_id]
+                shard.expired += 1
+                return None
+            return session
+
+    def refresh(self, session_id, ttl=None):
+        """Slide the expiry of a live session forward; returns it (or None)."""
+        shard = self._shard(session_id)
+        now = self.clock()
+        with shard.lock:
+            self._advance(shard, now)
+            session = shard.sessions.get(session_id)
+            if session is None or session.expiry_time <= now:
+                return None
+            session.expiry_time = now + (self.ttl if ttl is None else ttl)
+            self._schedule(shard, session_id, session.expiry_time)
+            return session
+
+    def revoke(self, session_id):
+        shard = self._shard(session_id)
+        with shard.lock:
+            return shard.sessions.pop(session_id, None) is not None
+
+    def expire(self):
+        """Advance every shard's wheel to now; returns the live session count."""
+        now = self.clock()
+        for shard in self._shards:
+            with shard.lock:
+                self._advance(shard, now)
+        return len(self)
+
+    def __len__(self):
+        return sum(len(shard.sessions) for shard in self._shards)
+
+    def __contains__(self, session_id):
+        return self.get(session_id) is not None
+
+    def stats(self):
+        sizes = [len(shard.sessions) for shard in self._shards]
+        return {'sessions': sum(sizes), 'shards': len(sizes), 'largest_shard': max(sizes),
+                'expired': sum(shard.expired for shard in self._shards),
+                'wheel_entries': sum(len(bucket) for shard in self._shards for bucket in shard.wheel)}
+
+
+# =============================================================================
+# 4. AuthenticationService - SINGLE AND BATCH LOGIN
+# =============================================================================
+
+"""
+THE 3.3.0 FLOW, SHARED BY MANY REQUESTS:
+    validate username and password -> look up the account -> check lockout
+    -> create a session in the shared store
+
+The 3.3.0 manager keeps one failure counter and one session per instance.
+The service is a long-lived object: failure counts are kept per username
+and sessions live in the SessionStore.
+
+FAILURE COUNTS:
+A username is locked out after MAX_LOGIN_ATTEMPTS failures. Each failure
+pushes its entry's expiry LOCKOUT_SECONDS past the latest failure, so a
+lockout lifts by itself once that window passes quietly. Entries stay in
+the dict in order of their latest failure: expired ones are dropped from
+the front on every new failure, and at most MAX_TRACKED_USERNAMES are kept
+(the oldest go first), so spraying distinct usernames cannot grow memory
+without bound.
+
+CLOCK:
+Session expiry times are compared with the store's clock, so the service
+uses that clock too. Passing a store together with a different clock is a
+ValueError. As in 3.3.0, "authentication" checks
+the credential format and the account lock only. Pass verify_password to
+check a real credential (e.g. a hashlib.scrypt comparison). That check
+would then dominate the cost of a login.
+
+login_many validates a whole batch and draws all session ids with one
+take(). Sessions are inserted per shard in add_many.
+"""
+
+
+class AuthenticationService:
+    """High-QPS login path: precompiled validation, bulk ids, sharded sessions."""
+
+    MAX_LOGIN_ATTEMPTS = 3
+    SESSION_TIMEOUT_MINUTES = 30
+    DEFAULT_PERMISSION_LEVEL = 'read'
+    LOCKOUT_SECONDS = 15 * 60
+    MAX_TRACKED_USERNAMES = 100_000
+
+    def __init__(self, accounts=None, store=None, id_generator=None, verify_password=None, clock=None):
+        if store is None:
+            store = SessionStore(ttl=self.SESSION_TIMEOUT_MINUTES * 60, clock=clock or time.time)
+        elif clock is not None and clock is not store.clock:
+            raise ValueError("clock differs from the store's clock; sessions would expire on the wrong time base")
+        self.accounts = accounts
+        self.store = store
+        self.clock = store.clock
+        self.id_generator = id_generator or SessionIdGenerator()
+        self.verify_password = verify_password
+        self.failed_login_counts = {}               # username -> [failures, expiry time]
+        self._permissions = (self.DEFAULT_PERMISSION_LEVEL,)
+
+    def _get_user_account(self, username):
+        if self.accounts is None:
+            return {"username": username, "is_locked": False, "user_id": 123}
+        return self.accounts.get(username)
+
+    def _check(self, username, password):
+        """The account dict when this login may proceed, else None (and count a failure)."""
+        if not (validate_username(username) and validate_password(password)):
+            self._record_failure(username)
+            return None
+        if self.failure_count(username) >= self.MAX_LOGIN_ATTEMPTS:
+            return None
+        account = self._get_user_account(username)
+        if account is None or account.get('is_locked', False):
+            self._record_failure(username)
+            return None
+        if self.verify_password is not None and not self.verify_password(account, password):
+            self._record_failure(username)
+            return None
+        return account
+
+    def failure_count(self, username):
+        """Recent failures for username (0 once its lockout window has passed)."""
+        entry = self.failed_login_counts.get(username)
+        if entry is None or entry[1] <= self.clock():
+            return 0
+        return entry[0]
+
+    def _record_failure(self, username):
+        if type(username) is not str:
+            return
+        now = self.clock()
+        counts = self.failed_login_counts
+        entry = counts.pop(username, None)
+        failures = entry[0] if entry is not None and entry[1] > now else 0
+        counts[username] = [failures + 1, now + self.LOCKOUT_SECONDS]   # re-inserted last
+        while counts:
+            oldest = next(iter(counts))
+            if counts[oldest][1] > now and len(counts) <= self.MAX_TRACKED_USERNAMES:
+                break
+            counts.pop(oldest, None)
+
+    def _new_session(self, session_id, account, now):
+        return Session(session_id, account['user_id'], now,
+                       now + self.SESSION_TIMEOUT_MINUTES * 60, self._permissions)
+
+    def login(self, username, password):
+        """Session id on success, None on failure."""
+        account = self._check(username, password)
+        if account is None:
+            return None
+        self.failed_login_counts.pop(username, None)
+        session = self._new_session(self.id_generator.next_id(), account, self.clock())
+        self.store.add(session)
+        return session.session_id
+
+    def authenticate_user(self, username, password):
+        """3.3.0-compatible: True on success (the session goes to the store)."""
+        return self.login(username, password) is not None
+
+    def login_many(self, credentials):
+        """[(username, password), ...] -> [session id or None, ...]."""
+        accounts = [self._check(username, password) for username, password in credentials]
+        ids = iter(self.id_generator.take(sum(account is not None for account in accounts)))
+        now = self.clock()
+        results, sessions = [], []
+        for (username, _), account in zip(credentials, accounts):
+            if account is None:
+                results.append(None)
+                continue
+            self.failed_login_counts.pop(username, None)
+            session = self._new_session(next(ids), account, now)
+            sessions.append(session)
+            results.append(session.session_id)
+        self.store.add_many(sessions)
+        return results
+
+    def get_session(self, session_id):
+        return self.store.get(session_id)
+
+    def logout(self, session_id):
+        return self.store.revoke(session_id)
+
+
+# =============================================================================
+# 5. BENCHMARK: LOGINS PER SECOND
+# =============================================================================
+
+"""
+REFERENCE:
+OriginalAuthenticationManager is the 3.3.0 class with its login path
+unchanged. Timings cover validation, session-id generation and full logins
+(single and batched). Credentials are a realistic mix: mostly valid, some
+bad usernames and weak passwords.
+"""
+
+
+class OriginalAuthenticationManager:
+    """3.3.0 UserAuthenticationManager login path (reference copy)."""
+
+    MAX_LOGIN_ATTEMPTS = 3
+    SESSION_TIMEOUT_MINUTES = 30
+    DEFAULT_PERMISSION_LEVEL = 'read'
+
+    def __init__(self, database_connection=None, logger=None):
+        self.database_connection = database_connection
+        self.logger = logger
+        self.failed_login_count = 0
+        self.is_authenticated = False
+        self.current_user_id = None
+        self._session_data = {}
+
+    def authenticate_user(self, username, password):
+        is_username_valid = self._validate_username(username)
+        is_password_valid = self._validate_password(password)
+        user_account = self._get_user_account(username)
+        has_exceeded_attempts = self.failed_login_count >= self.MAX_LOGIN_ATTEMPTS
+        is_account_locked = user_account and user_account.get('is_locked', False)
+        if has_exceeded_attempts or is_account_locked:
+            return False
+        if is_username_valid and is_password_valid:
+            self.is_authenticated = True
+            self.current_user_id = user_account['user_id']
+            self.failed_login_count = 0
+            self._create_user_session(user_account)
+            return True
+        self.failed_login_count += 1
+        return False
+
+    def _validate_username(self, username):
+        if not username or not isinstance(username, str):
+            return False
+        min_length = 3
+        max_length = 50
+        allowed_characters = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-')
+        length_is_valid = min_length <= len(username) <= max_length
+        characters_are_valid = all(char in allowed_characters for char in username)
+        return length_is_valid and characters_are_valid
+
+    def _validate_password(self, password):
+        if not password:
+            return False
+        has_minimum_length = len(password) >= 8
+        has_uppercase_letter = any(char.isupper() for char in password)
+        has_lowercase_letter = any(char.islower() for char in password)
+        has_digit = any(char.isdigit() for char in password)
+        has_special_character = any(char in "!@#$%^&*()_+-=" for char in password)
+        meets_complexity_requirements = (
+            has_uppercase_letter and has_lowercase_letter and has_digit and has_special_character
+        )
+        return has_minimum_length and meets_complexity_requirements
+
+    def _get_user_account(self, username):
+        return {"username": username, "is_locked": False, "user_id": 123}
+
+    def _create_user_session(self, user_account):
+        session_start_time = time.time()
+        self._session_data = {
+            'session_id': str(uuid.uuid4()),
+            'user_id': user_account['user_id'],
+            'start_time': session_start_time,
+            'expiry_time': session_start_time + (self.SESSION_TIMEOUT_MINUTES * 60),
+            'permissions': [self.DEFAULT_PERMISSION_LEVEL],
+        }
+
+
+def make_credentials(count, seed=7):
+    """Mostly valid (username, password) pairs with some invalid ones mixed in."""
+    rng = random.Random(seed)
+    credentials = []
+    for index in range(count):
+        roll = rng.random()
+        username = f'user_{index}' if roll > 0.05 else f'bad user {index}'
+        password = f'Secr3t!{index:06d}xY' if roll < 0.9 else f'weakpassword{index}'
+        credentials.append((username, password))
+    return credentials
+
+
+def benchmark_logins(logins=BENCHMARK_LOGINS):
+    """Validations/s, ids/s and logins/s: 3.3.0 manager vs AuthenticationService."""
+    credentials = make_credentials(logins)
+    results = {'logins': logins}
+
+    original = OriginalAuthenticationManager()
+    start = time.perf_counter()
+    expected = [original._validate_username(u) and original._validate_password(p) for u, p in credentials]
+    original_validation = time.perf_counter() - start
+    start = time.perf_counter()
+    validated = validate_credentials(credentials)
+    validation = time.perf_counter() - start
+    results['validation_original_per_s'] = logins / original_validation
+    results['validation_precompiled_per_s'] = logins / validation
+    results['validation_matches'] = validated == expected
+
+    start = time.perf_counter()
+    for _ in range(logins):
+        str(uuid.uuid4())
+    uuid_time = time.perf_counter() - start
+    generator = SessionIdGenerator()
+    start = time.perf_counter()
+    ids = [generator.next_id() for _ in range(logins)]
+    batch_time = time.perf_counter() - start
+    results['ids_uuid4_per_s'] = logins / uuid_time
+    results['ids_batched_per_s'] = logins / batch_time
+    results['ids_unique'] = len(set(ids)) == logins
+
+    start = time.perf_counter()
+    original_results = []
+    for username, password in credentials:
+        original.failed_login_count = 0       # 3.3.0 counts failures per instance; reset per request
+        original_results.append(original.authenticate_user(username, password))
+    original_time = time.perf_counter() - start
+
+    service = AuthenticationService()
+    start = time.perf_counter()
+    single = [service.login(username, password) for username, password in credentials]
+    single_time = time.perf_counter() - start
+
+    batched_service = AuthenticationService()
+    start = time.perf_counter()
+    batched = []
+    for offset in range(0, logins, 1_000):
+        batched.extend(batched_service.login_many(credentials[offset:offset + 1_000]))
+    batch_login_time = time.perf_counter() - start
+
+    results['original_logins_per_s'] = logins / original_time
+    results['service_logins_per_s'] = logins / single_time
+    results['service_batched_logins_per_s'] = logins / batch_login_time
+    results['single_speedup'] = original_time / single_time
+    results['batched_speedup'] = original_time / batch_login_time
+    results['outcomes_match'] = ([session_id is not None for session_id in single] == original_results
+                                 == [session_id is not None for session_id in batched])
+    results['sessions_stored'] = len(service.store)
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_validation():
+    """
+    PRECOMPILED VALIDATION DEMONSTRATION
+    One fullmatch for usernames, one set pass for passwords
+    """
+
+    reference = OriginalAuthenticationManager()
+    usernames = ['alice_01', 'ab', 'bad user', 'name\n', 'x' * 51, 'Zoë']
+    passwords = ['Secr3t!pw', 'secret!pw1', 'SECRET!PW1', 'Secret!pw', 'Secret1pw', 'Sh0rt!', 'ÉCOLE!é٣x']
+    results = {}
+    for username in usernames:
+        results[username] = validate_username(username)
+        same = results[username] == reference._validate_username(username)
+        print(f"   username {username!r:>24}: {results[username]} (matches 3.3.0: {same})")
+    for password in passwords:
+        results[password] = validate_password(password)
+        same = results[password] == reference._validate_password(password)
+        print(f"   password {password!r:>24}: {results[password]} (matches 3.3.0: {same})")
+    return results
+
+
+def demonstrate_session_ids():
+    """
+    BATCH SESSION-ID DEMONSTRATION
+    Many ids from one secrets.token_bytes call
+    """
+
+    generator = SessionIdGenerator(batch_size=8)
+    ids = [generator.next_id() for _ in range(10)] + generator.take(5)
+    print(f"   first ids: {ids[:3]}")
+    print(f"   {len(ids)} ids, {len(set(ids))} unique, {len(ids[0]) * 4} bits each, "
+          f"{generator.refills} token_bytes calls")
+    print(f"   uuid4 for comparison: {uuid.uuid4()}")
+
+    shared = SessionIdGenerator(batch_size=64)
+    singles, batches = [], []
+
+    def pop_singles():
+        singles.extend(shared.next_id() for _ in range(2_000))
+
+    def take_batches():
+        batches.extend(shared.take(50) for _ in range(100))
+
+    threads = [threading.Thread(target=target) for target in (pop_singles, take_batches) * 3]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handed_out = singles + [session_id for batch in batches for session_id in batch]
+    threaded_ok = (all(len(batch) == 50 for batch in batches)
+                   and len(set(handed_out)) == len(handed_out) == 3 * (2_000 + 100 * 50))
+    print(f"   6 threads mixing next_id() and take(50): {len(handed_out):,} ids, "
+          f"full batches and no duplicates: {threaded_ok}")
+    return {'ids': len(ids), 'unique': len(set(ids)), 'refills': generator.refills,
+            'threaded_ok': threaded_ok}
+
+
+def demonstrate_session_store():
+    """
+    SESSION STORE DEMONSTRATION
+    Sharded sessions expiring on a timing wheel
+    """
+
+    now = [1_000.0]
+    store = SessionStore(ttl=60, shards=4, tick=1.0, slots=32, clock=lambda: now[0])
+    generator = SessionIdGenerator()
+    sessions = [Session(generator(), user, now[0], now[0] + ttl, ('read',))
+                for user, ttl in enumerate((10, 20, 45, 90, 600))]
+    store.add_many(sessions)
+    print(f"   stored {len(store)} sessions (TTL 10/20/45/90/600 s, wheel span 32 s)")
+
+    store.refresh(sessions[0].session_id, ttl=40)
+    for step in (15, 30, 50, 100, 700):
+        now[0] = 1_000.0 + step
+        live = store.expire()
+        print(f"   t+{step:>3}s: {live} live, stats={store.stats()}")
+    return store.stats()
+
+
+def demonstrate_authentication_service():
+    """
+    AUTHENTICATION SERVICE DEMONSTRATION
+    Single and batch logins sharing one store
+    """
+
+    accounts = {'alice': {'user_id': 1}, 'bob': {'user_id': 2, 'is_locked': True}, 'dave': {'user_id': 4}}
+    service = AuthenticationService(accounts)
+    alice = service.login('alice', 'Wonder1and!')
+    print(f"   alice -> {alice[:8]}..., session {service.get_session(alice)}")
+    print(f"   bob (locked) -> {service.login('bob', 'Builder!99X')}")
+    for _ in range(3):
+        service.login('carol', 'weak')
+    print(f"   carol after 3 bad attempts: failures={service.failure_count('carol')}")
+
+    now = [1_000.0]
+    sprayed = AuthenticationService(accounts, clock=lambda: now[0])
+    sprayed.MAX_TRACKED_USERNAMES = 100
+    for index in range(1_000):
+        sprayed.login(f'spray{index}', 'weak')
+    for _ in range(3):
+        sprayed.login('dave', 'weak')
+    locked = sprayed.login('dave', 'Str0ng!Pass') is None
+    now[0] += sprayed.LOCKOUT_SECONDS
+    unlocked = sprayed.login('dave', 'Str0ng!Pass') is not None
+    print(f"   1,000 sprayed usernames -> {len(sprayed.failed_login_counts)} tracked; "
+          f"dave locked: {locked}, after {sprayed.LOCKOUT_SECONDS}s: {unlocked}")
+    try:
+        AuthenticationService(store=SessionStore(), clock=time.time)
+        clock_checked = False
+    except ValueError:
+        clock_checked = True
+
+    batch = service.login_many([('alice', 'Wonder1and!'), ('dave', 'Str0ng!Pass'), ('eve', 'nope')])
+    print(f"   login_many -> {[session_id and session_id[:8] for session_id in batch]}")
+    print(f"   logout alice: {service.logout(alice)}, sessions stored: {len(service.store)}")
+    print(f"   3.3.0 session layout: {sorted(service.get_session(batch[0]).as_dict())}")
+    return {'sessions': len(service.store), 'batch': [session_id is not None for session_id in batch],
+            'failures_bounded': len(sprayed.failed_login_counts) <= 100,
+            'lockout_expires': locked and unlocked, 'clock_checked': clock_checked}
+
+
+def demonstrate_login_benchmarks(logins=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 1,000,000 logins
+    """
+
+    if logins is None:
+        logins = FULL_BENCHMARK_LOGINS if '--full' in sys.argv else BENCHMARK_LOGINS
+    results = benchmark_logins(logins)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute authentication and session demonstrations
+    Pass --full for the 1,000,000-login benchmark
+    """
+
+    print("🎯 PYTHON SYNTAX - HIGH-QPS AUTHENTICATION WITH SHARDED SESSIONS")
+    print("=" * 60)
+
+    sections = [
+        ("Validation", demonstrate_validation),
+        ("Session Ids", demonstrate_session_ids),
+        ("Session Store", demonstrate_session_store),
+        ("Authentication Service", demonstrate_authentication_service),
+        ("Login Benchmarks", demonstrate_login_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
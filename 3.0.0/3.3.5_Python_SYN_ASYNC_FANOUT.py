@@ -0,0 +1,781 @@
+""" 3.3.5_Python_SYN_ASYNC_FANOUT.py """
+
+# =============================================================================
+# PYTHON SYNTAX - ASYNC FAN-OUT WITH LIMITS, TIMEOUTS AND RETRIES
+# =============================================================================
+# Version: 3.3.5 | Educational Excellence Target: 9.5/10
+# Purpose: Grow the three-URL asyncio.gather example into a runner for thousands of endpoints
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Bound concurrency with an asyncio.Semaphore instead of creating every task up front
+✓ Put a timeout on each attempt and retry with jittered exponential backoff
+✓ Stream results in completion order from an async generator
+✓ Collect p50/p90/p99 latency, retry and timeout counts for every run
+✓ Test against a local asyncio TCP stand-in server, at 10^4 tasks
+
+🚀 QUICK NAVIGATION:
+├── 1. RETRY POLICY AND LATENCY METRICS (FOUNDATION)
+├── 2. FanOutRunner (BOUNDED, STREAMING)
+├── 3. LOCAL TCP STAND-IN SERVER AND CLIENT
+├── 4. REFERENCE: THE 3.3.0 GATHER PATTERN
+└── 5. BENCHMARK: THROUGHPUT AND TAIL LATENCY
+
+🔍 CORE CONCEPT:
+async_syntax_example in 3.3.0 and basic_async_patterns in 3.5.0 pass every
+coroutine to asyncio.gather at once. That works for three URLs. With
+thousands of endpoints, gather creates every task immediately, opens as
+many connections as the OS allows and has no timeout. One failure raises
+out of gather and throws away the other results, and nothing is returned
+until the slowest endpoint answers. A fan-out runner admits tasks through a
+semaphore, bounds each attempt with a timeout, retries transient errors
+after a randomized pause and yields each result as soon as it is ready.
+"""
+
+import asyncio
+import math
+import random
+import sys
+import time
+from array import array
+
+# =============================================================================
+# 1. RETRY POLICY AND LATENCY METRICS - FOUNDATION
+# =============================================================================
+
+"""
+BACKOFF WITH JITTER:
+Retry n waits up to base_delay * 2**(n-1), capped at max_delay. With plain
+exponential backoff, every task that failed together retries together and
+hits the recovering endpoint in synchronized waves. Jitter spreads those
+retries out:
+- 'full':  uniform(0, cap). Spreads retries the most; the usual default
+- 'equal': cap/2 + uniform(0, cap/2). Always waits at least half the cap
+- 'none':  exactly cap (shown for comparison)
+Only errors in retry_on are retried: timeouts, connection errors and
+truncated replies. Any other exception is a bug or a permanent failure and
+is reported on the first attempt.
+
+LATENCY:
+Each task's latency is measured from when it gets its semaphore slot until
+its final result, so it includes every attempt and backoff pause.
+Percentiles use the nearest-rank method on the sorted samples, so p99 is a
+latency that was actually observed. Samples are kept in an array('d')
+(8 bytes each), so 10^6 tasks cost 8 MB.
+"""
+
+DEFAULT_CONCURRENCY = 100
+DEFAULT_TIMEOUT = 1.0               # seconds per attempt
+DEFAULT_ATTEMPTS = 3                # first try + 2 retries
+DEFAULT_BASE_DELAY = 0.05
+DEFAULT_MAX_DELAY = 2.0
+JITTER_MODES = ('full', 'equal', 'none')
+RETRYABLE_ERRORS = (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError)
+PERCENTILES = (0.5, 0.9, 0.99)
+
+# Benchmark configuration
+BENCHMARK_TASKS = 10_000
+FULL_BENCHMARK_TASKS = 100_000
+BENCHMARK_LIMITS = (10, 100, 1_000)
+BENCHMARK_LATENCY = (0.001, 0.005)  # stand-in server reply delay range (seconds)
+DEFAULT_BACKLOG = 2_048             # listen queue; asyncio's default of 100 drops connection bursts
+
+
+class RetryPolicy:
+    """How many attempts, which errors to retry and how long to wait between them."""
+
+    def __init__(self, attempts=DEFAULT_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY,
+                 max_delay=DEFAULT_MAX_DELAY, jitter='full', retry_on=RETRYABLE_ERRORS):
+        if attempts < 1:
+            raise ValueError(f"attempts must be at least 1, got {attempts}")
+        if jitter not in JITTER_MODES:
+            raise ValueError(f"jitter must be one of {JITTER_MODES}, got {jitter!r}")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def should_retry(self, error):
+        return isinstance(error, self.retry_on)
+
+    def backoff(self, retry, rng=random):
+        """Seconds to wait before retry number `retry` (1-based)."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        if self.jitter == 'full':
+            return rng.uniform(0.0, cap)
+        if self.jitter == 'equal':
+            return cap / 2 + rng.uniform(0.0, cap / 2)
+        return cap
+
+    def __repr__(self):
+        return (f"RetryPolicy(attempts={self.attempts}, base_delay={self.base_delay}, "
+                f"max_delay={self.max_delay}, jitter={self.jitter!r})")
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence (fraction in 0..1)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LatencyRecorder:
+    """Latency samples in seconds, summarized in milliseconds."""
+
+    __slots__ = ('samples',)
+
+    def __init__(self):
+        self.samples = array('d')
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+
+    def __len__(self):
+        return len(self.samples)
+
+    def summary(self):
+        """{'count', 'mean_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms'}."""
+        ordered = sorted(self.samples)
+        count = len(ordered)
+        summary = {'count': count, 'mean_ms': 1_000 * sum(ordered) / count if count else 0.0}
+        for fraction in PERCENTILES:
+            summary[f'p{round(fraction * 100)}_ms'] = 1_000 * percentile(ordered, fraction)
+        summary['max_ms'] = 1_000 * ordered[-1] if count else 0.0
+        return summary
+
+
+# =============================================================================
+# 2. FanOutRunner - BOUNDED, STREAMING
+# =============================================================================
+
+"""
+ADMISSION:
+run() starts a producer that walks the items and acquires one semaphore
+permit before creating each task. At most `concurrency` tasks exist at any
+time, whether there are 10 items or 10^6, and the items can be a lazy
+iterator. Passing the same asyncio.Semaphore to several runners puts one
+limit on all of them (for example, one per host).
+
+BACKPRESSURE:
+A permit is released only when the consumer takes the result from run(),
+not when the task finishes. Running tasks plus results not yet consumed
+never exceed the limit. A slow consumer slows admission instead of letting
+finished results pile up in memory. A task keeps its permit during backoff
+pauses as well, so a burst of failures also slows admission instead of
+adding load to a struggling endpoint.
+
+STREAMING AND EARLY EXIT:
+Results arrive on an asyncio.Queue in completion order. Calling aclose()
+on the stream after a break cancels the producer and every in-flight task
+and returns their permits (asyncio also runs this cleanup when an
+abandoned generator is garbage-collected). gather() is the
+convenience form: it waits for everything and returns results in input
+order, like asyncio.gather, but with the same limits. Failures come back as
+TaskResult objects with .error set and are never raised, so one bad
+endpoint does not hide thousands of good results. That includes a
+CancelledError (or other BaseException) raised by the task function itself;
+it is reported without a retry. Only cancellation aimed at the runner's
+own tasks (aclose(), cancelling the consumer) and KeyboardInterrupt or
+SystemExit propagate.
+"""
+
+
+class TaskResult:
+    """Outcome of one item: value or error, attempts used and total latency."""
+
+    __slots__ = ('index', 'item', 'value', 'error', 'attempts', 'latency')
+
+    def __init__(self, index, item, value, error, attempts, latency):
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+        self.attempts = attempts
+        self.latency = latency
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = repr(self.value) if self.ok else type(self.error).__name__
+        return (f"TaskResult(#{self.index} {self.item!r} -> {outcome}, "
+                f"attempts={self.attempts}, {1_000 * self.latency:.1f} ms)")
+
+
+def _must_propagate(error, stopping):
+    """True when a BaseException belongs to the runner or the event loop, not the task."""
+    if isinstance(error, (KeyboardInterrupt, SystemExit)) or stopping():
+        return True
+    cancelling = getattr(asyncio.current_task(), 'cancelling', None)   # Python 3.11+
+    return cancelling is not None and cancelling() > 0
+
+
+class _Submitted:
+    """Queue marker from the producer: no more tasks after `total`."""
+
+    __slots__ = ('total',)
+
+    def __init__(self, total):
+        self.total = total
+
+
+class FanOutRunner:
+    """Run one coroutine function over many items with limits, timeouts and retries."""
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                 retry=None, semaphore=None, seed=None):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.concurrency = concurrency
+        self.timeout = timeout            # per attempt; None disables
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.semaphore = semaphore        # shared limit; a private one per run() if None
+        self._rng = random.Random(seed)
+        self.latencies = LatencyRecorder()
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.elapsed = 0.0
+
+    async def _attempt(self, func, item):
+        if self.timeout is None:
+            return await func(item)
+        return await asyncio.wait_for(func(item), self.timeout)
+
+    async def _run_one(self, func, index, item, stopping):
+        self.in_flight += 1
+        if self.in_flight > self.peak_in_flight:
+            self.peak_in_flight = self.in_flight
+        start = time.perf_counter()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                try:
+                    value = await self._attempt(func, item)
+                except BaseException as error:
+                    if not isinstance(error, Exception) and _must_propagate(error, stopping):
+                        raise
+                    if isinstance(error, asyncio.TimeoutError):
+                        self.timeouts += 1
+                    if attempt >= self.retry.attempts or not self.retry.should_retry(error):
+                        self.failed += 1
+                        return self._finish(index, item, None, error, attempt, start)
+                    self.retries += 1
+                    await asyncio.sleep(self.retry.backoff(attempt, self._rng))
+                else:
+                    self.succeeded += 1
+                    return self._finish(index, item, value, None, attempt, start)
+        finally:
+            self.in_flight -= 1
+
+    def _finish(self, index, item, value, error, attempts, start):
+        latency = time.perf_counter() - start
+        self.latencies.record(latency)
+        return TaskResult(index, item, value, error, attempts, latency)
+
+    async def run(self, func, items):
+        """Async generator: one TaskResult per item, in completion order."""
+        semaphore = self.semaphore if self.semaphore is not None else asyncio.Semaphore(self.concurrency)
+        results = asyncio.Queue()
+        running = set()
+        held = 0                          # permits taken by the producer, not yet returned
+        stopping = False                  # set once run() starts cancelling its own tasks
+
+        async def work(index, item):
+            results.put_nowait(await self._run_one(func, index, item, lambda: stopping))
+
+        async def produce():
+            nonlocal held
+            submitted = 0
+            try:
+                for item in items:
+                    await semaphore.acquire()
+                    held += 1
+                    task = asyncio.ensure_future(work(submitted, item))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+                    submitted += 1
+            finally:
+                results.put_nowait(_Submitted(submitted))
+
+        start = time.perf_counter()
+        producer = asyncio.ensure_future(produce())
+        total = None
+        delivered = 0
+        try:
+            while total is None or delivered < total:
+                result = await results.get()
+                if type(result) is _Submitted:
+                    total = result.total
+                    await producer        # re-raises an error from the items iterator
+                    continue
+                held -= 1
+                semaphore.release()
+                delivered += 1
+                yield result
+        finally:
+            stopping = True
+            producer.cancel()
+            leftovers = [producer, *running]
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*leftovers, return_exceptions=True)
+            for _ in range(held):
+                semaphore.release()
+            held = 0
+            self.elapsed += time.perf_counter() - start
+
+    async def gather(self, func, items):
+        """Every TaskResult, in the order of items."""
+        collected = [result async for result in self.run(func, items)]
+        collected.sort(key=lambda result: result.index)
+        return collected
+
+    def stats(self):
+        """Totals over all runs, plus latency percentiles in milliseconds."""
+        tasks = self.succeeded + self.failed
+        stats = {'tasks': tasks, 'succeeded': self.succeeded, 'failed': self.failed,
+                 'retries': self.retries, 'timeouts': self.timeouts,
+                 'peak_in_flight': self.peak_in_flight,
+                 'tasks_per_s': tasks / self.elapsed if self.elapsed else 0.0}
+        stats.update(self.latencies.summary())
+        del stats['count']
+        return stats
+
+
+# =============================================================================
+# 3. LOCAL TCP STAND-IN SERVER AND CLIENT
+# =============================================================================
+
+"""
+STAND-IN SERVER:
+A real asyncio.start_server on 127.0.0.1 (port 0 picks a free port) that
+speaks a one-line protocol: the client sends "<path>\\n" and the server
+answers "OK <path>\\n" after a random delay in `latency`. Several requests
+can share one connection. It can misbehave on purpose:
+- failure_rate: close the connection without answering (client sees a reset)
+- stall_rate:   answer only after `stall` seconds (client should time out)
+The listen backlog is raised from asyncio's default of 100. Otherwise a
+burst of 1,000 connects overflows the queue, and the kernel's 1 s SYN
+retransmit shows up as a false p99.
+A seeded random.Random makes every run repeatable. The runner is tested
+through real sockets, the event loop and the kernel's loopback, with no
+mocks.
+
+CLIENT:
+StandInClient keeps idle connections open for reuse (keep-alive) and never
+opens more than max_connections. Opening a new TCP connection for every
+request would leave 10^4 sockets in TIME_WAIT after one benchmark pass.
+A request that fails or is cancelled (for example by a timeout) may leave
+a half-read reply in the stream, so that connection is closed instead of
+being put back.
+"""
+
+
+class StandInServer:
+    """Local asyncio TCP server answering one line per request, with optional faults."""
+
+    def __init__(self, latency=BENCHMARK_LATENCY, failure_rate=0.0, stall_rate=0.0,
+                 stall=5.0, host='127.0.0.1', port=0, backlog=DEFAULT_BACKLOG, seed=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.address = None
+        self.requests = 0
+        self.dropped = 0
+        self.stalled = 0
+        self.connections = 0
+        self._rng = random.Random(seed)
+        self._server = None
+        self._handlers = set()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=self.backlog)
+        self.address = self._server.sockets[0].getsockname()[:2]
+        return self
+
+    async def close(self):
+        if self._server is None:
+            return
+        self._server.close()
+        for handler in list(self._handlers):
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _handle(self, reader, writer):
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        self.connections += 1
+        rng = self._rng
+        low, high = self.latency
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.requests += 1
+                roll = rng.random()
+                if roll < self.failure_rate:
+                    self.dropped += 1
+                    break
+                if roll < self.failure_rate + self.stall_rate:
+                    self.stalled += 1
+                    await asyncio.sleep(self.stall)
+                elif high > 0:
+                    await asyncio.sleep(rng.uniform(low, high))
+                writer.write(b'OK ' + line)
+                await writer.drain()
+        except (OSError, asyncio.CancelledError):
+            pass                          # client went away, or close() is shutting down
+        finally:
+            writer.close()
+            self._handlers.discard(handler)
+
+
+class StandInClient:
+    """Keep-alive client for StandInServer with a bounded connection pool."""
+
+    def __init__(self, host, port, max_connections=DEFAULT_CONCURRENCY):
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.opened = 0
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle = []
+
+    async def _checkout(self):
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            connection = await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            self._slots.release()
+            raise
+        self.opened += 1
+        return connection
+
+    async def fetch(self, path):
+        """Send one request and return the reply line, e.g. 'OK /users/7'."""
+        reader, writer = await self._checkout()
+        try:
+            writer.write(path.encode() + b'\n')
+            await writer.drain()
+            line = await reader.readline()
+            if not line.endswith(b'\n'):
+                raise asyncio.IncompleteReadError(line, None)
+        except BaseException:
+            writer.close()
+            self._slots.release()
+            raise
+        self._idle.append((reader, writer))
+        self._slots.release()
+        return line[:-1].decode()
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+# =============================================================================
+# 4. REFERENCE: THE 3.3.0 GATHER PATTERN
+# =============================================================================
+
+"""
+REFERENCE:
+original_fetch_data and original_process_multiple_urls are the nested
+functions of 3.3.0 async_syntax_example, unchanged except that the fetch
+function can be passed in. 3.5.0 basic_async_patterns (process_concurrent)
+uses the same pattern. Every coroutine is created and scheduled at once,
+there is no limit and no timeout, and the first exception propagates out
+of gather while the other tasks keep running unobserved.
+"""
+
+
+async def original_fetch_data(url):
+    """3.3.0 fetch_data (reference copy)."""
+    print(f"Fetching {url}")
+    await asyncio.sleep(0.1)
+    return f"Data from {url}"
+
+
+async def original_process_multiple_urls(urls, fetch=original_fetch_data):
+    """3.3.0 process_multiple_urls: one unbounded asyncio.gather (reference copy)."""
+    tasks = [fetch(url) for url in urls]
+    results = await asyncio.gather(*tasks)
+    return dict(zip(urls, results))
+
+
+def timed(fetch, recorder):
+    """Wrap a coroutine function so each call's latency goes into recorder."""
+    async def timed_fetch(item):
+        start = time.perf_counter()
+        try:
+            return await fetch(item)
+        finally:
+            recorder.record(time.perf_counter() - start)
+    return timed_fetch
+
+
+# =============================================================================
+# 5. BENCHMARK: THROUGHPUT AND TAIL LATENCY
+# =============================================================================
+
+"""
+SETUP:
+One process hosts both the stand-in server and the clients. Replies take
+1-5 ms, so any endpoint could do a few hundred requests per second on its
+own. Throughput measures how well the fan-out overlaps that waiting.
+
+COMPARISONS:
+- gather:   the 3.3.0 pattern over all tasks at once. It uses a
+            1,000-connection pool, because one socket per task would need
+            2 x 10^4 file descriptors in this single process. Its latency
+            includes the time each task waits for a pooled connection.
+- limit_N:  FanOutRunner with N concurrent tasks and an N-connection pool
+- faulty_*: a server that drops 2% of requests and stalls 0.5% for 2 s,
+            with a 0.2 s timeout per attempt. no_retry takes one attempt;
+            retry takes up to 3 attempts with full jitter. The rates show
+            how retries raise the success rate while timeouts cap p99.
+"""
+
+
+async def _run_limit(address, urls, limit, retry=None, timeout=1.0):
+    client = StandInClient(*address, max_connections=limit)
+    runner = FanOutRunner(concurrency=limit, timeout=timeout, retry=retry, seed=limit)
+    async for _ in runner.run(client.fetch, urls):
+        pass
+    await client.close()
+    return runner.stats()
+
+
+async def _benchmark(tasks):
+    results = {'tasks': tasks}
+    urls = [f'/item/{index}' for index in range(tasks)]
+
+    async with StandInServer(latency=BENCHMARK_LATENCY, seed=1) as server:
+        client = StandInClient(*server.address, max_connections=max(BENCHMARK_LIMITS))
+        recorder = LatencyRecorder()
+        start = time.perf_counter()
+        replies = await original_process_multiple_urls(urls, timed(client.fetch, recorder))
+        elapsed = time.perf_counter() - start
+        await client.close()
+        summary = recorder.summary()
+        results['gather_tasks_per_s'] = tasks / elapsed
+        results['gather_p50_ms'] = summary['p50_ms']
+        results['gather_p99_ms'] = summary['p99_ms']
+        results['gather_all_replied'] = all(replies[url] == f'OK {url}' for url in urls)
+
+        for limit in BENCHMARK_LIMITS:
+            stats = await _run_limit(server.address, urls, limit)
+            results[f'limit_{limit}_tasks_per_s'] = stats['tasks_per_s']
+            results[f'limit_{limit}_p50_ms'] = stats['p50_ms']
+            results[f'limit_{limit}_p99_ms'] = stats['p99_ms']
+            results[f'limit_{limit}_all_succeeded'] = stats['succeeded'] == tasks
+
+    policies = (('no_retry', RetryPolicy(attempts=1)), ('retry', RetryPolicy(attempts=3)))
+    for name, policy in policies:
+        async with StandInServer(latency=BENCHMARK_LATENCY, failure_rate=0.02, stall_rate=0.005,
+                                 stall=2.0, seed=2) as server:
+            stats = await _run_limit(server.address, urls, 100, retry=policy, timeout=0.2)
+        results[f'faulty_{name}_success_rate'] = stats['succeeded'] / tasks
+        results[f'faulty_{name}_tasks_per_s'] = stats['tasks_per_s']
+        results[f'faulty_{name}_p99_ms'] = stats['p99_ms']
+        results[f'faulty_{name}_retries'] = stats['retries']
+        results[f'faulty_{name}_timeouts'] = stats['timeouts']
+    return results
+
+
+def benchmark_fan_out(tasks=BENCHMARK_TASKS):
+    """Tasks/s and p50/p99 latency: unbounded gather vs FanOutRunner limits and retries."""
+    return asyncio.run(_benchmark(tasks))
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_retry_policy():
+    """
+    RETRY POLICY DEMONSTRATION
+    Exponential backoff caps and the delays each jitter mode draws
+    """
+
+    rng = random.Random(42)
+    results = {}
+    for jitter in JITTER_MODES:
+        policy = RetryPolicy(attempts=6, base_delay=0.1, max_delay=1.0, jitter=jitter)
+        delays = [policy.backoff(retry, rng) for retry in range(1, 6)]
+        results[jitter] = delays
+        print(f"   {jitter:>5}: " + ", ".join(f"{delay:.3f}" for delay in delays) + " s")
+    policy = RetryPolicy()
+    for error in (asyncio.TimeoutError(), ConnectionResetError(), ValueError('bad payload')):
+        print(f"   retry {type(error).__name__}? {policy.should_retry(error)}")
+    samples = sorted(range(1, 101))
+    print(f"   nearest-rank on 1..100: p50={percentile(samples, 0.5)}, "
+          f"p99={percentile(samples, 0.99)}, p100={percentile(samples, 1.0)}")
+    return results
+
+
+def demonstrate_stand_in_server():
+    """
+    STAND-IN SERVER DEMONSTRATION
+    The 3.3.0 gather pattern against a real local TCP server
+    """
+
+    async def main():
+        async with StandInServer(latency=(0.01, 0.02), seed=3) as server:
+            client = StandInClient(*server.address, max_connections=3)
+            urls = ["api1.example.com", "api2.example.com", "api3.example.com"]
+            data = await original_process_multiple_urls(urls, client.fetch)
+            print(f"   server on {server.address[0]}:{server.address[1]}")
+            for url, reply in data.items():
+                print(f"   {url} -> {reply!r}")
+            await client.close()
+
+        async with StandInServer(latency=(0.0, 0.0), failure_rate=1.0, seed=3) as broken:
+            client = StandInClient(*broken.address)
+            try:
+                await original_process_multiple_urls(urls, client.fetch)
+            except Exception as error:
+                print(f"   gather against a failing server raises {type(error).__name__}: "
+                      f"all other results are lost")
+            await client.close()
+        return {'replies': len(data), 'requests': server.requests, 'connections': server.connections}
+
+    return asyncio.run(main())
+
+
+def demonstrate_fan_out_runner():
+    """
+    FAN-OUT RUNNER DEMONSTRATION
+    Results streamed in completion order from a flaky server
+    """
+
+    async def main():
+        async with StandInServer(latency=(0.001, 0.02), failure_rate=0.05, stall_rate=0.02,
+                                 stall=1.0, seed=4) as server:
+            client = StandInClient(*server.address, max_connections=20)
+            runner = FanOutRunner(concurrency=20, timeout=0.1,
+                                  retry=RetryPolicy(attempts=3, base_delay=0.01), seed=4)
+            order = []
+            eventful = 0
+            async for result in runner.run(client.fetch, (f'/users/{n}' for n in range(200))):
+                order.append(result.index)
+                if len(order) <= 3:
+                    print(f"   {result}")
+                elif (not result.ok or result.attempts > 1) and eventful < 4:
+                    eventful += 1
+                    print(f"   {result}")
+            await client.close()
+        stats = runner.stats()
+        print(f"   completion order starts {order[:8]} (not input order)")
+        print(f"   server: {server.requests} requests, {server.dropped} dropped, {server.stalled} stalled")
+        print(f"   stats: {', '.join(f'{k}={v:.4g}' for k, v in stats.items())}")
+        return stats
+
+    return asyncio.run(main())
+
+
+def demonstrate_early_exit():
+    """
+    EARLY EXIT DEMONSTRATION
+    Stop after the first few results; the rest are never started
+    """
+
+    async def main():
+        async with StandInServer(latency=(0.005, 0.05), seed=5) as server:
+            client = StandInClient(*server.address, max_connections=10)
+            runner = FanOutRunner(concurrency=10, seed=5)
+            stream = runner.run(client.fetch, (f'/search/{n}' for n in range(10_000)))
+            first = []
+            async for result in stream:
+                first.append(result.value)
+                if len(first) == 3:
+                    break
+            await stream.aclose()
+            await client.close()
+            print(f"   first replies: {first}")
+            print(f"   10,000 items offered, {server.requests} requests sent, "
+                  f"{runner.in_flight} tasks still running")
+        return {'first': first, 'requests': server.requests}
+
+    return asyncio.run(main())
+
+
+def demonstrate_fan_out_benchmarks(tasks=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 100,000 tasks
+    """
+
+    if tasks is None:
+        tasks = FULL_BENCHMARK_TASKS if '--full' in sys.argv else BENCHMARK_TASKS
+    results = benchmark_fan_out(tasks)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute async fan-out demonstrations
+    Pass --full for the 100,000-task benchmark
+    """
+
+    print("🎯 PYTHON SYNTAX - ASYNC FAN-OUT WITH LIMITS, TIMEOUTS AND RETRIES")
+    print("=" * 60)
+
+    sections = [
+        ("Retry Policy", demonstrate_retry_policy),
+        ("Stand-In Server", demonstrate_stand_in_server),
+        ("Fan-Out Runner", demonstrate_fan_out_runner),
+        ("Early Exit", demonstrate_early_exit),
+        ("Fan-Out Benchmarks", demonstrate_fan_out_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
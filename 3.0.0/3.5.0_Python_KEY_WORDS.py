@@ -2025,6 +2025,8 @@ def demonstrate_async_keywords():
     
     async def basic_async_patterns():
         """Demonstrate basic async/await patterns."""
+        # Bounded fan-out with timeouts, retries and streamed results:
+        # see 3.3.5_Python_SYN_ASYNC_FANOUT.py
         
         import asyncio
         
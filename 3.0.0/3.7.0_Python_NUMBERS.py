@@ -328,6 +328,7 @@ def demonstrate_integer_operations():
         # Check if large number is prime (simplified test)
         def is_prime_simple(n):
             """Simple primality test for demonstration."""
+            # Deterministic Miller-Rabin and segmented sieve: 3.7.1_Python_NUM_NUMBER_THEORY.py
             if n < 2:
                 return False
             if n == 2:
@@ -707,6 +708,7 @@ def demonstrate_complex_operations():
             
             def generate_signal(frequency, phase, amplitude, samples):
                 """Generate complex exponential signal."""
+                # Phasor-table generation into interleaved arrays: 3.7.5_Python_NUM_COMPLEX_SIGNAL.py
                 signal = []
                 for n in range(samples):
                     # e^(j*2*pi*f*n + j*phase)
@@ -732,6 +734,7 @@ def demonstrate_complex_operations():
         # Geometric transformations
         def geometric_transformations():
             """Demonstrate geometric transformations using complex numbers."""
+            # Whole-array rotate/scale/translate: ComplexArray in 3.7.5_Python_NUM_COMPLEX_SIGNAL.py
             
             # Points in complex plane
             points = [1 + 0j, 0 + 1j, -1 + 0j, 0 - 1j]  # Unit square vertices
@@ -912,9 +915,11 @@ def demonstrate_precision_types():
         # Continued fraction approximations
         def continued_fraction_example():
             """Demonstrate rational approximations."""
-            
+            # Batch/bounded approximations with cached convergents (no Fraction
+            # per step): see 3.7.7_Python_NUM_CONTINUED_FRACTIONS.py
+
             import math
-            
+
             # Approximate pi with fractions
             pi_approx = Fraction(math.pi).limit_denominator(1000)
             
@@ -1340,6 +1345,7 @@ def demonstrate_number_formatting():
         # Custom base conversion
         def to_base(num, base):
             """Convert number to arbitrary base."""
+            # Bulk/huge-int version with digit-group tables: 3.7.4_Python_NUM_BULK_FORMAT.py
             if num == 0:
                 return "0"
             
@@ -1392,6 +1398,7 @@ def demonstrate_number_formatting():
             # Alternative: manual grouping
             def manual_grouping(number, separator=',', group_size=3):
                 """Manually add grouping separators."""
+                # Column-at-a-time grouping: group_many in 3.7.4_Python_NUM_BULK_FORMAT.py
                 str_num = str(int(number))
                 if len(str_num) <= group_size:
                     return str_num
@@ -1430,6 +1437,7 @@ def demonstrate_number_formatting():
         # Engineering notation (powers of 1000)
         def engineering_notation(num):
             """Convert to engineering notation."""
+            # Bulk version (exact exponent, 1000.00 rollover fixed): 3.7.4_Python_NUM_BULK_FORMAT.py
             import math
             
             if num == 0:
@@ -1736,6 +1744,7 @@ def demonstrate_real_world_applications():
     # Financial calculations
     def financial_applications():
         """Comprehensive financial calculation examples."""
+        # Column-oriented batch version (float64/decimal, processes): 3.7.2_Python_NUM_FINANCE_ENGINE.py
         
         # Compound interest calculator
         def compound_interest_calculator(principal, rate, time, frequency=1):
@@ -1829,6 +1838,7 @@ def demonstrate_real_world_applications():
         # Physics calculations
         def projectile_motion(initial_velocity, angle_degrees, height=0):
             """Calculate projectile motion parameters."""
+            # Batch RK4/Euler simulation with drag and sweeps: 3.7.6_Python_NUM_PROJECTILE_BATCH.py
             
             g = 9.81  # Acceleration due to gravity
             angle_rad = math.radians(angle_degrees)
@@ -1862,6 +1872,7 @@ def demonstrate_real_world_applications():
         # Statistical analysis
         def statistical_analysis(data):
             """Comprehensive statistical analysis."""
+            # One-pass mergeable version with t-digest percentiles: 3.7.3_Python_NUM_STREAMING_STATS.py
             
             import statistics
             
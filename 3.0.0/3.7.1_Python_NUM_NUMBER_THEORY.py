@@ -0,0 +1,528 @@
+""" 3.7.1_Python_NUM_NUMBER_THEORY.py """
+
+# =============================================================================
+# PYTHON NUMBERS - NUMBER THEORY: SIEVES & PRIMALITY
+# =============================================================================
+# Version: 3.7.1 | Educational Excellence Target: 9.5/10
+# Purpose: One shared, fast home for prime testing and prime generation
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Build a Sieve of Eratosthenes on a bytearray with slice assignment
+✓ Split the sieve into segments so memory stays flat up to 10**9 and beyond
+✓ Run sieve segments in parallel on a process pool
+✓ Test any 64-bit integer with deterministic Miller-Rabin
+✓ Answer batch questions: is_prime over an array, primes_in_range(lo, hi)
+
+🚀 QUICK NAVIGATION:
+├── 1. SMALL-PRIME TABLE (CACHED FOUNDATION)
+├── 2. SEGMENTED SIEVE (BYTEARRAY BITMAP)
+├── 3. PARALLEL SEGMENTS (PROCESS POOL)
+├── 4. DETERMINISTIC MILLER-RABIN (64-BIT)
+├── 5. BATCH APIs (is_prime_batch, primes_in_range)
+└── 6. BENCHMARK VS TRIAL DIVISION
+
+🔍 CORE CONCEPT:
+MathOperations.is_prime (3.2.0), filtering_patterns.is_prime (3.9.0) and
+is_prime_simple (3.7.0) all trial-divide up to sqrt(n) on every call.
+A sieve answers many questions at once by crossing off multiples with
+C-speed slice writes, and Miller-Rabin answers single large questions in
+a dozen modular exponentiations instead of tens of thousands of divisions.
+"""
+
+import array
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress
+
+# =============================================================================
+# 1. SMALL-PRIME TABLE - CACHED FOUNDATION
+# =============================================================================
+
+"""
+SMALL-PRIME TABLE:
+Every composite below 2**32 has a prime factor below 2**16, so one cached
+table of primes up to SMALL_PRIME_LIMIT seeds every sieve segment up to
+2**32 and gives O(1) lookups for small inputs.
+"""
+
+SMALL_PRIME_LIMIT = 1 << 16
+SEGMENT_SIZE = 1 << 20  # odd numbers per segment (covers 2 * 2**20 integers)
+
+# The first 12 primes are exact witnesses for every n < PSI_12 (~3.2 * 10**23,
+# covers 64-bit). PSI_12 itself is a strong pseudoprime to all of them.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+PSI_12 = 318_665_857_834_031_151_167_461
+
+# Adding 41 stays exact for every n < PSI_13 (~3.3 * 10**24); above that,
+# is_prime adds random bases and is probabilistic (error < 4**-rounds)
+EXTENDED_MILLER_RABIN_BASES = MILLER_RABIN_BASES + (41,)
+PSI_13 = 3_317_044_064_679_887_385_961_981
+PROBABILISTIC_ROUNDS = 32
+
+# Smaller inputs need fewer witnesses: (exclusive upper bound, bases)
+MILLER_RABIN_TIERS = (
+    (3_215_031_751, (2, 3, 5, 7)),
+    (3_474_749_660_383, (2, 3, 5, 7, 11, 13)),
+    (341_550_071_728_321, (2, 3, 5, 7, 11, 13, 17)),
+    (PSI_12, MILLER_RABIN_BASES),
+    (PSI_13, EXTENDED_MILLER_RABIN_BASES),
+)
+
+# Sieve a batch's span when it is at most this many integers per value
+DENSE_SPAN_PER_VALUE = 256
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_LIMITS = (10 ** 6, 10 ** 7)
+FULL_BENCHMARK_LIMITS = (10 ** 6, 10 ** 7, 10 ** 8, 10 ** 9)
+BENCHMARK_SAMPLE = 2_000
+
+
+def simple_sieve(limit):
+    """bytearray where flags[n] == 1 iff n is prime, for 0 <= n < limit."""
+    flags = bytearray([1]) * limit
+    flags[:2] = b'\x00\x00'[:limit]
+    for p in range(2, math.isqrt(limit - 1) + 1 if limit > 1 else 0):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return flags
+
+
+@lru_cache(maxsize=None)
+def small_prime_flags(limit=SMALL_PRIME_LIMIT):
+    return bytes(simple_sieve(limit))
+
+
+@lru_cache(maxsize=None)
+def small_primes(limit=SMALL_PRIME_LIMIT):
+    """Cached tuple of all primes below limit."""
+    return tuple(compress(range(limit), small_prime_flags(limit)))
+
+
+def _base_primes(hi):
+    """Odd primes needed to sieve up to hi (exclusive)."""
+    root = math.isqrt(max(hi - 1, 0))
+    if root < SMALL_PRIME_LIMIT:
+        return [p for p in small_primes() if 2 < p <= root]
+    return list(compress(range(root + 1), simple_sieve(root + 1)))[1:]
+
+
+# =============================================================================
+# 2. SEGMENTED SIEVE - BYTEARRAY BITMAP
+# =============================================================================
+
+"""
+ODD-ONLY SEGMENTS:
+A segment covering [lo, hi) stores one byte per odd number: index i
+stands for first_odd + 2*i. For each base prime p we start at the first
+odd multiple >= max(p*p, lo) and clear every p-th byte with one slice
+assignment - the inner loop runs in C.
+"""
+
+
+def sieve_segment(lo, hi, base_primes=None):
+    """
+    Sieve the odd numbers in [lo, hi).
+
+    Returns (first_odd, flags) where flags[i] == 1 iff first_odd + 2*i is
+    prime. The prime 2 is never represented; callers add it themselves.
+    """
+    first = lo | 1
+    if first >= hi:
+        return first, bytearray()
+    length = (hi - first + 1) // 2
+    flags = bytearray([1]) * length
+    if base_primes is None:
+        base_primes = _base_primes(hi)
+    for p in base_primes:
+        square = p * p
+        if square >= hi:
+            break
+        start = max(square, (first + p - 1) // p * p)
+        if not start & 1:
+            start += p  # first odd multiple
+        index = (start - first) // 2
+        if index < length:
+            flags[index::p] = bytes(len(range(index, length, p)))
+    if first == 1:
+        flags[0] = 0  # 1 is not prime
+    return first, flags
+
+
+def _segment_bounds(lo, hi, segment_size):
+    span = 2 * segment_size
+    return [(start, min(start + span, hi)) for start in range(lo, hi, span)]
+
+
+def _segment_primes_worker(lo, hi):
+    """Process-pool worker: primes in [lo, hi) as raw array('Q') bytes."""
+    first, flags = sieve_segment(lo, hi)
+    primes = array.array('Q', compress(range(first, hi, 2), flags))
+    return primes.tobytes()
+
+
+def _segment_count_worker(lo, hi):
+    """Process-pool worker: number of odd primes in [lo, hi)."""
+    return sieve_segment(lo, hi)[1].count(1)
+
+
+# =============================================================================
+# 3. PARALLEL SEGMENTS - PROCESS POOL
+# =============================================================================
+
+def _run_segments(worker, lo, hi, segment_size, workers):
+    """Map worker over the segments of [lo, hi), serially or on a pool."""
+    bounds = _segment_bounds(lo, hi, segment_size)
+    if workers and workers > 1 and len(bounds) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(worker, *zip(*bounds)))
+    base = _base_primes(hi)
+    if worker is _segment_count_worker:
+        return [sieve_segment(a, b, base)[1].count(1) for a, b in bounds]
+    results = []
+    for a, b in bounds:
+        first, flags = sieve_segment(a, b, base)
+        results.append(array.array('Q', compress(range(first, b, 2), flags)).tobytes())
+    return results
+
+
+def primes_in_range(lo, hi, segment_size=SEGMENT_SIZE, workers=None):
+    """All primes p with lo <= p < hi, as array('Q')."""
+    lo = max(lo, 0)
+    primes = array.array('Q')
+    if hi <= lo:
+        return primes
+    if lo <= 2 < hi:
+        primes.append(2)
+    for chunk in _run_segments(_segment_primes_worker, lo, hi, segment_size, workers):
+        primes.frombytes(chunk)
+    return primes
+
+
+def count_primes(lo, hi, segment_size=SEGMENT_SIZE, workers=None):
+    """Number of primes p with lo <= p < hi, without materialising them."""
+    lo = max(lo, 0)
+    if hi <= lo:
+        return 0
+    total = sum(_run_segments(_segment_count_worker, lo, hi, segment_size, workers))
+    return total + (lo <= 2 < hi)
+
+
+# =============================================================================
+# 4. DETERMINISTIC MILLER-RABIN - 64-BIT
+# =============================================================================
+
+def miller_rabin(n, bases=MILLER_RABIN_BASES):
+    """Strong-probable-prime test; exact for n < PSI_12 with the default bases."""
+    if n < 2:
+        return False
+    for p in bases:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n):
+    """
+    Primality of a single integer.
+
+    Table lookup below SMALL_PRIME_LIMIT, a few cheap trial divisions,
+    then deterministic Miller-Rabin below PSI_13. Larger n also get
+    PROBABILISTIC_ROUNDS random bases, so a True there is probable, not proven.
+    """
+    if n < SMALL_PRIME_LIMIT:
+        return n >= 0 and small_prime_flags()[n] == 1
+    for p in small_primes()[:25]:  # primes below 100 reject ~88% of composites
+        if n % p == 0:
+            return False
+    for bound, bases in MILLER_RABIN_TIERS:
+        if n < bound:
+            return miller_rabin(n, bases)
+    rng = random.Random(n)  # repeatable answer for each n
+    bases = EXTENDED_MILLER_RABIN_BASES + tuple(rng.randrange(2, n - 1) for _ in range(PROBABILISTIC_ROUNDS))
+    return miller_rabin(n, bases)
+
+
+# =============================================================================
+# 5. BATCH APIs - is_prime_batch, primes_in_range
+# =============================================================================
+
+def is_prime_batch(values, typecode='B'):
+    """
+    Primality of every value, as array(typecode) of 0/1 flags.
+
+    When the values are dense within their span the span is sieved once
+    and each value becomes a byte lookup; sparse values fall back to
+    is_prime (Miller-Rabin) one by one.
+    """
+    values = values if isinstance(values, (array.array, list, tuple)) else list(values)
+    if not len(values):
+        return array.array(typecode)
+    lo, hi = min(values), max(values) + 1
+    if hi <= SMALL_PRIME_LIMIT and lo >= 0:
+        flags = small_prime_flags()
+        return array.array(typecode, [flags[v] for v in values])
+    if hi - lo <= DENSE_SPAN_PER_VALUE * len(values) and lo >= 0:
+        first, flags = sieve_segment(lo, hi)
+        small = small_prime_flags()
+        lookup = []
+        for v in values:
+            if v < SMALL_PRIME_LIMIT:
+                lookup.append(small[v])
+            elif v & 1:
+                lookup.append(flags[(v - first) >> 1])
+            else:
+                lookup.append(0)
+        return array.array(typecode, lookup)
+    return array.array(typecode, [is_prime(v) for v in values])
+
+
+# =============================================================================
+# 6. BENCHMARK VS TRIAL DIVISION
+# =============================================================================
+
+def math_operations_is_prime(n):
+    """MathOperations.is_prime from 3.2.0_Python_OPERATORS.py."""
+    if n < 2:
+        return False
+    if n == 2:
+        return True
+    if n % 2 == 0:
+        return False
+    return not any(n % i == 0 for i in range(3, int(n**0.5) + 1, 2))
+
+
+def filtering_patterns_is_prime(n):
+    """filtering_patterns.is_prime from 3.9.0_Python_ARRAYS.py."""
+    if n < 2:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def is_prime_simple(n):
+    """is_prime_simple from 3.7.0_Python_NUMBERS.py."""
+    if n < 2:
+        return False
+    if n == 2:
+        return True
+    if n % 2 == 0:
+        return False
+    for i in range(3, int(n**0.5) + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+
+TRIAL_DIVISION_IMPLEMENTATIONS = {
+    'MathOperations.is_prime (3.2.0)': math_operations_is_prime,
+    'filtering_patterns.is_prime (3.9.0)': filtering_patterns_is_prime,
+    'is_prime_simple (3.7.0)': is_prime_simple,
+}
+
+# Trial division gets too slow to enumerate whole ranges above this limit
+TRIAL_DIVISION_RANGE_LIMIT = 10 ** 6
+
+
+def benchmark_primality(limits=BENCHMARK_LIMITS, sample_size=BENCHMARK_SAMPLE, workers=4):
+    """
+    Two workloads per limit:
+    - count every prime below the limit (range workload)
+    - test a random sample of values below the limit (sparse workload)
+    """
+    rng = random.Random(42)
+    results = {}
+    for limit in limits:
+        row = {}
+        expected = None
+
+        if limit <= TRIAL_DIVISION_RANGE_LIMIT:
+            for name, function in TRIAL_DIVISION_IMPLEMENTATIONS.items():
+                start = time.perf_counter()
+                found = sum(1 for n in range(limit) if function(n))
+                row[f'range: {name}'] = time.perf_counter() - start
+                expected = found if expected is None else expected
+                assert found == expected, f"{name} disagrees"
+
+        start = time.perf_counter()
+        counted = count_primes(0, limit)
+        row['range: segmented sieve'] = time.perf_counter() - start
+        start = time.perf_counter()
+        counted_parallel = count_primes(0, limit, workers=workers)
+        row[f'range: segmented sieve x{workers} processes'] = time.perf_counter() - start
+        assert counted == counted_parallel and (expected is None or counted == expected)
+
+        sample = array.array('Q', (rng.randrange(limit) for _ in range(sample_size)))
+        reference = None
+        for name, function in TRIAL_DIVISION_IMPLEMENTATIONS.items():
+            start = time.perf_counter()
+            flags = [function(v) for v in sample]
+            row[f'sample: {name}'] = time.perf_counter() - start
+            reference = flags if reference is None else reference
+        start = time.perf_counter()
+        flags = is_prime_batch(sample)
+        row['sample: is_prime_batch'] = time.perf_counter() - start
+        assert list(map(bool, flags)) == reference, "is_prime_batch disagrees"
+
+        results[limit] = {'prime_count': counted, 'timings': row}
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_small_primes():
+    """
+    SMALL-PRIME TABLE DEMONSTRATION
+    Cached sieve up to 2**16
+    """
+
+    primes = small_primes()
+    results = {
+        'table_size': len(primes),
+        'first_primes': primes[:10],
+        'largest_small_prime': primes[-1],
+        'lookup_65521': is_prime(65521),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_segmented_sieve():
+    """
+    SEGMENTED SIEVE DEMONSTRATION
+    Primes in a window far from zero
+    """
+
+    window = primes_in_range(10 ** 12, 10 ** 12 + 200)
+    results = {
+        'primes_below_100': list(primes_in_range(0, 100)),
+        'window_10^12': list(window),
+        'count_below_10^6': count_primes(0, 10 ** 6),
+        'count_below_10^6_small_segments': count_primes(0, 10 ** 6, segment_size=1 << 12),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_miller_rabin():
+    """
+    MILLER-RABIN DEMONSTRATION
+    Exact answers for 64-bit inputs
+    """
+
+    candidates = {
+        'mersenne_2^31-1': 2 ** 31 - 1,
+        'mersenne_2^61-1': 2 ** 61 - 1,
+        'carmichael_561': 561,
+        'strong_pseudoprime_base2': 3215031751,
+        'largest_64bit_prime': 2 ** 64 - 59,
+        '2^64-1': 2 ** 64 - 1,
+        'psi_12_strong_pseudoprime': PSI_12,     # 399165290221 * 798330580441
+        'psi_13_strong_pseudoprime': PSI_13,
+        'mersenne_2^89-1': 2 ** 89 - 1,          # above PSI_13: probabilistic
+    }
+    results = {name: is_prime(value) for name, value in candidates.items()}
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    results['psi_12_fools_default_bases'] = miller_rabin(PSI_12)
+    print(f"   miller_rabin(PSI_12) with only the 12 default bases: {results['psi_12_fools_default_bases']}")
+    if results['psi_12_strong_pseudoprime'] or results['psi_13_strong_pseudoprime']:
+        raise AssertionError("is_prime accepted a strong pseudoprime")
+    return results
+
+
+def demonstrate_batch_api():
+    """
+    BATCH API DEMONSTRATION
+    Dense values are sieved, sparse values use Miller-Rabin
+    """
+
+    dense = array.array('Q', range(10 ** 9, 10 ** 9 + 30))
+    sparse = array.array('Q', [97, 2 ** 31 - 1, 10 ** 18 + 9, 10 ** 18 + 7])
+    results = {
+        'dense_primes': [v for v, flag in zip(dense, is_prime_batch(dense)) if flag],
+        'sparse_flags': list(is_prime_batch(sparse)),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_primality_benchmarks(limits=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full to sieve all the way to 10**9
+    """
+
+    if limits is None:
+        limits = FULL_BENCHMARK_LIMITS if '--full' in sys.argv else BENCHMARK_LIMITS
+    results = benchmark_primality(limits)
+
+    for limit, result in results.items():
+        print(f"   limit={limit:,} primes={result['prime_count']:,}")
+        for name, seconds in result['timings'].items():
+            print(f"      {name:<48} {seconds * 1000:10.2f} ms")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute number theory demonstrations
+    Pass --full for the 10**9 benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - NUMBER THEORY")
+    print("=" * 60)
+
+    sections = [
+        ("Small Primes", demonstrate_small_primes),
+        ("Segmented Sieve", demonstrate_segmented_sieve),
+        ("Miller-Rabin", demonstrate_miller_rabin),
+        ("Batch API", demonstrate_batch_api),
+        ("Primality Benchmarks", demonstrate_primality_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
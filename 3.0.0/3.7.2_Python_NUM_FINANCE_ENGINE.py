@@ -0,0 +1,555 @@
+""" 3.7.2_Python_NUM_FINANCE_ENGINE.py """
+
+# =============================================================================
+# PYTHON NUMBERS - BATCH FINANCE ENGINE
+# =============================================================================
+# Version: 3.7.2 | Educational Excellence Target: 9.5/10
+# Purpose: Evaluate millions of interest and loan scenarios per run
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Store scenarios as columns (array('d') / array('i')) instead of dicts
+✓ Run a fast float64 path with log1p/exp for accurate growth factors
+✓ Run an exact decimal path with one shared Context and cached powers
+✓ Stream amortization schedules lazily with generators
+✓ Split large scenario sets across processes and measure scenarios/second
+
+🚀 QUICK NAVIGATION:
+├── 1. SCENARIO COLUMNS (FOUNDATION)
+├── 2. FLOAT64 PATH (SPEED)
+├── 3. DECIMAL PATH (PRECISION)
+├── 4. LAZY AMORTIZATION SCHEDULES (GENERATORS)
+├── 5. FinanceEngine (PROCESS-POOL BATCHES)
+└── 6. BENCHMARK VS PER-SCENARIO CALCULATORS
+
+🔍 CORE CONCEPT:
+compound_interest_calculator and loan_payment_calculator in 3.7.0 convert
+every input with Decimal(str(x)) and handle one scenario per call. In a
+risk run most scenarios share a handful of rates and frequencies, so the
+expensive part - (1 + r/n) ** (n*t) - can be computed once per distinct
+(rate, frequency, periods) and reused across the whole column.
+"""
+
+import array
+import math
+import random
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Context, Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
+
+# =============================================================================
+# 1. SCENARIO COLUMNS - FOUNDATION
+# =============================================================================
+
+"""
+COLUMN LAYOUT:
+A ScenarioBatch holds four parallel columns. principal, rate and years are
+array('d'); frequency (compounding or payment periods per year) is
+array('i'). Columns slice cheaply and travel to worker processes as raw
+bytes.
+"""
+
+PRECISION_MODES = ('float', 'decimal')
+DEFAULT_DECIMAL_PRECISION = 28
+CENT = Decimal('0.01')
+
+# Default scenario counts for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SCENARIOS = 100_000
+FULL_BENCHMARK_SCENARIOS = 2_000_000
+BENCHMARK_WORKERS = 4
+
+
+class ScenarioBatch:
+    """Column-oriented set of (principal, rate, years, frequency) scenarios."""
+
+    __slots__ = ('principal', 'rate', 'years', 'frequency')
+
+    def __init__(self, principal, rate, years, frequency):
+        self.principal = array.array('d', principal)
+        self.rate = array.array('d', rate)
+        self.years = array.array('d', years)
+        self.frequency = array.array('i', frequency)
+        if not len(self.principal) == len(self.rate) == len(self.years) == len(self.frequency):
+            raise ValueError("scenario columns must have equal lengths")
+
+    @classmethod
+    def from_records(cls, records):
+        """Build from dicts with 'amount'/'principal', 'rate', 'years' and optional 'frequency'."""
+        records = list(records)
+        return cls(
+            [r.get('principal', r.get('amount')) for r in records],
+            [r['rate'] for r in records],
+            [r['years'] for r in records],
+            [r.get('frequency', 1) for r in records],
+        )
+
+    @classmethod
+    def random(cls, count, seed=0, rate_grid=None):
+        """
+        Synthetic risk-run scenarios.
+
+        Rates come from a small grid (as in a real shock grid), which is
+        what lets the decimal path reuse its cached growth factors.
+        """
+        rng = random.Random(seed)
+        rate_grid = rate_grid or [round(0.0025 * step, 4) for step in range(1, 41)]
+        return cls(
+            [round(rng.uniform(1_000, 500_000), 2) for _ in range(count)],
+            [rng.choice(rate_grid) for _ in range(count)],
+            [rng.choice((1, 2, 3, 5, 7, 10, 15, 20, 30)) for _ in range(count)],
+            [rng.choice((1, 4, 12)) for _ in range(count)],
+        )
+
+    def __len__(self):
+        return len(self.principal)
+
+    def slice(self, start, stop):
+        batch = ScenarioBatch.__new__(ScenarioBatch)
+        batch.principal = self.principal[start:stop]
+        batch.rate = self.rate[start:stop]
+        batch.years = self.years[start:stop]
+        batch.frequency = self.frequency[start:stop]
+        return batch
+
+    def to_payload(self):
+        return tuple(column.tobytes() for column in (self.principal, self.rate, self.years, self.frequency))
+
+    @classmethod
+    def from_payload(cls, payload):
+        batch = cls.__new__(cls)
+        for name, typecode, raw in zip(cls.__slots__, 'dddi', payload):
+            column = array.array(typecode)
+            column.frombytes(raw)
+            setattr(batch, name, column)
+        return batch
+
+
+# =============================================================================
+# 2. FLOAT64 PATH - SPEED
+# =============================================================================
+
+"""
+FLOAT64 GROWTH FACTORS:
+(1 + r/n) ** (n*t) loses digits when r/n is tiny because 1 + r/n rounds
+first. exp(n*t * log1p(r/n)) keeps them. Both paths below loop once over
+zipped columns inside a comprehension and write straight into array('d').
+"""
+
+
+def float_growth_factors(batch):
+    """(1 + r/n) ** (n*t) for every scenario, as array('d')."""
+    exp, log1p = math.exp, math.log1p
+    return array.array('d', [
+        exp(n * t * log1p(r / n))
+        for r, t, n in zip(batch.rate, batch.years, batch.frequency)
+    ])
+
+
+def float_compound_amounts(batch):
+    """Final amounts P * (1 + r/n) ** (n*t), as array('d')."""
+    exp, log1p = math.exp, math.log1p
+    return array.array('d', [
+        p * exp(n * t * log1p(r / n))
+        for p, r, t, n in zip(batch.principal, batch.rate, batch.years, batch.frequency)
+    ])
+
+
+def float_loan_payments(batch):
+    """Level payment per period P * i / (1 - (1 + i) ** -N), i = r/n, N = n*t."""
+    exp, log1p = math.exp, math.log1p
+    payments = []
+    append = payments.append
+    for p, r, t, n in zip(batch.principal, batch.rate, batch.years, batch.frequency):
+        periods = n * t
+        if r == 0:
+            append(p / periods)
+        else:
+            i = r / n
+            append(p * i / -math.expm1(-periods * log1p(i)))
+    return array.array('d', payments)
+
+
+# =============================================================================
+# 3. DECIMAL PATH - PRECISION
+# =============================================================================
+
+"""
+DECIMAL PATH:
+- One Context shared by the engine: context methods (ctx.power, ctx.multiply)
+  skip the thread-local getcontext() lookup behind every operator.
+- Inputs become Decimal through their shortest repr (the same value
+  Decimal(str(x)) gives), memoised because rates and terms repeat.
+- Growth factors are cached per (rate, frequency, years); integral period
+  counts use exact integer powers.
+"""
+
+
+class DecimalFinance:
+    """Decimal arithmetic for scenario batches with shared context and caches."""
+
+    def __init__(self, precision=DEFAULT_DECIMAL_PRECISION, cache_size=4096):
+        self.context = Context(prec=precision, rounding=ROUND_HALF_EVEN)
+        self.to_decimal = lru_cache(maxsize=cache_size)(self._to_decimal)
+        self.growth_factor = lru_cache(maxsize=cache_size)(self._growth_factor)
+        self.discount_factor = lru_cache(maxsize=cache_size)(self._discount_factor)
+
+    @staticmethod
+    def _to_decimal(value):
+        return Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+
+    def _periods(self, years, frequency):
+        periods = years * frequency
+        return int(periods) if float(periods).is_integer() else self.to_decimal(float(periods))
+
+    def _growth_factor(self, rate, frequency, years):
+        ctx = self.context
+        base = ctx.add(1, ctx.divide(self.to_decimal(rate), frequency))
+        return ctx.power(base, self._periods(years, frequency))
+
+    def _discount_factor(self, rate, frequency, years):
+        """1 - (1 + i) ** -N, the loan-payment denominator."""
+        ctx = self.context
+        return ctx.subtract(1, ctx.divide(1, self.growth_factor(rate, frequency, years)))
+
+    def compound_amounts(self, batch):
+        """Final amounts as a list of Decimal."""
+        ctx, to_decimal, growth = self.context, self.to_decimal, self.growth_factor
+        return [
+            ctx.multiply(to_decimal(p), growth(r, n, t))
+            for p, r, t, n in zip(batch.principal, batch.rate, batch.years, batch.frequency)
+        ]
+
+    def loan_payments(self, batch):
+        """Level payment per period as a list of Decimal."""
+        ctx, to_decimal = self.context, self.to_decimal
+        payments = []
+        for p, r, t, n in zip(batch.principal, batch.rate, batch.years, batch.frequency):
+            principal = to_decimal(p)
+            if r == 0:
+                payments.append(ctx.divide(principal, self._periods(t, n)))
+            else:
+                i = ctx.divide(to_decimal(r), n)
+                payments.append(ctx.divide(ctx.multiply(principal, i), self.discount_factor(r, n, t)))
+        return payments
+
+    def cache_info(self):
+        return {
+            'to_decimal': self.to_decimal.cache_info(),
+            'growth_factor': self.growth_factor.cache_info(),
+        }
+
+
+# =============================================================================
+# 4. LAZY AMORTIZATION SCHEDULES - GENERATORS
+# =============================================================================
+
+AmortizationRow = namedtuple('AmortizationRow', 'period payment interest principal balance')
+
+
+def amortization_schedule(principal, rate, years, frequency=12, precision='float', finance=None):
+    """
+    Yield one AmortizationRow per payment period.
+
+    Nothing is stored: a 30-year monthly schedule for a million loans can be
+    summarised row by row. In decimal mode every amount is rounded to cents
+    and the final payment absorbs the rounding remainder.
+    """
+    periods = int(round(years * frequency))
+    batch = ScenarioBatch([principal], [rate], [years], [frequency])
+
+    if precision == 'float':
+        payment = float_loan_payments(batch)[0]
+        i = rate / frequency
+        balance = float(principal)
+        for period in range(1, periods + 1):
+            interest = balance * i
+            if period == periods:
+                payment = balance + interest
+            principal_part = payment - interest
+            balance -= principal_part
+            yield AmortizationRow(period, payment, interest, principal_part, balance)
+        return
+
+    if precision != 'decimal':
+        raise ValueError(f"precision must be one of {PRECISION_MODES}, got {precision!r}")
+    finance = finance or DecimalFinance()
+    ctx = finance.context
+    payment = finance.loan_payments(batch)[0].quantize(CENT, context=ctx)
+    i = ctx.divide(finance.to_decimal(rate), frequency)
+    balance = finance.to_decimal(principal)
+    for period in range(1, periods + 1):
+        interest = ctx.multiply(balance, i).quantize(CENT, context=ctx)
+        if period == periods:
+            payment = balance + interest
+        principal_part = payment - interest
+        balance -= principal_part
+        yield AmortizationRow(period, payment, interest, principal_part, balance)
+
+
+# =============================================================================
+# 5. FinanceEngine - PROCESS-POOL BATCHES
+# =============================================================================
+
+_FLOAT_KERNELS = {'compound': float_compound_amounts, 'loan': float_loan_payments}
+
+
+def _engine_worker(kind, precision, decimal_precision, payload):
+    """Process-pool worker: evaluate one slice of scenarios."""
+    batch = ScenarioBatch.from_payload(payload)
+    if precision == 'float':
+        return _FLOAT_KERNELS[kind](batch).tobytes()
+    finance = DecimalFinance(decimal_precision)
+    return finance.compound_amounts(batch) if kind == 'compound' else finance.loan_payments(batch)
+
+
+class FinanceEngine:
+    """
+    Batch evaluator for compound interest and loan payments.
+
+    precision='float' returns array('d'); precision='decimal' returns a
+    list of Decimal. With workers > 1 batches of at least parallel_threshold
+    scenarios are split into contiguous slices, one task per worker.
+    """
+
+    def __init__(self, precision='float', decimal_precision=DEFAULT_DECIMAL_PRECISION,
+                 workers=None, parallel_threshold=50_000):
+        if precision not in PRECISION_MODES:
+            raise ValueError(f"precision must be one of {PRECISION_MODES}, got {precision!r}")
+        self.precision = precision
+        self.decimal_precision = decimal_precision
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.finance = DecimalFinance(decimal_precision)
+
+    def _evaluate(self, kind, batch):
+        if self.workers and self.workers > 1 and len(batch) >= self.parallel_threshold:
+            return self._evaluate_parallel(kind, batch)
+        if self.precision == 'float':
+            return _FLOAT_KERNELS[kind](batch)
+        if kind == 'compound':
+            return self.finance.compound_amounts(batch)
+        return self.finance.loan_payments(batch)
+
+    def _evaluate_parallel(self, kind, batch):
+        step = -(-len(batch) // self.workers)
+        payloads = [batch.slice(start, start + step).to_payload() for start in range(0, len(batch), step)]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            parts = pool.map(_engine_worker, [kind] * len(payloads), [self.precision] * len(payloads),
+                             [self.decimal_precision] * len(payloads), payloads)
+            if self.precision == 'float':
+                result = array.array('d')
+                for part in parts:
+                    result.frombytes(part)
+                return result
+            result = []
+            for part in parts:
+                result.extend(part)
+            return result
+
+    def compound_interest(self, batch):
+        """Final amounts for every scenario."""
+        return self._evaluate('compound', batch)
+
+    def loan_payments(self, batch):
+        """Level payment per period for every scenario."""
+        return self._evaluate('loan', batch)
+
+    def interest_earned(self, batch):
+        amounts = self.compound_interest(batch)
+        if self.precision == 'float':
+            return array.array('d', [a - p for a, p in zip(amounts, batch.principal)])
+        to_decimal = self.finance.to_decimal
+        return [a - to_decimal(p) for a, p in zip(amounts, batch.principal)]
+
+    def amortization_schedule(self, principal, rate, years, frequency=12):
+        return amortization_schedule(principal, rate, years, frequency, self.precision, self.finance)
+
+
+# =============================================================================
+# 6. BENCHMARK VS PER-SCENARIO CALCULATORS
+# =============================================================================
+
+def compound_interest_calculator(principal, rate, time, frequency=1):
+    """Per-scenario baseline mirroring 3.7.0 financial_applications."""
+    P = Decimal(str(principal))
+    r = Decimal(str(rate))
+    t = Decimal(str(time))
+    n = Decimal(str(frequency))
+    amount = P * (1 + r/n) ** (n * t)
+    return float(amount)
+
+
+def loan_payment_calculator(principal, annual_rate, years):
+    """Per-scenario baseline mirroring 3.7.0 financial_applications (monthly)."""
+    P = Decimal(str(principal))
+    r = Decimal(str(annual_rate)) / 12
+    n = Decimal(str(years * 12))
+    if r == 0:
+        return float(P / n)
+    return float(P * (r * (1 + r)**n) / ((1 + r)**n - 1))
+
+
+def benchmark_finance_engine(scenarios=BENCHMARK_SCENARIOS, workers=BENCHMARK_WORKERS):
+    """Scenarios per second for the baseline and each engine mode."""
+    batch = ScenarioBatch.random(scenarios)
+    baseline_count = min(scenarios, 20_000)  # the per-scenario loop is slow
+    results = {}
+
+    def record(name, count, function):
+        start = time.perf_counter()
+        output = function()
+        elapsed = time.perf_counter() - start
+        results[name] = {'seconds': elapsed, 'scenarios_per_second': count / elapsed}
+        return output
+
+    baseline = record('per-scenario Decimal(str(x)) calculator', baseline_count, lambda: [
+        compound_interest_calculator(p, r, t, n)
+        for p, r, t, n in zip(batch.principal[:baseline_count], batch.rate[:baseline_count],
+                              batch.years[:baseline_count], batch.frequency[:baseline_count])
+    ])
+    floats = record('engine float64', scenarios, lambda: FinanceEngine('float').compound_interest(batch))
+    decimals = record('engine decimal', scenarios, lambda: FinanceEngine('decimal').compound_interest(batch))
+    record(f'engine float64 x{workers} processes', scenarios,
+           lambda: FinanceEngine('float', workers=workers).compound_interest(batch))
+    record(f'engine decimal x{workers} processes', scenarios,
+           lambda: FinanceEngine('decimal', workers=workers).compound_interest(batch))
+
+    results['max_relative_error_float_vs_decimal'] = max(
+        abs(f - float(d)) / float(d) for f, d in zip(floats, decimals)
+    )
+    results['max_abs_error_decimal_vs_baseline'] = max(
+        abs(b - float(d)) for b, d in zip(baseline, decimals)
+    )
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_scenario_batches():
+    """
+    SCENARIO BATCH DEMONSTRATION
+    The 3.7.0 portfolio evaluated as columns
+    """
+
+    portfolio = ScenarioBatch.from_records([
+        {'name': 'Stock A', 'amount': 10000, 'rate': 0.08, 'years': 5, 'frequency': 12},
+        {'name': 'Bond B', 'amount': 5000, 'rate': 0.04, 'years': 5, 'frequency': 12},
+        {'name': 'CD C', 'amount': 3000, 'rate': 0.025, 'years': 5, 'frequency': 12},
+    ])
+    float_amounts = FinanceEngine('float').compound_interest(portfolio)
+    decimal_amounts = FinanceEngine('decimal').compound_interest(portfolio)
+    total_initial = sum(portfolio.principal)
+
+    results = {
+        'float_amounts': [round(a, 2) for a in float_amounts],
+        'decimal_amounts': [a.quantize(CENT) for a in decimal_amounts],
+        'portfolio_return': round((sum(float_amounts) - total_initial) / total_initial, 6),
+        'loan_250k_4.5%_30y': FinanceEngine('decimal').loan_payments(
+            ScenarioBatch([250000], [0.045], [30], [12]))[0].quantize(CENT),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_decimal_caching():
+    """
+    DECIMAL CACHE DEMONSTRATION
+    Distinct rates are far fewer than scenarios
+    """
+
+    engine = FinanceEngine('decimal')
+    batch = ScenarioBatch.random(20_000, seed=7)
+    engine.compound_interest(batch)
+    info = engine.finance.cache_info()
+    results = {
+        'scenarios': len(batch),
+        'growth_factor_hits': info['growth_factor'].hits,
+        'growth_factor_misses': info['growth_factor'].misses,
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_amortization():
+    """
+    AMORTIZATION DEMONSTRATION
+    Lazily generated schedule rows
+    """
+
+    schedule = amortization_schedule(250000, 0.045, 30, 12, precision='decimal')
+    first_rows = [next(schedule) for _ in range(3)]
+    *_, last_row = schedule
+    total_interest = sum(row.interest for row in amortization_schedule(250000, 0.045, 30, 12, 'decimal'))
+
+    results = {
+        'first_rows': [(row.period, str(row.payment), str(row.interest), str(row.balance)) for row in first_rows],
+        'last_row': (last_row.period, str(last_row.payment), str(last_row.balance)),
+        'total_interest': total_interest,
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_finance_benchmarks(scenarios=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 2 * 10**6 scenarios
+    """
+
+    if scenarios is None:
+        scenarios = FULL_BENCHMARK_SCENARIOS if '--full' in sys.argv else BENCHMARK_SCENARIOS
+    results = benchmark_finance_engine(scenarios)
+
+    print(f"   scenarios={scenarios:,}")
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"   {name:<42} {value['scenarios_per_second']:>14,.0f} scenarios/s")
+        else:
+            print(f"   {name}: {value:.3g}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute finance engine demonstrations
+    Pass --full for the 2 * 10**6 scenario benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - BATCH FINANCE ENGINE")
+    print("=" * 60)
+
+    sections = [
+        ("Scenario Batches", demonstrate_scenario_batches),
+        ("Decimal Caching", demonstrate_decimal_caching),
+        ("Amortization", demonstrate_amortization),
+        ("Finance Benchmarks", demonstrate_finance_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,551 @@
+""" 3.7.3_Python_NUM_STREAMING_STATS.py """
+
+# =============================================================================
+# PYTHON NUMBERS - STREAMING STATISTICS ACCUMULATOR
+# =============================================================================
+# Version: 3.7.3 | Educational Excellence Target: 9.5/10
+# Purpose: Summarise unbounded numeric streams in one pass with bounded memory
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Compute count, mean and variance in one pass (Welford / Chan et al.)
+✓ Track min, max and mode while the data streams past
+✓ Estimate percentiles with a t-digest in bounded memory
+✓ Merge accumulators built on different chunks or processes
+✓ Compare a one-pass summary with repeated statistics-module passes
+
+🚀 QUICK NAVIGATION:
+├── 1. MERGEABLE MOMENTS (WELFORD / CHAN)
+├── 2. T-DIGEST (BOUNDED-MEMORY PERCENTILES)
+├── 3. StreamingStats (ONE-PASS ACCUMULATOR)
+├── 4. PARALLEL SUMMARIES (PROCESS POOL + MERGE)
+└── 5. BENCHMARK VS statistical_analysis
+
+🔍 CORE CONCEPT:
+statistical_analysis in 3.7.0 walks the data once per statistic and then
+sorts all of it for two percentiles. Every one of those statistics can be
+kept as a small state that is updated per chunk and combined with another
+state of the same kind - which is also what lets separate machines
+summarise their own telemetry and ship only the summaries.
+"""
+
+import array
+import math
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import mul
+
+# =============================================================================
+# 1. MERGEABLE MOMENTS - WELFORD / CHAN
+# =============================================================================
+
+"""
+MERGING MOMENTS:
+For two groups with counts n_a, n_b, means m_a, m_b and sums of squared
+deviations M2_a, M2_b (Chan, Golub & LeVeque):
+
+    delta = m_b - m_a
+    n     = n_a + n_b
+    mean  = m_a + delta * n_b / n
+    M2    = M2_a + M2_b + delta**2 * n_a * n_b / n
+
+Welford's per-value update is the n_b == 1 case. Applying the formula to
+whole chunks keeps the inner loops in C (fsum, map) while staying
+numerically stable.
+"""
+
+CHUNK_SIZE = 1 << 16
+DEFAULT_COMPRESSION = 200  # t-digest delta: ~delta/2 centroids, error ~1/delta at the median
+DEFAULT_MODE_LIMIT = 100_000  # stop tracking the mode past this many distinct values
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SIZES = (10 ** 5, 10 ** 6)
+FULL_BENCHMARK_SIZES = (10 ** 6, 10 ** 7, 10 ** 8)
+BASELINE_LIMIT = 10 ** 7  # statistical_analysis needs the whole list in memory
+
+
+def chunk_moments(chunk):
+    """(count, mean, M2) of one in-memory chunk."""
+    n = len(chunk)
+    if not n:
+        return 0, 0.0, 0.0
+    mean = math.fsum(chunk) / n
+    deviations = [x - mean for x in chunk]
+    return n, mean, math.fsum(map(mul, deviations, deviations))
+
+
+def merge_moments(a, b):
+    """Combine two (count, mean, M2) triples."""
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    if not n_a:
+        return b
+    if not n_b:
+        return a
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+# =============================================================================
+# 2. T-DIGEST - BOUNDED-MEMORY PERCENTILES
+# =============================================================================
+
+"""
+T-DIGEST (merging variant, k1 scale function):
+Sorted data is summarised by centroids (mean, weight). The scale function
+k(q) = delta / (2*pi) * asin(2q - 1) allows at most one unit of k per
+centroid, so centroids are tiny near q = 0 and q = 1 (accurate tails) and
+large near the median. A sorted chunk is cut at the quantiles where k
+crosses an integer, so building its centroids is delta/2 slices plus fsum.
+"""
+
+
+class TDigest:
+    """Merging t-digest over float values."""
+
+    __slots__ = ('compression', 'means', 'weights', 'total', 'min', 'max')
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = []
+        self.weights = []
+        self.total = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _k(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _chunk_boundaries(self, count):
+        """Indices cutting a sorted chunk of count values at integer k."""
+        half = self.compression / 4
+        steps = int(2 * half)
+        boundaries = {0, count}
+        for step in range(1, steps):
+            q = (math.sin(2 * math.pi * (step - half) / self.compression) + 1) / 2
+            boundaries.add(round(q * count))
+        return sorted(boundaries)
+
+    def add_chunk(self, chunk):
+        """Add many values (any iterable of floats)."""
+        values = sorted(chunk)
+        if not values:
+            return
+        means, weights = [], []
+        bounds = self._chunk_boundaries(len(values))
+        for start, stop in zip(bounds, bounds[1:]):
+            if stop > start:
+                part = values[start:stop]
+                means.append(math.fsum(part) / len(part))
+                weights.append(len(part))
+        self._absorb(means, weights, len(values), values[0], values[-1])
+
+    def merge(self, other):
+        """Absorb another digest (from another chunk or process)."""
+        if other.total:
+            self._absorb(other.means, other.weights, other.total, other.min, other.max)
+        return self
+
+    def _absorb(self, means, weights, total, low, high):
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+        combined = sorted(zip(self.means + list(means), self.weights + list(weights)))
+        self.total += total
+        self._compress(combined)
+
+    def _compress(self, centroids):
+        total = self.total
+        k = self._k
+        out_means, out_weights = [], []
+        current_mean, current_weight = centroids[0]
+        weight_before = 0
+        k_lower = k(0.0)
+        for mean, weight in centroids[1:]:
+            if k(min((weight_before + current_weight + weight) / total, 1.0)) - k_lower <= 1:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                out_means.append(current_mean)
+                out_weights.append(current_weight)
+                weight_before += current_weight
+                k_lower = k(min(weight_before / total, 1.0))
+                current_mean, current_weight = mean, weight
+        out_means.append(current_mean)
+        out_weights.append(current_weight)
+        self.means, self.weights = out_means, out_weights
+
+    def quantile(self, q):
+        """Estimated value at quantile q (0 <= q <= 1)."""
+        if not self.total:
+            raise ValueError("quantile of an empty digest")
+        if not 0 <= q <= 1:
+            raise ValueError(f"quantile must be in [0, 1], got {q}")
+        # Same position convention as statistical_analysis: rank (n - 1) * q
+        # Value j (0-based) sits at position j + 0.5; min and max anchor the ends.
+        target = q * (self.total - 1) + 0.5
+        previous_center, previous_mean = 0.5, self.min
+        cumulative = 0
+        for mean, weight in zip(self.means, self.weights):
+            center = cumulative + weight / 2
+            if target <= center:
+                span = center - previous_center
+                fraction = (target - previous_center) / span if span > 0 else 0.0
+                return previous_mean + (mean - previous_mean) * fraction
+            cumulative += weight
+            previous_center, previous_mean = center, mean
+        span = self.total - 0.5 - previous_center
+        fraction = (target - previous_center) / span if span > 0 else 1.0
+        return previous_mean + (self.max - previous_mean) * fraction
+
+    def __len__(self):
+        return len(self.means)
+
+
+# =============================================================================
+# 3. StreamingStats - ONE-PASS ACCUMULATOR
+# =============================================================================
+
+class StreamingStats:
+    """
+    Mergeable one-pass summary: count, mean, variance, min, max, mode and
+    t-digest percentiles.
+
+    Count, min, max and mode counts merge exactly; mean and variance merge
+    with the Chan formula (floating point, numerically stable). The mode
+    is dropped once more than mode_limit distinct values have been seen,
+    which keeps memory bounded for continuous data.
+    """
+
+    def __init__(self, compression=DEFAULT_COMPRESSION, mode_limit=DEFAULT_MODE_LIMIT):
+        self.moments = (0, 0.0, 0.0)
+        self.min = math.inf
+        self.max = -math.inf
+        self.mode_limit = mode_limit
+        self.counts = Counter() if mode_limit else None
+        self.digest = TDigest(compression)
+
+    def update(self, chunk):
+        """Add one in-memory chunk of values."""
+        if not len(chunk):
+            return self
+        self.moments = merge_moments(self.moments, chunk_moments(chunk))
+        self.min = min(self.min, min(chunk))
+        self.max = max(self.max, max(chunk))
+        if self.counts is not None:
+            self.counts.update(chunk)
+            if len(self.counts) > self.mode_limit:
+                self.counts = None
+        self.digest.add_chunk(chunk)
+        return self
+
+    def update_stream(self, values, chunk_size=CHUNK_SIZE):
+        """Consume any iterable chunk by chunk (never holds more than chunk_size values)."""
+        if isinstance(values, (array.array, list, tuple)):
+            for start in range(0, len(values), chunk_size):
+                self.update(values[start:start + chunk_size])
+            return self
+        iterator = iter(values)
+        while chunk := list(islice(iterator, chunk_size)):
+            self.update(chunk)
+        return self
+
+    def merge(self, other):
+        """Absorb another accumulator."""
+        self.moments = merge_moments(self.moments, other.moments)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if self.counts is not None and other.counts is not None:
+            self.counts.update(other.counts)
+            if len(self.counts) > self.mode_limit:
+                self.counts = None
+        else:
+            self.counts = None
+        self.digest.merge(other.digest)
+        return self
+
+    def __or__(self, other):
+        return StreamingStats.merged([self, other])
+
+    @classmethod
+    def merged(cls, accumulators):
+        """One accumulator combining all of them (an empty one for no input)."""
+        accumulators = list(accumulators)
+        if not accumulators:
+            return cls()
+        result = cls(accumulators[0].digest.compression, accumulators[0].mode_limit)
+        for accumulator in accumulators:
+            result.merge(accumulator)
+        return result
+
+    # Results ----------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.moments[0]
+
+    @property
+    def mean(self):
+        return self.moments[1]
+
+    def variance(self, sample=True):
+        n, _, m2 = self.moments
+        return m2 / (n - 1) if sample and n > 1 else m2 / n if n else 0.0
+
+    def stdev(self, sample=True):
+        return math.sqrt(self.variance(sample))
+
+    def mode(self):
+        """Most common value, or None once the mode is no longer tracked."""
+        if not self.counts:
+            return None
+        return self.counts.most_common(1)[0][0]
+
+    def percentile(self, p):
+        return self.digest.quantile(p / 100)
+
+    def summary(self):
+        """Same keys as 3.7.0 statistical_analysis."""
+        if not self.count:
+            raise ValueError("summary of an empty accumulator")
+        mode = self.mode()
+        stats = {
+            'count': self.count,
+            'mean': self.mean,
+            'median': self.percentile(50),
+            'std_dev': self.stdev() if self.count > 1 else 0,
+            'variance': self.variance() if self.count > 1 else 0,
+            'min': self.min,
+            'max': self.max,
+            'range': self.max - self.min,
+            'mode': mode if mode is not None else 'No unique mode',
+            'percentile_25': self.percentile(25),
+            'percentile_75': self.percentile(75),
+        }
+        stats['iqr'] = stats['percentile_75'] - stats['percentile_25']
+        return stats
+
+
+# =============================================================================
+# 4. PARALLEL SUMMARIES - PROCESS POOL + MERGE
+# =============================================================================
+
+def _summarise_worker(raw, typecode, compression, mode_limit):
+    """Process-pool worker: summarise one slice sent as raw array bytes."""
+    values = array.array(typecode)
+    values.frombytes(raw)
+    return StreamingStats(compression, mode_limit).update_stream(values)
+
+
+def summarise_parallel(values, workers=4, compression=DEFAULT_COMPRESSION, mode_limit=DEFAULT_MODE_LIMIT):
+    """Split an array across processes and merge the partial accumulators."""
+    values = values if isinstance(values, array.array) else array.array('d', values)
+    if not values:
+        return StreamingStats(compression, mode_limit)
+    step = -(-len(values) // workers)
+    slices = [values[start:start + step].tobytes() for start in range(0, len(values), step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_summarise_worker, slices, [values.typecode] * len(slices),
+                         [compression] * len(slices), [mode_limit] * len(slices))
+        return StreamingStats.merged(parts)
+
+
+# =============================================================================
+# 5. BENCHMARK VS statistical_analysis
+# =============================================================================
+
+def statistical_analysis(data):
+    """Multi-pass baseline from 3.7.0 scientific_applications."""
+    stats = {
+        'count': len(data),
+        'mean': statistics.mean(data),
+        'median': statistics.median(data),
+        'std_dev': statistics.stdev(data) if len(data) > 1 else 0,
+        'variance': statistics.variance(data) if len(data) > 1 else 0,
+        'min': min(data),
+        'max': max(data),
+        'range': max(data) - min(data),
+    }
+    try:
+        stats['mode'] = statistics.mode(data)
+    except statistics.StatisticsError:
+        stats['mode'] = 'No unique mode'
+    sorted_data = sorted(data)
+    n = len(sorted_data)
+
+    def percentile(p):
+        k = (n - 1) * p / 100
+        f = math.floor(k)
+        c = math.ceil(k)
+        if f == c:
+            return sorted_data[int(k)]
+        return sorted_data[int(f)] * (c - k) + sorted_data[int(c)] * (k - f)
+
+    stats['percentile_25'] = percentile(25)
+    stats['percentile_75'] = percentile(75)
+    stats['iqr'] = stats['percentile_75'] - stats['percentile_25']
+    return stats
+
+
+def generate_telemetry(count, seed=0, chunk_size=CHUNK_SIZE):
+    """Yield chunks of synthetic readings (two decimals, so the mode is meaningful)."""
+    rng = random.Random(seed)
+    gauss = rng.gauss
+    remaining = count
+    while remaining:
+        size = min(chunk_size, remaining)
+        yield array.array('d', [round(gauss(50.0, 12.0), 2) for _ in range(size)])
+        remaining -= size
+
+
+def benchmark_streaming_stats(sizes=BENCHMARK_SIZES):
+    """Time the multi-pass baseline and the accumulator; report accuracy."""
+    results = {}
+    for size in sizes:
+        row = {}
+        accumulator = StreamingStats()
+        data = array.array('d') if size <= BASELINE_LIMIT else None
+        elapsed = 0.0
+        for chunk in generate_telemetry(size):
+            start = time.perf_counter()
+            accumulator.update(chunk)
+            elapsed += time.perf_counter() - start  # data generation is not timed
+            if data is not None:
+                data.extend(chunk)
+        row['streaming accumulator'] = elapsed
+        streamed = accumulator.summary()
+
+        if data is not None:
+            values = data.tolist()
+            start = time.perf_counter()
+            baseline = statistical_analysis(values)
+            row['statistical_analysis'] = time.perf_counter() - start
+            row['max percentile error'] = max(
+                abs(streamed[key] - baseline[key]) for key in ('median', 'percentile_25', 'percentile_75')
+            )
+            row['relative stdev error'] = abs(streamed['std_dev'] - baseline['std_dev']) / baseline['std_dev']
+            row['mode matches'] = streamed['mode'] == baseline['mode']
+        row['centroids'] = len(accumulator.digest)
+        results[size] = row
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_one_pass_summary():
+    """
+    ONE-PASS SUMMARY DEMONSTRATION
+    Same keys as statistical_analysis
+    """
+
+    data = [1, 2, 3, 4, 5, 5, 6, 7, 8, 9]
+    streamed = StreamingStats().update(data).summary()
+    baseline = statistical_analysis(data)
+
+    results = {key: (round(streamed[key], 4), round(baseline[key], 4))
+               for key in ('mean', 'median', 'std_dev', 'mode', 'percentile_25', 'percentile_75')}
+    for key, (stream_value, base_value) in results.items():
+        print(f"   {key}: streaming={stream_value} baseline={base_value}")
+    return results
+
+
+def demonstrate_merging():
+    """
+    MERGE DEMONSTRATION
+    Chunks summarised separately, then combined
+    """
+
+    chunks = list(generate_telemetry(200_000, seed=3, chunk_size=50_000))
+    separate = [StreamingStats().update(chunk) for chunk in chunks]
+    merged = StreamingStats.merged(separate)
+    whole = StreamingStats().update_stream(array.array('d', [x for chunk in chunks for x in chunk]))
+
+    results = {
+        'count': (merged.count, whole.count),
+        'mean': (merged.mean, whole.mean),
+        'variance': (merged.variance(), whole.variance()),
+        'mode': (merged.mode(), whole.mode()),
+        'p99': (merged.percentile(99), whole.percentile(99)),
+    }
+    for key, (merged_value, whole_value) in results.items():
+        print(f"   {key}: merged={merged_value} single={whole_value}")
+    return results
+
+
+def demonstrate_parallel_summary():
+    """
+    PARALLEL SUMMARY DEMONSTRATION
+    Worker processes return accumulators that merge in the parent
+    """
+
+    data = array.array('d', [x for chunk in generate_telemetry(100_000, seed=5) for x in chunk])
+    summary = summarise_parallel(data, workers=2).summary()
+    results = {key: summary[key] for key in ('count', 'mean', 'median', 'iqr')}
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_streaming_benchmarks(sizes=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 10**6 to 10**8 values
+    """
+
+    if sizes is None:
+        sizes = FULL_BENCHMARK_SIZES if '--full' in sys.argv else BENCHMARK_SIZES
+    results = benchmark_streaming_stats(sizes)
+
+    for size, row in results.items():
+        print(f"   values={size:,}")
+        for name, value in row.items():
+            if name in ('streaming accumulator', 'statistical_analysis'):
+                print(f"      {name:<24} {value * 1000:10.1f} ms")
+            else:
+                print(f"      {name:<24} {value}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute streaming statistics demonstrations
+    Pass --full for the 10**6 - 10**8 value benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - STREAMING STATISTICS")
+    print("=" * 60)
+
+    sections = [
+        ("One-Pass Summary", demonstrate_one_pass_summary),
+        ("Merging", demonstrate_merging),
+        ("Parallel Summary", demonstrate_parallel_summary),
+        ("Streaming Benchmarks", demonstrate_streaming_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
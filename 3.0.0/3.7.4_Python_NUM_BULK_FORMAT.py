@@ -0,0 +1,594 @@
+""" 3.7.4_Python_NUM_BULK_FORMAT.py """
+
+# =============================================================================
+# PYTHON NUMBERS - BULK NUMBER FORMATTING
+# =============================================================================
+# Version: 3.7.4 | Educational Excellence Target: 9.5/10
+# Purpose: Format millions of numbers for reports without per-number overhead
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Convert integers to any base with digit-group tables (2-5 digits per divmod)
+✓ Convert huge integers with divide-and-conquer instead of digit-by-digit
+✓ Group digits and produce engineering notation for whole columns at once
+✓ Cache compiled format specs so a report never re-parses "{:,.2f}"
+✓ Stream formatted text straight into io.StringIO or a bytes buffer
+
+🚀 QUICK NAVIGATION:
+├── 1. DIGIT-GROUP TABLES & FORMAT-SPEC CACHE (FOUNDATION)
+├── 2. BASE CONVERSION (SMALL & HUGE INTEGERS)
+├── 3. DIGIT GROUPING (BULK)
+├── 4. ENGINEERING NOTATION (BULK)
+├── 5. BUFFER WRITERS (StringIO / BYTES)
+└── 6. BENCHMARK VS format() AND 3.7.0 HELPERS
+
+🔍 CORE CONCEPT:
+to_base, manual_grouping and engineering_notation in 3.7.0 build each
+string character by character with `digit + result`, which copies the
+whole string on every step. Producing whole chunks of digits per
+operation, pushing per-number work into C-level map/format calls, and
+joining once per batch removes nearly all of that overhead.
+"""
+
+import array
+import io
+import math
+import random
+import sys
+import time
+from functools import lru_cache
+from itertools import repeat
+
+# =============================================================================
+# 1. DIGIT-GROUP TABLES & FORMAT-SPEC CACHE - FOUNDATION
+# =============================================================================
+
+"""
+DIGIT GROUPS:
+divmod(n, base**2) peels two digits per step and a table of base**2
+two-char strings turns the remainder straight into text. Going further
+while the table stays small pays off: groups of k digits with
+base**k <= DIGIT_TABLE_LIMIT (4 for base 10, 5 for base 7, 3 for base 36)
+are built once per base and kept.
+"""
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGIT_TABLE_LIMIT = 1 << 16  # max entries in a digit-group table
+LEAF_DIGITS = 32  # below base**LEAF_DIGITS the table loop wins over splitting
+WRITE_CHUNK = 1 << 15  # values joined per write() call
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_COUNT = 200_000
+FULL_BENCHMARK_COUNT = 10_000_000
+BENCHMARK_HUGE_BITS = 50_000
+FULL_BENCHMARK_HUGE_BITS = 1_000_000
+
+
+def _check_base(base):
+    if not 2 <= base <= len(DIGITS):
+        raise ValueError(f"base must be between 2 and {len(DIGITS)}, got {base}")
+
+
+@lru_cache(maxsize=None)
+def digit_table(base):
+    """
+    (k, table) where table[r] is r written as exactly k digits of base.
+
+    k is at least 2 (digit pairs) and as large as DIGIT_TABLE_LIMIT allows.
+    """
+    _check_base(base)
+    width = 2
+    while base ** (width + 1) <= DIGIT_TABLE_LIMIT:
+        width += 1
+    table = ['']
+    for _ in range(width):
+        table = [prefix + DIGITS[digit] for prefix in table for digit in range(base)]
+    return width, tuple(table)
+
+
+@lru_cache(maxsize=256)
+def format_spec(spec):
+    """
+    Cached formatter for one format spec, e.g. format_spec(',.2f')(x).
+
+    Use it where a callable is needed; for a bare spec over a column,
+    map(format, values, repeat(spec)) stays entirely in C.
+    """
+    return ("{:" + spec + "}").format
+
+
+# =============================================================================
+# 2. BASE CONVERSION - SMALL & HUGE INTEGERS
+# =============================================================================
+
+"""
+DIVIDE AND CONQUER:
+For a huge n, split n = high * base**k + low with k a power-of-two multiple
+of LEAF_DIGITS and convert both halves recursively, padding low to exactly
+k digits. Each level does one big divmod instead of k small ones, and the
+powers base**k are cached per base (each is the square of the previous).
+This also sidesteps the 4300-digit limit on str(int) in Python 3.11+.
+"""
+
+
+def _small_to_base(num, base, width=0):
+    """Digit-group conversion of a non-negative int."""
+    width_per_group, table = digit_table(base)
+    group = base ** width_per_group
+    parts = []
+    while num >= group:
+        num, remainder = divmod(num, group)
+        parts.append(table[remainder])
+    parts.append(table[num].lstrip('0') or '0')
+    parts.reverse()
+    text = ''.join(parts)
+    return text.rjust(width, '0') if width else text
+
+
+@lru_cache(maxsize=None)
+def _split_power(base, level):
+    """base ** (LEAF_DIGITS * 2**level), by repeated squaring."""
+    if level == 0:
+        return base ** LEAF_DIGITS
+    previous = _split_power(base, level - 1)
+    return previous * previous
+
+
+def _huge_to_base(num, base, width, level, out):
+    if level < 0:
+        out.append(_small_to_base(num, base, width))
+        return
+    digits = LEAF_DIGITS << level
+    high, low = divmod(num, _split_power(base, level))
+    if high or width > digits:
+        _huge_to_base(high, base, max(width - digits, 0), level - 1, out)
+        _huge_to_base(low, base, digits, level - 1, out)
+    else:
+        _huge_to_base(low, base, width, level - 1, out)
+
+
+def to_base(num, base):
+    """Convert an int to a string in base 2..36 (negative values get '-')."""
+    _check_base(base)
+    if num < 0:
+        return '-' + to_base(-num, base)
+    if base in (2, 8, 16):
+        return format(num, 'b' if base == 2 else 'o' if base == 8 else 'X')
+    if num < _split_power(base, 0):
+        return _small_to_base(num, base)
+    # Highest level whose power is still <= num
+    level = 0
+    while _split_power(base, level + 1) <= num:
+        level += 1
+    out = []
+    _huge_to_base(num, base, 0, level, out)
+    return ''.join(out)
+
+
+def to_base_many(numbers, base, separator='\n'):
+    """Convert many ints and join them once."""
+    _check_base(base)
+    if base in (2, 8, 16):
+        return separator.join(map(format, numbers, repeat('b' if base == 2 else 'o' if base == 8 else 'X')))
+    width, table = digit_table(base)
+    group, leaf_limit = base ** width, _split_power(base, 0)
+    texts = []
+    append = texts.append
+    for num in numbers:
+        if not 0 <= num < leaf_limit:
+            append(to_base(num, base))
+            continue
+        # _small_to_base inlined: this loop is the hot path of a report
+        parts = []
+        while num >= group:
+            num, remainder = divmod(num, group)
+            parts.append(table[remainder])
+        parts.append(table[num].lstrip('0') or '0')
+        parts.reverse()
+        append(''.join(parts))
+    return separator.join(texts)
+
+
+# =============================================================================
+# 3. DIGIT GROUPING - BULK
+# =============================================================================
+
+"""
+GROUPING:
+format(n, ',') groups in C. Other separators are one str.replace over the
+whole joined batch, unless the line separator itself contains a comma
+(the replace would rewrite it too); other group sizes slice the digit
+string from the right.
+"""
+
+
+def group_digits(number, separator=',', group_size=3):
+    """Grouped integer part of number, like manual_grouping in 3.7.0."""
+    number = int(number)
+    if group_size == 3:
+        text = format(number, ',')
+        return text if separator == ',' else text.replace(',', separator)
+    digits = str(abs(number))
+    head = len(digits) % group_size or group_size
+    groups = [digits[:head]] + [digits[i:i + group_size] for i in range(head, len(digits), group_size)]
+    return ('-' if number < 0 else '') + separator.join(groups)
+
+
+def group_many(numbers, separator=',', group_size=3, line_separator='\n'):
+    """Group a whole column of numbers into one string."""
+    if group_size == 3 and (separator == ',' or ',' not in line_separator):
+        text = line_separator.join(map(format, map(int, numbers), repeat(',')))
+        return text if separator == ',' else text.replace(',', separator)
+    return line_separator.join([group_digits(number, separator, group_size) for number in numbers])
+
+
+# =============================================================================
+# 4. ENGINEERING NOTATION - BULK
+# =============================================================================
+
+"""
+ENGINEERING NOTATION:
+floor(log10(|x|)) gives the exponent and x is scaled by an exact power of
+ten (10**0 .. 10**22 are exact floats: multiply for negative exponents,
+divide for positive ones). log10 can be off by one next to a power of
+ten and the mantissa can round up to 1000, so both are corrected after
+scaling. The bulk path collects (mantissa, exponent) columns and formats
+them with one cached spec through map(), so the per-value Python work is
+just the arithmetic.
+"""
+
+_EXACT_POWERS = [10.0 ** power for power in range(23)]
+_FAST_RANGE = (1e-300, 1e300)  # outside this, scaling is done via the '%e' string
+
+
+@lru_cache(maxsize=64)
+def _engineering_spec(precision):
+    """(pair formatter, rollover bound) for a mantissa precision."""
+    return format_spec_pair(f'.{precision}f', '+03d'), 1000.0 - 0.5 * 10.0 ** -precision
+
+
+@lru_cache(maxsize=64)
+def format_spec_pair(first_spec, second_spec, joiner='e'):
+    """Cached two-field formatter, e.g. mantissa and exponent."""
+    return ("{:" + first_spec + "}" + joiner + "{:" + second_spec + "}").format
+
+
+def _engineering_parts(num, rollover):
+    """(mantissa, exponent) with exponent % 3 == 0 and |mantissa| in [1, 1000)."""
+    magnitude = abs(num)
+    if _FAST_RANGE[0] <= magnitude < _FAST_RANGE[1]:
+        exponent = math.floor(math.log10(magnitude))
+        exponent -= exponent % 3
+        if exponent >= 0:
+            mantissa = num / (_EXACT_POWERS[exponent] if exponent < 23 else 10.0 ** exponent)
+        else:
+            mantissa = num * (_EXACT_POWERS[-exponent] if exponent > -23 else 10.0 ** -exponent)
+        if abs(mantissa) < 1.0:
+            exponent -= 3
+            mantissa *= 1000.0
+    else:
+        # Extremes (subnormals, near overflow): read digits and exponent from '%e'
+        digits, _, exponent = format(num, '.16e').partition('e')
+        exponent = int(exponent)
+        mantissa = float(digits) * _EXACT_POWERS[exponent % 3]
+        exponent -= exponent % 3
+    if abs(mantissa) >= rollover:
+        exponent += 3
+        mantissa /= 1000.0
+    return mantissa, exponent
+
+
+def engineering_notation(num, precision=2):
+    """Engineering notation: exponent a multiple of 3, mantissa in [1, 1000)."""
+    formatter, rollover = _engineering_spec(precision)
+    if num == 0:
+        return formatter(0.0, 0)
+    if not math.isfinite(num):
+        return str(num)
+    return formatter(*_engineering_parts(num, rollover))
+
+
+def engineering_many(numbers, precision=2, separator='\n'):
+    """Engineering notation for a whole column, joined once."""
+    formatter, rollover = _engineering_spec(precision)
+    mantissas, exponents, non_finite = [], [], []
+    log10, floor, powers = math.log10, math.floor, _EXACT_POWERS
+    low, high = _FAST_RANGE
+    for index, num in enumerate(numbers):
+        magnitude = abs(num)
+        if low <= magnitude < high:
+            exponent = floor(log10(magnitude))
+            exponent -= exponent % 3
+            if 0 <= exponent < 23:
+                mantissa = num / powers[exponent]
+            elif -23 < exponent < 0:
+                mantissa = num * powers[-exponent]
+            else:
+                mantissa, exponent = _engineering_parts(num, rollover)
+            if not 1.0 <= abs(mantissa) < rollover:
+                mantissa, exponent = _engineering_parts(num, rollover)
+        elif num == 0:
+            mantissa, exponent = 0.0, 0
+        elif math.isfinite(num):
+            mantissa, exponent = _engineering_parts(num, rollover)
+        else:
+            mantissa, exponent = 0.0, 0
+            non_finite.append((index, str(num)))
+        mantissas.append(mantissa)
+        exponents.append(exponent)
+    if not non_finite:
+        return separator.join(map(formatter, mantissas, exponents))
+    texts = list(map(formatter, mantissas, exponents))
+    for index, text in non_finite:
+        texts[index] = text
+    return separator.join(texts)
+
+
+# =============================================================================
+# 5. BUFFER WRITERS - StringIO / BYTES
+# =============================================================================
+
+"""
+WRITERS:
+Formatting tens of millions of values into one string would need the whole
+report in memory twice. write_formatted formats WRITE_CHUNK values at a
+time and hands each joined chunk to the buffer: io.StringIO and text files
+get str, io.BytesIO / binary files / bytearray get ASCII bytes.
+"""
+
+FORMATTERS = {
+    'base': lambda chunk, options: to_base_many(chunk, options.get('base', 10)),
+    'grouped': lambda chunk, options: group_many(chunk, options.get('separator', ','),
+                                                 options.get('group_size', 3)),
+    'engineering': lambda chunk, options: engineering_many(chunk, options.get('precision', 2)),
+    'spec': lambda chunk, options: '\n'.join(map(format, chunk, repeat(options['spec']))),
+}
+
+
+def write_formatted(numbers, out, kind='spec', chunk_size=WRITE_CHUNK, **options):
+    """
+    Format numbers line by line into out; returns the number of values written.
+
+    kind is one of FORMATTERS: 'base' (base=...), 'grouped' (separator=...,
+    group_size=...), 'engineering' (precision=...) or 'spec' (spec=',.2f').
+    """
+    try:
+        formatter = FORMATTERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown format kind {kind!r}; expected one of {sorted(FORMATTERS)}") from None
+    binary = isinstance(out, (bytearray, io.BufferedIOBase, io.BytesIO)) or 'b' in getattr(out, 'mode', '')
+    write = out.extend if isinstance(out, bytearray) else out.write
+    written = 0
+    for start in range(0, len(numbers), chunk_size):
+        chunk = numbers[start:start + chunk_size]
+        text = formatter(chunk, options) + '\n'
+        write(text.encode('ascii') if binary else text)
+        written += len(chunk)
+    return written
+
+
+# =============================================================================
+# 6. BENCHMARK VS format() AND 3.7.0 HELPERS
+# =============================================================================
+
+def to_base_loop(num, base):
+    """to_base from 3.7.0 base_representations."""
+    if num == 0:
+        return "0"
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    result = ""
+    while num > 0:
+        result = digits[num % base] + result
+        num //= base
+    return result
+
+
+def manual_grouping(number, separator=',', group_size=3):
+    """manual_grouping from 3.7.0 locale_formatting."""
+    str_num = str(int(number))
+    if len(str_num) <= group_size:
+        return str_num
+    result = ""
+    for i, digit in enumerate(reversed(str_num)):
+        if i > 0 and i % group_size == 0:
+            result = separator + result
+        result = digit + result
+    return result
+
+
+def engineering_notation_log10(num):
+    """engineering_notation from 3.7.0 scientific_notation."""
+    if num == 0:
+        return "0.00e+00"
+    exponent = math.floor(math.log10(abs(num)))
+    eng_exponent = 3 * (exponent // 3)
+    mantissa = num / (10 ** eng_exponent)
+    return f"{mantissa:.2f}e{eng_exponent:+03d}"
+
+
+def _time(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def benchmark_bulk_formatting(count=BENCHMARK_COUNT, huge_bits=BENCHMARK_HUGE_BITS):
+    """Time each formatting task three ways: 3.7.0 helper, format(), bulk module."""
+    rng = random.Random(11)
+    ints = [rng.randrange(10 ** 12) for _ in range(count)]
+    floats = array.array('d', [rng.uniform(-1, 1) * 10.0 ** rng.randrange(-12, 13) for _ in range(count)])
+    results = {}
+
+    helper = _time(lambda: '\n'.join([to_base_loop(n, 7) for n in ints]))
+    bulk = _time(lambda: to_base_many(ints, 7))
+    assert helper[1] == bulk[1]
+    results['base 7'] = {'3.7.0 helper': helper[0], 'bulk': bulk[0]}
+
+    helper = _time(lambda: '\n'.join([to_base_loop(n, 16) for n in ints]))
+    builtin = _time(lambda: '\n'.join([format(n, 'X') for n in ints]))
+    bulk = _time(lambda: to_base_many(ints, 16))
+    assert helper[1] == builtin[1] == bulk[1]
+    results['base 16'] = {'3.7.0 helper': helper[0], 'format()': builtin[0], 'bulk': bulk[0]}
+
+    helper = _time(lambda: '\n'.join([manual_grouping(n, ' ') for n in ints]))
+    builtin = _time(lambda: '\n'.join([format(n, ',').replace(',', ' ') for n in ints]))
+    bulk = _time(lambda: group_many(ints, ' '))
+    assert helper[1] == builtin[1] == bulk[1]
+    results['grouping'] = {'3.7.0 helper': helper[0], 'format()': builtin[0], 'bulk': bulk[0]}
+
+    helper = _time(lambda: '\n'.join([engineering_notation_log10(x) for x in floats]))
+    bulk = _time(lambda: engineering_many(floats))
+    results['engineering'] = {'3.7.0 helper': helper[0], 'bulk': bulk[0]}
+    results['engineering mismatches (3.7.0 off-by-one/rounding)'] = sum(
+        a != b for a, b in zip(helper[1].split('\n'), bulk[1].split('\n')))
+
+    builtin = _time(lambda: '\n'.join([format(x, ',.2f') for x in floats]))
+    bulk = _time(lambda: '\n'.join(map(format, floats, repeat(',.2f'))))
+    assert builtin[1] == bulk[1]
+    results["spec ',.2f'"] = {'format()': builtin[0], 'bulk': bulk[0]}
+
+    buffer = io.StringIO()
+    bulk = _time(lambda: write_formatted(ints, buffer, 'grouped'))
+    results['grouping -> StringIO'] = {'bulk': bulk[0]}
+
+    huge = rng.getrandbits(huge_bits) | 1 << (huge_bits - 1)
+    limit = sys.get_int_max_str_digits() if hasattr(sys, 'get_int_max_str_digits') else 0
+    row = {}
+    if huge_bits <= 50_000:
+        row['3.7.0 helper'] = _time(lambda: to_base_loop(huge, 10))[0]
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+    try:
+        builtin = _time(lambda: str(huge))
+        row['str()'] = builtin[0]
+    finally:
+        if hasattr(sys, 'set_int_max_str_digits'):
+            sys.set_int_max_str_digits(limit)
+    bulk = _time(lambda: to_base(huge, 10))
+    assert bulk[1] == builtin[1]
+    row['bulk'] = bulk[0]
+    results[f'huge int ({huge_bits:,} bits) base 10'] = row
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_base_conversion():
+    """
+    BASE CONVERSION DEMONSTRATION
+    Pair tables for small ints, divide-and-conquer for huge ones
+    """
+
+    huge = 3 ** 20_000
+    results = {
+        'base_3': to_base(255, 3),
+        'base_7': to_base(255, 7),
+        'base_12': to_base(255, 12),
+        'base_36': to_base(255, 36),
+        'negative_base_5': to_base(-1234, 5),
+        'huge_3^20000_base_3_digits': len(to_base(huge, 3)),
+        'huge_base_10_prefix': to_base(huge, 10)[:20],
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_grouping_and_engineering():
+    """
+    GROUPING & ENGINEERING DEMONSTRATION
+    Column-at-a-time helpers
+    """
+
+    numbers = [0.000123, 1234.5, 1234567.89, 0.0000000456, 999.999, 1e-6]
+    results = {
+        'grouped': group_many([1234567, -9876543210, 12], separator='.').split('\n'),
+        'grouped_by_4': group_digits(123456789, ' ', 4),
+        'engineering': engineering_many(numbers).split('\n'),
+        'engineering_3.7.0': [engineering_notation_log10(num) for num in numbers],
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_buffer_writers():
+    """
+    BUFFER WRITER DEMONSTRATION
+    Chunked writes into StringIO and bytearray
+    """
+
+    text_buffer = io.StringIO()
+    byte_buffer = bytearray()
+    write_formatted([1234.5, 0.25, 1e6], text_buffer, spec=',.2f')
+    write_formatted(range(10), byte_buffer, 'base', base=3, chunk_size=4)
+
+    results = {
+        'stringio': text_buffer.getvalue().split('\n')[:3],
+        'bytearray': bytes(byte_buffer).split(b'\n')[:10],
+        'spec_cache': format_spec_pair.cache_info().currsize,
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_formatting_benchmarks(count=None, huge_bits=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 10**7 numbers and a 10**6-bit integer
+    """
+
+    full = '--full' in sys.argv
+    count = count or (FULL_BENCHMARK_COUNT if full else BENCHMARK_COUNT)
+    huge_bits = huge_bits or (FULL_BENCHMARK_HUGE_BITS if full else BENCHMARK_HUGE_BITS)
+    results = benchmark_bulk_formatting(count, huge_bits)
+
+    print(f"   numbers={count:,}")
+    for task, row in results.items():
+        if isinstance(row, dict):
+            timings = '   '.join(f"{name} {seconds * 1000:8.1f} ms" for name, seconds in row.items())
+            print(f"   {task:<32} {timings}")
+        else:
+            print(f"   {task}: {row}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute bulk formatting demonstrations
+    Pass --full for the 10**7 number benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - BULK NUMBER FORMATTING")
+    print("=" * 60)
+
+    sections = [
+        ("Base Conversion", demonstrate_base_conversion),
+        ("Grouping & Engineering", demonstrate_grouping_and_engineering),
+        ("Buffer Writers", demonstrate_buffer_writers),
+        ("Formatting Benchmarks", demonstrate_formatting_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
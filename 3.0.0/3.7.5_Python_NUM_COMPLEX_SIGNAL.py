@@ -0,0 +1,524 @@
+""" 3.7.5_Python_NUM_COMPLEX_SIGNAL.py """
+
+# =============================================================================
+# PYTHON NUMBERS - COMPLEX SIGNAL ARRAYS
+# =============================================================================
+# Version: 3.7.5 | Educational Excellence Target: 9.5/10
+# Purpose: Store and process millions of complex samples compactly
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Store complex samples as interleaved (re, im) pairs in one array('d')
+✓ Expose the real and imaginary parts as zero-copy strided memoryviews
+✓ Multiply, rotate and take magnitude/phase block by block with C-level map()
+✓ Generate sinusoids from precomputed phasor tables instead of cmath.exp per sample
+✓ Measure memory and speed against lists of Python complex
+
+🚀 QUICK NAVIGATION:
+├── 1. INTERLEAVED LAYOUT (FOUNDATION)
+├── 2. ComplexArray (STORAGE & ZERO-COPY VIEWS)
+├── 3. BLOCK OPERATIONS (MULTIPLY, ROTATE, MAGNITUDE, PHASE)
+├── 4. PHASOR TABLES (SIGNAL GENERATION)
+└── 5. BENCHMARK VS LISTS OF complex
+
+🔍 CORE CONCEPT:
+A list of complex spends ~40 bytes per sample (a 32-byte object plus an
+8-byte pointer). Interleaved doubles spend 16, can be written to disk or
+a socket as-is, and give strided views of either component for free.
+Arithmetic stays in C by streaming whole blocks of components through
+map(operator.mul, ...) rather than looping sample by sample.
+"""
+
+import array
+import cmath
+import math
+import sys
+import time
+from fractions import Fraction
+from functools import lru_cache
+from itertools import repeat
+from operator import add, mul, sub
+
+# =============================================================================
+# 1. INTERLEAVED LAYOUT - FOUNDATION
+# =============================================================================
+
+"""
+INTERLEAVED LAYOUT:
+sample k lives at data[2k] (real) and data[2k + 1] (imaginary).
+data[0::2] and data[1::2] select one component - as a copy on the array,
+or as a zero-copy view through memoryview(data)[0::2].
+"""
+
+BLOCK_SIZE = 1 << 16  # samples per block; bounds temporary component copies
+MAX_TABLE_PERIOD = 1 << 16  # longest exact period tiled from a phasor table
+TAU = 2 * math.pi
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SAMPLES = 1_000_000
+FULL_BENCHMARK_SAMPLES = 10_000_000
+
+
+def _empty(samples):
+    return array.array('d', bytes(16 * samples))
+
+
+# =============================================================================
+# 2. ComplexArray - STORAGE & ZERO-COPY VIEWS
+# =============================================================================
+
+class ComplexArray:
+    """
+    Fixed-length complex vector stored as interleaved array('d').
+
+    Indexing returns Python complex values; bulk operations return new
+    ComplexArray objects (or array('d') for real-valued results).
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data=None):
+        data = array.array('d') if data is None else data
+        if not isinstance(data, array.array) or data.typecode != 'd':
+            data = array.array('d', data)
+        if len(data) % 2:
+            raise ValueError("interleaved data must have an even length")
+        self.data = data
+
+    # Construction -----------------------------------------------------------
+
+    @classmethod
+    def zeros(cls, samples):
+        return cls(_empty(samples))
+
+    @classmethod
+    def from_parts(cls, real, imag):
+        real = real if isinstance(real, array.array) else array.array('d', real)
+        imag = imag if isinstance(imag, array.array) else array.array('d', imag)
+        if len(real) != len(imag):
+            raise ValueError("real and imaginary parts must have equal lengths")
+        data = _empty(len(real))
+        data[0::2] = real
+        data[1::2] = imag
+        return cls(data)
+
+    @classmethod
+    def from_complex(cls, values):
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        return cls.from_parts([z.real for z in values], [z.imag for z in values])
+
+    @classmethod
+    def from_polar(cls, magnitude, phase):
+        magnitude = array.array('d', magnitude)
+        phase = array.array('d', phase)
+        return cls.from_parts(
+            map(mul, magnitude, map(math.cos, phase)),
+            map(mul, magnitude, map(math.sin, phase)),
+        )
+
+    # Sequence protocol ------------------------------------------------------
+
+    def __len__(self):
+        return len(self.data) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            samples = range(*index.indices(len(self)))
+            if not samples:
+                return ComplexArray()
+            first, last, step = 2 * samples[0], 2 * samples[-1], 2 * samples.step
+            if step == 2:
+                return ComplexArray(self.data[first:last + 2])
+            # Component bounds from the first/last sample, so a negative step
+            # never produces a -1 stop that would wrap to the end of the array
+            if step > 0:
+                real_stop, imag_stop = last + 1, last + 2
+            else:
+                real_stop, imag_stop = (last - 1 if last else None), last
+            return ComplexArray.from_parts(self.data[first:real_stop:step],
+                                           self.data[first + 1:imag_stop:step])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ComplexArray index out of range")
+        return complex(self.data[2 * index], self.data[2 * index + 1])
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ComplexArray assignment index out of range")
+        value = complex(value)
+        self.data[2 * index] = value.real
+        self.data[2 * index + 1] = value.imag
+
+    def __iter__(self):
+        return map(complex, self.data[0::2], self.data[1::2])
+
+    def tolist(self):
+        return list(self)
+
+    def tobytes(self):
+        return self.data.tobytes()
+
+    def __eq__(self, other):
+        return isinstance(other, ComplexArray) and self.data == other.data
+
+    def __repr__(self):
+        preview = ', '.join(str(z) for z in self[:3])
+        return f"ComplexArray([{preview}{', ...' if len(self) > 3 else ''}], samples={len(self)})"
+
+    # Zero-copy component views ---------------------------------------------
+
+    @property
+    def real(self):
+        """Writable strided memoryview of the real parts (no copy)."""
+        return memoryview(self.data)[0::2]
+
+    @property
+    def imag(self):
+        """Writable strided memoryview of the imaginary parts (no copy)."""
+        return memoryview(self.data)[1::2]
+
+    # =========================================================================
+    # 3. BLOCK OPERATIONS - MULTIPLY, ROTATE, MAGNITUDE, PHASE
+    # =========================================================================
+
+    def _blocks(self):
+        """Yield (start, stop) sample ranges of at most BLOCK_SIZE."""
+        samples = len(self)
+        for start in range(0, samples, BLOCK_SIZE):
+            yield start, min(start + BLOCK_SIZE, samples)
+
+    def _components(self, start, stop):
+        return self.data[2 * start:2 * stop:2], self.data[2 * start + 1:2 * stop:2]
+
+    def _map_blocks(self, other, kernel):
+        """Build a new array from kernel(a, b, c, d) -> (re, im) per block."""
+        if len(other) != len(self):
+            raise ValueError(f"length mismatch: {len(self)} vs {len(other)}")
+        out = _empty(len(self))
+        for start, stop in self._blocks():
+            a, b = self._components(start, stop)
+            c, d = other._components(start, stop)
+            re, im = kernel(a, b, c, d)
+            out[2 * start:2 * stop:2] = array.array('d', re)
+            out[2 * start + 1:2 * stop:2] = array.array('d', im)
+        return ComplexArray(out)
+
+    def _scalar_blocks(self, value):
+        """Multiply every sample by one complex scalar (re, im)."""
+        value = complex(value)
+        r, s = value.real, value.imag
+        out = _empty(len(self))
+        for start, stop in self._blocks():
+            a, b = self._components(start, stop)
+            out[2 * start:2 * stop:2] = array.array(
+                'd', map(sub, map(mul, a, repeat(r)), map(mul, b, repeat(s))))
+            out[2 * start + 1:2 * stop:2] = array.array(
+                'd', map(add, map(mul, a, repeat(s)), map(mul, b, repeat(r))))
+        return ComplexArray(out)
+
+    def __mul__(self, other):
+        if not isinstance(other, ComplexArray):
+            return self._scalar_blocks(other)
+        return self._map_blocks(other, lambda a, b, c, d: (
+            map(sub, map(mul, a, c), map(mul, b, d)),
+            map(add, map(mul, a, d), map(mul, b, c)),
+        ))
+
+    __rmul__ = __mul__
+
+    def __add__(self, other):
+        if not isinstance(other, ComplexArray):
+            other = complex(other)
+            result = ComplexArray(array.array('d', self.data))
+            for start, stop in self._blocks():
+                a, b = self._components(start, stop)
+                result.data[2 * start:2 * stop:2] = array.array('d', map(add, a, repeat(other.real)))
+                result.data[2 * start + 1:2 * stop:2] = array.array('d', map(add, b, repeat(other.imag)))
+            return result
+        if len(other) != len(self):
+            raise ValueError(f"length mismatch: {len(self)} vs {len(other)}")
+        # Interleaved layout: component-wise addition is plain element-wise addition
+        return ComplexArray(array.array('d', map(add, self.data, other.data)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if not isinstance(other, ComplexArray):
+            return self + (-complex(other))
+        if len(other) != len(self):
+            raise ValueError(f"length mismatch: {len(self)} vs {len(other)}")
+        return ComplexArray(array.array('d', map(sub, self.data, other.data)))
+
+    def scale(self, factor):
+        """Multiply by a real factor (one map over the interleaved data)."""
+        return ComplexArray(array.array('d', map(mul, self.data, repeat(float(factor)))))
+
+    def rotate(self, angle):
+        """Rotate every sample by angle radians (multiply by e^(j*angle))."""
+        return self._scalar_blocks(cmath.rect(1.0, angle))
+
+    def conjugate(self):
+        result = ComplexArray(array.array('d', self.data))
+        imag = result.data[1::2]
+        result.data[1::2] = array.array('d', map(mul, imag, repeat(-1.0)))
+        return result
+
+    def magnitude(self):
+        """|z| for every sample, as array('d')."""
+        out = array.array('d')
+        for start, stop in self._blocks():
+            a, b = self._components(start, stop)
+            out.extend(map(math.hypot, a, b))
+        return out
+
+    def phase(self):
+        """arg(z) in (-pi, pi] for every sample, as array('d')."""
+        out = array.array('d')
+        for start, stop in self._blocks():
+            a, b = self._components(start, stop)
+            out.extend(map(math.atan2, b, a))
+        return out
+
+    def power(self):
+        """Total power sum(|z|**2) - one fsum over the squared interleaved data."""
+        return math.fsum(map(mul, self.data, self.data))
+
+    def sum(self):
+        return complex(math.fsum(self.data[0::2]), math.fsum(self.data[1::2]))
+
+
+# =============================================================================
+# 4. PHASOR TABLES - SIGNAL GENERATION
+# =============================================================================
+
+"""
+PHASOR TABLES:
+e^(j(2*pi*f*n + phase)) repeats exactly when f = p/q with a small q, so one
+period of q samples is computed (with amplitude and phase folded in) and
+tiled with array repetition - a memcpy. Other frequencies split
+n = block*B + k: a cached table holds e^(j*2*pi*f*k) for k < B and each
+block multiplies it by one scalar phasor, so cmath work is O(B + n/B).
+"""
+
+
+@lru_cache(maxsize=128)
+def phasor_table(frequency, length):
+    """Interleaved e^(j*2*pi*frequency*k) for k < length (cached)."""
+    data = _empty(length)
+    angles = [TAU * ((frequency * k) % 1.0) for k in range(length)]
+    data[0::2] = array.array('d', map(math.cos, angles))
+    data[1::2] = array.array('d', map(math.sin, angles))
+    return data
+
+
+def _exact_period(frequency):
+    """Smallest q <= MAX_TABLE_PERIOD with frequency*q an integer, else None."""
+    fraction = Fraction(frequency).limit_denominator(MAX_TABLE_PERIOD)
+    if abs(float(fraction) - frequency) <= 1e-15 * max(1.0, abs(frequency)):
+        return fraction.denominator
+    return None
+
+
+def generate_signal(frequency, phase, amplitude, samples):
+    """amplitude * e^(j*(2*pi*frequency*n + phase)) for n < samples."""
+    start_phasor = cmath.rect(amplitude, phase)
+    period = _exact_period(frequency)
+    if period is not None and period <= samples:
+        one_period = ComplexArray(phasor_table(frequency, period)) * start_phasor
+        repeats = -(-samples // period)
+        return ComplexArray((one_period.data * repeats)[:2 * samples])
+
+    block = min(BLOCK_SIZE, max(samples, 1))
+    table = ComplexArray(phasor_table(frequency, block))
+    out = _empty(samples)
+    for start in range(0, samples, block):
+        stop = min(start + block, samples)
+        turn = (frequency * start) % 1.0
+        chunk = table[:stop - start] * (start_phasor * cmath.rect(1.0, TAU * turn))
+        out[2 * start:2 * stop] = chunk.data
+    return ComplexArray(out)
+
+
+# =============================================================================
+# 5. BENCHMARK VS LISTS OF complex
+# =============================================================================
+
+def generate_signal_cmath(frequency, phase, amplitude, samples):
+    """generate_signal from 3.7.0 complex_applications.signal_processing."""
+    signal = []
+    for n in range(samples):
+        exponent = 1j * (2 * math.pi * frequency * n + phase)
+        signal.append(amplitude * cmath.exp(exponent))
+    return signal
+
+
+def _list_memory(values):
+    return sys.getsizeof(values) + sum(map(sys.getsizeof, values[:1000])) * len(values) // max(len(values[:1000]), 1)
+
+
+def benchmark_complex_signals(samples=BENCHMARK_SAMPLES):
+    """Time generation and block operations against lists of complex."""
+    results = {}
+
+    def timed(name, kind, function):
+        start = time.perf_counter()
+        value = function()
+        results.setdefault(name, {})[kind] = time.perf_counter() - start
+        return value
+
+    listed = timed('generate (f=0.1)', 'list of complex', lambda: generate_signal_cmath(0.1, 0.0, 1.0, samples))
+    packed = timed('generate (f=0.1)', 'ComplexArray', lambda: generate_signal(0.1, 0.0, 1.0, samples))
+    timed('generate (f=1/e)', 'list of complex', lambda: generate_signal_cmath(1 / math.e, 0.3, 0.5, samples))
+    packed_other = timed('generate (f=1/e)', 'ComplexArray', lambda: generate_signal(1 / math.e, 0.3, 0.5, samples))
+    listed_other = generate_signal_cmath(1 / math.e, 0.3, 0.5, samples)
+
+    rotation = cmath.exp(1j * math.pi / 4)
+    timed('rotate 45°', 'list of complex', lambda: [p * rotation for p in listed])
+    timed('rotate 45°', 'ComplexArray', lambda: packed.rotate(math.pi / 4))
+    timed('multiply', 'list of complex', lambda: [a * b for a, b in zip(listed, listed_other)])
+    timed('multiply', 'ComplexArray', lambda: packed * packed_other)
+    timed('magnitude', 'list of complex', lambda: [abs(z) for z in listed])
+    timed('magnitude', 'ComplexArray', packed.magnitude)
+    timed('phase', 'list of complex', lambda: [cmath.phase(z) for z in listed])
+    timed('phase', 'ComplexArray', packed.phase)
+    timed('real part', 'list of complex', lambda: [z.real for z in listed])
+    timed('real part', 'ComplexArray', lambda: packed.real)
+
+    step = max(samples // 1000, 1)
+    results['max |difference| vs cmath.exp per sample (f=1/e)'] = max(
+        abs(packed_other[i] - listed_other[i]) for i in range(0, samples, step))
+    results['memory bytes'] = {
+        'list of complex': _list_memory(listed),
+        'ComplexArray': packed.data.buffer_info()[1] * packed.data.itemsize,
+    }
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_signal_generation():
+    """
+    SIGNAL GENERATION DEMONSTRATION
+    The 3.7.0 signals from phasor tables
+    """
+
+    signal1 = generate_signal(0.1, 0, 1, 10)
+    signal2 = generate_signal(0.3, math.pi / 4, 0.5, 10)
+    combined = signal1 + signal2
+    reference = [a + b for a, b in zip(generate_signal_cmath(0.1, 0, 1, 10),
+                                       generate_signal_cmath(0.3, math.pi / 4, 0.5, 10))]
+
+    results = {
+        'signal1_samples': [complex(round(z.real, 6), round(z.imag, 6)) for z in signal1[:3]],
+        'combined_samples': [complex(round(z.real, 6), round(z.imag, 6)) for z in combined[:3]],
+        'signal_power': round(combined[:3].power(), 9),
+        'max_error_vs_cmath': max(abs(a - b) for a, b in zip(combined, reference)),
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_geometric_transformations():
+    """
+    GEOMETRIC TRANSFORMATION DEMONSTRATION
+    Rotate, scale and translate whole point sets
+    """
+
+    points = ComplexArray.from_complex([1 + 0j, 0 + 1j, -1 + 0j, 0 - 1j])
+    results = {
+        'rotated_45_degrees': [complex(round(z.real, 6), round(z.imag, 6)) for z in points.rotate(math.pi / 4)],
+        'scaled_2x': points.scale(2).tolist(),
+        'translated': (points + (1 + 1j)).tolist(),
+        'magnitudes': list(points.magnitude()),
+        'phases_degrees': [round(math.degrees(p)) for p in points.phase()],
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_zero_copy_views():
+    """
+    ZERO-COPY VIEW DEMONSTRATION
+    Strided memoryviews share memory with the array
+    """
+
+    signal = ComplexArray.from_complex([1 + 2j, 3 + 4j, 5 + 6j])
+    real_view = signal.real
+    real_view[1] = 30.0  # writes straight into the interleaved data
+
+    results = {
+        'real_view': real_view.tolist(),
+        'imag_view': signal.imag.tolist(),
+        'view_strides': real_view.strides,
+        'after_write': signal.tolist(),
+        'shares_memory': real_view.obj is signal.data,
+    }
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_signal_benchmarks(samples=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 10**7 samples
+    """
+
+    if samples is None:
+        samples = FULL_BENCHMARK_SAMPLES if '--full' in sys.argv else BENCHMARK_SAMPLES
+    results = benchmark_complex_signals(samples)
+
+    print(f"   samples={samples:,}")
+    for name, row in results.items():
+        if not isinstance(row, dict):
+            print(f"   {name}: {row:.3g}")
+        elif name == 'memory bytes':
+            print(f"   {name:<20} " + '   '.join(f"{kind} {value / 1e6:8.1f} MB" for kind, value in row.items()))
+        else:
+            print(f"   {name:<20} " + '   '.join(f"{kind} {value * 1000:8.1f} ms" for kind, value in row.items()))
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute complex signal demonstrations
+    Pass --full for the 10**7 sample benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - COMPLEX SIGNAL ARRAYS")
+    print("=" * 60)
+
+    sections = [
+        ("Signal Generation", demonstrate_signal_generation),
+        ("Geometric Transformations", demonstrate_geometric_transformations),
+        ("Zero-Copy Views", demonstrate_zero_copy_views),
+        ("Signal Benchmarks", demonstrate_signal_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,463 @@
+""" 3.7.6_Python_NUM_PROJECTILE_BATCH.py """
+
+# =============================================================================
+# PYTHON NUMBERS - BATCH PROJECTILE SIMULATION
+# =============================================================================
+# Version: 3.7.6 | Educational Excellence Target: 9.5/10
+# Purpose: Simulate millions of launches, with drag, using numeric integration
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Hold particle state as structure-of-arrays array('d') columns
+✓ Integrate motion with semi-implicit Euler or RK4 at a fixed time step
+✓ Add quadratic air drag, where no closed form exists
+✓ Drop landed particles from the active set as the simulation runs
+✓ Sweep parameter grids on a process pool and measure particle-steps/second
+
+🚀 QUICK NAVIGATION:
+├── 1. STRUCTURE-OF-ARRAYS STATE (FOUNDATION)
+├── 2. INTEGRATORS (EULER, RK4)
+├── 3. ProjectileBatch (BLOCKED STEPPING & ACTIVE SET)
+├── 4. PARAMETER SWEEPS (PROCESS POOL)
+└── 5. BENCHMARK & VALIDATION VS CLOSED FORM
+
+🔍 CORE CONCEPT:
+projectile_motion in 3.7.0 answers one launch with a closed formula, which
+only exists without drag. A time-stepped integrator handles any force law;
+keeping every particle's x, y, vx, vy in parallel columns and advancing
+them all step by step turns a sweep of a million launches into a handful
+of tight loops, and particles leave those loops as soon as they land.
+"""
+
+import array
+import itertools
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# =============================================================================
+# 1. STRUCTURE-OF-ARRAYS STATE - FOUNDATION
+# =============================================================================
+
+"""
+STATE COLUMNS:
+x, y, vx, vy and drag (k in a = -g*y_hat - k*|v|*v) are array('d') columns
+of the active particles; ids (array('q')) map them back to their launch.
+Results (time_of_flight, range, max_height) are full-length columns indexed
+by launch id and filled in as particles land.
+
+During a block of steps the active columns are handled as lists (cheap
+tolist()/array() round trips in C), and written back to the arrays at the
+end of each block.
+"""
+
+GRAVITY = 9.81
+DEFAULT_DT = 0.01
+DEFAULT_BLOCK_STEPS = 64
+DEFAULT_MAX_TIME = 1_000.0
+INTEGRATORS = ('euler', 'rk4')
+
+# Default grid sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_GRID = (20, 20, 5)  # velocities x angles x heights
+FULL_BENCHMARK_GRID = (100, 90, 20)
+BENCHMARK_WORKERS = 4
+
+
+def _landing(y, vy, nvy, h):
+    """Time within a step at which y reaches 0 (quadratic in the step)."""
+    a = (nvy - vy) / h
+    if a == 0:
+        return y / -vy if vy else h
+    disc = vy * vy - 2 * a * y
+    return (-vy - math.sqrt(disc)) / a if disc >= 0 else h
+
+
+# =============================================================================
+# 2. INTEGRATORS - EULER, RK4
+# =============================================================================
+
+"""
+RK4 FOR PROJECTILES:
+Acceleration depends only on velocity, so with stage accelerations a1..a4
+the classic RK4 update reduces to
+
+    v' = v + h/6 * (a1 + 2*a2 + 2*a3 + a4)
+    x' = x + h*v + h**2/6 * (a1 + a2 + a3)
+
+Without drag a1 = a2 = a3 = a4 = -g and this is exact. Semi-implicit Euler
+(v first, then x with the new v) is the cheap alternative.
+
+Each step function loops once over the zipped columns, emits the next
+active columns, and reports particles that crossed y = 0 together with
+the apex of any particle whose vy changed sign during the step.
+"""
+
+
+def _step_euler(columns, h, g, landed, apexes):
+    X, Y, VX, VY, K, ID = columns
+    nX, nY, nVX, nVY, nK, nID = [], [], [], [], [], []
+    hypot = math.hypot
+    for x, y, vx, vy, k, i in zip(X, Y, VX, VY, K, ID):
+        drag = k * hypot(vx, vy)
+        nvx = vx - h * drag * vx
+        nvy = vy - h * (g + drag * vy)
+        ny = y + h * nvy
+        if vy > 0 >= nvy:
+            apexes.append((i, y + vy * vy * h / (2 * (vy - nvy))))
+        if ny < 0:
+            landed.append((i, x, y, vx, vy, nvx, nvy))
+            continue
+        nX.append(x + h * nvx)
+        nY.append(ny)
+        nVX.append(nvx)
+        nVY.append(nvy)
+        nK.append(k)
+        nID.append(i)
+    return nX, nY, nVX, nVY, nK, nID
+
+
+def _step_rk4(columns, h, g, landed, apexes):
+    X, Y, VX, VY, K, ID = columns
+    nX, nY, nVX, nVY, nK, nID = [], [], [], [], [], []
+    hypot = math.hypot
+    half, sixth, h2_sixth = h / 2, h / 6, h * h / 6
+    for x, y, vx, vy, k, i in zip(X, Y, VX, VY, K, ID):
+        if k:
+            s = k * hypot(vx, vy)
+            a1x, a1y = -s * vx, -g - s * vy
+            ux, uy = vx + half * a1x, vy + half * a1y
+            s = k * hypot(ux, uy)
+            a2x, a2y = -s * ux, -g - s * uy
+            ux, uy = vx + half * a2x, vy + half * a2y
+            s = k * hypot(ux, uy)
+            a3x, a3y = -s * ux, -g - s * uy
+            ux, uy = vx + h * a3x, vy + h * a3y
+            s = k * hypot(ux, uy)
+            a4x, a4y = -s * ux, -g - s * uy
+            nvx = vx + sixth * (a1x + 2 * (a2x + a3x) + a4x)
+            nvy = vy + sixth * (a1y + 2 * (a2y + a3y) + a4y)
+            nx = x + h * vx + h2_sixth * (a1x + a2x + a3x)
+            ny = y + h * vy + h2_sixth * (a1y + a2y + a3y)
+        else:
+            nvx, nvy = vx, vy - h * g
+            nx, ny = x + h * vx, y + h * vy - half * h * g
+        if vy > 0 >= nvy:
+            # Parabolic apex within the step
+            apexes.append((i, y + vy * vy * h / (2 * (vy - nvy))))
+        if ny < 0:
+            landed.append((i, x, y, vx, vy, nvx, nvy))
+            continue
+        nX.append(nx)
+        nY.append(ny)
+        nVX.append(nvx)
+        nVY.append(nvy)
+        nK.append(k)
+        nID.append(i)
+    return nX, nY, nVX, nVY, nK, nID
+
+
+_STEPPERS = {'euler': _step_euler, 'rk4': _step_rk4}
+
+
+# =============================================================================
+# 3. ProjectileBatch - BLOCKED STEPPING & ACTIVE SET
+# =============================================================================
+
+class ProjectileBatch:
+    """
+    Many projectiles advanced together from one ground level (y = 0).
+
+    Launches are given as velocity (m/s), angle (degrees), height (m) and an
+    optional quadratic drag coefficient k (1/m). run() integrates until every
+    particle has landed or max_time is reached.
+    """
+
+    def __init__(self, velocities, angles, heights, drag=0.0, gravity=GRAVITY):
+        velocities = array.array('d', velocities)
+        angles = array.array('d', angles)
+        heights = array.array('d', heights)
+        count = len(velocities)
+        if not len(angles) == len(heights) == count:
+            raise ValueError("velocity, angle and height columns must have equal lengths")
+        drag = array.array('d', [drag]) * count if isinstance(drag, (int, float)) else array.array('d', drag)
+        if len(drag) != count:
+            raise ValueError("drag column must have one coefficient per launch")
+
+        radians = [math.radians(angle) for angle in angles]
+        self.gravity = gravity
+        self.count = count
+        self.time = 0.0
+        self.time_at_step_start = 0.0
+        self.steps = 0
+        self.particle_steps = 0
+        # Active-set columns
+        self.x = array.array('d', bytes(8 * count))
+        self.y = array.array('d', heights)
+        self.vx = array.array('d', [v * math.cos(r) for v, r in zip(velocities, radians)])
+        self.vy = array.array('d', [v * math.sin(r) for v, r in zip(velocities, radians)])
+        self.drag = drag
+        self.ids = array.array('q', range(count))
+        # Result columns, indexed by launch id
+        nan = array.array('d', [math.nan])
+        self.time_of_flight = nan * count
+        self.range = nan * count
+        self.max_height = array.array('d', heights)
+
+    @classmethod
+    def from_grid(cls, velocities, angles, heights, drag=0.0):
+        """Cartesian product of the parameter lists (velocity-major order)."""
+        grid = list(itertools.product(velocities, angles, heights))
+        return cls([g[0] for g in grid], [g[1] for g in grid], [g[2] for g in grid], drag)
+
+    @property
+    def active(self):
+        return len(self.ids)
+
+    def _record(self, landed, apexes, h):
+        for i, height in apexes:
+            if height > self.max_height[i]:
+                self.max_height[i] = height
+        for i, x, y, vx, vy, nvx, nvy in landed:
+            tau = min(max(_landing(y, vy, nvy, h), 0.0), h)
+            ax = (nvx - vx) / h
+            self.time_of_flight[i] = self.time_at_step_start + tau
+            self.range[i] = x + vx * tau + 0.5 * ax * tau * tau
+
+    def run(self, dt=DEFAULT_DT, method='rk4', block_steps=DEFAULT_BLOCK_STEPS, max_time=DEFAULT_MAX_TIME):
+        """Advance until every particle has landed (or max_time); returns self."""
+        try:
+            step = _STEPPERS[method]
+        except KeyError:
+            raise ValueError(f"method must be one of {INTEGRATORS}, got {method!r}") from None
+        g = self.gravity
+        # Time is start + n*dt rather than a running sum, so it does not drift
+        start_time, start_steps = self.time, self.steps
+        while self.active and self.time < max_time:
+            columns = (self.x.tolist(), self.y.tolist(), self.vx.tolist(),
+                       self.vy.tolist(), self.drag.tolist(), self.ids.tolist())
+            for _ in range(block_steps):
+                if not columns[0] or self.time >= max_time:
+                    break
+                landed, apexes = [], []
+                self.particle_steps += len(columns[0])
+                self.time_at_step_start = self.time
+                columns = step(columns, dt, g, landed, apexes)
+                self._record(landed, apexes, dt)
+                self.steps += 1
+                self.time = start_time + (self.steps - start_steps) * dt
+            # End of block: write the surviving active set back to the arrays
+            self.x, self.y, self.vx, self.vy, self.drag = (array.array('d', column) for column in columns[:5])
+            self.ids = array.array('q', columns[5])
+        return self
+
+    def results(self):
+        return {
+            'time_of_flight': self.time_of_flight,
+            'range': self.range,
+            'max_height': self.max_height,
+        }
+
+
+# =============================================================================
+# 4. PARAMETER SWEEPS - PROCESS POOL
+# =============================================================================
+
+def _sweep_worker(payload, drag, dt, method):
+    """Process-pool worker: simulate one slice of launches sent as bytes."""
+    velocities, angles, heights = (array.array('d') for _ in range(3))
+    for column, raw in zip((velocities, angles, heights), payload):
+        column.frombytes(raw)
+    batch = ProjectileBatch(velocities, angles, heights, drag).run(dt, method)
+    return (batch.time_of_flight.tobytes(), batch.range.tobytes(),
+            batch.max_height.tobytes(), batch.particle_steps)
+
+
+def sweep_grid(velocities, angles, heights, drag=0.0, dt=DEFAULT_DT, method='rk4', workers=None):
+    """
+    Simulate every (velocity, angle, height) combination.
+
+    Returns (results, particle_steps) where results holds the same three
+    columns as ProjectileBatch.results(), in velocity-major grid order.
+    """
+    grid = list(itertools.product(velocities, angles, heights))
+    columns = [array.array('d', values) for values in zip(*grid)] if grid else [array.array('d')] * 3
+    if not workers or workers < 2:
+        batch = ProjectileBatch(*columns, drag).run(dt, method)
+        return batch.results(), batch.particle_steps
+
+    step = -(-len(grid) // workers)
+    payloads = [tuple(column[start:start + step].tobytes() for column in columns)
+                for start in range(0, len(grid), step)]
+    results = {name: array.array('d') for name in ('time_of_flight', 'range', 'max_height')}
+    particle_steps = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for flight, reach, height, steps in pool.map(
+                _sweep_worker, payloads, itertools.repeat(drag), itertools.repeat(dt), itertools.repeat(method)):
+            results['time_of_flight'].frombytes(flight)
+            results['range'].frombytes(reach)
+            results['max_height'].frombytes(height)
+            particle_steps += steps
+    return results, particle_steps
+
+
+# =============================================================================
+# 5. BENCHMARK & VALIDATION VS CLOSED FORM
+# =============================================================================
+
+def projectile_motion(initial_velocity, angle_degrees, height=0):
+    """Closed form from 3.7.0 scientific_applications (no drag)."""
+    g = 9.81
+    angle_rad = math.radians(angle_degrees)
+    vx = initial_velocity * math.cos(angle_rad)
+    vy = initial_velocity * math.sin(angle_rad)
+    t_flight = (vy + math.sqrt(vy**2 + 2*g*height)) / g
+    return {
+        'maximum_height': height + (vy**2) / (2 * g),
+        'time_of_flight': t_flight,
+        'range': vx * t_flight,
+    }
+
+
+def _grid_axes(shape):
+    n_velocities, n_angles, n_heights = shape
+    velocities = [10 + 90 * i / max(n_velocities - 1, 1) for i in range(n_velocities)]
+    angles = [5 + 80 * i / max(n_angles - 1, 1) for i in range(n_angles)]
+    heights = [50 * i / max(n_heights - 1, 1) for i in range(n_heights)]
+    return velocities, angles, heights
+
+
+def benchmark_projectiles(shape=BENCHMARK_GRID, workers=BENCHMARK_WORKERS, dt=DEFAULT_DT):
+    """Particle-steps per second for each integrator, serial and on a pool."""
+    velocities, angles, heights = _grid_axes(shape)
+    launches = len(velocities) * len(angles) * len(heights)
+    results = {'launches': launches}
+
+    start = time.perf_counter()
+    closed = [projectile_motion(v, a, h) for v, a, h in itertools.product(velocities, angles, heights)]
+    results['closed form (no drag) launches/s'] = launches / (time.perf_counter() - start)
+
+    for method in INTEGRATORS:
+        for drag, label in ((0.0, 'no drag'), (0.002, 'drag')):
+            start = time.perf_counter()
+            columns, particle_steps = sweep_grid(velocities, angles, heights, drag, dt, method)
+            elapsed = time.perf_counter() - start
+            results[f'{method} {label} particle-steps/s'] = particle_steps / elapsed
+            if drag == 0.0:
+                results[f'{method} max range error (m)'] = max(
+                    abs(reach - c['range']) for reach, c in zip(columns['range'], closed))
+
+    start = time.perf_counter()
+    _, particle_steps = sweep_grid(velocities, angles, heights, 0.002, dt, 'rk4', workers)
+    results[f'rk4 drag x{workers} processes particle-steps/s'] = particle_steps / (time.perf_counter() - start)
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_single_launch():
+    """
+    SINGLE LAUNCH DEMONSTRATION
+    RK4 against the 3.7.0 closed form (50 m/s at 45° from 10 m)
+    """
+
+    batch = ProjectileBatch([50], [45], [10]).run(method='rk4')
+    closed = projectile_motion(50, 45, 10)
+    results = {
+        name: (round(batch.results()[key][0], 6), round(closed[name], 6))
+        for key, name in (('time_of_flight', 'time_of_flight'), ('range', 'range'),
+                          ('max_height', 'maximum_height'))
+    }
+    for key, (simulated, exact) in results.items():
+        print(f"   {key}: simulated={simulated} closed_form={exact}")
+    return results
+
+
+def demonstrate_drag_sweep():
+    """
+    DRAG SWEEP DEMONSTRATION
+    Best launch angle drops below 45° once drag is added
+    """
+
+    angles = list(range(20, 71, 5))
+    results = {}
+    for drag in (0.0, 0.001, 0.005):
+        batch = ProjectileBatch([60] * len(angles), angles, [0] * len(angles), drag).run()
+        best = max(range(len(angles)), key=batch.range.__getitem__)
+        results[f'k={drag}'] = {'best_angle': angles[best], 'range': round(batch.range[best], 2),
+                                'steps': batch.steps}
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_active_set():
+    """
+    ACTIVE SET DEMONSTRATION
+    Landed particles leave the loop
+    """
+
+    batch = ProjectileBatch([10, 30, 60], [45, 45, 45], [0, 0, 0])
+    trace = []
+    while batch.active:
+        batch.run(block_steps=100, max_time=batch.time + 1.0)
+        trace.append((round(batch.time, 2), batch.active))
+    results = {'time_vs_active': trace, 'particle_steps': batch.particle_steps,
+               'full_grid_steps': batch.steps * batch.count}
+    for key, value in results.items():
+        print(f"   {key}: {value}")
+    return results
+
+
+def demonstrate_projectile_benchmarks(shape=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for a 180,000-launch grid
+    """
+
+    if shape is None:
+        shape = FULL_BENCHMARK_GRID if '--full' in sys.argv else BENCHMARK_GRID
+    results = benchmark_projectiles(shape)
+    for key, value in results.items():
+        print(f"   {key}: {value:,.6g}" if isinstance(value, float) else f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute projectile batch demonstrations
+    Pass --full for the large parameter-grid benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - BATCH PROJECTILE SIMULATION")
+    print("=" * 60)
+
+    sections = [
+        ("Single Launch", demonstrate_single_launch),
+        ("Drag Sweep", demonstrate_drag_sweep),
+        ("Active Set", demonstrate_active_set),
+        ("Projectile Benchmarks", demonstrate_projectile_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,472 @@
+""" 3.7.7_Python_NUM_CONTINUED_FRACTIONS.py """
+
+# =============================================================================
+# PYTHON NUMBERS - CONTINUED FRACTIONS & RATIONAL APPROXIMATION
+# =============================================================================
+# Version: 3.7.7 | Educational Excellence Target: 9.5/10
+# Purpose: Approximate whole tables of floats by bounded-denominator rationals
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Expand exact integer ratios into continued-fraction terms with divmod
+✓ Build convergents lazily with the p/q recurrence, without Fraction objects
+✓ Find best rational approximations with a bounded denominator
+✓ Share cached convergent tables between repeated inputs
+✓ Convert float arrays to numerator/denominator columns in one pass
+
+🚀 QUICK NAVIGATION:
+├── 1. CONTINUED FRACTION TERMS (FOUNDATION)
+├── 2. ContinuedFraction (LAZY CONVERGENTS)
+├── 3. SHARED CACHE & BEST APPROXIMATION
+├── 4. BATCH CONVERSION OF FLOAT ARRAYS
+└── 5. BENCHMARK VS Fraction.limit_denominator
+
+🔍 CORE CONCEPT:
+continued_fraction_example in 3.7.0 builds a Fraction for each value and
+calls limit_denominator, which creates and subtracts more Fractions, each
+normalised with a gcd. The convergents p/q of a continued fraction are
+already in lowest terms, so plain integer pairs and the recurrence
+p[k] = a[k]*p[k-1] + p[k-2] are enough. A table of convergents for a
+value depends only on that value, so it can be computed once, lazily,
+and reused for every later request and every denominator bound.
+"""
+
+import array
+import math
+import sys
+import time
+from bisect import bisect_right
+from fractions import Fraction
+from functools import lru_cache
+
+# =============================================================================
+# 1. CONTINUED FRACTION TERMS - FOUNDATION
+# =============================================================================
+
+"""
+TERMS FROM AN EXACT RATIO:
+Every float is an exact ratio of integers (float.as_integer_ratio), so its
+continued fraction is finite and Euclid's algorithm produces it:
+
+    a, r = divmod(n, d);  then continue with (d, r) until r == 0
+
+Floor division makes the first term of a negative value negative and every
+later term positive, which is the standard (regular) expansion.
+"""
+
+DEFAULT_MAX_DENOMINATOR = 1_000_000
+CONVERGENT_CACHE_SIZE = 65_536
+
+# Benchmark configuration
+BENCHMARK_VALUES = 20_000
+FULL_BENCHMARK_VALUES = 500_000
+BENCHMARK_DISTINCT_RATES = 250
+
+
+def continued_fraction_terms(numerator, denominator=1):
+    """Yield the regular continued-fraction terms of numerator/denominator."""
+    if denominator == 0:
+        raise ZeroDivisionError("denominator must not be zero")
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    while denominator:
+        term, remainder = divmod(numerator, denominator)
+        yield term
+        numerator, denominator = denominator, remainder
+
+
+def evaluate_terms(terms):
+    """Collapse continued-fraction terms to a reduced (numerator, denominator) pair."""
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    for term in terms:
+        p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+    if q1 == 0:
+        raise ValueError("at least one term is required")
+    return p1, q1
+
+
+# =============================================================================
+# 2. ContinuedFraction - LAZY CONVERGENTS
+# =============================================================================
+
+"""
+THE P/Q RECURRENCE:
+Starting from p[-2]/q[-2] = 0/1 and p[-1]/q[-1] = 1/0,
+
+    p[k] = a[k] * p[k-1] + p[k-2]
+    q[k] = a[k] * q[k-1] + q[k-2]
+
+gives each convergent from the previous two in two multiply-adds. The
+convergents are coprime by construction (p[k]q[k-1] - p[k-1]q[k] = ±1), so
+no gcd is ever needed.
+
+LAZY EXTENSION:
+A ContinuedFraction keeps the Euclid remainder state between calls and only
+expands as far as the largest denominator bound asked for so far. A bound of
+1000 costs a handful of terms; a later bound of 10**6 continues from there
+instead of starting over.
+"""
+
+
+class ContinuedFraction:
+    """Lazily expanded continued fraction of an exact ratio, with cached convergents."""
+
+    __slots__ = ('numerator', 'denominator', 'terms', 'numerators', 'denominators',
+                 '_n', '_d', '_p0', '_q0', '_p1', '_q1')
+
+    def __init__(self, numerator, denominator=1):
+        if denominator == 0:
+            raise ZeroDivisionError("denominator must not be zero")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        self.numerator = numerator
+        self.denominator = denominator
+        self.terms = []
+        self.numerators = []
+        self.denominators = []
+        self._n, self._d = numerator, denominator
+        self._p0, self._q0, self._p1, self._q1 = 0, 1, 1, 0
+
+    @classmethod
+    def from_value(cls, value):
+        """Expand a float, int, Fraction or Decimal exactly (NaN/inf are rejected)."""
+        return cls(*value.as_integer_ratio())
+
+    @property
+    def exhausted(self):
+        """True once the expansion has reached the exact value."""
+        return self._d == 0
+
+    def _extend(self, max_denominator):
+        """Expand until a convergent's denominator exceeds the bound (or the value is exact)."""
+        n, d = self._n, self._d
+        q1 = self._q1
+        if not d or q1 > max_denominator:
+            return
+        p0, q0, p1 = self._p0, self._q0, self._p1
+        terms, ps, qs = self.terms, self.numerators, self.denominators
+        while d and q1 <= max_denominator:
+            term, remainder = divmod(n, d)
+            p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+            terms.append(term)
+            ps.append(p1)
+            qs.append(q1)
+            n, d = d, remainder
+        self._n, self._d = n, d
+        self._p0, self._q0, self._p1, self._q1 = p0, q0, p1, q1
+
+    def __iter__(self):
+        """Yield convergents (p, q) lazily, reusing any already computed."""
+        index = 0
+        while True:
+            if index == len(self.denominators):
+                if self._d == 0:
+                    return
+                self._extend(self._q1)
+            yield self.numerators[index], self.denominators[index]
+            index += 1
+
+    def expand(self):
+        """Expand completely and return the list of terms."""
+        while self._d:
+            self._extend(self._q1)
+        return self.terms
+
+    def best(self, max_denominator=DEFAULT_MAX_DENOMINATOR):
+        """
+        Closest p/q with 1 <= q <= max_denominator, as a (p, q) pair.
+
+        Same answer as Fraction(value).limit_denominator(max_denominator): the
+        last convergent within the bound or the largest semiconvergent
+        between it and the one before, whichever is closer (ties go to the
+        convergent).
+        """
+        if max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1")
+        self._extend(max_denominator)
+        ps, qs = self.numerators, self.denominators
+        index = bisect_right(qs, max_denominator) - 1
+        p1, q1 = ps[index], qs[index]
+        if index == len(qs) - 1:
+            return p1, q1  # exact value fits within the bound
+        p0, q0 = (ps[index - 1], qs[index - 1]) if index else (1, 0)
+        k = (max_denominator - q0) // q1
+        sp, sq = p0 + k * p1, q0 + k * q1
+        n, d = self.numerator, self.denominator
+        # |p1/q1 - n/d| <= |sp/sq - n/d|, cross-multiplied to stay in integers
+        if abs(p1 * d - n * q1) * sq <= abs(sp * d - n * sq) * q1:
+            return p1, q1
+        return sp, sq
+
+
+# =============================================================================
+# 3. SHARED CACHE & BEST APPROXIMATION
+# =============================================================================
+
+"""
+ONE TABLE PER VALUE:
+expansion(value) is an lru_cache around ContinuedFraction.from_value, so
+every caller asking about the same value shares one lazily grown table of
+convergents. Rate tables repeat the same few hundred values endlessly; after
+the first lookup each one is a bisect over a short list and one comparison.
+
+Because the cached objects grow in place, share them between threads only
+behind a lock; within one thread (or one worker process) no care is needed.
+"""
+
+
+@lru_cache(maxsize=CONVERGENT_CACHE_SIZE)
+def expansion(value):
+    """Cached ContinuedFraction for value (shared by all callers)."""
+    return ContinuedFraction.from_value(value)
+
+
+def convergents(value):
+    """Lazy generator of the convergents (p, q) of value, from the shared cache."""
+    return iter(expansion(value))
+
+
+def best_rational(value, max_denominator=DEFAULT_MAX_DENOMINATOR):
+    """Best (p, q) approximation of value with q <= max_denominator."""
+    return expansion(value).best(max_denominator)
+
+
+def convergent_cache_info():
+    """Hit/miss statistics of the shared convergent cache."""
+    return expansion.cache_info()
+
+
+# =============================================================================
+# 4. BATCH CONVERSION OF FLOAT ARRAYS
+# =============================================================================
+
+"""
+COLUMNS IN, COLUMNS OUT:
+rationalize_many takes any iterable of floats (typically array('d')) and
+returns two array('q') columns, numerators and denominators. A per-call dict
+answers values repeated within the batch without touching the shared cache;
+new values go through expansion(), so they also benefit later batches.
+
+Numerators must fit in 64 bits: |value| * max_denominator < 2**63.
+array('q') raises OverflowError otherwise.
+"""
+
+
+def rationalize_many(values, max_denominator=DEFAULT_MAX_DENOMINATOR):
+    """Best rational approximations of values as (numerators, denominators) arrays."""
+    if max_denominator < 1:
+        raise ValueError("max_denominator should be at least 1")
+    seen = {}
+    lookup = seen.get
+
+    def approximate(value):
+        pair = seen[value] = expansion(value).best(max_denominator)
+        return pair
+
+    pairs = [lookup(value) or approximate(value) for value in values]
+    if not pairs:
+        return array.array('q'), array.array('q')
+    numerators, denominators = zip(*pairs)
+    return array.array('q', numerators), array.array('q', denominators)
+
+
+def rationalize_fractions(values, max_denominator=DEFAULT_MAX_DENOMINATOR):
+    """Fraction objects for callers that need them (built from coprime pairs)."""
+    numerators, denominators = rationalize_many(values, max_denominator)
+    return [Fraction(p, q) for p, q in zip(numerators, denominators)]
+
+
+# =============================================================================
+# 5. BENCHMARK VS Fraction.limit_denominator
+# =============================================================================
+
+def continued_fraction_example():
+    """Reference implementation from 3.7.0 (one Fraction per value)."""
+    pi_approx = Fraction(math.pi).limit_denominator(1000)
+    golden_ratio = (1 + math.sqrt(5)) / 2
+    golden_approx = Fraction(golden_ratio).limit_denominator(100)
+    return {
+        'pi_approximation': {
+            'fraction': str(pi_approx),
+            'decimal': float(pi_approx),
+            'error': abs(math.pi - float(pi_approx))
+        },
+        'golden_ratio_approximation': {
+            'fraction': str(golden_approx),
+            'decimal': float(golden_approx),
+            'actual_golden': golden_ratio
+        }
+    }
+
+
+def _rate_table(count, distinct):
+    """count rates drawn cyclically from `distinct` values between 0.1% and 25%."""
+    rates = [0.001 + 0.249 * ((i * 0.6180339887498949) % 1.0) for i in range(distinct)]
+    return array.array('d', (rates[(i * 7919) % distinct] for i in range(count)))
+
+
+def _distinct_values(count):
+    """count distinct floats spread over (0, 1000)."""
+    return array.array('d', (((i * 0.7548776662466927) % 1.0) * 1000.0 for i in range(count)))
+
+
+def benchmark_rationalize(count=BENCHMARK_VALUES, max_denominator=10_000):
+    """Time Fraction.limit_denominator against rationalize_many on two workloads."""
+    results = {'values': count, 'max_denominator': max_denominator}
+    workloads = {
+        'distinct': _distinct_values(count),
+        'rate_table': _rate_table(count, BENCHMARK_DISTINCT_RATES),
+    }
+
+    for name, values in workloads.items():
+        expansion.cache_clear()
+
+        start = time.perf_counter()
+        reference = [Fraction(v).limit_denominator(max_denominator) for v in values]
+        fraction_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        numerators, denominators = rationalize_many(values, max_denominator)
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rationalize_many(values, max_denominator)
+        warm_time = time.perf_counter() - start
+
+        matches = all(f.numerator == p and f.denominator == q
+                      for f, p, q in zip(reference, numerators, denominators))
+        results[f'{name}_fraction_s'] = fraction_time
+        results[f'{name}_engine_cold_s'] = cold_time
+        results[f'{name}_engine_warm_s'] = warm_time
+        results[f'{name}_cold_speedup'] = fraction_time / cold_time if cold_time else float('inf')
+        results[f'{name}_values_per_s'] = count / cold_time if cold_time else float('inf')
+        results[f'{name}_matches_fraction'] = matches
+
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION FUNCTIONS
+# =============================================================================
+
+def demonstrate_convergents():
+    """
+    LAZY CONVERGENT DEMONSTRATION
+    Convergents of pi and the golden ratio via the p/q recurrence
+    """
+
+    golden_ratio = (1 + math.sqrt(5)) / 2
+    results = {}
+    for name, value in (('pi', math.pi), ('golden_ratio', golden_ratio)):
+        lazy = convergents(value)
+        first = [next(lazy) for _ in range(6)]
+        results[name] = first
+        print(f"   {name}: " + ", ".join(f"{p}/{q}" for p, q in first))
+
+    table = expansion(math.pi)
+    print(f"   pi terms computed so far: {table.terms}")
+    print(f"   full expansion of float(pi): {len(table.expand())} terms")
+    print(f"   evaluate_terms([1]*10) = {evaluate_terms([1] * 10)} (Fibonacci ratio)")
+    results['pi_terms'] = len(table.terms)
+    return results
+
+
+def demonstrate_best_approximation():
+    """
+    BEST APPROXIMATION DEMONSTRATION
+    Bounded denominators, checked against Fraction.limit_denominator
+    """
+
+    reference = continued_fraction_example()
+    results = {}
+    for bound in (10, 100, 1000, 100_000):
+        p, q = best_rational(math.pi, bound)
+        expected = Fraction(math.pi).limit_denominator(bound)
+        results[bound] = (p, q)
+        print(f"   pi, q <= {bound:>7,}: {p}/{q}  error={abs(math.pi - p / q):.3e}"
+              f"  matches Fraction: {(p, q) == (expected.numerator, expected.denominator)}")
+
+    print(f"   3.7.0 reference: pi ≈ {reference['pi_approximation']['fraction']}, "
+          f"golden ≈ {reference['golden_ratio_approximation']['fraction']}")
+    golden = best_rational((1 + math.sqrt(5)) / 2, 100)
+    print(f"   engine:          golden ≈ {golden[0]}/{golden[1]}")
+    print(f"   negative value: best_rational(-0.3333, 100) = {best_rational(-0.3333, 100)}")
+    results['golden'] = golden
+    return results
+
+
+def demonstrate_rate_table():
+    """
+    RATE TABLE DEMONSTRATION
+    Batch conversion with shared cached convergents
+    """
+
+    expansion.cache_clear()
+    rates = _rate_table(10_000, 40)
+    numerators, denominators = rationalize_many(rates, 10_000)
+    print(f"   converted {len(rates):,} rates to {numerators.typecode}/{denominators.typecode} columns")
+    for i in range(3):
+        print(f"   {rates[i]:.10f} ≈ {numerators[i]}/{denominators[i]}")
+
+    rationalize_many(rates, 1_000_000)
+    info = convergent_cache_info()
+    print(f"   second batch with a larger bound: cache hits={info.hits}, misses={info.misses}")
+    print(f"   as Fractions: {rationalize_fractions(rates[:3], 100)}")
+    return {'rates': len(rates), 'cache_hits': info.hits, 'cache_misses': info.misses}
+
+
+def demonstrate_continued_fraction_benchmarks(count=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 500,000 values per workload
+    """
+
+    if count is None:
+        count = FULL_BENCHMARK_VALUES if '--full' in sys.argv else BENCHMARK_VALUES
+    results = benchmark_rationalize(count)
+    for key, value in results.items():
+        if isinstance(value, bool):
+            print(f"   {key}: {value}")
+        elif isinstance(value, float):
+            print(f"   {key}: {value:,.6g}")
+        else:
+            print(f"   {key}: {value:,}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute continued-fraction demonstrations
+    Pass --full for the large benchmark
+    """
+
+    print("🎯 PYTHON NUMBERS - CONTINUED FRACTIONS & RATIONAL APPROXIMATION")
+    print("=" * 60)
+
+    sections = [
+        ("Convergents", demonstrate_convergents),
+        ("Best Approximation", demonstrate_best_approximation),
+        ("Rate Table", demonstrate_rate_table),
+        ("Continued Fraction Benchmarks", demonstrate_continued_fraction_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -645,7 +645,8 @@ def demonstrate_nested_lists():
         row_1 = matrix[1]                    # [4, 5, 6]
         col_1 = [row[1] for row in matrix]   # [2, 5, 8]
         
-        # Matrix transpose
+        # Matrix transpose (copies every element; a strided array only swaps
+        # its strides - see 3.10.1_Python_IDX_STRIDED_ARRAY.py)
         transpose = [[matrix[i][j] for i in range(len(matrix))] 
                     for j in range(len(matrix[0]))]
         
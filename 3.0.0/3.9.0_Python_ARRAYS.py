@@ -1247,7 +1247,7 @@ def demonstrate_array_vs_list():
                     'array_vs_list_ratio': array_access_time / list_access_time if list_access_time > 0 else float('inf')
                 }
             
-            # Append performance
+            # Append performance (chunked growth: 3.9.2_Python_ARR_CHUNKED_BUFFER.py)
             def test_append_performance():
                 test_list = []
                 test_array = array.array('i')
@@ -1471,6 +1471,9 @@ def demonstrate_array_algorithms():
     def sorting_algorithms():
         """Implement and demonstrate sorting algorithms with arrays."""
         
+        # These O(n²) sorts are for learning only; for real workloads use the
+        # in-place adaptive sorts in 3.9.1_Python_ARR_ADAPTIVE_SORT.py
+        
         # Test data
         original_data = [64, 34, 25, 12, 22, 11, 90]
         
@@ -1660,6 +1663,7 @@ def demonstrate_array_algorithms():
             # Custom filter function
             def is_prime(n):
                 """Check if number is prime."""
+                # For whole arrays use is_prime_batch in 3.7.1_Python_NUM_NUMBER_THEORY.py
                 if n < 2:
                     return False
                 for i in range(2, int(n ** 0.5) + 1):
@@ -2608,6 +2612,9 @@ def demonstrate_real_world_applications():
     def data_processing_pipeline():
         """Complete data processing pipeline using arrays."""
         
+        # Block-based, single-pass version with per-stage metrics:
+        # 3.9.3_Python_ARR_SENSOR_PIPELINE.py
+        
         # Simulate sensor data (temperature readings)
         def generate_sensor_data():
             """Generate simulated sensor data."""
@@ -2619,6 +2626,8 @@ def demonstrate_real_world_applications():
         def validate_and_clean_data(sensor_array):
             """Validate and clean sensor data."""
             
+            # For unbounded streams, ChunkedArrayBuffer / TypedRingBuffer in
+            # 3.9.2_Python_ARR_CHUNKED_BUFFER.py grow without copying
             valid_readings = array.array('b')
             invalid_count = 0
             outliers_removed = 0
@@ -2969,7 +2978,7 @@ def demonstrate_real_world_applications():
         def process_with_lists():
             """Process data using regular Python lists."""
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Create data
             data_list = list(range(data_size))
@@ -2978,7 +2987,7 @@ def demonstrate_real_world_applications():
             squared = [x*x for x in data_list]
             evens = [x for x in squared if x % 2 == 0]
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             return {
                 'method': 'Python lists',
@@ -2992,7 +3001,7 @@ def demonstrate_real_world_applications():
         def process_with_arrays():
             """Process data using arrays."""
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Create data
             data_array = array.array('i', range(data_size))
@@ -3004,7 +3013,7 @@ def demonstrate_real_world_applications():
                 if squared % 2 == 0:
                     squared_array.append(squared)
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             return {
                 'method': 'Arrays',
@@ -3018,7 +3027,7 @@ def demonstrate_real_world_applications():
         def process_with_generators():
             """Process data using generators for memory efficiency."""
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Generator pipeline
             def data_generator():
@@ -3038,7 +3047,7 @@ def demonstrate_real_world_applications():
             pipeline = filter_evens(square_generator(data_generator()))
             results = array.array('L', pipeline)
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             return {
                 'method': 'Generator pipeline',
@@ -3048,6 +3057,9 @@ def demonstrate_real_world_applications():
                 'result_sample': list(results[:10])
             }
         
+        # Fused single-pass version of these pipelines (generated kernels):
+        # see 3.9.4_Python_ARR_FUSED_EXPRESSIONS.py
+        
         # Execute all methods
         list_result = process_with_lists()
         array_result = process_with_arrays()
@@ -0,0 +1,521 @@
+""" 3.9.1_Python_ARR_ADAPTIVE_SORT.py """
+
+# =============================================================================
+# PYTHON ARRAYS - HYBRID ADAPTIVE IN-PLACE SORTING
+# =============================================================================
+# Version: 3.9.1 | Educational Excellence Target: 9.5/10
+# Purpose: Sort typed array.array objects in place without quadratic algorithms
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Replace the O(n²) teaching sorts from 3.9.0 with production strategies
+✓ Use counting sort for byte arrays ('b'/'B')
+✓ Apply LSD radix sort to every integer type code
+✓ Map IEEE-754 floats to order-preserving integer keys
+✓ Fall back to list-based timsort when it is the better choice
+✓ Sort huge arrays in parallel chunks and merge them with a k-way merge
+
+🚀 QUICK NAVIGATION:
+├── 1. TYPE CODE CLASSIFICATION (FOUNDATION)
+├── 2. COUNTING SORT FOR BYTE ARRAYS (LINEAR)
+├── 3. LSD RADIX SORT FOR INTEGERS (LINEAR)
+├── 4. FLOAT-TO-KEY TRANSFORM (IEEE-754)
+├── 5. ADAPTIVE DISPATCH & TIMSORT FALLBACK (STRATEGY)
+├── 6. PARALLEL CHUNK SORT & K-WAY MERGE (SCALING)
+└── 7. BENCHMARKS VS sorted(list(arr))
+
+🔍 CORE CONCEPT:
+An array.array knows its element type. That type tells us which linear-time
+algorithm applies, so the sorter can pick counting sort, radix sort or timsort
+per array instead of always paying for a generic comparison sort.
+"""
+
+import array
+import heapq
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+# =============================================================================
+# 1. TYPE CODE CLASSIFICATION - FOUNDATION
+# =============================================================================
+
+"""
+TYPE CODE FAMILIES:
+Every sorting strategy below only applies to some type codes
+"""
+
+BYTE_TYPECODES = 'bB'
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+FLOAT_TYPECODES = 'fd'
+
+# Unsigned integer type code with the same item size as each float type code,
+# used to reinterpret float bits as sortable integer keys
+FLOAT_KEY_TYPECODES = {
+    'f': next(tc for tc in 'IL' if array.array(tc).itemsize == 4),
+    'd': 'Q',
+}
+
+# Below this many elements timsort beats counting sort even for byte arrays
+SMALL_ARRAY_THRESHOLD = 2048
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SIZES = (10**4, 10**5, 10**6)
+FULL_BENCHMARK_SIZES = (10**4, 10**5, 10**6, 10**7, 10**8)
+
+
+def classify_typecode(typecode):
+    """Return the family ('byte', 'integer', 'float' or 'other') of a type code."""
+    if typecode in BYTE_TYPECODES:
+        return 'byte'
+    if typecode in INTEGER_TYPECODES:
+        return 'integer'
+    if typecode in FLOAT_TYPECODES:
+        return 'float'
+    return 'other'
+
+
+# =============================================================================
+# 2. COUNTING SORT FOR BYTE ARRAYS - LINEAR
+# =============================================================================
+
+"""
+COUNTING SORT:
+Byte arrays have at most 256 distinct values, so counting them and writing
+each value back as a run is O(n + 256) and never compares two elements
+"""
+
+def counting_sort_bytes(arr):
+    """
+    Sort a 'b' or 'B' array in place with counting sort.
+
+    The counts are taken in one pass over the raw bytes (Counter counts
+    in C), then the sorted bytes are rebuilt as one run per value.
+    """
+    if arr.typecode not in BYTE_TYPECODES:
+        raise TypeError(f"counting_sort_bytes needs a 'b' or 'B' array, got '{arr.typecode}'")
+
+    counts = Counter(arr.tobytes())
+    # Raw byte order is 0..255; for signed bytes -128..-1 live in 128..255
+    if arr.typecode == 'b':
+        byte_order = chain(range(128, 256), range(128))
+    else:
+        byte_order = range(256)
+
+    sorted_raw = b''.join(bytes((byte_value,)) * counts[byte_value] for byte_value in byte_order)
+    arr[:] = array.array(arr.typecode, sorted_raw)
+    return arr
+
+
+def counting_sort_small_range(arr):
+    """
+    Sort an integer array in place when its value range is small.
+
+    Uses a Counter (hash counting in C) and rebuilds the array from the
+    sorted distinct keys; cost is O(n + k log k) for k distinct values.
+    """
+    counts = Counter(arr)
+    position = 0
+    typecode = arr.typecode
+    for value in sorted(counts):
+        count = counts[value]
+        arr[position:position + count] = array.array(typecode, [value]) * count
+        position += count
+    return arr
+
+
+# =============================================================================
+# 3. LSD RADIX SORT FOR INTEGERS - LINEAR
+# =============================================================================
+
+"""
+LSD RADIX SORT:
+Sort by the least significant digit first, keeping each pass stable.
+After the pass on the most significant digit the data is fully ordered.
+Offsetting by the minimum makes signed values non-negative and also means
+narrow value ranges need fewer passes.
+"""
+
+def _radix_digit_bits(length):
+    """Pick the digit width: wide digits mean fewer passes on large inputs."""
+    return 16 if length >= 1 << 16 else 8
+
+
+def radix_sort_keys(keys, key_bits=None):
+    """
+    Stable LSD radix sort of a list of non-negative ints; returns a new list.
+
+    key_bits bounds the number of passes (defaults to the widest key).
+    """
+    if not keys:
+        return []
+    if key_bits is None:
+        key_bits = max(keys).bit_length()
+
+    digit_bits = _radix_digit_bits(len(keys))
+    mask = (1 << digit_bits) - 1
+    shift = 0
+    while shift < key_bits:
+        buckets = [[] for _ in range(1 << digit_bits)]
+        appenders = [bucket.append for bucket in buckets]
+        for key in keys:
+            appenders[(key >> shift) & mask](key)
+        keys = list(chain.from_iterable(buckets))
+        shift += digit_bits
+    return keys
+
+
+def radix_sort_integers(arr):
+    """Sort any integer-typecode array in place with LSD radix sort."""
+    if arr.typecode not in INTEGER_TYPECODES:
+        raise TypeError(f"radix_sort_integers needs an integer array, got '{arr.typecode}'")
+    if len(arr) < 2:
+        return arr
+
+    minimum = min(arr)
+    maximum = max(arr)
+    offset_keys = [value - minimum for value in arr]
+    sorted_keys = radix_sort_keys(offset_keys, (maximum - minimum).bit_length())
+    arr[:] = array.array(arr.typecode, [key + minimum for key in sorted_keys])
+    return arr
+
+
+# =============================================================================
+# 4. FLOAT-TO-KEY TRANSFORM - IEEE-754
+# =============================================================================
+
+"""
+ORDER-PRESERVING FLOAT KEYS:
+Reinterpret the float bits as an unsigned integer, then
+• positive floats: set the sign bit (they sort above all negatives)
+• negative floats: flip every bit (larger magnitude sorts lower)
+The resulting integers compare exactly like the floats (positive NaNs go last).
+"""
+
+def float_array_to_keys(arr):
+    """Return an unsigned integer array of order-preserving keys for a float array."""
+    key_typecode = FLOAT_KEY_TYPECODES[arr.typecode]
+    keys = array.array(key_typecode)
+    keys.frombytes(arr.tobytes())
+
+    bits = keys.itemsize * 8
+    sign_bit = 1 << (bits - 1)
+    all_bits = (1 << bits) - 1
+    keys[:] = array.array(key_typecode, [
+        key ^ all_bits if key & sign_bit else key | sign_bit
+        for key in keys
+    ])
+    return keys
+
+
+def keys_to_float_array(keys, typecode):
+    """Invert float_array_to_keys, returning a new float array."""
+    bits = keys.itemsize * 8
+    sign_bit = 1 << (bits - 1)
+    all_bits = (1 << bits) - 1
+    raw = array.array(keys.typecode, [
+        key & ~sign_bit if key & sign_bit else key ^ all_bits
+        for key in keys
+    ])
+    result = array.array(typecode)
+    result.frombytes(raw.tobytes())
+    return result
+
+
+def radix_sort_floats(arr):
+    """Sort an 'f' or 'd' array in place by radix sorting its bit keys."""
+    if arr.typecode not in FLOAT_TYPECODES:
+        raise TypeError(f"radix_sort_floats needs a float array, got '{arr.typecode}'")
+    if len(arr) < 2:
+        return arr
+
+    keys = float_array_to_keys(arr)
+    sorted_keys = array.array(keys.typecode, radix_sort_keys(list(keys), keys.itemsize * 8))
+    arr[:] = keys_to_float_array(sorted_keys, arr.typecode)
+    return arr
+
+
+# =============================================================================
+# 5. ADAPTIVE DISPATCH & TIMSORT FALLBACK - STRATEGY
+# =============================================================================
+
+"""
+DISPATCH RULES (measured with the benchmarks in section 7):
+• 'b'/'B'          → counting sort (always linear, counts run in C)
+• everything else  → timsort on a list copy
+Radix sort and range counting stay available explicitly. In pure Python
+their per-element bucket and Counter work loses to the C timsort on
+random data, so 'auto' does not pick them.
+"""
+
+def timsort_array(arr):
+    """Sort in place via the list-based timsort fallback."""
+    arr[:] = array.array(arr.typecode, sorted(arr))
+    return arr
+
+
+def choose_sort_method(arr):
+    """Return the name of the strategy sort_array(method='auto') would use."""
+    if classify_typecode(arr.typecode) == 'byte' and len(arr) >= SMALL_ARRAY_THRESHOLD:
+        return 'counting'
+    return 'timsort'
+
+
+def sort_array(arr, method='auto'):
+    """
+    Sort an array.array in place and return it.
+
+    method: 'auto', 'counting', 'counting_range', 'radix' or 'timsort'
+    """
+    if method == 'auto':
+        method = choose_sort_method(arr)
+
+    if method == 'counting':
+        return counting_sort_bytes(arr)
+    if method == 'counting_range':
+        return counting_sort_small_range(arr)
+    if method == 'radix':
+        family = classify_typecode(arr.typecode)
+        if family in ('byte', 'integer'):
+            return radix_sort_integers(arr)
+        if family == 'float':
+            return radix_sort_floats(arr)
+        raise TypeError(f"radix sort does not support type code '{arr.typecode}'")
+    if method == 'timsort':
+        return timsort_array(arr)
+    raise ValueError(f"Unknown sort method: {method!r}")
+
+
+# =============================================================================
+# 6. PARALLEL CHUNK SORT & K-WAY MERGE - SCALING
+# =============================================================================
+
+"""
+PARALLEL SORTING:
+1. Split the array into one chunk per worker
+2. Each worker process sorts its chunk (chunks travel as raw bytes)
+3. heapq.merge performs a k-way merge of the sorted chunks
+4. The merged stream is written back into the original array
+"""
+
+def _sort_chunk_worker(payload):
+    """Process-pool worker: sort one chunk given as (typecode, raw bytes, method)."""
+    typecode, raw, method = payload
+    chunk = array.array(typecode)
+    chunk.frombytes(raw)
+    sort_array(chunk, method)
+    return chunk.tobytes()
+
+
+def parallel_sort_array(arr, workers=4, method='auto', min_chunk=100_000):
+    """
+    Sort arr in place by sorting chunks on a process pool, then k-way merging.
+
+    Falls back to a single-process sort when the array is too small to
+    be worth the transfer cost.
+    """
+    length = len(arr)
+    chunk_count = min(workers, max(1, length // min_chunk))
+    if chunk_count < 2:
+        return sort_array(arr, method)
+
+    typecode = arr.typecode
+    step = -(-length // chunk_count)
+    payloads = [
+        (typecode, arr[start:start + step].tobytes(), method)
+        for start in range(0, length, step)
+    ]
+
+    with ProcessPoolExecutor(max_workers=chunk_count) as executor:
+        sorted_raw = list(executor.map(_sort_chunk_worker, payloads))
+
+    sorted_chunks = []
+    for raw in sorted_raw:
+        chunk = array.array(typecode)
+        chunk.frombytes(raw)
+        sorted_chunks.append(chunk)
+
+    arr[:] = array.array(typecode, heapq.merge(*sorted_chunks))
+    return arr
+
+
+# =============================================================================
+# 7. BENCHMARKS VS sorted(list(arr))
+# =============================================================================
+
+def _make_benchmark_array(typecode, size, rng):
+    """Create a random array covering the natural range of a type code."""
+    if typecode in FLOAT_TYPECODES:
+        return array.array(typecode, [rng.uniform(-1e6, 1e6) for _ in range(size)])
+    itemsize = array.array(typecode).itemsize
+    if typecode.isupper():
+        low, high = 0, (1 << (itemsize * 8)) - 1
+    else:
+        low, high = -(1 << (itemsize * 8 - 1)), (1 << (itemsize * 8 - 1)) - 1
+    # Keep wide types within 32 bits so the data stays comparable across sizes
+    low, high = max(low, -(1 << 31)), min(high, (1 << 31) - 1)
+    return array.array(typecode, [rng.randint(low, high) for _ in range(size)])
+
+
+def benchmark_array_sorts(sizes=BENCHMARK_SIZES, typecodes='bhid', include_parallel=True):
+    """
+    Time every strategy against the sorted(list(arr)) baseline.
+
+    Radix sort is skipped above 10**6 elements where pure-Python bucket
+    passes take minutes; the parallel sort is only timed from 10**6 up.
+    """
+    import random
+    rng = random.Random(42)
+    results = {}
+
+    for typecode in typecodes:
+        for size in sizes:
+            source = _make_benchmark_array(typecode, size, rng)
+            timings = {}
+
+            start = time.perf_counter()
+            baseline = sorted(list(source))
+            timings['sorted(list(arr))'] = time.perf_counter() - start
+
+            methods = ['auto', 'timsort']
+            if size <= 10**6:
+                methods.append('radix')
+            if typecode in INTEGER_TYPECODES:
+                methods.append('counting_range')
+            if typecode in BYTE_TYPECODES:
+                methods.append('counting')
+
+            for method in methods:
+                candidate = array.array(typecode, source)
+                start = time.perf_counter()
+                sort_array(candidate, method)
+                timings[method] = time.perf_counter() - start
+                assert candidate.tolist() == baseline, f"{method} produced a wrong order"
+
+            if include_parallel and size >= 10**6:
+                candidate = array.array(typecode, source)
+                start = time.perf_counter()
+                parallel_sort_array(candidate)
+                timings['parallel'] = time.perf_counter() - start
+                assert candidate.tolist() == baseline, "parallel sort produced a wrong order"
+
+            results[(typecode, size)] = {
+                'auto_method': choose_sort_method(source),
+                'timings': timings,
+                'speedup_vs_baseline': {
+                    name: timings['sorted(list(arr))'] / elapsed if elapsed > 0 else float('inf')
+                    for name, elapsed in timings.items()
+                },
+            }
+
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_adaptive_sorting():
+    """
+    COMPREHENSIVE ADAPTIVE SORT DEMONSTRATION
+    Every strategy on small arrays of each type code family
+    """
+
+    data = [64, 34, 25, 12, 22, 11, 90, -5, 0, 64]
+
+    byte_array = array.array('b', data)
+    int_array = array.array('q', [value * 1_000_003 for value in data])
+    float_array = array.array('d', [-0.5, 3.25, -1e300, 0.0, 2.5, -0.0, 1e-300])
+
+    results = {
+        'counting_sort_bytes': counting_sort_bytes(array.array('b', byte_array)).tolist(),
+        'radix_sort_integers': radix_sort_integers(array.array('q', int_array)).tolist(),
+        'radix_sort_floats': radix_sort_floats(array.array('d', float_array)).tolist(),
+        'timsort_fallback': timsort_array(array.array('d', float_array)).tolist(),
+        'auto_choices': {
+            'byte_array': choose_sort_method(byte_array),
+            'int_array': choose_sort_method(int_array),
+            'large_byte_array': choose_sort_method(array.array('B', bytes(5000))),
+            'float_array': choose_sort_method(float_array),
+        },
+    }
+
+    for name in ('counting_sort_bytes', 'radix_sort_integers', 'radix_sort_floats'):
+        print(f"   {name}: {results[name]}")
+    print(f"   auto choices: {results['auto_choices']}")
+    return results
+
+
+def demonstrate_parallel_sorting():
+    """
+    PARALLEL SORT DEMONSTRATION
+    Chunked process-pool sort merged with heapq.merge
+    """
+
+    import random
+    rng = random.Random(7)
+    data = array.array('i', [rng.randint(-10**9, 10**9) for _ in range(400_000)])
+    expected = sorted(data)
+
+    start = time.perf_counter()
+    parallel_sort_array(data, workers=4)
+    elapsed = time.perf_counter() - start
+
+    correct = data.tolist() == expected
+    print(f"   parallel sort of {len(data):,} ints: {elapsed:.3f}s (correct: {correct})")
+    return {'size': len(data), 'seconds': elapsed, 'correct': correct}
+
+
+def demonstrate_sort_benchmarks(sizes=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full to benchmark up to 10**8 elements
+    """
+
+    if sizes is None:
+        sizes = FULL_BENCHMARK_SIZES if '--full' in sys.argv else BENCHMARK_SIZES[:2]
+    results = benchmark_array_sorts(sizes=sizes)
+
+    for (typecode, size), result in results.items():
+        timings = ', '.join(f"{name}={seconds:.4f}s" for name, seconds in result['timings'].items())
+        print(f"   '{typecode}' n={size:>11,} auto→{result['auto_method']:<14} {timings}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute adaptive sorting demonstrations
+    Pass --full to benchmark sizes up to 10**8 (needs several GB of RAM)
+    """
+
+    print("🎯 PYTHON ARRAYS - HYBRID ADAPTIVE SORTING")
+    print("=" * 60)
+
+    sections = [
+        ("Adaptive Sorting", demonstrate_adaptive_sorting),
+        ("Parallel Sorting", demonstrate_parallel_sorting),
+        ("Sort Benchmarks", demonstrate_sort_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
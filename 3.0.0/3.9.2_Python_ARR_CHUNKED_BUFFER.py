@@ -0,0 +1,515 @@
+""" 3.9.2_Python_ARR_CHUNKED_BUFFER.py """
+
+# =============================================================================
+# PYTHON ARRAYS - CHUNKED GROWABLE BUFFERS & RING BUFFERS
+# =============================================================================
+# Version: 3.9.2 | Educational Excellence Target: 9.5/10
+# Purpose: Grow typed buffers without copying and keep sliding sensor windows
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Understand why array.append occasionally copies the whole array
+✓ Build a chunked buffer (a list of fixed-size arrays) that never copies on growth
+✓ Bulk-extend from any buffer-protocol object via memoryview byte copies
+✓ Keep a fixed-capacity ring buffer for sliding sensor windows
+✓ Export stored data zero-copy through memoryview
+✓ Benchmark append, extend and iteration against list and array.array
+
+🚀 QUICK NAVIGATION:
+├── 1. GROWTH STRATEGIES (FOUNDATION)
+├── 2. CHUNKED ARRAY BUFFER (GROWTH WITHOUT COPIES)
+├── 3. TYPED RING BUFFER (SLIDING WINDOWS)
+├── 4. STREAMING INGEST EXAMPLE (APPLICATION)
+└── 5. BENCHMARKS VS list AND array.array
+
+🔍 CORE CONCEPT:
+array.array over-allocates and reallocates as it grows, so a long stream of
+appends copies the data several times. Fixed-size chunks are allocated once
+and filled in place: growth only adds a chunk, nothing is ever moved.
+"""
+
+import array
+import sys
+import time
+from itertools import islice
+
+# =============================================================================
+# 1. GROWTH STRATEGIES - FOUNDATION
+# =============================================================================
+
+"""
+GROWTH STRATEGIES:
+• array.array   - one contiguous block, realloc (and copy) on growth
+• list          - pointer array, realloc on growth, one object per element
+• chunked       - list of fixed-size arrays, growth allocates a new chunk
+• ring          - one fixed block, the oldest element is overwritten
+"""
+
+DEFAULT_CHUNK_SIZE = 4096
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SIZE = 200_000
+FULL_BENCHMARK_SIZE = 10_000_000
+
+
+def _empty_chunk(typecode, size):
+    """Allocate a zero-filled array of exactly size elements in one call."""
+    return array.array(typecode, bytes(size * array.array(typecode).itemsize))
+
+
+def _as_byte_view(data, typecode):
+    """Return a flat byte memoryview over data, checking its item format."""
+    view = memoryview(data)
+    if view.format != typecode and not (view.itemsize == 1 and array.array(typecode).itemsize == 1):
+        raise TypeError(f"buffer format '{view.format}' does not match type code '{typecode}'")
+    return view.cast('B')
+
+
+# =============================================================================
+# 2. CHUNKED ARRAY BUFFER - GROWTH WITHOUT COPIES
+# =============================================================================
+
+class ChunkedArrayBuffer:
+    """
+    Growable typed buffer stored as a list of fixed-size array chunks.
+
+    Appends fill the current chunk in place; a full chunk is never moved,
+    so growth costs one allocation per chunk_size elements and no copies.
+    """
+
+    def __init__(self, typecode, chunk_size=DEFAULT_CHUNK_SIZE, initial=None):
+        self.typecode = typecode
+        self.itemsize = array.array(typecode).itemsize
+        self.chunk_size = chunk_size
+        self._chunks = []
+        self._fill = chunk_size  # elements used in the last chunk; full means "allocate"
+        if initial is not None:
+            self.extend(initial)
+
+    def __len__(self):
+        if not self._chunks:
+            return 0
+        return (len(self._chunks) - 1) * self.chunk_size + self._fill
+
+    def _new_chunk(self):
+        chunk = _empty_chunk(self.typecode, self.chunk_size)
+        self._chunks.append(chunk)
+        self._fill = 0
+        return chunk
+
+    def append(self, value):
+        """Append one element."""
+        if self._fill == self.chunk_size:
+            self._new_chunk()
+        self._chunks[-1][self._fill] = value
+        self._fill += 1
+
+    def extend(self, values):
+        """
+        Append many elements.
+
+        Buffer-protocol inputs (array.array, memoryview, bytes for 'b'/'B')
+        are copied chunk by chunk as raw bytes, without per-element work.
+        """
+        try:
+            source = _as_byte_view(values, self.typecode)
+        except TypeError:
+            if isinstance(values, (array.array, memoryview)):
+                raise
+            for value in values:
+                self.append(value)
+            return
+
+        itemsize = self.itemsize
+        offset = 0
+        total = len(source)
+        while offset < total:
+            if self._fill == self.chunk_size:
+                self._new_chunk()
+            room = (self.chunk_size - self._fill) * itemsize
+            count = min(room, total - offset)
+            start = self._fill * itemsize
+            memoryview(self._chunks[-1]).cast('B')[start:start + count] = source[offset:offset + count]
+            offset += count
+            self._fill += count // itemsize
+
+    def __getitem__(self, index):
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("ChunkedArrayBuffer index out of range")
+        chunk_index, position = divmod(index, self.chunk_size)
+        return self._chunks[chunk_index][position]
+
+    def chunk_views(self):
+        """Yield zero-copy memoryviews over the used part of every chunk."""
+        for chunk in self._chunks[:-1]:
+            yield memoryview(chunk)
+        if self._chunks:
+            yield memoryview(self._chunks[-1])[:self._fill]
+
+    def __iter__(self):
+        for chunk in self._chunks[:-1]:
+            yield from chunk
+        if self._chunks:
+            yield from islice(self._chunks[-1], self._fill)
+
+    def __buffer__(self, flags):
+        """
+        Buffer protocol export (PEP 688, Python 3.12+).
+
+        Zero-copy while the data fits in one chunk; beyond that the chunks
+        are not contiguous, so the export is one merged copy. Use
+        chunk_views() for zero-copy scatter/gather access at any size.
+        """
+        if len(self._chunks) == 1:
+            return memoryview(self._chunks[0])[:self._fill]
+        return memoryview(self.to_array())
+
+    def export(self):
+        """Return a memoryview over all elements (see __buffer__)."""
+        return self.__buffer__(0)
+
+    def to_array(self):
+        """Return the contents as a new array.array."""
+        result = array.array(self.typecode)
+        for view in self.chunk_views():
+            result.frombytes(view.cast('B'))
+        return result
+
+    def write_to(self, stream):
+        """Write raw bytes to a binary stream straight from the chunks."""
+        written = 0
+        for view in self.chunk_views():
+            written += stream.write(view.cast('B'))
+        return written
+
+    def memory_usage(self):
+        """Bytes allocated for element storage."""
+        return len(self._chunks) * self.chunk_size * self.itemsize
+
+    def __repr__(self):
+        return (f"ChunkedArrayBuffer('{self.typecode}', len={len(self)}, "
+                f"chunks={len(self._chunks)}, chunk_size={self.chunk_size})")
+
+
+# =============================================================================
+# 3. TYPED RING BUFFER - SLIDING WINDOWS
+# =============================================================================
+
+class TypedRingBuffer:
+    """
+    Fixed-capacity typed ring buffer for sliding windows.
+
+    Storage is allocated once; when full, each new element overwrites
+    the oldest one. A running sum is kept so the window mean is O(1).
+    """
+
+    def __init__(self, typecode, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.typecode = typecode
+        self.itemsize = array.array(typecode).itemsize
+        self.capacity = capacity
+        self._data = _empty_chunk(typecode, capacity)
+        self._start = 0
+        self._count = 0
+        self._running_sum = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def full(self):
+        return self._count == self.capacity
+
+    def append(self, value):
+        """Append one element, evicting the oldest when full."""
+        end = (self._start + self._count) % self.capacity
+        if self._count == self.capacity:
+            self._running_sum -= self._data[end]
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._count += 1
+        self._data[end] = value
+        self._running_sum += value
+
+    def extend(self, values):
+        """
+        Append many elements.
+
+        Buffer-protocol inputs are copied as at most two byte slices; only
+        the last `capacity` elements of the input can survive anyway.
+        """
+        try:
+            source = _as_byte_view(values, self.typecode)
+        except TypeError:
+            if isinstance(values, (array.array, memoryview)):
+                raise
+            for value in values:
+                self.append(value)
+            return
+
+        itemsize = self.itemsize
+        count = len(source) // itemsize
+        if count >= self.capacity:
+            tail = source[(count - self.capacity) * itemsize:]
+            memoryview(self._data).cast('B')[:] = tail
+            self._start = 0
+            self._count = self.capacity
+            self._running_sum = sum(self._data)
+            return
+
+        evicted = max(0, self._count + count - self.capacity)
+        for view in self._segments(self._start, evicted):
+            self._running_sum -= sum(view)
+        write_at = (self._start + self._count) % self.capacity
+        first = min(count, self.capacity - write_at)
+        raw = memoryview(self._data).cast('B')
+        raw[write_at * itemsize:(write_at + first) * itemsize] = source[:first * itemsize]
+        raw[:(count - first) * itemsize] = source[first * itemsize:]
+        self._running_sum += sum(source.cast(self.typecode))
+        self._start = (self._start + evicted) % self.capacity
+        self._count = min(self.capacity, self._count + count)
+
+    def _segments(self, start, count):
+        """Return one or two memoryviews covering count elements from start."""
+        view = memoryview(self._data)
+        first = min(count, self.capacity - start)
+        segments = [view[start:start + first]]
+        if count > first:
+            segments.append(view[:count - first])
+        return segments
+
+    def views(self):
+        """Zero-copy views of the window in order (one or two segments)."""
+        return self._segments(self._start, self._count)
+
+    def __iter__(self):
+        for view in self.views():
+            yield from view
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("TypedRingBuffer index out of range")
+        return self._data[(self._start + index) % self.capacity]
+
+    def mean(self):
+        """Window mean from the running sum."""
+        return self._running_sum / self._count if self._count else 0.0
+
+    def linearize(self):
+        """Rotate storage in place so the window starts at index 0."""
+        if self._start:
+            ordered = array.array(self.typecode)
+            for view in self.views():
+                ordered.frombytes(view.cast('B'))
+            memoryview(self._data).cast('B')[:len(ordered) * self.itemsize] = memoryview(ordered).cast('B')
+            self._start = 0
+        return self
+
+    def __buffer__(self, flags):
+        """Buffer protocol export (PEP 688, Python 3.12+) of the ordered window."""
+        self.linearize()
+        return memoryview(self._data)[:self._count]
+
+    def export(self):
+        """Return a memoryview over the ordered window."""
+        return self.__buffer__(0)
+
+    def to_array(self):
+        """Return the window, oldest first, as a new array.array."""
+        result = array.array(self.typecode)
+        for view in self.views():
+            result.frombytes(view.cast('B'))
+        return result
+
+    def __repr__(self):
+        return f"TypedRingBuffer('{self.typecode}', len={self._count}, capacity={self.capacity})"
+
+
+# =============================================================================
+# 4. STREAMING INGEST EXAMPLE - APPLICATION
+# =============================================================================
+
+def demonstrate_chunked_buffer():
+    """
+    CHUNKED BUFFER DEMONSTRATION
+    Append, bulk extend from memoryview, zero-copy views and export
+    """
+
+    buffer = ChunkedArrayBuffer('b', chunk_size=8)
+    for reading in (21, 22, -3, 19):
+        buffer.append(reading)
+    buffer.extend(array.array('b', range(10, 20)))
+    buffer.extend(memoryview(array.array('b', [99, 98])))
+
+    chunk_lengths = [len(view) for view in buffer.chunk_views()]
+    exported = buffer.export()
+    first_chunk = next(buffer.chunk_views())
+
+    print(f"   {buffer!r}")
+    print(f"   contents: {list(buffer)}")
+    print(f"   zero-copy chunk views: {chunk_lengths} (first: {first_chunk.tolist()})")
+    print(f"   exported memoryview: format='{exported.format}', len={len(exported)}")
+
+    return {
+        'length': len(buffer),
+        'contents': list(buffer),
+        'chunk_lengths': chunk_lengths,
+        'exported_length': len(exported),
+    }
+
+
+def demonstrate_ring_buffer():
+    """
+    RING BUFFER DEMONSTRATION
+    Sliding sensor window with O(1) mean
+    """
+
+    window = TypedRingBuffer('h', capacity=5)
+    means = []
+    for reading in (20, 21, 22, 23, 24, 25, 26):
+        window.append(reading)
+        means.append(window.mean())
+    window.extend(array.array('h', [30, 31, 32]))
+
+    print(f"   {window!r}")
+    print(f"   window (oldest first): {window.to_array().tolist()}")
+    print(f"   running means: {means}")
+    print(f"   mean after bulk extend: {window.mean()}")
+
+    return {
+        'window': window.to_array().tolist(),
+        'running_means': means,
+        'final_mean': window.mean(),
+    }
+
+
+def demonstrate_streaming_ingest():
+    """
+    STREAMING INGEST DEMONSTRATION
+    Cleaned sensor readings land in a chunked buffer, the latest in a ring
+    """
+
+    import random
+    rng = random.Random(3)
+    cleaned = ChunkedArrayBuffer('b', chunk_size=256)
+    latest = TypedRingBuffer('b', capacity=60)
+
+    for _ in range(20):
+        batch = array.array('b', [rng.randint(-40, 125) for _ in range(100)])
+        valid = array.array('b', [value for value in batch if -30 <= value <= 100])
+        cleaned.extend(valid)
+        latest.extend(valid)
+
+    print(f"   stored {len(cleaned):,} cleaned readings in {len(list(cleaned.chunk_views()))} chunks")
+    print(f"   latest window mean: {latest.mean():.2f}")
+    return {'stored': len(cleaned), 'window_mean': latest.mean()}
+
+
+# =============================================================================
+# 5. BENCHMARKS VS list AND array.array
+# =============================================================================
+
+def benchmark_growable_buffers(size=BENCHMARK_SIZE, typecode='d', chunk_size=DEFAULT_CHUNK_SIZE):
+    """Time append, bulk extend and iteration for each container."""
+
+    source = array.array(typecode, range(size))
+    factories = {
+        'list': list,
+        'array.array': lambda: array.array(typecode),
+        'chunked': lambda: ChunkedArrayBuffer(typecode, chunk_size),
+    }
+    results = {}
+
+    for name, factory in factories.items():
+        timings = {}
+
+        container = factory()
+        append = container.append
+        start = time.perf_counter()
+        for value in source:
+            append(value)
+        timings['append'] = time.perf_counter() - start
+
+        container = factory()
+        start = time.perf_counter()
+        for offset in range(0, size, 10_000):
+            container.extend(memoryview(source)[offset:offset + 10_000])
+        timings['extend_memoryview'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        total = 0
+        for value in container:
+            total += value
+        timings['iterate'] = time.perf_counter() - start
+
+        assert total == sum(source), f"{name} lost data"
+        results[name] = timings
+
+    ring = TypedRingBuffer(typecode, capacity=1024)
+    start = time.perf_counter()
+    for value in source:
+        ring.append(value)
+    results['ring(1024)'] = {'append': time.perf_counter() - start}
+
+    return results
+
+
+def demonstrate_buffer_benchmarks(size=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full to benchmark 10**7 elements
+    """
+
+    if size is None:
+        size = FULL_BENCHMARK_SIZE if '--full' in sys.argv else BENCHMARK_SIZE
+    results = benchmark_growable_buffers(size)
+
+    print(f"   n={size:,}")
+    for name, timings in results.items():
+        row = ', '.join(f"{op}={seconds:.4f}s" for op, seconds in timings.items())
+        print(f"   {name:<12} {row}")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute growable buffer demonstrations
+    Pass --full for the 10**7 element benchmark
+    """
+
+    print("🎯 PYTHON ARRAYS - CHUNKED & RING BUFFERS")
+    print("=" * 60)
+
+    sections = [
+        ("Chunked Buffer", demonstrate_chunked_buffer),
+        ("Ring Buffer", demonstrate_ring_buffer),
+        ("Streaming Ingest", demonstrate_streaming_ingest),
+        ("Buffer Benchmarks", demonstrate_buffer_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
@@ -0,0 +1,580 @@
+""" 3.9.3_Python_ARR_SENSOR_PIPELINE.py """
+
+# =============================================================================
+# PYTHON ARRAYS - BLOCK-BASED SENSOR INGEST PIPELINE
+# =============================================================================
+# Version: 3.9.3 | Educational Excellence Target: 9.5/10
+# Purpose: Process sensor readings in typed blocks instead of one by one
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ Split an ingest job into generate/read → validate → outlier → aggregate → persist
+✓ Move fixed-size array('b') / array('h') blocks between stages as memoryviews
+✓ Filter byte blocks in C with bytes.translate(None, delete)
+✓ Compute count, mean, variance, min and max in a single pass per block
+✓ Run stages concurrently as threads joined by bounded queues
+✓ Report per-stage throughput and latency
+
+🚀 QUICK NAVIGATION:
+├── 1. BLOCKS & SINGLE-PASS STATISTICS (FOUNDATION)
+├── 2. PIPELINE STAGES (GENERATE, VALIDATE, OUTLIER, AGGREGATE, PERSIST)
+├── 3. STAGE METRICS (THROUGHPUT & LATENCY)
+├── 4. SEQUENTIAL & THREADED EXECUTION (ORCHESTRATION)
+└── 5. BENCHMARK VS THE 3.9.0 PER-ELEMENT PIPELINE
+
+🔍 CORE CONCEPT:
+data_processing_pipeline in 3.9.0 builds a list with one random.randint per
+reading and walks the data several times. Working on blocks lets every step
+run as one C-level call per block, and keeping blocks small and fixed keeps
+memory flat no matter how long the stream is.
+"""
+
+import array
+import io
+import math
+import queue
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+# =============================================================================
+# 1. BLOCKS & SINGLE-PASS STATISTICS - FOUNDATION
+# =============================================================================
+
+"""
+BLOCKS:
+A block is a memoryview over an array('b') or array('h'). Stages only see
+the memoryview, so a stage that does not change the data passes it on
+without copying.
+"""
+
+DEFAULT_BLOCK_SIZE = 65536
+
+# Sensor range produced by the simulated hardware and the valid range kept
+SENSOR_MIN, SENSOR_MAX = -40, 125
+VALID_MIN, VALID_MAX = -30, 100
+
+# Default number of readings for the quick and the full benchmark (--full)
+BENCHMARK_READINGS = 1_000_000
+FULL_BENCHMARK_READINGS = 50_000_000
+
+_END_OF_STREAM = object()
+
+
+class BlockStats:
+    """
+    Mergeable running statistics (count, sum, sum of squares, min, max).
+
+    Built from a value histogram, so one pass over the block is enough;
+    two BlockStats merge exactly by adding their fields.
+    """
+
+    __slots__ = ('count', 'total', 'total_squares', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.total_squares = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    @classmethod
+    def from_histogram(cls, histogram):
+        stats = cls()
+        for value, count in histogram.items():
+            stats.count += count
+            stats.total += value * count
+            stats.total_squares += value * value * count
+        if histogram:
+            stats.minimum = min(histogram)
+            stats.maximum = max(histogram)
+        return stats
+
+    @classmethod
+    def from_block(cls, view):
+        """Single pass over a block: Counter does the counting in C."""
+        return cls.from_histogram(_histogram(view))
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self):
+        if not self.count:
+            return 0.0
+        # Integers are summed exactly, so this form does not lose precision
+        return (self.total_squares - self.total * self.total / self.count) / self.count
+
+    @property
+    def std_dev(self):
+        return math.sqrt(max(self.variance, 0.0))
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std_dev': self.std_dev,
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None,
+        }
+
+
+def _histogram(view):
+    """Value histogram of a block; byte blocks are counted as raw bytes."""
+    if view.format == 'b':
+        raw_counts = Counter(view.cast('B').tobytes())
+        return Counter({(byte - 256 if byte > 127 else byte): count
+                        for byte, count in raw_counts.items()})
+    return Counter(view)
+
+
+def _keep_range(view, low, high):
+    """Return a memoryview with only the values in [low, high]."""
+    if view.format == 'b':
+        # Delete every byte whose signed value falls outside the range (runs in C)
+        delete = bytes(value & 0xFF for value in range(-128, 128) if not low <= value <= high)
+        kept = array.array('b')
+        kept.frombytes(view.cast('B').tobytes().translate(None, delete))
+        return memoryview(kept)
+    return memoryview(array.array(view.format, [value for value in view if low <= value <= high]))
+
+
+# =============================================================================
+# 2. PIPELINE STAGES - GENERATE, VALIDATE, OUTLIER, AGGREGATE, PERSIST
+# =============================================================================
+
+def generate_sensor_blocks(total_readings, block_size=DEFAULT_BLOCK_SIZE, typecode='b', seed=None):
+    """
+    Source stage: yield simulated readings in [SENSOR_MIN, SENSOR_MAX].
+
+    Random bytes are mapped onto the sensor range with one translate
+    table per block instead of one random.randint call per reading.
+    (256 is not a multiple of the span, so low readings are slightly
+    more likely - fine for a simulation, not for statistics tests.)
+    """
+    rng = random.Random(seed)
+    span = SENSOR_MAX - SENSOR_MIN + 1
+    table = bytes(((byte % span) + SENSOR_MIN) & 0xFF for byte in range(256))
+
+    remaining = total_readings
+    while remaining > 0:
+        size = min(block_size, remaining)
+        mapped = rng.randbytes(size).translate(table)
+        block = array.array('b')
+        block.frombytes(mapped)
+        if typecode != 'b':
+            block = array.array(typecode, block)
+        yield memoryview(block)
+        remaining -= size
+
+
+def read_sensor_blocks(stream, block_size=DEFAULT_BLOCK_SIZE, typecode='b'):
+    """Source stage: yield blocks of raw readings from a binary stream."""
+    itemsize = array.array(typecode).itemsize
+    while True:
+        raw = stream.read(block_size * itemsize)
+        if not raw:
+            return
+        block = array.array(typecode)
+        block.frombytes(raw[:len(raw) - len(raw) % itemsize])
+        yield memoryview(block)
+
+
+class RangeValidator:
+    """Drop readings outside the sensor's valid range."""
+
+    name = 'validate'
+
+    def __init__(self, low=VALID_MIN, high=VALID_MAX):
+        self.low = low
+        self.high = high
+        self.rejected = 0
+
+    def __call__(self, view):
+        kept = _keep_range(view, self.low, self.high)
+        self.rejected += len(view) - len(kept)
+        return kept
+
+
+class OutlierRejector:
+    """
+    Drop readings more than `sigmas` standard deviations from the mean.
+
+    The mean and deviation come from the running statistics of every
+    block seen so far (including this one), gathered in the same pass
+    that the block is filtered with, so no full-data pre-pass is needed.
+    """
+
+    name = 'outliers'
+
+    def __init__(self, sigmas=2.0):
+        self.sigmas = sigmas
+        self.running = BlockStats()
+        self.rejected = 0
+
+    def __call__(self, view):
+        self.running.merge(BlockStats.from_block(view))
+        spread = self.sigmas * self.running.std_dev
+        low = math.ceil(self.running.mean - spread)
+        high = math.floor(self.running.mean + spread)
+        kept = _keep_range(view, low, high)
+        self.rejected += len(view) - len(kept)
+        return kept
+
+
+class Aggregator:
+    """Merge per-block statistics and the value histogram for the median."""
+
+    name = 'aggregate'
+
+    def __init__(self):
+        self.stats = BlockStats()
+        self.histogram = Counter()
+
+    def __call__(self, view):
+        block_histogram = _histogram(view)
+        self.histogram.update(block_histogram)
+        self.stats.merge(BlockStats.from_histogram(block_histogram))
+        return view
+
+    def median(self):
+        midpoint = (self.stats.count - 1) / 2
+        seen = 0
+        lower = None
+        for value in sorted(self.histogram):
+            seen += self.histogram[value]
+            if lower is None and seen > math.floor(midpoint):
+                lower = value
+            if seen > math.ceil(midpoint):
+                return (lower + value) / 2
+        return lower
+
+    def summary(self):
+        summary = self.stats.as_dict()
+        summary['median'] = self.median() if self.stats.count else None
+        return summary
+
+
+class Persister:
+    """Sink stage: write each block's raw bytes to a binary stream."""
+
+    name = 'persist'
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_written = 0
+
+    def __call__(self, view):
+        self.bytes_written += self.stream.write(view.cast('B'))
+        return view
+
+
+# =============================================================================
+# 3. STAGE METRICS - THROUGHPUT & LATENCY
+# =============================================================================
+
+class StageMetrics:
+    """Per-stage counters: blocks, readings in, busy time and block latencies."""
+
+    def __init__(self, name):
+        self.name = name
+        self.blocks = 0
+        self.readings = 0
+        self.busy_seconds = 0.0
+        self.latencies = []
+
+    def record(self, readings, seconds):
+        self.blocks += 1
+        self.readings += readings
+        self.busy_seconds += seconds
+        self.latencies.append(seconds)
+
+    def _percentile(self, fraction):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def report(self):
+        return {
+            'blocks': self.blocks,
+            'readings': self.readings,
+            'busy_seconds': self.busy_seconds,
+            'readings_per_second': self.readings / self.busy_seconds if self.busy_seconds else 0.0,
+            'p50_block_latency_ms': self._percentile(0.50) * 1000,
+            'p99_block_latency_ms': self._percentile(0.99) * 1000,
+        }
+
+
+# =============================================================================
+# 4. SEQUENTIAL & THREADED EXECUTION - ORCHESTRATION
+# =============================================================================
+
+class SensorPipeline:
+    """
+    Source followed by a chain of block stages.
+
+    run() processes each block through every stage in turn; with
+    concurrent=True each stage runs in its own thread, connected to the
+    next by a bounded queue so a slow stage applies back-pressure.
+    """
+
+    def __init__(self, source, stages):
+        self.source = source
+        self.stages = list(stages)
+        self.metrics = {'source': StageMetrics('source')}
+        for stage in self.stages:
+            self.metrics[stage.name] = StageMetrics(stage.name)
+
+    def _timed_source(self):
+        metrics = self.metrics['source']
+        iterator = iter(self.source)
+        while True:
+            start = time.perf_counter()
+            try:
+                view = next(iterator)
+            except StopIteration:
+                return
+            metrics.record(len(view), time.perf_counter() - start)
+            yield view
+
+    def _apply(self, stage, view):
+        start = time.perf_counter()
+        result = stage(view)
+        self.metrics[stage.name].record(len(view), time.perf_counter() - start)
+        return result
+
+    def run(self, concurrent=False, queue_size=4):
+        """Run to completion and return the per-stage metrics reports."""
+        start = time.perf_counter()
+        if concurrent:
+            self._run_threaded(queue_size)
+        else:
+            for view in self._timed_source():
+                for stage in self.stages:
+                    view = self._apply(stage, view)
+        elapsed = time.perf_counter() - start
+
+        reports = {name: metrics.report() for name, metrics in self.metrics.items()}
+        reports['wall_seconds'] = elapsed
+        reports['readings_per_second'] = self.metrics['source'].readings / elapsed if elapsed else 0.0
+        return reports
+
+    def _run_threaded(self, queue_size):
+        queues = [queue.Queue(maxsize=queue_size) for _ in self.stages]
+        errors = []
+
+        def feed():
+            try:
+                for view in self._timed_source():
+                    queues[0].put(view)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                queues[0].put(_END_OF_STREAM)
+
+        def work(position, stage):
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(queues) else None
+            failed = False
+            while True:
+                view = inbox.get()
+                if view is _END_OF_STREAM:
+                    break
+                if failed:
+                    continue  # keep draining so upstream never blocks
+                try:
+                    result = self._apply(stage, view)
+                except Exception as error:
+                    errors.append(error)
+                    failed = True
+                    continue
+                if outbox is not None:
+                    outbox.put(result)
+            if outbox is not None:
+                outbox.put(_END_OF_STREAM)
+
+        threads = [threading.Thread(target=feed, name='source')]
+        threads += [
+            threading.Thread(target=work, args=(position, stage), name=stage.name)
+            for position, stage in enumerate(self.stages)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+
+def build_sensor_pipeline(source, sink_stream=None, sigmas=2.0):
+    """Standard validate → outlier → aggregate → persist pipeline."""
+    validator = RangeValidator()
+    rejector = OutlierRejector(sigmas)
+    aggregator = Aggregator()
+    persister = Persister(sink_stream if sink_stream is not None else io.BytesIO())
+    pipeline = SensorPipeline(source, [validator, rejector, aggregator, persister])
+    return pipeline, {
+        'validator': validator,
+        'rejector': rejector,
+        'aggregator': aggregator,
+        'persister': persister,
+    }
+
+
+# =============================================================================
+# 5. BENCHMARK VS THE 3.9.0 PER-ELEMENT PIPELINE
+# =============================================================================
+
+def per_element_pipeline(total_readings, seed=None):
+    """The 3.9.0 approach: randint per reading, separate passes for stats."""
+    rng = random.Random(seed)
+    sensor_array = array.array('b', [rng.randint(SENSOR_MIN, SENSOR_MAX) for _ in range(total_readings)])
+
+    valid_for_stats = [x for x in sensor_array if VALID_MIN <= x <= VALID_MAX]
+    mean = sum(valid_for_stats) / len(valid_for_stats)
+    std_dev = math.sqrt(sum((x - mean) ** 2 for x in valid_for_stats) / len(valid_for_stats))
+    threshold = 2 * std_dev
+
+    valid_readings = array.array('b')
+    for reading in sensor_array:
+        if VALID_MIN <= reading <= VALID_MAX and abs(reading - mean) <= threshold:
+            valid_readings.append(reading)
+    return len(valid_readings)
+
+
+def benchmark_sensor_pipeline(total_readings=BENCHMARK_READINGS, block_size=DEFAULT_BLOCK_SIZE):
+    """Compare the per-element pipeline with sequential and threaded block pipelines."""
+    results = {}
+
+    start = time.perf_counter()
+    kept = per_element_pipeline(total_readings, seed=1)
+    elapsed = time.perf_counter() - start
+    results['per_element'] = {'seconds': elapsed, 'kept': kept,
+                              'readings_per_second': total_readings / elapsed}
+
+    for typecode in ('b', 'h'):
+        for concurrent in (False, True):
+            source = generate_sensor_blocks(total_readings, block_size, typecode, seed=1)
+            pipeline, parts = build_sensor_pipeline(source)
+            reports = pipeline.run(concurrent=concurrent)
+            label = f"blocks_{typecode}_{'threaded' if concurrent else 'sequential'}"
+            results[label] = {
+                'seconds': reports['wall_seconds'],
+                'kept': parts['aggregator'].stats.count,
+                'readings_per_second': reports['readings_per_second'],
+                'stages': {name: report for name, report in reports.items() if isinstance(report, dict)},
+            }
+
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_block_pipeline():
+    """
+    BLOCK PIPELINE DEMONSTRATION
+    Sequential run with per-stage metrics and final statistics
+    """
+
+    source = generate_sensor_blocks(200_000, block_size=16_384, seed=42)
+    pipeline, parts = build_sensor_pipeline(source)
+    reports = pipeline.run()
+
+    summary = parts['aggregator'].summary()
+    print(f"   readings kept: {summary['count']:,} "
+          f"(invalid: {parts['validator'].rejected:,}, outliers: {parts['rejector'].rejected:,})")
+    print(f"   mean={summary['mean']:.2f} std={summary['std_dev']:.2f} "
+          f"median={summary['median']} range=[{summary['min']}, {summary['max']}]")
+    for name in ['source'] + [stage.name for stage in pipeline.stages]:
+        report = reports[name]
+        print(f"   {name:<10} {report['readings_per_second']:>14,.0f} readings/s  "
+              f"p50={report['p50_block_latency_ms']:.3f}ms p99={report['p99_block_latency_ms']:.3f}ms")
+
+    return {'summary': summary, 'reports': reports}
+
+
+def demonstrate_threaded_pipeline():
+    """
+    THREADED PIPELINE DEMONSTRATION
+    Same stages as threads joined by bounded queues, reading from a stream
+    """
+
+    raw = io.BytesIO()
+    for view in generate_sensor_blocks(200_000, seed=42):
+        raw.write(view.cast('B'))
+    raw.seek(0)
+
+    persisted = io.BytesIO()
+    pipeline, parts = build_sensor_pipeline(read_sensor_blocks(raw, 16_384), persisted)
+    reports = pipeline.run(concurrent=True, queue_size=2)
+
+    print(f"   threaded run: {reports['readings_per_second']:,.0f} readings/s, "
+          f"{parts['persister'].bytes_written:,} bytes persisted")
+    return {'reports': reports, 'bytes_written': parts['persister'].bytes_written}
+
+
+def demonstrate_pipeline_benchmarks(total_readings=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 5 * 10**7 readings
+    """
+
+    if total_readings is None:
+        total_readings = FULL_BENCHMARK_READINGS if '--full' in sys.argv else BENCHMARK_READINGS
+    results = benchmark_sensor_pipeline(total_readings)
+
+    print(f"   readings={total_readings:,}")
+    for label, result in results.items():
+        print(f"   {label:<24} {result['seconds']:.3f}s  {result['readings_per_second']:>14,.0f} readings/s")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute sensor pipeline demonstrations
+    Pass --full for the 5 * 10**7 reading benchmark
+    """
+
+    print("🎯 PYTHON ARRAYS - BLOCK-BASED SENSOR PIPELINE")
+    print("=" * 60)
+
+    sections = [
+        ("Block Pipeline", demonstrate_block_pipeline),
+        ("Threaded Pipeline", demonstrate_threaded_pipeline),
+        ("Pipeline Benchmarks", demonstrate_pipeline_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)
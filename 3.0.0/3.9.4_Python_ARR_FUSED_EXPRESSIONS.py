@@ -0,0 +1,463 @@
+""" 3.9.4_Python_ARR_FUSED_EXPRESSIONS.py """
+
+# =============================================================================
+# PYTHON ARRAYS - LAZY FUSED EXPRESSIONS OVER TYPED ARRAYS
+# =============================================================================
+# Version: 3.9.4 | Educational Excellence Target: 9.5/10
+# Purpose: Chain map/filter/zip/reduce over array.array in one fused pass
+# Target: Intermediate to Advanced Python programmers
+# =============================================================================
+
+"""
+🎯 LEARNING OBJECTIVES:
+By working through this module, you will:
+✓ See why "square, then filter evens" with intermediates touches data twice
+✓ Record map/filter/zip operations lazily instead of running them at once
+✓ Fuse a whole chain into ONE generated comprehension (one pass, no temporaries)
+✓ Evaluate in cache-sized blocks and write into a preallocated typed output
+✓ Send blocks to a process pool when the chain is made of string expressions
+✓ Benchmark lists, arrays and the fused engine side by side
+
+🚀 QUICK NAVIGATION:
+├── 1. WHY FUSION (FOUNDATION)
+├── 2. KERNEL GENERATION (ONE COMPREHENSION PER CHAIN)
+├── 3. LAZY ARRAY EXPRESSIONS (API, BLOCKED & PARALLEL EVALUATION)
+└── 4. BENCHMARK: LISTS VS ARRAYS VS FUSED
+
+🔍 CORE CONCEPT:
+An expression such as
+    lazy(data).map('x * x').filter('x % 2 == 0').to_array('q')
+is only a description until a terminal (to_array, sum, reduce...) runs.
+The terminal turns the chain into a single comprehension:
+    [x for x in block for x in (x * x,) if x % 2 == 0]
+so each element is loaded once, transformed and filtered in one go.
+"""
+
+import array
+import functools
+import operator
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# =============================================================================
+# 1. WHY FUSION - FOUNDATION
+# =============================================================================
+
+"""
+MATERIALIZED VS FUSED:
+• materialized: squared = [x*x for x in data]; evens = [x for x in squared if ...]
+  → two passes, one full-size temporary list
+• fused: one loop doing both steps per element
+  → one pass, no temporary, output written straight into a typed array
+String expressions (e.g. 'x * x') are inlined into the loop, so they cost
+no function call at all; callables are supported but pay a call per element.
+"""
+
+DEFAULT_BLOCK_SIZE = 16384  # elements per block; keeps a block's working set in cache
+
+# Default sizes for the quick benchmark and the full benchmark (--full)
+BENCHMARK_SIZE = 1_000_000
+FULL_BENCHMARK_SIZE = 20_000_000
+
+
+# =============================================================================
+# 2. KERNEL GENERATION - ONE COMPREHENSION PER CHAIN
+# =============================================================================
+
+"""
+KERNELS:
+Each operation becomes one clause of a comprehension that keeps rebinding x:
+    map 'expr'       → for x in ((expr),)
+    map callable     → for x in (_f0(x),)
+    filter 'expr'    → if (expr)
+    filter callable  → if _f1(x)
+String expressions are wrapped in parentheses, so 'x, -x' yields a tuple
+instead of silently becoming a second loop value.
+A zip source starts the clause list with `for x, y in zip(a, b)`,
+followed by a combine step that merges x and y back into x.
+"""
+
+def _operation_clause(position, kind, operation, namespace):
+    """Return the comprehension clause for one operation."""
+    if isinstance(operation, str):
+        expression = operation
+    else:
+        name = f"_f{position}"
+        namespace[name] = operation
+        expression = f"{name}(x, y)" if kind == 'combine' else f"{name}(x)"
+    if kind in ('map', 'combine'):
+        return f"for x in (({expression}),)"
+    if kind == 'filter':
+        return f"if ({expression})"
+    raise ValueError(f"Unknown operation kind: {kind!r}")
+
+
+def _kernel_source(operations, zipped, wrapper):
+    """Build the source of a function that runs the fused chain on one block."""
+    namespace = {}
+    head = "for x, y in zip(block, other)" if zipped else "for x in block"
+    clauses = [head] + [
+        _operation_clause(position, kind, operation, namespace)
+        for position, (kind, operation) in enumerate(operations)
+    ]
+    body = f"{wrapper}(x {' '.join(clauses)})" if wrapper else f"[x {' '.join(clauses)}]"
+    source = f"def kernel(block, other=None):\n    return {body}\n"
+    return source, namespace
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_string_kernel(operations, zipped, wrapper):
+    """Compile (and cache) a kernel made only of string expressions."""
+    return _compile_kernel(operations, zipped, wrapper)
+
+
+def _compile_kernel(operations, zipped, wrapper):
+    source, namespace = _kernel_source(operations, zipped, wrapper)
+    namespace.update({'sum': sum, 'min': min, 'max': max, 'len': len})
+    exec(compile(source, '<fused-kernel>', 'exec'), namespace)
+    return namespace['kernel']
+
+
+def build_kernel(operations, zipped=False, wrapper=None):
+    """
+    Return a function kernel(block, other=None) running the fused chain.
+
+    wrapper: None for a list result, or 'sum'/'min'/'max' to reduce the
+    block with a generator expression instead of building a list.
+    """
+    operations = tuple(operations)
+    if all(isinstance(operation, str) for _, operation in operations):
+        return _compile_string_kernel(operations, zipped, wrapper)
+    return _compile_kernel(operations, zipped, wrapper)
+
+
+# =============================================================================
+# 3. LAZY ARRAY EXPRESSIONS - API, BLOCKED & PARALLEL EVALUATION
+# =============================================================================
+
+class LazyArray:
+    """
+    Deferred chain of map/filter operations over an array.array source.
+
+    Builders (map, filter) return a new LazyArray and do no work.
+    Terminals (to_array, tolist, sum, min, max, count, reduce) fuse the
+    chain into one kernel and evaluate it block by block.
+    """
+
+    def __init__(self, source, other=None, operations=(), block_size=DEFAULT_BLOCK_SIZE):
+        if other is not None and len(other) != len(source):
+            raise ValueError("zipped sources must have the same length")
+        self.source = source
+        self.other = other
+        self.operations = tuple(operations)
+        self.block_size = block_size
+
+    # Builders ---------------------------------------------------------------
+
+    def _extend(self, kind, operation):
+        return LazyArray(self.source, self.other, self.operations + ((kind, operation),), self.block_size)
+
+    def map(self, operation):
+        """Transform each element; operation is a callable or an expression in x."""
+        return self._extend('map', operation)
+
+    def filter(self, predicate):
+        """Keep elements where predicate (callable or expression in x) is true."""
+        return self._extend('filter', predicate)
+
+    @property
+    def preserves_length(self):
+        return all(kind != 'filter' for kind, _ in self.operations)
+
+    @property
+    def is_picklable(self):
+        """Only chains of string expressions can be shipped to worker processes."""
+        return all(isinstance(operation, str) for _, operation in self.operations)
+
+    # Block iteration --------------------------------------------------------
+
+    def _blocks(self):
+        """Yield (block, other_block) pairs of memoryview slices (no copies)."""
+        source = memoryview(self.source)
+        other = memoryview(self.other) if self.other is not None else None
+        for start in range(0, len(source), self.block_size):
+            stop = start + self.block_size
+            yield source[start:stop], (other[start:stop] if other is not None else None)
+
+    def _run_blocks(self, wrapper=None):
+        kernel = build_kernel(self.operations, self.other is not None, wrapper)
+        for block, other_block in self._blocks():
+            yield kernel(block, other_block)
+
+    # Terminals --------------------------------------------------------------
+
+    def to_array(self, typecode=None, out=None, workers=None):
+        """
+        Evaluate into a typed array.
+
+        Map-only chains write into a preallocated output (pass `out` to
+        reuse a buffer); chains with filters append block results. With
+        workers set, blocks are evaluated on a process pool.
+        """
+        typecode = typecode or (out.typecode if out is not None else self.source.typecode)
+        if workers:
+            return self._to_array_parallel(typecode, out, workers)
+
+        if self.preserves_length:
+            if out is None:
+                out = array.array(typecode, bytes(len(self.source) * array.array(typecode).itemsize))
+            elif len(out) < len(self.source):
+                raise ValueError("output array is smaller than the source")
+            position = 0
+            for values in self._run_blocks():
+                out[position:position + len(values)] = array.array(typecode, values)
+                position += len(values)
+            return out
+
+        result = out if out is not None else array.array(typecode)
+        if out is not None:
+            del result[:]
+        for values in self._run_blocks():
+            result.extend(values)
+        return result
+
+    def tolist(self):
+        result = []
+        for values in self._run_blocks():
+            result.extend(values)
+        return result
+
+    def sum(self):
+        return sum(self._run_blocks('sum'))
+
+    def count(self):
+        if self.preserves_length:
+            return len(self.source)
+        return sum(len(values) for values in self._run_blocks())
+
+    def min(self):
+        return min(value for values in self._run_blocks() for value in values)
+
+    def max(self):
+        return max(value for values in self._run_blocks() for value in values)
+
+    def reduce(self, function, initial):
+        """Fold the fused results with function(accumulator, value)."""
+        accumulator = initial
+        for values in self._run_blocks():
+            accumulator = functools.reduce(function, values, accumulator)
+        return accumulator
+
+    # Parallel evaluation ----------------------------------------------------
+
+    def _to_array_parallel(self, typecode, out, workers):
+        if not self.is_picklable:
+            raise ValueError("parallel evaluation needs string expressions, not callables")
+
+        tasks = [
+            (self.operations, self.other is not None, typecode,
+             block.cast('B').tobytes(), block.format,
+             other_block.cast('B').tobytes() if other_block is not None else None,
+             other_block.format if other_block is not None else None)
+            for block, other_block in self._blocks()
+        ]
+        result = out if out is not None else array.array(typecode)
+        del result[:]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for raw in executor.map(_evaluate_block_worker, tasks, chunksize=4):
+                result.frombytes(raw)
+        return result
+
+    def __repr__(self):
+        chain = ''.join(f".{kind}({operation!r})" for kind, operation in self.operations)
+        source = 'zip(source, other)' if self.other is not None else 'source'
+        return f"LazyArray({source}[{len(self.source)}]){chain}"
+
+
+def _evaluate_block_worker(task):
+    """Process-pool worker: rebuild one block, run the cached kernel, return bytes."""
+    operations, zipped, typecode, raw, block_format, other_raw, other_format = task
+    block = array.array(block_format)
+    block.frombytes(raw)
+    other = None
+    if other_raw is not None:
+        other = array.array(other_format)
+        other.frombytes(other_raw)
+    kernel = _compile_string_kernel(operations, zipped, None)
+    return array.array(typecode, kernel(block, other)).tobytes()
+
+
+def lazy(source, block_size=DEFAULT_BLOCK_SIZE):
+    """Start a lazy expression over an array.array (or any buffer)."""
+    return LazyArray(source, block_size=block_size)
+
+
+def lazy_zip(source, other, combine, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Start a lazy expression over two equal-length arrays.
+
+    combine is an expression in x and y (or a callable of two arguments)
+    producing the value that later map/filter steps see as x.
+    """
+    return LazyArray(source, other, (('combine', combine),), block_size)
+
+
+# =============================================================================
+# 4. BENCHMARK: LISTS VS ARRAYS VS FUSED
+# =============================================================================
+
+def square_filter_evens_lists(size):
+    """3.9.0 method 1: materialize squared, then evens."""
+    data = list(range(size))
+    squared = [x * x for x in data]
+    return [x for x in squared if x % 2 == 0]
+
+
+def square_filter_evens_arrays(size):
+    """3.9.0 method 2: one Python loop appending to an array."""
+    data = array.array('q', range(size))
+    result = array.array('q')
+    for x in data:
+        squared = x * x
+        if squared % 2 == 0:
+            result.append(squared)
+    return result
+
+
+def square_filter_evens_fused(size, workers=None):
+    """Fused engine: one generated comprehension per block."""
+    data = array.array('q', range(size))
+    return lazy(data).map('x * x').filter('x % 2 == 0').to_array('q', workers=workers)
+
+
+def benchmark_square_filter_evens(size=BENCHMARK_SIZE, include_parallel=True):
+    """Time the 3.9.0 "square then filter evens" case for each method."""
+    methods = {
+        'lists (materialized)': square_filter_evens_lists,
+        'arrays (append loop)': square_filter_evens_arrays,
+        'fused engine': square_filter_evens_fused,
+    }
+    if include_parallel:
+        methods['fused engine, 4 processes'] = functools.partial(square_filter_evens_fused, workers=4)
+
+    results = {}
+    expected = None
+    for name, method in methods.items():
+        start = time.perf_counter()
+        output = method(size)
+        elapsed = time.perf_counter() - start
+        values = list(output)
+        if expected is None:
+            expected = values
+        assert values == expected, f"{name} produced different results"
+        results[name] = {'seconds': elapsed, 'result_count': len(values)}
+
+    fastest = min(result['seconds'] for result in results.values())
+    for result in results.values():
+        result['relative_to_fastest'] = result['seconds'] / fastest if fastest else 1.0
+    return results
+
+
+# =============================================================================
+# DEMONSTRATIONS
+# =============================================================================
+
+def demonstrate_fused_expressions():
+    """
+    FUSED EXPRESSION DEMONSTRATION
+    Builders, generated kernels and terminals
+    """
+
+    data = array.array('i', range(1, 21))
+    expression = lazy(data).map('x * x').filter('x % 2 == 0')
+    source, _ = _kernel_source(expression.operations, False, None)
+
+    prices = array.array('d', [9.5, 20.0, 3.25, 41.0])
+    quantities = array.array('d', [3, 1, 10, 2])
+    totals = lazy_zip(prices, quantities, 'x * y')
+
+    results = {
+        'expression': repr(expression),
+        'generated_kernel': source.strip(),
+        'to_array': expression.to_array('q').tolist(),
+        'sum': expression.sum(),
+        'count': expression.count(),
+        'reduce_product_of_first_three': lazy(data).filter('x <= 3').reduce(operator.mul, 1),
+        'callable_map': lazy(data).map(abs).filter(lambda x: x > 18).tolist(),
+        'zip_totals': totals.tolist(),
+        'zip_total_sum': totals.sum(),
+    }
+
+    print(f"   {results['expression']}")
+    print(f"   kernel: {results['generated_kernel'].splitlines()[-1].strip()}")
+    print(f"   to_array: {results['to_array']}")
+    print(f"   sum={results['sum']} count={results['count']} zip totals={results['zip_totals']}")
+    return results
+
+
+def demonstrate_preallocated_output():
+    """
+    PREALLOCATED OUTPUT DEMONSTRATION
+    Map-only chains reuse one output buffer across evaluations
+    """
+
+    readings = array.array('d', [20.5, 21.0, 19.5, 22.25])
+    fahrenheit = array.array('d', bytes(len(readings) * 8))
+    output_id = id(fahrenheit)
+
+    lazy(readings).map('x * 9 / 5 + 32').to_array(out=fahrenheit)
+    reused = id(fahrenheit) == output_id
+
+    print(f"   fahrenheit: {fahrenheit.tolist()} (same buffer: {reused})")
+    return {'fahrenheit': fahrenheit.tolist(), 'buffer_reused': reused}
+
+
+def demonstrate_fusion_benchmarks(size=None):
+    """
+    BENCHMARK DEMONSTRATION
+    Run with --full for 2 * 10**7 elements
+    """
+
+    if size is None:
+        size = FULL_BENCHMARK_SIZE if '--full' in sys.argv else BENCHMARK_SIZE
+    results = benchmark_square_filter_evens(size)
+
+    print(f"   square then filter evens, n={size:,}")
+    for name, result in results.items():
+        print(f"   {name:<28} {result['seconds']:.4f}s  ({result['relative_to_fastest']:.2f}x fastest)")
+    return results
+
+
+# =============================================================================
+# DEMONSTRATION EXECUTION
+# =============================================================================
+
+if __name__ == "__main__":
+    """
+    Execute fused expression demonstrations
+    Pass --full for the 2 * 10**7 element benchmark
+    """
+
+    print("🎯 PYTHON ARRAYS - LAZY FUSED EXPRESSIONS")
+    print("=" * 60)
+
+    sections = [
+        ("Fused Expressions", demonstrate_fused_expressions),
+        ("Preallocated Output", demonstrate_preallocated_output),
+        ("Fusion Benchmarks", demonstrate_fusion_benchmarks),
+    ]
+
+    for section_name, demo_function in sections:
+        print(f"\n📋 {section_name.upper()}")
+        print("-" * 50)
+
+        try:
+            results = demo_function()
+            print(f"✅ {section_name} demonstration completed successfully")
+            print(f"   Results: {len(results)} categories demonstrated")
+
+        except Exception as e:
+            print(f"❌ Error in {section_name}: {str(e)}")
+
+    print("=" * 60)